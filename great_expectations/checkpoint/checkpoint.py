@@ -3,7 +3,8 @@ import datetime
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union, cast
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 from uuid import UUID
 
 import great_expectations.exceptions as ge_exceptions
@@ -19,6 +20,7 @@ from great_expectations.checkpoint.util import (
 from great_expectations.core import RunIdentifier
 from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import (
+    Batch,
     BatchRequest,
     BatchRequestBase,
     RuntimeBatchRequest,
@@ -26,6 +28,7 @@ from great_expectations.core.batch import (
     get_batch_request_as_dict,
 )
 from great_expectations.core.config_peer import ConfigOutputModes, ConfigPeer
+from great_expectations.core.expectation_suite import ExpectationSuite
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationSuiteValidationResultMeta,
@@ -50,7 +53,7 @@ from great_expectations.validation_operators import ActionListValidationOperator
 from great_expectations.validation_operators.types.validation_operator_result import (
     ValidationOperatorResult,
 )
-from great_expectations.validator.validator import Validator
+from great_expectations.validator.validator import EvaluatedExpectationSuite, Validator
 
 logger = logging.getLogger(__name__)
 
@@ -167,18 +170,23 @@ class BaseCheckpoint(ConfigPeer):
         ) as async_executor:
             # noinspection PyUnresolvedReferences
             async_validation_operator_results: List[
-                AsyncResult[ValidationOperatorResult]
+                AsyncResult[Dict[int, ValidationOperatorResult]]
             ] = []
             if len(validations) > 0:
-                for idx, validation_dict in enumerate(validations):
-                    self._run_validation(
+                # Validations of the same Batch are run together, so that the Batch is loaded only once and metrics
+                # of all their Expectation Suites are resolved in one validation graph.
+                validation_group: List[Tuple[int, dict]]
+                for validation_group in self._group_validations_by_batch(
+                    substituted_runtime_config=substituted_runtime_config,
+                    validations=validations,
+                ):
+                    self._run_validations_of_batch(
                         substituted_runtime_config=substituted_runtime_config,
                         async_validation_operator_results=async_validation_operator_results,
                         async_executor=async_executor,
                         result_format=result_format,
                         run_id=run_id,
-                        idx=idx,
-                        validation_dict=validation_dict,
+                        validations=validation_group,
                     )
             else:
                 self._run_validation(
@@ -189,11 +197,18 @@ class BaseCheckpoint(ConfigPeer):
                     run_id=run_id,
                 )
 
-            checkpoint_run_results: dict = {}
+            validation_operator_results: Dict[int, ValidationOperatorResult] = {}
             async_validation_operator_result: AsyncResult
             for async_validation_operator_result in async_validation_operator_results:
-                async_result = async_validation_operator_result.result()
-                run_results = async_result.run_results
+                validation_operator_results.update(
+                    async_validation_operator_result.result()
+                )
+
+            # Run results are reported in the order of validations (regardless of grouping).
+            checkpoint_run_results: dict = {}
+            idx: int
+            for idx in sorted(validation_operator_results.keys()):
+                run_results = validation_operator_results[idx].run_results
 
                 run_result: dict
                 validation_result: Optional[ExpectationSuiteValidationResult]
@@ -311,9 +326,56 @@ class BaseCheckpoint(ConfigPeer):
         async_executor: AsyncExecutor,
         result_format: Optional[dict],
         run_id: Optional[Union[str, RunIdentifier]],
-        idx: Optional[int] = 0,
+        idx: int = 0,
         validation_dict: Optional[dict] = None,
     ) -> None:
+        self._run_validations_of_batch(
+            substituted_runtime_config=substituted_runtime_config,
+            async_validation_operator_results=async_validation_operator_results,
+            async_executor=async_executor,
+            result_format=result_format,
+            run_id=run_id,
+            validations=[(idx, validation_dict)],
+        )
+
+    def _run_validations_of_batch(
+        self,
+        substituted_runtime_config: dict,
+        async_validation_operator_results: List[AsyncResult],
+        async_executor: AsyncExecutor,
+        result_format: Optional[dict],
+        run_id: Optional[Union[str, RunIdentifier]],
+        validations: List[Tuple[int, Optional[dict]]],
+    ) -> None:
+        """
+        Submits validations (pairs of index and validation dictionary), sharing the same Batch, as one unit of work.
+        """
+        prepared_validations: List[dict] = [
+            self._prepare_validation(
+                substituted_runtime_config=substituted_runtime_config,
+                result_format=result_format,
+                idx=idx,
+                validation_dict=validation_dict,
+            )
+            for idx, validation_dict in validations
+        ]
+
+        # Batch data and Expectation Suites are loaded as part of the submitted work (rather than in this loop), so
+        # that loading Batch data for multiple validations proceeds concurrently (if concurrency is enabled).
+        async_validation_operator_result = async_executor.submit(
+            self._load_validators_and_run_validation_operators,
+            prepared_validations=prepared_validations,
+            run_id=run_id,
+        )
+        async_validation_operator_results.append(async_validation_operator_result)
+
+    def _prepare_validation(
+        self,
+        substituted_runtime_config: dict,
+        result_format: Optional[dict],
+        idx: int = 0,
+        validation_dict: Optional[dict] = None,
+    ) -> dict:
         if validation_dict is None:
             validation_dict = {}
             validation_dict["id_"] = substituted_runtime_config.get(
@@ -338,21 +400,6 @@ class BaseCheckpoint(ConfigPeer):
                 "include_rendered_content", False
             )
 
-            validator: Validator = self.data_context.get_validator(
-                batch_request=batch_request,
-                expectation_suite_name=(
-                    expectation_suite_name
-                    if not self.data_context.ge_cloud_mode
-                    else None
-                ),
-                expectation_suite_ge_cloud_id=(
-                    expectation_suite_ge_cloud_id
-                    if self.data_context.ge_cloud_mode
-                    else None
-                ),
-                include_rendered_content=include_rendered_content,
-            )
-
             action_list: list = substituted_validation_dict.get("action_list")
             runtime_configuration_validation = substituted_validation_dict.get(
                 "runtime_configuration", {}
@@ -386,21 +433,136 @@ class BaseCheckpoint(ConfigPeer):
                 operator_run_kwargs["catch_exceptions"] = catch_exceptions_validation
 
             validation_id: Optional[str] = substituted_validation_dict.get("id_")
+        except (
+            ge_exceptions.CheckpointError,
+            ge_exceptions.ExecutionEngineError,
+            ge_exceptions.MetricError,
+        ) as e:
+            raise ge_exceptions.CheckpointError(
+                f"Exception occurred while running validation[{idx}] of Checkpoint '{self.name}': {e.message}."
+            )
 
-            async_validation_operator_result = async_executor.submit(
-                action_list_validation_operator.run,
-                assets_to_validate=[validator],
-                run_id=run_id,
-                evaluation_parameters=substituted_validation_dict.get(
+        return {
+            "idx": idx,
+            "batch_request": batch_request,
+            "expectation_suite_name": expectation_suite_name,
+            "expectation_suite_ge_cloud_id": expectation_suite_ge_cloud_id,
+            "include_rendered_content": include_rendered_content,
+            "action_list_validation_operator": action_list_validation_operator,
+            "operator_run_kwargs": {
+                "evaluation_parameters": substituted_validation_dict.get(
                     "evaluation_parameters"
                 ),
-                result_format=result_format,
-                checkpoint_identifier=checkpoint_identifier,
-                checkpoint_name=self.name,
-                validation_id=validation_id,
+                "result_format": result_format,
+                "checkpoint_identifier": checkpoint_identifier,
+                "checkpoint_name": self.name,
+                "validation_id": validation_id,
                 **operator_run_kwargs,
-            )
-            async_validation_operator_results.append(async_validation_operator_result)
+            },
+        }
+
+    def _load_validators_and_run_validation_operators(
+        self,
+        prepared_validations: List[dict],
+        run_id: Optional[Union[str, RunIdentifier]],
+    ) -> Dict[int, ValidationOperatorResult]:
+        """
+        Loads Batch data and Expectation Suites of validations (sharing the same Batch) into Validator objects and runs
+        validation operators on them; time spent loading (in seconds) is recorded as "batch_load_time" in every run
+        result of validation operators.
+
+        If there is more than one validation, then Batch data is loaded only once, and metrics of all Expectation Suites
+        are resolved together (in one validation graph), before validation operators are run.
+        """
+        idx: int = prepared_validations[0]["idx"]
+        validation_operator_results: Dict[int, ValidationOperatorResult] = {}
+        try:
+            batch_load_start_time: float = time.perf_counter()
+            batch_list: Optional[List[Batch]] = None
+            if len(prepared_validations) > 1:
+                batch_list = self.data_context.get_batch_list(
+                    batch_request=prepared_validations[0]["batch_request"]
+                )
+
+            prepared_validation: dict
+            validators: List[Validator] = []
+            batch_load_times: List[float] = []
+            for prepared_validation in prepared_validations:
+                idx = prepared_validation["idx"]
+                validators.append(
+                    self.data_context.get_validator(
+                        batch_request=(
+                            prepared_validation["batch_request"]
+                            if batch_list is None
+                            else None
+                        ),
+                        batch_list=batch_list,
+                        expectation_suite_name=(
+                            prepared_validation["expectation_suite_name"]
+                            if not self.data_context.ge_cloud_mode
+                            else None
+                        ),
+                        expectation_suite_ge_cloud_id=(
+                            prepared_validation["expectation_suite_ge_cloud_id"]
+                            if self.data_context.ge_cloud_mode
+                            else None
+                        ),
+                        include_rendered_content=prepared_validation[
+                            "include_rendered_content"
+                        ],
+                    )
+                )
+                # Time spent loading shared Batch data is attributed to the first validation.
+                batch_load_times.append(time.perf_counter() - batch_load_start_time)
+                batch_load_start_time = time.perf_counter()
+
+            metrics: Optional[Dict[Tuple[str, str, str], Any]] = None
+            evaluated_expectation_suites: Dict[int, EvaluatedExpectationSuite] = {}
+            if len(validators) > 1:
+                idx = prepared_validations[0]["idx"]
+                operator_run_kwargs: dict = prepared_validations[0][
+                    "operator_run_kwargs"
+                ]
+                validator: Validator
+                # Evaluation parameters are evaluated once; the same evaluated configurations are validated below.
+                evaluated_expectation_suites = {
+                    prepared_validation["idx"]: validator.evaluate_expectation_suite(
+                        run_id=run_id,
+                        evaluation_parameters=operator_run_kwargs[
+                            "evaluation_parameters"
+                        ],
+                    )
+                    for prepared_validation, validator in zip(
+                        prepared_validations, validators
+                    )
+                }
+                metrics = validators[0].resolve_expectation_suites_metrics(
+                    evaluated_expectation_suites=list(
+                        evaluated_expectation_suites.values()
+                    ),
+                    result_format=operator_run_kwargs["result_format"],
+                )
+
+            batch_load_time: float
+            validation_operator_result: ValidationOperatorResult
+            run_result: dict
+            for prepared_validation, validator, batch_load_time in zip(
+                prepared_validations, validators, batch_load_times
+            ):
+                idx = prepared_validation["idx"]
+                validation_operator_result = prepared_validation[
+                    "action_list_validation_operator"
+                ].run(
+                    assets_to_validate=[validator],
+                    run_id=run_id,
+                    metrics=metrics,
+                    evaluated_expectation_suite=evaluated_expectation_suites.get(idx),
+                    **prepared_validation["operator_run_kwargs"],
+                )
+                for run_result in validation_operator_result.run_results.values():
+                    run_result["batch_load_time"] = batch_load_time
+
+                validation_operator_results[idx] = validation_operator_result
         except (
             ge_exceptions.CheckpointError,
             ge_exceptions.ExecutionEngineError,
@@ -410,6 +572,112 @@ class BaseCheckpoint(ConfigPeer):
                 f"Exception occurred while running validation[{idx}] of Checkpoint '{self.name}': {e.message}."
             )
 
+        return validation_operator_results
+
+    def _group_validations_by_batch(
+        self, substituted_runtime_config: dict, validations: List[dict]
+    ) -> List[List[Tuple[int, dict]]]:
+        """
+        Groups validations (as pairs of index and validation dictionary, in order of first occurrence), whose effective
+        BatchRequest, evaluation parameters, and runtime configuration are identical (only their Expectation Suites and
+        actions differ), so that each group can be validated against Batch data loaded only once.
+
+        Validations, whose Expectation Suites depend on results of other validations (through evaluation parameters),
+        are never grouped, so that actions of preceding validations (e.g., storing evaluation parameters) run first.
+        """
+        groups: Dict[Any, List[Tuple[int, dict]]] = {}
+        substituted_validation_dicts: Dict[int, dict] = {}
+
+        idx: int
+        validation_dict: dict
+        substituted_validation_dict: dict
+        batch_request: Optional[BatchRequestBase]
+        key: Any
+        for idx, validation_dict in enumerate(validations):
+            key = idx
+            try:
+                substituted_validation_dict = get_substituted_validation_dict(
+                    substituted_runtime_config=substituted_runtime_config,
+                    validation_dict=validation_dict,
+                )
+                substituted_validation_dicts[idx] = substituted_validation_dict
+                batch_request = substituted_validation_dict.get("batch_request")
+                # Batch data, supplied in memory, is not compared (such validations are not grouped).
+                if batch_request is not None and not batch_request_contains_batch_data(
+                    batch_request=batch_request
+                ):
+                    key = (
+                        batch_request.id,
+                        json.dumps(
+                            {
+                                "evaluation_parameters": substituted_validation_dict.get(
+                                    "evaluation_parameters"
+                                ),
+                                "runtime_configuration": substituted_validation_dict.get(
+                                    "runtime_configuration"
+                                ),
+                                "include_rendered_content": substituted_validation_dict.get(
+                                    "include_rendered_content"
+                                ),
+                            },
+                            sort_keys=True,
+                            default=str,
+                        ),
+                    )
+            except ge_exceptions.CheckpointError:
+                # Invalid validations are not grouped (errors are reported, when these validations are run).
+                pass
+
+            groups.setdefault(key, []).append((idx, validation_dict))
+
+        # Expectation Suites are only loaded (for inspecting their dependencies) when grouping is possible.
+        validation_groups: List[List[Tuple[int, dict]]] = []
+        validation_group: List[Tuple[int, dict]]
+        for validation_group in groups.values():
+            if len(validation_group) == 1:
+                validation_groups.append(validation_group)
+                continue
+
+            independent_validations: List[Tuple[int, dict]] = []
+            for idx, validation_dict in validation_group:
+                if self._depends_on_validation_results(
+                    substituted_validation_dict=substituted_validation_dicts[idx]
+                ):
+                    validation_groups.append([(idx, validation_dict)])
+                else:
+                    independent_validations.append((idx, validation_dict))
+
+            if independent_validations:
+                validation_groups.append(independent_validations)
+
+        # Groups are run in order of their first validations.
+        return sorted(validation_groups, key=lambda group: group[0][0])
+
+    def _depends_on_validation_results(self, substituted_validation_dict: dict) -> bool:
+        """
+        Returns True if evaluation parameters of the Expectation Suite of the validation refer to results of other
+        validations (e.g., "urn:great_expectations:validations:..."), or if the Expectation Suite cannot be loaded.
+        """
+        try:
+            expectation_suite: ExpectationSuite
+            if self.data_context.ge_cloud_mode:
+                expectation_suite = self.data_context.get_expectation_suite(
+                    ge_cloud_id=substituted_validation_dict.get(
+                        "expectation_suite_ge_cloud_id"
+                    )
+                )
+            else:
+                expectation_suite = self.data_context.get_expectation_suite(
+                    expectation_suite_name=substituted_validation_dict.get(
+                        "expectation_suite_name"
+                    )
+                )
+        except ge_exceptions.GreatExpectationsError:
+            # Errors are reported, when this validation is run.
+            return True
+
+        return len(expectation_suite.get_evaluation_parameter_dependencies()) > 0
+
     def self_check(self, pretty_print=True) -> dict:
         # Provide visibility into parameters that Checkpoint was instantiated with.
         report_object: dict = {"config": self.config.to_json_dict()}
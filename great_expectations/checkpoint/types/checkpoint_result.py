@@ -31,6 +31,9 @@ class CheckpointResult(SerializableDictDot):
     might have an extra key named "expectation_suite_severity_level" to indicate if the suite is at either a
     "warning" or "failure" level.
 
+    Run results, produced by Checkpoint, also have a "batch_load_time" key, containing the time (in seconds) spent
+    loading Batch data and Expectation Suite of the validation (separately from the time spent validating).
+
     e.g.
     {
         ValidationResultIdentifier: {
@@ -262,12 +265,18 @@ class CheckpointResult(SerializableDictDot):
                 and (successful_validation_count / validation_result_count) * 100
             )
 
+            batch_load_time = sum(
+                run_result.get("batch_load_time", 0.0)
+                for run_result in self.run_results.values()
+            )
+
             self._statistics = {
                 "data_asset_count": data_asset_count,
                 "validation_result_count": validation_result_count,
                 "successful_validation_count": successful_validation_count,
                 "unsuccessful_validation_count": unsuccessful_validation_count,
                 "successful_validation_percent": successful_validation_percent,
+                "batch_load_time": batch_load_time,
                 "validation_statistics": self._list_validation_statistics(),
             }
 
@@ -1,6 +1,7 @@
 import copy
 import json
 import logging
+import weakref
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
@@ -1001,6 +1002,7 @@ class ExpectationConfiguration(SerializableDictDot):
 
         self._raw_kwargs = self._kwargs
         self._kwargs = evaluation_args
+        self._notify_modification_observers()
         if len(substituted_parameters) > 0:
             self.meta["substituted_parameters"] = substituted_parameters
 
@@ -1051,6 +1053,7 @@ class ExpectationConfiguration(SerializableDictDot):
     @ge_cloud_id.setter
     def ge_cloud_id(self, value: str) -> None:
         self._ge_cloud_id = value
+        self._notify_modification_observers()
 
     @property
     def expectation_context(self) -> Optional[ExpectationContext]:
@@ -1066,11 +1069,44 @@ class ExpectationConfiguration(SerializableDictDot):
 
     @property
     def kwargs(self) -> dict:
+        # Returned dictionary may be modified in place; hence, observers are notified of every access.
+        self._notify_modification_observers()
         return self._kwargs
 
     @kwargs.setter
     def kwargs(self, value: dict) -> None:
         self._kwargs = value
+        self._notify_modification_observers()
+
+    def _add_modification_observer(self, observer: Any) -> None:
+        """
+        Registers observer (e.g., index of ExpectationSuite), whose "expectation_configuration_modified()" method is
+        called whenever kwargs (or "ge_cloud_id") of this ExpectationConfiguration may have been modified.  Observers are
+        referenced weakly.
+        """
+        observers: Optional[weakref.WeakSet] = getattr(
+            self, "_modification_observers", None
+        )
+        if observers is None:
+            observers = weakref.WeakSet()
+            self._modification_observers = observers
+
+        observers.add(observer)
+
+    def _notify_modification_observers(self) -> None:
+        observers: Optional[weakref.WeakSet] = getattr(
+            self, "_modification_observers", None
+        )
+        if observers:
+            observer: Any
+            for observer in observers:
+                observer.expectation_configuration_modified(self)
+
+    def __getstate__(self) -> dict:
+        # Observers are bound to this very object; hence, they are neither copied nor pickled.
+        state: dict = self.__dict__.copy()
+        state.pop("_modification_observers", None)
+        return state
 
     @property
     def rendered_content(self) -> Optional[List[RenderedAtomicContent]]:
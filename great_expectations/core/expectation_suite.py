@@ -1,10 +1,22 @@
 import datetime
 import json
 import logging
+import operator
 import pprint
 import uuid
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import great_expectations as ge
 from great_expectations import __version__ as ge_version
@@ -45,6 +57,314 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Stands in for unhashable values (other than dictionaries, lists, tuples, and sets) in keys of expectation indexes.
+_UNHASHABLE_VALUE = object()
+
+
+def _to_hashable(value: Any) -> Hashable:
+    """Converts value to hashable value, which compares equal to hashable values of all values comparing equal to it."""
+    if isinstance(value, dict):
+        return frozenset((key, _to_hashable(element)) for key, element in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_hashable(element) for element in value)
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_to_hashable(element) for element in value)
+
+    try:
+        hash(value)
+    except TypeError:
+        return _UNHASHABLE_VALUE
+
+    return value
+
+
+class _ExpectationConfigurationList(list):
+    """
+    List of the ExpectationConfiguration objects of an ExpectationSuite, which counts its modifications, so that
+    "_ExpectationConfigurationIndex" detects these without comparing the list with the indexed one element by element.
+    """
+
+    # Class attribute serves as initial value (copies are populated before their attributes are restored).
+    modification_count: int = 0
+
+    def __setitem__(self, key, value) -> None:
+        self.modification_count += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        self.modification_count += 1
+        super().__delitem__(key)
+
+    # Overrides of in-place operators return the list itself, like those of "list" (which typeshed also exempts).
+    def __iadd__(self, other):  # type: ignore[misc]
+        self.modification_count += 1
+        return super().__iadd__(other)
+
+    def __imul__(self, other):  # type: ignore[misc]
+        self.modification_count += 1
+        return super().__imul__(other)
+
+    def append(self, value) -> None:
+        self.modification_count += 1
+        super().append(value)
+
+    def extend(self, values) -> None:
+        self.modification_count += 1
+        super().extend(values)
+
+    def insert(self, index, value) -> None:
+        self.modification_count += 1
+        super().insert(index, value)
+
+    def pop(self, index=-1):
+        self.modification_count += 1
+        return super().pop(index)
+
+    def remove(self, value) -> None:
+        self.modification_count += 1
+        super().remove(value)
+
+    def clear(self) -> None:
+        self.modification_count += 1
+        super().clear()
+
+    def sort(self, *args, **kwargs) -> None:
+        self.modification_count += 1
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self.modification_count += 1
+        super().reverse()
+
+
+class _ExpectationConfigurationIndex:
+    """
+    Hash indexes of the ExpectationConfiguration objects of an ExpectationSuite (by position), keyed by expectation type
+    and domain kwargs, by expectation type and success kwargs, and by "ge_cloud_id", so that ExpectationConfiguration
+    objects matching a candidate are found without comparing the candidate to every ExpectationConfiguration.
+
+    Indexes only narrow down candidates; matches are still decided by "ExpectationConfiguration.isEquivalentTo()".
+    Since the list of ExpectationConfiguration objects can be modified (or replaced) directly, it is checked for
+    modifications prior to every lookup (using its modification count, if it is "_ExpectationConfigurationList", or by
+    comparing identities of its elements with the indexed ones, otherwise), and indexes are rebuilt, if it has been
+    modified.  ExpectationConfiguration objects can also be modified in place; the index observes them, and only those,
+    whose kwargs (or "ge_cloud_id") may have been modified since the previous lookup, are re-indexed.
+    """
+
+    def __init__(self) -> None:
+        # List of ExpectationConfiguration objects, which was indexed, and its modification count at that time.
+        self._source: Optional[List[ExpectationConfiguration]] = None
+        self._source_modification_count: Optional[int] = None
+        self._expectations: List[ExpectationConfiguration] = []
+        # Domain key, success key (both None, if kwargs could not be determined), and "ge_cloud_id" key, by position.
+        self._keys: List[Tuple[Optional[Hashable], Optional[Hashable], str]] = []
+        self._domain_index: Dict[Hashable, List[int]] = {}
+        self._success_index: Dict[Hashable, List[int]] = {}
+        self._ge_cloud_id_index: Dict[str, List[int]] = {}
+        # Positions of ExpectationConfiguration objects, whose kwargs could not be determined (always candidates).
+        self._unindexed: List[int] = []
+        # Positions of ExpectationConfiguration objects, keyed by their identities.
+        self._positions: Dict[int, List[int]] = {}
+        # Identities of ExpectationConfiguration objects, which may have been modified since they were indexed.
+        self._modified: Set[int] = set()
+
+    def sync(self, expectations: List[ExpectationConfiguration]) -> None:
+        """Rebuilds indexes, if given list of ExpectationConfiguration objects differs from the indexed one."""
+        modification_count: Optional[int] = getattr(
+            expectations, "modification_count", None
+        )
+        if expectations is self._source and modification_count is not None:
+            if modification_count == self._source_modification_count:
+                self._reindex_modified_expectations()
+                return
+        elif len(expectations) == len(self._expectations) and not any(
+            map(operator.is_not, expectations, self._expectations)
+        ):
+            self._source = expectations
+            self._source_modification_count = modification_count
+            self._reindex_modified_expectations()
+            return
+
+        self._source = expectations
+        self._source_modification_count = modification_count
+
+        indexed_keys: Dict[int, Tuple[Optional[Hashable], Optional[Hashable], str]] = {
+            id(expectation): keys
+            for expectation, keys in zip(self._expectations, self._keys)
+        }
+        self._expectations = list(expectations)
+        self._keys = []
+        expectation: ExpectationConfiguration
+        for expectation in self._expectations:
+            if id(expectation) in indexed_keys:
+                self._keys.append(indexed_keys[id(expectation)])
+            else:
+                self._keys.append(self._get_keys(expectation_configuration=expectation))
+                self._observe(expectation_configuration=expectation)
+
+        self._build_indexes()
+        self._reindex_modified_expectations()
+
+    def append(self, expectation_configuration: ExpectationConfiguration) -> None:
+        """Indexes ExpectationConfiguration, which was just appended to the indexed list."""
+        self._expectations.append(expectation_configuration)
+        self._keys.append(
+            self._get_keys(expectation_configuration=expectation_configuration)
+        )
+        self._add_to_indexes(position=len(self._expectations) - 1)
+        self._observe(expectation_configuration=expectation_configuration)
+        self._acknowledge_source_modification()
+
+    def replace(
+        self, position: int, expectation_configuration: ExpectationConfiguration
+    ) -> None:
+        """Re-indexes ExpectationConfiguration at given position of the indexed list (which was just set or patched)."""
+        self._remove_from_indexes(position=position)
+        self._expectations[position] = expectation_configuration
+        self._keys[position] = self._get_keys(
+            expectation_configuration=expectation_configuration
+        )
+        self._add_to_indexes(position=position)
+        self._observe(expectation_configuration=expectation_configuration)
+        self._acknowledge_source_modification()
+
+    def remove(self, positions: List[int]) -> None:
+        """Removes ExpectationConfiguration objects at given positions, which were just removed from the indexed list."""
+        position: int
+        for position in sorted(positions, reverse=True):
+            self._expectations.pop(position)
+            self._keys.pop(position)
+
+        self._build_indexes()
+        self._acknowledge_source_modification()
+
+    def find_candidates(
+        self,
+        expectation_configuration: ExpectationConfiguration,
+        match_type: str,
+    ) -> Optional[List[int]]:
+        """
+        Returns positions of ExpectationConfiguration objects, which may match given ExpectationConfiguration on given
+        match_type (or None, if kwargs of given ExpectationConfiguration could not be determined).
+        """
+        domain_key: Optional[Hashable]
+        success_key: Optional[Hashable]
+        domain_key, success_key, _ = self._get_keys(
+            expectation_configuration=expectation_configuration
+        )
+        if domain_key is None:
+            return None
+
+        # Matching on success kwargs (or on all kwargs) implies matching on domain kwargs.
+        candidates: List[int]
+        if match_type == "success":
+            candidates = self._success_index.get(success_key, [])
+        else:
+            candidates = self._domain_index.get(domain_key, [])
+
+        return sorted(candidates + self._unindexed)
+
+    def find_by_ge_cloud_id(self, ge_cloud_id: Union[str, uuid.UUID]) -> List[int]:
+        return sorted(self._ge_cloud_id_index.get(str(ge_cloud_id), []))
+
+    def expectation_configuration_modified(
+        self, expectation_configuration: ExpectationConfiguration
+    ) -> None:
+        """Called by observed ExpectationConfiguration, whose kwargs (or "ge_cloud_id") may have been modified."""
+        self._modified.add(id(expectation_configuration))
+
+    def _observe(self, expectation_configuration: ExpectationConfiguration) -> None:
+        # Keys have just been computed; hence, ExpectationConfiguration is not (yet) considered modified.
+        expectation_configuration._add_modification_observer(observer=self)
+        self._modified.discard(id(expectation_configuration))
+
+    def _reindex_modified_expectations(self) -> None:
+        """Re-indexes ExpectationConfiguration objects, whose kwargs (or "ge_cloud_id") may have been modified."""
+        if not self._modified:
+            return
+
+        # Computing keys accesses kwargs (thereby notifying the index); hence, notifications are collected separately.
+        modified: Set[int] = self._modified
+        self._modified = set()
+
+        expectation_id: int
+        position: int
+        for expectation_id in modified:
+            for position in list(self._positions.get(expectation_id, [])):
+                self._remove_from_indexes(position=position)
+                self._keys[position] = self._get_keys(
+                    expectation_configuration=self._expectations[position]
+                )
+                self._add_to_indexes(position=position)
+
+        self._modified.clear()
+
+    def _acknowledge_source_modification(self) -> None:
+        self._source_modification_count = getattr(
+            self._source, "modification_count", None
+        )
+
+    @staticmethod
+    def _get_keys(
+        expectation_configuration: ExpectationConfiguration,
+    ) -> Tuple[Optional[Hashable], Optional[Hashable], str]:
+        expectation_type: str = expectation_configuration.expectation_type
+        ge_cloud_id_key: str = str(expectation_configuration.ge_cloud_id)
+        try:
+            return (
+                (
+                    expectation_type,
+                    _to_hashable(expectation_configuration.get_domain_kwargs()),
+                ),
+                (
+                    expectation_type,
+                    _to_hashable(expectation_configuration.get_success_kwargs()),
+                ),
+                ge_cloud_id_key,
+            )
+        except Exception:
+            return None, None, ge_cloud_id_key
+
+    def _build_indexes(self) -> None:
+        self._domain_index = {}
+        self._success_index = {}
+        self._ge_cloud_id_index = {}
+        self._unindexed = []
+        self._positions = {}
+        position: int
+        for position in range(len(self._expectations)):
+            self._add_to_indexes(position=position)
+
+    def _add_to_indexes(self, position: int) -> None:
+        domain_key: Optional[Hashable]
+        success_key: Optional[Hashable]
+        ge_cloud_id_key: str
+        domain_key, success_key, ge_cloud_id_key = self._keys[position]
+        self._positions.setdefault(id(self._expectations[position]), []).append(
+            position
+        )
+        self._ge_cloud_id_index.setdefault(ge_cloud_id_key, []).append(position)
+        if domain_key is None:
+            self._unindexed.append(position)
+        else:
+            self._domain_index.setdefault(domain_key, []).append(position)
+            self._success_index.setdefault(success_key, []).append(position)
+
+    def _remove_from_indexes(self, position: int) -> None:
+        domain_key: Optional[Hashable]
+        success_key: Optional[Hashable]
+        ge_cloud_id_key: str
+        domain_key, success_key, ge_cloud_id_key = self._keys[position]
+        self._positions[id(self._expectations[position])].remove(position)
+        self._ge_cloud_id_index[ge_cloud_id_key].remove(position)
+        if domain_key is None:
+            self._unindexed.remove(position)
+        else:
+            self._domain_index[domain_key].remove(position)
+            self._success_index[success_key].remove(position)
+
 
 class ExpectationSuite(SerializableDictDot):
     """
@@ -72,12 +392,12 @@ class ExpectationSuite(SerializableDictDot):
 
         if expectations is None:
             expectations = []
-        self.expectations = [
+        self.expectations = _ExpectationConfigurationList(
             ExpectationConfiguration(**expectation)
             if isinstance(expectation, dict)
             else expectation
             for expectation in expectations
-        ]
+        )
         if evaluation_parameters is None:
             evaluation_parameters = {}
         self.evaluation_parameters = evaluation_parameters
@@ -93,6 +413,7 @@ class ExpectationSuite(SerializableDictDot):
         # We require meta information to be serializable, but do not convert until necessary
         ensure_json_serializable(meta)
         self.meta = meta
+        self._expectation_index = _ExpectationConfigurationIndex()
 
     def add_citation(
         self,
@@ -204,6 +525,7 @@ class ExpectationSuite(SerializableDictDot):
             setattr(result, key, deepcopy(getattr(self, key)))
 
         setattr(result, "_data_context", self._data_context)
+        setattr(result, "_expectation_index", _ExpectationConfigurationIndex())
 
         return result
 
@@ -281,7 +603,11 @@ class ExpectationSuite(SerializableDictDot):
            Notes:
                May want to add type-checking in the future.
         """
+        expectation_index: _ExpectationConfigurationIndex = (
+            self._get_expectation_index()
+        )
         self.expectations.append(expectation_config)
+        expectation_index.append(expectation_configuration=expectation_config)
 
     def remove_expectation(
         self,
@@ -324,6 +650,7 @@ class ExpectationSuite(SerializableDictDot):
                 removed_expectations = []
                 for index in sorted(found_expectation_indexes, reverse=True):
                     removed_expectations.append(self.expectations.pop(index))
+                self._expectation_index.remove(positions=found_expectation_indexes)
                 return removed_expectations
             else:
                 raise ValueError(
@@ -332,7 +659,11 @@ class ExpectationSuite(SerializableDictDot):
                 )
 
         else:
-            return [self.expectations.pop(found_expectation_indexes[0])]
+            removed_expectation: ExpectationConfiguration = self.expectations.pop(
+                found_expectation_indexes[0]
+            )
+            self._expectation_index.remove(positions=found_expectation_indexes)
+            return [removed_expectation]
 
     def remove_all_expectations_of_type(
         self, expectation_types: Union[List[str], str]
@@ -345,11 +676,11 @@ class ExpectationSuite(SerializableDictDot):
             for expectation in self.expectations
             if expectation.expectation_type in expectation_types
         ]
-        self.expectations = [
+        self.expectations = _ExpectationConfigurationList(
             expectation
             for expectation in self.expectations
             if expectation.expectation_type not in expectation_types
-        ]
+        )
 
         return removed_expectations
 
@@ -391,8 +722,27 @@ class ExpectationSuite(SerializableDictDot):
                 "Ensure that expectation configuration is valid."
             )
 
+        expectation_index: _ExpectationConfigurationIndex = (
+            self._get_expectation_index()
+        )
+
+        candidate_indexes: Optional[List[int]] = None
+        if ge_cloud_id is not None:
+            candidate_indexes = expectation_index.find_by_ge_cloud_id(
+                ge_cloud_id=ge_cloud_id
+            )
+        elif expectation_configuration is not None:
+            candidate_indexes = expectation_index.find_candidates(
+                expectation_configuration=expectation_configuration,
+                match_type=match_type,
+            )
+
+        if candidate_indexes is None:
+            candidate_indexes = list(range(len(self.expectations)))
+
         match_indexes = []
-        for idx, expectation in enumerate(self.expectations):
+        for idx in candidate_indexes:
+            expectation = self.expectations[idx]
             if ge_cloud_id is not None:
                 if str(expectation.ge_cloud_id) == str(ge_cloud_id):
                     match_indexes.append(idx)
@@ -404,6 +754,11 @@ class ExpectationSuite(SerializableDictDot):
 
         return match_indexes
 
+    def _get_expectation_index(self) -> _ExpectationConfigurationIndex:
+        """Returns index of expectations, synchronized with "self.expectations" (which may have been modified directly)."""
+        self._expectation_index.sync(expectations=self.expectations)
+        return self._expectation_index
+
     def find_expectations(
         self,
         expectation_configuration: Optional[ExpectationConfiguration] = None,
@@ -469,10 +824,13 @@ class ExpectationSuite(SerializableDictDot):
                 "Must provide either existing_expectation_configuration or ge_cloud_id"
             )
 
+        expectation_configuration: ExpectationConfiguration
         if isinstance(new_expectation_configuration, dict):
-            new_expectation_configuration = expectationConfigurationSchema.load(
+            expectation_configuration = expectationConfigurationSchema.load(
                 new_expectation_configuration
             )
+        else:
+            expectation_configuration = new_expectation_configuration
 
         found_expectation_indexes = self.find_expectation_indexes(
             existing_expectation_configuration, match_type, ge_cloud_id
@@ -485,7 +843,11 @@ class ExpectationSuite(SerializableDictDot):
         elif len(found_expectation_indexes) == 0:
             raise ValueError("No matching Expectation was found.")
 
-        self.expectations[found_expectation_indexes[0]] = new_expectation_configuration
+        self.expectations[found_expectation_indexes[0]] = expectation_configuration
+        self._expectation_index.replace(
+            position=found_expectation_indexes[0],
+            expectation_configuration=expectation_configuration,
+        )
 
     def patch_expectation(
         self,
@@ -525,6 +887,11 @@ class ExpectationSuite(SerializableDictDot):
             )
 
         self.expectations[found_expectation_indexes[0]].patch(op, path, value)
+        # Kwargs of patched expectation may have changed; hence, it is re-indexed.
+        self._expectation_index.replace(
+            position=found_expectation_indexes[0],
+            expectation_configuration=self.expectations[found_expectation_indexes[0]],
+        )
         return self.expectations[found_expectation_indexes[0]]
 
     def _add_expectation(
@@ -585,6 +952,10 @@ class ExpectationSuite(SerializableDictDot):
                 self.expectations[
                     found_expectation_indexes[0]
                 ] = expectation_configuration
+                self._expectation_index.replace(
+                    position=found_expectation_indexes[0],
+                    expectation_configuration=expectation_configuration,
+                )
             else:
                 if send_usage_event:
                     self.send_usage_event(success=False)
@@ -1,16 +1,39 @@
 import hashlib
 import json
-from typing import Any, Optional, Set
+from typing import Any, Optional, Set, Tuple, Union
 
 
 class IDDict(dict):
+    """
+    IDDict is a dictionary, which can compute a stable identifier ("to_id()") for its contents.
+
+    Because computing the identifier involves JSON serialization and hashing, the default identifier (i.e., the one
+    obtained with no explicit "id_keys" and "id_ignore_keys" arguments) is computed once and cached.  Every mutating
+    method of the dictionary invalidates the cached identifier.  Note that in-place mutation of nested values is not
+    detected; nested values of IDDict objects used as identifiers must be treated as immutable.
+    """
+
     _id_ignore_keys: Set[str] = set()
 
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is None and id_ignore_keys is None:
+            _id: Optional[Union[str, Tuple]] = self.__dict__.get("_cached_id")
+            if _id is None:
+                _id = self._compute_id(
+                    id_keys=self.keys(), id_ignore_keys=self._id_ignore_keys
+                )
+                self.__dict__["_cached_id"] = _id
+
+            return _id
+
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
             id_ignore_keys = self._id_ignore_keys
+
+        return self._compute_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+    def _compute_id(self, id_keys, id_ignore_keys) -> Union[str, Tuple]:
         id_keys = set(id_keys) - set(id_ignore_keys)
         if len(id_keys) == 0:
             return tuple()
@@ -23,6 +46,42 @@ class IDDict(dict):
             json.dumps(_id_dict, sort_keys=True).encode("utf-8")
         ).hexdigest()
 
+    def _invalidate_id(self) -> None:
+        self.__dict__.pop("_cached_id", None)
+
+    def __setitem__(self, key, value) -> None:
+        self._invalidate_id()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        self._invalidate_id()
+        super().__delitem__(key)
+
+    def update(self, *args, **kwargs) -> None:
+        self._invalidate_id()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._invalidate_id()
+        return super().setdefault(key, default)
+
+    def pop(self, key, *args):
+        self._invalidate_id()
+        return super().pop(key, *args)
+
+    def popitem(self):
+        self._invalidate_id()
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._invalidate_id()
+        super().clear()
+
+    # In-place union returns the dictionary itself (not a new one, like "__or__"), as typeshed also declares for "dict".
+    def __ior__(self, other):  # type: ignore[misc]
+        self._invalidate_id()
+        return super().__ior__(other)
+
     @staticmethod
     def convert_dictionary_to_id_dict(data: Optional[Any]):
         """
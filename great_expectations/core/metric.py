@@ -294,3 +294,65 @@ class ValidationMetricIdentifier(MetricIdentifier):
             metric_name=metric_id.metric_name,
             metric_kwargs_id=metric_id.metric_kwargs_id,
         )
+
+
+class BatchMetricIdentifier(DataContextKey):
+    """A BatchMetricIdentifier serves as a key to store and retrieve metrics computed on the Batch data, whose contents
+    are identified by "batch_fingerprint" (so that metric values can be reused by any Batch with the same fingerprint).
+    """
+
+    def __init__(
+        self,
+        batch_fingerprint,
+        metric_name,
+        metric_domain_kwargs_id,
+        metric_value_kwargs_id,
+    ) -> None:
+        self._batch_fingerprint = batch_fingerprint
+        self._metric_name = metric_name
+        self._metric_domain_kwargs_id = metric_domain_kwargs_id
+        self._metric_value_kwargs_id = metric_value_kwargs_id
+
+    @property
+    def batch_fingerprint(self):
+        return self._batch_fingerprint
+
+    @property
+    def metric_name(self):
+        return self._metric_name
+
+    @property
+    def metric_domain_kwargs_id(self):
+        return self._metric_domain_kwargs_id
+
+    @property
+    def metric_value_kwargs_id(self):
+        return self._metric_value_kwargs_id
+
+    def to_tuple(self):
+        return (
+            self.batch_fingerprint,
+            self.metric_name,
+            self.metric_domain_kwargs_id or "__",
+            self.metric_value_kwargs_id or "__",
+        )
+
+    def to_fixed_length_tuple(self):
+        return self.to_tuple()
+
+    @classmethod
+    def from_tuple(cls, tuple_):
+        if len(tuple_) != 4:
+            raise GreatExpectationsError(
+                "BatchMetricIdentifier tuple must have exactly four components."
+            )
+        return cls(
+            batch_fingerprint=tuple_[0],
+            metric_name=tuple_[1],
+            metric_domain_kwargs_id=None if tuple_[2] == "__" else tuple_[2],
+            metric_value_kwargs_id=None if tuple_[3] == "__" else tuple_[3],
+        )
+
+    @classmethod
+    def from_fixed_length_tuple(cls, tuple_):
+        return cls.from_tuple(tuple_)
@@ -61,6 +61,9 @@ class UsageStatisticsHandler:
         self._data_context = data_context
         self._ge_version = ge_version
 
+        # Durations of events are kept per thread, since decorated methods may be called from multiple threads at once.
+        self._event_durations = threading.local()
+
         self._message_queue = Queue()
         self._worker = threading.Thread(target=self._requests_worker, daemon=True)
         self._worker.start()
@@ -179,8 +182,8 @@ class UsageStatisticsHandler:
         event_duration_property_name: str = f'{message["event"]}.duration'.replace(
             ".", "_"
         )
-        if hasattr(self, event_duration_property_name):
-            delta_t: int = getattr(self, event_duration_property_name)
+        if hasattr(self._event_durations, event_duration_property_name):
+            delta_t: int = getattr(self._event_durations, event_duration_property_name)
             message["event_duration"] = delta_t
 
         return message
@@ -308,9 +311,11 @@ def usage_statistics_enabled_method(
                     event_duration_property_name: str = (
                         f"{event_name}.duration".replace(".", "_")
                     )
-                    setattr(handler, event_duration_property_name, delta_t)
+                    setattr(
+                        handler._event_durations, event_duration_property_name, delta_t
+                    )
                     handler.emit(message)
-                    delattr(handler, event_duration_property_name)
+                    delattr(handler._event_durations, event_duration_property_name)
 
             return result
 
@@ -1,7 +1,7 @@
 import logging
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import pyparsing as pp
 
@@ -19,6 +19,10 @@ class StoreBackend(metaclass=ABCMeta):
       - _set
       - list_keys
       - _has_key
+
+    Implementations, able to fetch or store values of multiple keys in bulk, may also provide implementations of:
+      - _get_many
+      - _set_many
     """
 
     IGNORED_FILES = [".ipynb_checkpoints"]
@@ -120,6 +124,13 @@ class StoreBackend(metaclass=ABCMeta):
         value = self._get(key, **kwargs)
         return value
 
+    def get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        """Returns values of given keys (in the same order), fetched in bulk, if this StoreBackend supports it."""
+        for key in keys:
+            self._validate_key(key)
+
+        return self._get_many(keys, **kwargs)
+
     def set(self, key, value, **kwargs):
         self._validate_key(key)
         self._validate_value(value)
@@ -130,6 +141,20 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def set_many(self, key_value_pairs: List[Tuple[tuple, Any]], **kwargs) -> None:
+        """Stores given (key, value) pairs in bulk (e.g., in one transaction), if this StoreBackend supports it."""
+        for key, value in key_value_pairs:
+            self._validate_key(key)
+            self._validate_value(value)
+
+        try:
+            self._set_many(key_value_pairs, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError(
+                "ValueError while calling _set_many on store backend."
+            )
+
     def move(self, source_key, dest_key, **kwargs):
         self._validate_key(source_key)
         self._validate_key(dest_key)
@@ -173,10 +198,17 @@ class StoreBackend(metaclass=ABCMeta):
     def _get(self, key) -> None:
         raise NotImplementedError
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        return [self._get(key, **kwargs) for key in keys]
+
     @abstractmethod
     def _set(self, key, value, **kwargs) -> None:
         raise NotImplementedError
 
+    def _set_many(self, key_value_pairs: List[Tuple[tuple, Any]], **kwargs) -> None:
+        for key, value in key_value_pairs:
+            self._set(key, value, **kwargs)
+
     @abstractmethod
     def _move(self, source_key, dest_key, **kwargs) -> None:
         raise NotImplementedError
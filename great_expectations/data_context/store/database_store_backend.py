@@ -1,7 +1,7 @@
 import logging
 import uuid
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.data_context.store.store_backend import StoreBackend
@@ -13,7 +13,7 @@ from great_expectations.util import (
 
 try:
     import sqlalchemy as sa
-    from sqlalchemy import Column, MetaData, String, Table, and_, column, select
+    from sqlalchemy import Column, MetaData, String, Table, and_, column, or_, select
     from sqlalchemy.engine.url import URL
     from sqlalchemy.exc import IntegrityError, NoSuchTableError, SQLAlchemyError
 
@@ -22,11 +22,30 @@ except ImportError:
     sa = None
     create_engine = None
 
+try:
+    # "INSERT ... ON CONFLICT" of SQLite dialect is available in SQLAlchemy 1.4 and later.
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+except ImportError:
+    sqlite_insert = None
+
 
 logger = logging.getLogger(__name__)
 
 
 class DatabaseStoreBackend(StoreBackend):
+    """
+    DatabaseStoreBackend stores values in a table of a database (created, if it does not exist), keyed by "key_columns".
+
+    Keyword arguments, other than those listed in the signature of the constructor, are passed to
+    "sqlalchemy.create_engine()"; hence, the pool of connections to the database can be configured (e.g., with
+    "pool_size", "max_overflow", "pool_recycle", and "pool_pre_ping"), so that frequent validations do not exhaust the
+    connections of the database.
+    """
+
+    # Keys, fetched by one query of "get_many()", are limited, so that the number of bind parameters (one per key column
+    # of every key) stays within the limits of all supported dialects (e.g., 999 for older SQLite versions).
+    MAX_BIND_PARAMETERS_PER_QUERY = 900
+
     def __init__(  # noqa: C901 - 16
         self,
         table_name,
@@ -170,9 +189,15 @@ class DatabaseStoreBackend(StoreBackend):
             create_engine_kwargs["connect_args"] = connect_args
 
         if "private_key_path" in credentials:
-            options, create_engine_kwargs = self._get_sqlalchemy_key_pair_auth_url(
-                drivername, credentials
-            )
+            (
+                options,
+                key_pair_create_engine_kwargs,
+            ) = self._get_sqlalchemy_key_pair_auth_url(drivername, credentials)
+            # Other kwargs (e.g., settings of the connection pool) are kept, along with the private key.
+            create_engine_kwargs["connect_args"] = {
+                **create_engine_kwargs.get("connect_args", {}),
+                **key_pair_create_engine_kwargs["connect_args"],
+            }
         else:
             options = get_sqlalchemy_url(drivername, **credentials)
 
@@ -250,31 +275,174 @@ class DatabaseStoreBackend(StoreBackend):
             logger.debug(f"Error fetching value: {str(e)}")
             raise ge_exceptions.StoreError(f"Unable to fetch value for key: {str(key)}")
 
-    def _set(self, key, value, allow_update=True, **kwargs) -> None:
-        cols = {k: v for (k, v) in zip(self.key_columns, key)}
-        cols["value"] = value
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        values: Dict[tuple, Any] = {}
+        batch_size: int = max(
+            1, self.MAX_BIND_PARAMETERS_PER_QUERY // len(self.key_columns)
+        )
+        offset: int
+        for offset in range(0, len(keys), batch_size):
+            sel = (
+                select(
+                    [column(key_col) for key_col in self.key_columns]
+                    + [column("value")]
+                )
+                .select_from(self._table)
+                .where(
+                    or_(
+                        *(
+                            and_(
+                                *(
+                                    getattr(self._table.columns, key_col) == val
+                                    for key_col, val in zip(self.key_columns, key)
+                                )
+                            )
+                            for key in keys[offset : offset + batch_size]
+                        )
+                    )
+                )
+            )
+            try:
+                rows = self.engine.execute(sel).fetchall()
+            except SQLAlchemyError as e:
+                logger.debug(f"Error fetching values: {str(e)}")
+                raise ge_exceptions.StoreError(
+                    f"Unable to fetch values for {len(keys)} keys"
+                )
 
-        if allow_update:
-            if self.has_key(key):  # noqa: W601
-                ins = (
-                    self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
-                    .values(**cols)
+            for row in rows:
+                values[tuple(row[:-1])] = row[-1]
+
+        key: tuple
+        for key in keys:
+            if key not in values:
+                raise ge_exceptions.StoreError(
+                    f"Unable to fetch value for key: {str(key)}"
                 )
-            else:
-                ins = self._table.insert().values(**cols)
-        else:
-            ins = self._table.insert().values(**cols)
 
+        return [values[key] for key in keys]
+
+    def _set(self, key, value, allow_update=True, **kwargs) -> None:
+        if allow_update:
+            self._set_many([(key, value)])
+            return
+
+        cols = self._get_row(key=key, value=value)
+        ins = self._table.insert().values(**cols)
         try:
             self.engine.execute(ins)
         except IntegrityError as e:
-            if self._get(key) == value:
-                logger.info(f"Key {str(key)} already exists with the same value.")
-            else:
-                raise ge_exceptions.StoreBackendError(
-                    f"Integrity error {str(e)} while trying to store key"
+            self._check_stored_value(key=key, value=value, error=e)
+
+    def _set_many(self, key_value_pairs: List[Tuple[tuple, Any]], **kwargs) -> None:
+        # Rows are deduplicated by key (the last value is stored), since an upsert cannot affect the same row twice.
+        rows: Dict[tuple, dict] = {
+            tuple(key): self._get_row(key=key, value=value)
+            for key, value in key_value_pairs
+        }
+        if not rows:
+            return
+
+        try:
+            with self.engine.begin() as connection:
+                self._upsert(connection=connection, rows=list(rows.values()))
+        except IntegrityError:
+            # Another writer may have inserted a key between its update and insert (without native upsert), which
+            # rolled back all rows, so rows are stored again one at a time.
+            key: tuple
+            row: dict
+            for key, row in rows.items():
+                try:
+                    with self.engine.begin() as connection:
+                        self._upsert(connection=connection, rows=[row])
+                except IntegrityError as e:
+                    self._check_stored_value(key=key, value=row["value"], error=e)
+
+    def _check_stored_value(
+        self, key: tuple, value: Any, error: "IntegrityError"
+    ) -> None:
+        if self._get(key) == value:
+            logger.info(f"Key {str(key)} already exists with the same value.")
+        else:
+            raise ge_exceptions.StoreBackendError(
+                f"Integrity error {str(error)} while trying to store key"
+            )
+
+    def _get_row(self, key: tuple, value: Any) -> dict:
+        row: dict = {k: v for (k, v) in zip(self.key_columns, key)}
+        row["value"] = value
+        return row
+
+    def _upsert(self, connection: "sa.engine.Connection", rows: List[dict]) -> None:
+        """
+        Inserts given rows, or updates values of rows with the same keys, using the native upsert of the dialect
+        ("INSERT ... ON CONFLICT" with PostgreSQL and SQLite, "INSERT ... ON DUPLICATE KEY UPDATE" with MySQL), if the
+        key columns are the primary key of the table; otherwise, rows are updated, and inserted, if not present.
+        """
+        if self._supports_native_upsert():
+            batch_size: int = max(
+                1, self.MAX_BIND_PARAMETERS_PER_QUERY // (len(self.key_columns) + 1)
+            )
+            offset: int
+            for offset in range(0, len(rows), batch_size):
+                connection.execute(
+                    self._build_upsert_statement(
+                        rows=rows[offset : offset + batch_size]
+                    )
                 )
+            return
+
+        row: dict
+        for row in rows:
+            result = connection.execute(
+                self._table.update()
+                .where(
+                    and_(
+                        *(
+                            getattr(self._table.columns, key_col) == row[key_col]
+                            for key_col in self.key_columns
+                        )
+                    )
+                )
+                .values(value=row["value"])
+            )
+            if result.rowcount == 0:
+                connection.execute(self._table.insert().values(**row))
+
+    def _supports_native_upsert(self) -> bool:
+        # Conflicts are detected on the primary key, which tables not created by this StoreBackend may lack.
+        if {col.name for col in self._table.primary_key.columns} != set(
+            self.key_columns
+        ):
+            return False
+
+        dialect_name: str = self.engine.dialect.name
+        if dialect_name == "sqlite":
+            # "INSERT ... ON CONFLICT" requires SQLite version 3.24.0 or later.
+            return sqlite_insert is not None and (
+                self.engine.dialect.server_version_info or ()
+            ) >= (3, 24, 0)
+
+        return dialect_name in ("postgresql", "mysql")
+
+    def _build_upsert_statement(self, rows: List[dict]) -> Any:
+        dialect_name: str = self.engine.dialect.name
+        if dialect_name == "mysql":
+            from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+            stmt = mysql_insert(self._table).values(rows)
+            return stmt.on_duplicate_key_update(value=stmt.inserted.value)
+
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
+            stmt = postgresql_insert(self._table).values(rows)
+        else:
+            stmt = sqlite_insert(self._table).values(rows)
+
+        return stmt.on_conflict_do_update(
+            index_elements=self.key_columns, set_={"value": stmt.excluded.value}
+        )
 
     def _move(self) -> None:  # type: ignore[override]
         raise NotImplementedError
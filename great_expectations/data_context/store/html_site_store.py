@@ -1,3 +1,4 @@
+import json
 import logging
 import os
 import re
@@ -222,11 +223,34 @@ class HtmlSiteStore:
                 class_name=store_backend["class_name"],
             )
 
+        manifest_config_defaults = {
+            "module_name": module_name,
+            "filepath_template": "site_manifest.json",
+            "suppress_store_backend_id": True,
+        }
+        if is_ge_cloud_store:
+            manifest_config_defaults = {
+                "module_name": module_name,
+                "suppress_store_backend_id": True,
+            }
+        manifest_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults=manifest_config_defaults,
+        )
+        if not manifest_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
         self.store_backends = {
             ExpectationSuiteIdentifier: expectation_suite_identifier_obj,
             ValidationResultIdentifier: validation_result_idendifier_obj,
             "index_page": index_page_obj,
             "static_assets": static_assets_obj,
+            "manifest": manifest_obj,
         }
 
         # NOTE: Instead of using the filesystem as the source of record for keys,
@@ -366,6 +390,33 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def get_manifest(self) -> dict:
+        """Returns the manifest of rendered pages, written by the last incremental build of the site (empty, if none).
+
+        The manifest maps names of site sections to entries, keyed by the source store key of every rendered page, which
+        hold the hash of the rendered resource and the summary of the resource shown on the index page.
+        """
+        store_backend = self.store_backends["manifest"]
+        if not store_backend.has_key(()):  # noqa: W601
+            return {}
+
+        try:
+            return json.loads(store_backend.get(()))
+        except ValueError:
+            logger.warning(
+                "Data Docs site manifest could not be read; all pages will be rendered."
+            )
+            return {}
+
+    def write_manifest(self, manifest: dict):
+        """Like the index page, the manifest uses a zero-length tuple as a key."""
+        return self.store_backends["manifest"].set(
+            (),
+            json.dumps(manifest, sort_keys=True),
+            content_encoding="utf-8",
+            content_type="application/json; charset=utf-8",
+        )
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
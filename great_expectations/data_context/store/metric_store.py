@@ -1,6 +1,11 @@
 import json
+from typing import Any, Dict, List, Optional, Set
 
-from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.core.data_context_key import DataContextKey
+from great_expectations.core.metric import (
+    BatchMetricIdentifier,
+    ValidationMetricIdentifier,
+)
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.core.util import ensure_json_serializable
 from great_expectations.data_context.store.database_store_backend import (
@@ -101,12 +106,105 @@ class EvaluationParameterStore(MetricStore):
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
     def get_bind_params(self, run_id: RunIdentifier) -> dict:
-        params = {}
-        for k in self._store_backend.list_keys(run_id.to_tuple()):
-            key = self.tuple_to_key(k)
-            params[key.to_evaluation_parameter_urn()] = self.get(key)  # type: ignore[attr-defined]
-        return params
+        keys: List[DataContextKey] = [
+            self.tuple_to_key(k)
+            for k in self._store_backend.list_keys(run_id.to_tuple())
+        ]
+        # Values of all metrics of the run are fetched at once (e.g., in one query with DatabaseStoreBackend).
+        values: List[Optional[Any]] = self.get_many(keys)
+        return {
+            key.to_evaluation_parameter_urn(): value  # type: ignore[attr-defined]
+            for key, value in zip(keys, values)
+        }
+
+    @property
+    def config(self) -> dict:
+        return self._config
+
+
+class BatchMetricStore(MetricStore):
+    """
+    A BatchMetricStore stores values of metrics, resolved by an ExecutionEngine, keyed by the fingerprint of the Batch
+    data and by the metric "id", so that metrics of immutable Batch data need not be recomputed by subsequent runs.
+    """
+
+    _key_class = BatchMetricIdentifier  # type: ignore[assignment]
+
+    def __init__(self, store_backend=None, store_name=None) -> None:
+        if store_backend is not None:
+            store_backend_module_name = store_backend.get(
+                "module_name", "great_expectations.data_context.store"
+            )
+            store_backend_class_name = store_backend.get(
+                "class_name", "InMemoryStoreBackend"
+            )
+            verify_dynamic_loading_support(module_name=store_backend_module_name)
+            store_backend_class = load_class(
+                store_backend_class_name, store_backend_module_name
+            )
+
+            # Store Backend Class was loaded successfully; verify that it is of a correct subclass.
+            if issubclass(store_backend_class, DatabaseStoreBackend):
+                # Provide defaults for this common case
+                store_backend["table_name"] = store_backend.get(
+                    "table_name", "ge_batch_metrics"
+                )
+                store_backend["key_columns"] = store_backend.get(
+                    "key_columns",
+                    [
+                        "batch_fingerprint",
+                        "metric_name",
+                        "metric_domain_kwargs_id",
+                        "metric_value_kwargs_id",
+                    ],
+                )
+        super().__init__(store_backend=store_backend, store_name=store_name)
+
+        # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
+        # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
+        self._config = {
+            "store_backend": store_backend,
+            "store_name": store_name,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
     @property
     def config(self) -> dict:
         return self._config
+
+    def get_persisted_values(
+        self,
+        keys: List[BatchMetricIdentifier],
+        persisted_key_tuples: Optional[Dict[str, Set[tuple]]] = None,
+    ) -> Dict[BatchMetricIdentifier, Any]:
+        """
+        Returns values of those of given keys that are persisted, fetched in bulk: keys of every Batch fingerprint are
+        listed once, and values of persisted keys are fetched with one "get_many()" call.
+
+        If "persisted_key_tuples" (key tuples, keyed by Batch fingerprint) is given, it serves as a cache: only keys of
+        Batch fingerprints missing from it are listed (and added to it).
+        """
+        if persisted_key_tuples is None:
+            persisted_key_tuples = {}
+
+        batch_fingerprint: str
+        for batch_fingerprint in {key.batch_fingerprint for key in keys}:
+            if batch_fingerprint not in persisted_key_tuples:
+                persisted_key_tuples[batch_fingerprint] = {
+                    tuple(key_tuple)
+                    for key_tuple in self._store_backend.list_keys(
+                        prefix=(batch_fingerprint,)
+                    )
+                }
+
+        persisted_keys: List[BatchMetricIdentifier] = [
+            key
+            for key in keys
+            if self.key_to_tuple(key) in persisted_key_tuples[key.batch_fingerprint]
+        ]
+        if not persisted_keys:
+            return {}
+
+        return dict(zip(persisted_keys, self.get_many(persisted_keys)))
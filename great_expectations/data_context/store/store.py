@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
 
 from great_expectations.core.configuration import AbstractConfig
 from great_expectations.core.data_context_key import DataContextKey
@@ -160,6 +160,20 @@ class Store:
         else:
             return None
 
+    def get_many(self, keys: Sequence[DataContextKey]) -> List[Optional[Any]]:
+        """Returns values of given keys (in the same order), fetched from the StoreBackend in bulk."""
+        if self.ge_cloud_mode:
+            return [self.get(key) for key in keys]
+
+        key: DataContextKey
+        for key in keys:
+            self._validate_key(key)
+
+        values: List[Any] = self._store_backend.get_many(
+            [self.key_to_tuple(key) for key in keys]
+        )
+        return [self.deserialize(value) if value else None for value in values]
+
     def set(self, key: DataContextKey, value: Any, **kwargs) -> None:
         if key == StoreBackend.STORE_BACKEND_ID_KEY:
             return self._store_backend.set(key, value, **kwargs)
@@ -169,6 +183,23 @@ class Store:
             self.key_to_tuple(key), self.serialize(value), **kwargs
         )
 
+    def set_many(self, key_value_pairs: List[Tuple[DataContextKey, Any]]) -> None:
+        """Stores given (key, value) pairs, written to the StoreBackend in bulk."""
+        if self.ge_cloud_mode:
+            for key, value in key_value_pairs:
+                self.set(key, value)
+            return
+
+        for key, _ in key_value_pairs:
+            self._validate_key(key)
+
+        self._store_backend.set_many(
+            [
+                (self.key_to_tuple(key), self.serialize(value))
+                for key, value in key_value_pairs
+            ]
+        )
+
     def list_keys(self) -> List[DataContextKey]:
         keys_without_store_backend_id = [
             key
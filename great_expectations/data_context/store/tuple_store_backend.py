@@ -5,15 +5,25 @@ import os
 import random
 import re
 import shutil
+import threading
 from abc import ABCMeta
 from typing import Any, List, Tuple
 
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
 from great_expectations.util import filter_properties_dict
 
 logger = logging.getLogger(__name__)
 
+# boto3 clients can be used from multiple threads once created, but creating them (and resources) from the default
+# session is not thread-safe (e.g., during concurrent Data Docs builds).
+_boto3_lock = threading.Lock()
+
+# Maximum number of concurrent requests, with which "get_many()" fetches objects from object storage.
+MAX_CONCURRENT_GETS: int = 16
+
 
 class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     r"""
@@ -217,6 +227,17 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     def config(self) -> dict:
         return self._config  # type: ignore[attr-defined]
 
+    def _get_many_concurrently(self, keys: List[tuple]) -> List[Any]:
+        """Fetches values of given keys with concurrent requests (for object storage, where every key is a request)."""
+        async_results: List[AsyncResult]
+        with AsyncExecutor(
+            concurrency_config=ConcurrencyConfig(enabled=True),
+            max_workers=min(len(keys), MAX_CONCURRENT_GETS),
+        ) as async_executor:
+            async_results = [async_executor.submit(self._get, key) for key in keys]
+
+        return [async_result.result() for async_result in async_results]
+
 
 class TupleFilesystemStoreBackend(TupleStoreBackend):
     """Uses a local filepath as a store.
@@ -547,6 +568,9 @@ class TupleS3StoreBackend(TupleStoreBackend):
             .decode(s3_response_object.get("ContentEncoding", "utf-8"))
         )
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        return self._get_many_concurrently(keys)
+
     def _set(
         self,
         key,
@@ -720,12 +744,14 @@ class TupleS3StoreBackend(TupleStoreBackend):
     def _create_client(self):
         import boto3
 
-        return boto3.client("s3", **self.boto3_options)
+        with _boto3_lock:
+            return boto3.client("s3", **self.boto3_options)
 
     def _create_resource(self):
         import boto3
 
-        return boto3.resource("s3", **self.boto3_options)
+        with _boto3_lock:
+            return boto3.resource("s3", **self.boto3_options)
 
     @property
     def config(self) -> dict:
@@ -833,6 +859,9 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         else:
             return gcs_response_object.download_as_string().decode("utf-8")
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        return self._get_many_concurrently(keys)
+
     def _set(
         self,
         key,
@@ -1030,6 +1059,9 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             self._container_client.download_blob(az_blob_key).readall().decode("utf-8")
         )
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        return self._get_many_concurrently(keys)
+
     def _set(self, key, value, content_encoding="utf-8", **kwargs):
 
         from azure.storage.blob import ContentSettings
@@ -1303,25 +1303,63 @@ class IncludeRenderedContentConfigSchema(Schema):
 class ConcurrencyConfig(DictDot):
     """WARNING: This class is experimental."""
 
-    def __init__(self, enabled: bool = False) -> None:
+    def __init__(
+        self,
+        enabled: bool = False,
+        concurrent_metric_resolution: bool = False,
+        max_database_query_concurrency: Optional[int] = None,
+        concurrent_rule_execution: bool = False,
+        concurrent_data_docs_build: bool = False,
+    ) -> None:
         """Initialize a concurrency configuration to control multithreaded execution.
 
         Args:
             enabled: Whether or not multithreading is enabled.
+            concurrent_metric_resolution: Whether or not independent metrics of a validation graph are resolved
+                concurrently (only takes effect if multithreading is enabled).
+            max_database_query_concurrency: Max number of concurrent database queries (defaults to 100).
+            concurrent_rule_execution: Whether or not Rule objects of a RuleBasedProfiler (and Domain objects of each
+                Rule) are profiled concurrently (only takes effect if multithreading is enabled).  This is most
+                beneficial for SQL and Spark backed ExecutionEngines, which release the GIL while computing metrics.
+            concurrent_data_docs_build: Whether or not pages of Data Docs sites are retrieved, rendered, and written
+                concurrently (only takes effect if multithreading is enabled).  This is most beneficial for sites and
+                stores backed by S3 or GCS, whose uploads and downloads release the GIL.
         """
         self._enabled = enabled
+        self._concurrent_metric_resolution = concurrent_metric_resolution
+        self._concurrent_rule_execution = concurrent_rule_execution
+        self._concurrent_data_docs_build = concurrent_data_docs_build
+        self._max_database_query_concurrency = max_database_query_concurrency
 
     @property
     def enabled(self):
         """Whether or not multithreading is enabled."""
         return self._enabled
 
+    @property
+    def concurrent_metric_resolution(self) -> bool:
+        """Whether or not independent metrics of a validation graph are resolved with multithreading."""
+        return self._concurrent_metric_resolution
+
+    @property
+    def concurrent_rule_execution(self) -> bool:
+        """Whether or not Rule objects (and their Domain objects) of a RuleBasedProfiler are profiled with multithreading."""
+        return self._concurrent_rule_execution
+
+    @property
+    def concurrent_data_docs_build(self) -> bool:
+        """Whether or not pages of Data Docs sites are retrieved, rendered, and written with multithreading."""
+        return self._concurrent_data_docs_build
+
     @property
     def max_database_query_concurrency(self) -> int:
         """Max number of concurrent database queries to execute with mulithreading."""
+        if self._max_database_query_concurrency is not None:
+            return self._max_database_query_concurrency
+
         # BigQuery has a limit of 100 for "Concurrent rate limit for interactive queries" as described at
-        # (https://cloud.google.com/bigquery/quotas#query_jobs). If necessary, this can later be tuned for other
-        # databases and/or be manually user configurable.
+        # (https://cloud.google.com/bigquery/quotas#query_jobs). If necessary, this can be tuned for other databases
+        # using the "max_database_query_concurrency" configuration key.
         return 100
 
     def add_sqlalchemy_create_engine_parameters(
@@ -1349,6 +1387,10 @@ class ConcurrencyConfigSchema(Schema):
     """WARNING: This class is experimental."""
 
     enabled = fields.Boolean(default=False)
+    concurrent_metric_resolution = fields.Boolean(default=False)
+    max_database_query_concurrency = fields.Integer(required=False, allow_none=True)
+    concurrent_rule_execution = fields.Boolean(default=False)
+    concurrent_data_docs_build = fields.Boolean(default=False)
 
 
 class GeCloudConfig(DictDot):
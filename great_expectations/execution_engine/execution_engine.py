@@ -1,19 +1,36 @@
 import copy
 import logging
+import math
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchMarkers, BatchSpec
+from great_expectations.core.id_dict import IDDict
+from great_expectations.core.metric import BatchMetricIdentifier
 from great_expectations.core.metric_domain_types import MetricDomainTypes
-from great_expectations.core.util import AzureUrl, DBFSPath, GCSUrl, S3Url
+from great_expectations.core.util import (
+    AzureUrl,
+    DBFSPath,
+    GCSUrl,
+    S3Url,
+    convert_to_json_serializable,
+)
+from great_expectations.data_context.store.metric_store import BatchMetricStore
+from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.execution_engine.bundled_metric_configuration import (
     BundledMetricConfiguration,
 )
+from great_expectations.execution_engine.metric_cache import (
+    LRUMetricCache,
+    MetricCache,
+    NoOpMetricCache,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -24,16 +41,8 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 
 logger = logging.getLogger(__name__)
 
-
-class NoOpDict:
-    def __getitem__(self, item):
-        return None
-
-    def __setitem__(self, key, value):
-        return None
-
-    def update(self, value):
-        return None
+# Sentinel, distinguishing metrics absent from the metric cache from cached metrics, whose value is None.
+_MISSING_METRIC_VALUE = object()
 
 
 class BatchData:
@@ -158,6 +167,8 @@ class ExecutionEngine(ABC):
         batch_spec_defaults=None,
         batch_data_dict=None,
         validator=None,
+        metric_cache: Optional[Union[MetricCache, dict]] = None,
+        batch_metric_store: Optional[Union[BatchMetricStore, dict]] = None,
     ) -> None:
         self.name = name
         self._validator = validator
@@ -165,11 +176,45 @@ class ExecutionEngine(ABC):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
-        if self._caching:
-            self._metric_cache = {}
+        # The metric cache is bounded (evicting least-recently-used entries) and scoped by batch; "metric_cache" may be
+        # either a MetricCache object or a configuration (with "class_name" and optional "module_name") of one.
+        if not self._caching:
+            self._metric_cache = NoOpMetricCache()
+        elif metric_cache is None:
+            self._metric_cache = LRUMetricCache()
+        elif isinstance(metric_cache, MetricCache):
+            self._metric_cache = metric_cache
         else:
-            self._metric_cache = NoOpDict()
+            self._metric_cache = instantiate_class_from_config(
+                config=metric_cache,
+                runtime_environment={},
+                config_defaults={
+                    "module_name": "great_expectations.execution_engine.metric_cache",
+                    "class_name": "LRUMetricCache",
+                },
+            )
+
+        # Optionally, resolved metrics are persisted in a BatchMetricStore (keyed by the fingerprint of the batch data), so
+        # that metrics of immutable batch data are not recomputed by subsequent runs; "batch_metric_store" may be either a
+        # BatchMetricStore object or a configuration (with "class_name" and optional "module_name") of one.
+        if batch_metric_store is None or isinstance(
+            batch_metric_store, BatchMetricStore
+        ):
+            self._batch_metric_store = batch_metric_store
+        else:
+            self._batch_metric_store = instantiate_class_from_config(
+                config=batch_metric_store,
+                runtime_environment={},
+                config_defaults={
+                    "module_name": "great_expectations.data_context.store",
+                    "class_name": "BatchMetricStore",
+                },
+            )
+
+        self._batch_fingerprints: Dict[str, Optional[str]] = {}
+        # Key tuples persisted in BatchMetricStore, keyed by Batch fingerprint (listed once per fingerprint, and kept up
+        # to date with metrics persisted by this ExecutionEngine), so that store keys are not listed on every resolution.
+        self._persisted_metric_key_tuples: Dict[str, Set[tuple]] = {}
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -199,6 +244,10 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "metric_cache": metric_cache if isinstance(metric_cache, dict) else None,
+            "batch_metric_store": batch_metric_store
+            if isinstance(batch_metric_store, dict)
+            else None,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -281,9 +330,21 @@ class ExecutionEngine(ABC):
         """
         Loads the specified batch_data into the execution engine
         """
+        self._metric_cache.invalidate(batch_id=batch_id)
+        self._batch_fingerprints.pop(batch_id, None)
         self._batch_data_dict[batch_id] = batch_data
         self._active_batch_data_id = batch_id
 
+    def unload_batch_data(self, batch_id: str) -> None:
+        """
+        Removes the specified batch_data (and metrics computed on it) from the execution engine
+        """
+        self._metric_cache.invalidate(batch_id=batch_id)
+        self._batch_fingerprints.pop(batch_id, None)
+        self._batch_data_dict.pop(batch_id, None)
+        if self._active_batch_data_id == batch_id:
+            self._active_batch_data_id = None
+
     def _load_batch_data_from_dict(self, batch_data_dict) -> None:
         """
         Loads all data in batch_data_dict into load_batch_data
@@ -325,13 +386,50 @@ class ExecutionEngine(ABC):
         metric_dependencies: dict
         k: Tuple[str, str, str]
         v: MetricConfiguration
+        metric_batch_ids: Dict[Tuple[str, str, str], Optional[str]] = {}
+        cached_value: Any
+        for metric_to_resolve in metrics_to_resolve:
+            metric_batch_ids[metric_to_resolve.id] = self._get_metric_batch_id(
+                metric_configuration=metric_to_resolve
+            )
+
+        metrics_to_persist: List[MetricConfiguration] = []
+        if self._batch_metric_store is not None:
+            metrics_to_persist = [
+                metric_to_resolve
+                for metric_to_resolve in metrics_to_resolve
+                if self._is_persistable_metric(metric_configuration=metric_to_resolve)
+            ]
+            persisted_metrics: Dict[
+                Tuple[str, str, str], Any
+            ] = self._get_persisted_metric_values(
+                metric_configurations=metrics_to_persist,
+                metric_batch_ids=metric_batch_ids,
+            )
+            resolved_metrics.update(persisted_metrics)
+            metrics_to_persist = [
+                metric_to_resolve
+                for metric_to_resolve in metrics_to_persist
+                if metric_to_resolve.id not in persisted_metrics
+            ]
+
         for metric_to_resolve in metrics_to_resolve:
+            if metric_to_resolve.id in resolved_metrics:
+                continue
+
             metric_dependencies = {}
             for k, v in metric_to_resolve.metric_dependencies.items():
                 if v.id in metrics:
                     metric_dependencies[k] = metrics[v.id]
-                elif self._caching and v.id in self._metric_cache:
-                    metric_dependencies[k] = self._metric_cache[v.id]
+                    continue
+
+                cached_value = self._metric_cache.get(
+                    batch_id=self._get_metric_batch_id(metric_configuration=v),
+                    metric_id=v.id,
+                    default=_MISSING_METRIC_VALUE,
+                )
+                if cached_value is not _MISSING_METRIC_VALUE:
+                    metric_dependencies[k] = cached_value
                 else:
                     raise ge_exceptions.MetricError(
                         message=f'Missing metric dependency: {str(k)} for metric "{metric_to_resolve.metric_name}".'
@@ -371,6 +469,34 @@ class ExecutionEngine(ABC):
                 )
                 continue
 
+            # Aggregate value metric functions may provide a partial function (computing the aggregate function and
+            # the domain of the metric without touching data), so that they can be resolved together in a bundle.
+            aggregate_partial_fn: Optional[Callable] = getattr(
+                metric_fn, "aggregate_partial_fn", None
+            )
+            if aggregate_partial_fn is not None:
+                try:
+                    (
+                        metric_fn,
+                        compute_domain_kwargs,
+                        accessor_domain_kwargs,
+                    ) = aggregate_partial_fn(**metric_provider_kwargs)
+                except Exception as e:
+                    raise ge_exceptions.MetricResolutionError(
+                        message=str(e), failed_metrics=(metric_to_resolve,)
+                    )
+
+                metric_fn_bundle.append(
+                    BundledMetricConfiguration(
+                        metric_configuration=metric_to_resolve,
+                        metric_fn=metric_fn,
+                        compute_domain_kwargs=compute_domain_kwargs,
+                        accessor_domain_kwargs=accessor_domain_kwargs,
+                        metric_provider_kwargs=metric_provider_kwargs,
+                    )
+                )
+                continue
+
             metric_fn_type = getattr(
                 metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE
             )
@@ -389,7 +515,6 @@ class ExecutionEngine(ABC):
                 )
 
             try:
-                # NOTE: DH 20220328: This is where we can introduce the Batch Metrics Store (BMS)
                 resolved_metrics[metric_to_resolve.id] = metric_fn(
                     **metric_provider_kwargs
                 )
@@ -401,22 +526,186 @@ class ExecutionEngine(ABC):
         if len(metric_fn_bundle) > 0:
             try:
                 # an engine-specific way of computing metrics together
-                # NOTE: DH 20220328: This is where we can introduce the Batch Metrics Store (BMS)
                 new_resolved: Dict[
                     Tuple[str, str, str], Any
                 ] = self.resolve_metric_bundle(metric_fn_bundle)
                 resolved_metrics.update(new_resolved)
+            except ge_exceptions.MetricResolutionError:
+                raise
             except Exception as e:
                 raise ge_exceptions.MetricResolutionError(
                     message=str(e),
                     failed_metrics=[x.metric_configuration for x in metric_fn_bundle],
                 )
 
-        if self._caching:
-            self._metric_cache.update(resolved_metrics)
+        if metrics_to_persist:
+            self._persist_metric_values(
+                metric_configurations=metrics_to_persist,
+                resolved_metrics=resolved_metrics,
+                metric_batch_ids=metric_batch_ids,
+            )
+
+        resolved_metrics_by_batch_id: Dict[
+            Optional[str], Dict[Tuple[str, str, str], Any]
+        ] = {}
+        metric_id: Tuple[str, str, str]
+        metric_value: Any
+        for metric_id, metric_value in resolved_metrics.items():
+            resolved_metrics_by_batch_id.setdefault(
+                metric_batch_ids.get(metric_id), {}
+            )[metric_id] = metric_value
+
+        batch_id: Optional[str]
+        for batch_id, batch_metrics in resolved_metrics_by_batch_id.items():
+            self._metric_cache.update(batch_id=batch_id, metrics=batch_metrics)
 
         return resolved_metrics
 
+    def _get_metric_batch_id(
+        self, metric_configuration: MetricConfiguration
+    ) -> Optional[str]:
+        """Returns batch_id of the domain of the given metric (the active batch, if domain does not specify one)."""
+        batch_id: Optional[str] = None
+        if metric_configuration.metric_domain_kwargs:
+            batch_id = metric_configuration.metric_domain_kwargs.get("batch_id")
+
+        return batch_id or self.active_batch_data_id
+
+    @property
+    def metric_cache(self) -> MetricCache:
+        return self._metric_cache
+
+    @property
+    def batch_metric_store(self) -> Optional[BatchMetricStore]:
+        return self._batch_metric_store
+
+    def get_batch_fingerprint(self, batch_id: Optional[str]) -> Optional[str]:
+        """Returns fingerprint, identifying contents of data of the given batch (or None, if it cannot be obtained)."""
+        if batch_id is None or batch_id not in self.loaded_batch_data_dict:
+            return None
+
+        if batch_id not in self._batch_fingerprints:
+            self._batch_fingerprints[batch_id] = self._compute_batch_fingerprint(
+                batch_data=self.loaded_batch_data_dict[batch_id]
+            )
+
+        return self._batch_fingerprints[batch_id]
+
+    def _compute_batch_fingerprint(self, batch_data: Any) -> Optional[str]:
+        """Computes engine-specific fingerprint of batch data (by default, batch data is not fingerprinted)."""
+        return None
+
+    def _get_batch_metric_identifier(
+        self, metric_configuration: MetricConfiguration, batch_id: Optional[str]
+    ) -> Optional[BatchMetricIdentifier]:
+        batch_fingerprint: Optional[str] = self.get_batch_fingerprint(batch_id=batch_id)
+        if batch_fingerprint is None:
+            return None
+
+        # Metrics are identified by the fingerprint of batch data; hence, "batch_id" is excluded from the domain "id".
+        return BatchMetricIdentifier(
+            batch_fingerprint=batch_fingerprint,
+            metric_name=metric_configuration.metric_name,
+            metric_domain_kwargs_id=IDDict(
+                metric_configuration.metric_domain_kwargs
+            ).to_id(id_ignore_keys={"batch_id"}),
+            metric_value_kwargs_id=metric_configuration.metric_value_kwargs_id,
+        )
+
+    def _is_persistable_metric(self, metric_configuration: MetricConfiguration) -> bool:
+        """
+        Returns False for metrics, whose values are never persisted (partial functions and series, provided by
+        metrics of MetricPartialFunctionTypes), so that these are not looked up in BatchMetricStore.
+        """
+        try:
+            _, metric_fn = get_metric_provider(
+                metric_name=metric_configuration.metric_name, execution_engine=self
+            )
+        except ge_exceptions.MetricProviderError:
+            return False
+
+        return not isinstance(
+            getattr(metric_fn, "metric_fn_type", None), MetricPartialFunctionTypes
+        )
+
+    def _get_persisted_metric_values(
+        self,
+        metric_configurations: List[MetricConfiguration],
+        metric_batch_ids: Dict[Tuple[str, str, str], Optional[str]],
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Returns persisted values of given metrics (keyed by metric "id"), fetched from BatchMetricStore in bulk."""
+        keys: Dict[BatchMetricIdentifier, Tuple[str, str, str]] = {}
+        metric_configuration: MetricConfiguration
+        key: Optional[BatchMetricIdentifier]
+        for metric_configuration in metric_configurations:
+            key = self._get_batch_metric_identifier(
+                metric_configuration=metric_configuration,
+                batch_id=metric_batch_ids.get(metric_configuration.id),
+            )
+            if key is not None:
+                keys[key] = metric_configuration.id
+
+        if not keys:
+            return {}
+
+        persisted_values: Dict[BatchMetricIdentifier, Any]
+        try:
+            persisted_values = self._batch_metric_store.get_persisted_values(
+                keys=list(keys.keys()),
+                persisted_key_tuples=self._persisted_metric_key_tuples,
+            )
+        except Exception as e:
+            # Failure to fetch persisted metrics must not fail their resolution.
+            logger.warning(f"Unable to fetch metric values from BatchMetricStore: {e}")
+            return {}
+
+        return {keys[key]: value for key, value in persisted_values.items()}
+
+    def _persist_metric_values(
+        self,
+        metric_configurations: List[MetricConfiguration],
+        resolved_metrics: Dict[Tuple[str, str, str], Any],
+        metric_batch_ids: Dict[Tuple[str, str, str], Optional[str]],
+    ) -> None:
+        metric_configuration: MetricConfiguration
+        key: Optional[BatchMetricIdentifier]
+        for metric_configuration in metric_configurations:
+            metric_value: Any = resolved_metrics.get(
+                metric_configuration.id, _MISSING_METRIC_VALUE
+            )
+            if not _is_persistable_metric_value(value=metric_value):
+                continue
+
+            key = self._get_batch_metric_identifier(
+                metric_configuration=metric_configuration,
+                batch_id=metric_batch_ids.get(metric_configuration.id),
+            )
+            if key is None:
+                continue
+
+            try:
+                self._batch_metric_store.set(
+                    key=key, value=convert_to_json_serializable(data=metric_value)
+                )
+                if key.batch_fingerprint in self._persisted_metric_key_tuples:
+                    self._persisted_metric_key_tuples[key.batch_fingerprint].add(
+                        self._batch_metric_store.key_to_tuple(key)
+                    )
+            except Exception as e:
+                # Failure to persist a metric must not fail its resolution.
+                logger.warning(
+                    f"Unable to persist value of metric {str(metric_configuration.id)} in BatchMetricStore: {e}"
+                )
+
+    def resolves_metric_from_batch_data(
+        self, metric_configuration: MetricConfiguration
+    ) -> bool:
+        """
+        Returns True, if this ExecutionEngine computes the given metric directly from batch data (rather than using its
+        MetricProvider), so that evaluation dependencies of the metric are not needed (by default, no metric is).
+        """
+        return False
+
     def resolve_metric_bundle(
         self, metric_fn_bundle
     ) -> Dict[Tuple[str, str, str], Any]:
@@ -499,6 +788,44 @@ class ExecutionEngine(ABC):
         new_domain_kwargs.setdefault("filter_conditions", []).append(row_condition)
         return new_domain_kwargs
 
+    def _get_domain_records_cache_key(
+        self, batch_id: str, domain_kwargs: dict
+    ) -> Optional[Tuple[str, str]]:
+        """Returns key, identifying filtered domain records of a batch (or None, if no filtering directives are present).
+
+        Only directives, which "get_domain_records()" applies to the batch data, are part of the key, so that (for
+        example) domains of different columns with the same "row_condition" share the same filtered records.
+        """
+        filtering_directives: dict = {
+            key: domain_kwargs[key]
+            for key in ["row_condition", "condition_parser", "filter_conditions"]
+            if domain_kwargs.get(key)
+        }
+        if "column" not in domain_kwargs and "ignore_row_if" in domain_kwargs:
+            if "column_A" in domain_kwargs and "column_B" in domain_kwargs:
+                directive_keys = ["column_A", "column_B", "ignore_row_if"]
+            elif "column_list" in domain_kwargs:
+                directive_keys = ["column_list", "ignore_row_if"]
+            else:
+                directive_keys = []
+
+            filtering_directives.update(
+                {key: domain_kwargs[key] for key in directive_keys}
+            )
+
+        if not filtering_directives.get("row_condition"):
+            filtering_directives.pop("condition_parser", None)
+
+        if not filtering_directives:
+            return None
+
+        return (
+            batch_id,
+            IDDict.convert_dictionary_to_id_dict(
+                data=convert_to_json_serializable(data=filtering_directives)
+            ).to_id(),
+        )
+
     def resolve_data_reference(
         self, data_connector_name: str, template_arguments: dict
     ):
@@ -750,3 +1077,27 @@ class MetricPartialFunctionTypes(Enum):
             return "condition"
         elif self.name in ["AGGREGATE_FN"]:
             return "aggregate_fn"
+
+
+def _is_persistable_metric_value(value: Any) -> bool:
+    """
+    Returns True for metric values, which are unchanged by JSON serialization (i.e., finite numbers, strings, booleans,
+    None, and lists and dictionaries composed of them); other values (e.g., DataFrames and partial functions) are not
+    persisted in BatchMetricStore.
+    """
+    if value is None or isinstance(value, (bool, str, np.bool_)):
+        return True
+
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return math.isfinite(value)
+
+    if isinstance(value, list):
+        return all(_is_persistable_metric_value(value=item) for item in value)
+
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _is_persistable_metric_value(value=item)
+            for key, item in value.items()
+        )
+
+    return False
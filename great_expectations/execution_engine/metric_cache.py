@@ -0,0 +1,249 @@
+import logging
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.types import DictDot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRIC_CACHE_MAX_ENTRIES: int = 10000
+DEFAULT_METRIC_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+
+
+@dataclass
+class MetricCacheStatistics(DictDot):
+    """
+    MetricCacheStatistics is a "dataclass" object, which holds counters describing the usage of a MetricCache.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    num_entries: int = 0
+    num_bytes: int = 0
+
+    def to_dict(self) -> dict:
+        """Returns: this MetricCacheStatistics as a dictionary"""
+        return asdict(self)
+
+    def to_json_dict(self) -> dict:
+        """Returns: this MetricCacheStatistics as a JSON dictionary"""
+        return convert_to_json_serializable(data=self.to_dict())
+
+
+class MetricCache(ABC):
+    """
+    MetricCache holds values of resolved metrics, scoped by batch (i.e., keyed by batch_id and by metric "id").
+
+    Execution engines consult MetricCache for dependencies that are not supplied by the caller of "resolve_metrics()"
+    and invalidate the entries of a batch, whenever data for that batch_id is loaded.
+    """
+
+    def __init__(self) -> None:
+        self._statistics = MetricCacheStatistics()
+
+    @property
+    def statistics(self) -> MetricCacheStatistics:
+        return self._statistics
+
+    @abstractmethod
+    def get(
+        self,
+        batch_id: Optional[str],
+        metric_id: Tuple[str, str, str],
+        default: Any = None,
+    ) -> Any:
+        """Returns cached value of metric with given "id" for given batch (or "default", if not cached)."""
+        pass
+
+    @abstractmethod
+    def update(
+        self, batch_id: Optional[str], metrics: Dict[Tuple[str, str, str], Any]
+    ) -> None:
+        """Adds values of resolved metrics (keyed by metric "id") of the given batch to the cache."""
+        pass
+
+    @abstractmethod
+    def invalidate(self, batch_id: Optional[str] = None) -> None:
+        """Removes entries of the given batch (or all entries, if "batch_id" is None) from the cache."""
+        pass
+
+
+class NoOpMetricCache(MetricCache):
+    """NoOpMetricCache does not retain any metric values (used when caching is turned off)."""
+
+    def get(
+        self,
+        batch_id: Optional[str],
+        metric_id: Tuple[str, str, str],
+        default: Any = None,
+    ) -> Any:
+        self._statistics.misses += 1
+        return default
+
+    def update(
+        self, batch_id: Optional[str], metrics: Dict[Tuple[str, str, str], Any]
+    ) -> None:
+        pass
+
+    def invalidate(self, batch_id: Optional[str] = None) -> None:
+        pass
+
+
+class LRUMetricCache(MetricCache):
+    """
+    LRUMetricCache evicts least-recently-used entries, once either the number of entries exceeds "max_entries" or the
+    (estimated) total size of cached values exceeds "max_bytes" (either limit is disabled when set to None).
+
+    LRUMetricCache is safe to use from multiple threads (e.g., when metrics are resolved concurrently).
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = DEFAULT_METRIC_CACHE_MAX_ENTRIES,
+        max_bytes: Optional[int] = DEFAULT_METRIC_CACHE_MAX_BYTES,
+    ) -> None:
+        super().__init__()
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        self._values: "OrderedDict[Tuple[Optional[str], Tuple[str, str, str]], Any]" = (
+            OrderedDict()
+        )
+        self._sizes: Dict[Tuple[Optional[str], Tuple[str, str, str]], int] = {}
+        self._batch_metric_ids: Dict[Optional[str], Set[Tuple[str, str, str]]] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    def get(
+        self,
+        batch_id: Optional[str],
+        metric_id: Tuple[str, str, str],
+        default: Any = None,
+    ) -> Any:
+        key: Tuple[Optional[str], Tuple[str, str, str]] = (batch_id, metric_id)
+        with self._lock:
+            if key not in self._values:
+                self._statistics.misses += 1
+                return default
+
+            self._statistics.hits += 1
+            self._values.move_to_end(key)
+            return self._values[key]
+
+    def update(
+        self, batch_id: Optional[str], metrics: Dict[Tuple[str, str, str], Any]
+    ) -> None:
+        metric_id: Tuple[str, str, str]
+        value: Any
+        with self._lock:
+            for metric_id, value in metrics.items():
+                key: Tuple[Optional[str], Tuple[str, str, str]] = (batch_id, metric_id)
+                if key in self._values:
+                    self._remove(key=key)
+
+                num_bytes: int = _estimate_size_in_bytes(value=value)
+                if self._max_bytes is not None and num_bytes > self._max_bytes:
+                    logger.debug(
+                        f"Value of metric {metric_id} ({num_bytes} bytes) exceeds metric cache capacity; not cached."
+                    )
+                    continue
+
+                self._values[key] = value
+                self._sizes[key] = num_bytes
+                self._batch_metric_ids.setdefault(batch_id, set()).add(metric_id)
+                self._statistics.num_entries += 1
+                self._statistics.num_bytes += num_bytes
+
+            self._evict()
+
+    def invalidate(self, batch_id: Optional[str] = None) -> None:
+        with self._lock:
+            if batch_id is None:
+                keys = list(self._values.keys())
+            else:
+                keys = [
+                    (batch_id, metric_id)
+                    for metric_id in self._batch_metric_ids.get(batch_id, set())
+                ]
+
+            key: Tuple[Optional[str], Tuple[str, str, str]]
+            for key in keys:
+                self._remove(key=key)
+
+            self._statistics.invalidations += len(keys)
+
+    def _evict(self) -> None:
+        key: Tuple[Optional[str], Tuple[str, str, str]]
+        while self._values and (
+            (
+                self._max_entries is not None
+                and self._statistics.num_entries > self._max_entries
+            )
+            or (
+                self._max_bytes is not None
+                and self._statistics.num_bytes > self._max_bytes
+            )
+        ):
+            key = next(iter(self._values))
+            self._remove(key=key)
+            self._statistics.evictions += 1
+
+    def _remove(self, key: Tuple[Optional[str], Tuple[str, str, str]]) -> None:
+        batch_id: Optional[str]
+        metric_id: Tuple[str, str, str]
+        batch_id, metric_id = key
+
+        del self._values[key]
+        self._statistics.num_entries -= 1
+        self._statistics.num_bytes -= self._sizes.pop(key)
+
+        batch_metric_ids: Set[Tuple[str, str, str]] = self._batch_metric_ids[batch_id]
+        batch_metric_ids.discard(metric_id)
+        if not batch_metric_ids:
+            del self._batch_metric_ids[batch_id]
+
+
+def _estimate_size_in_bytes(value: Any) -> int:
+    """Estimates memory footprint of metric value (data of pandas and NumPy objects, and items of containers)."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=False).sum())
+
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=False))
+
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage(deep=False))
+
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            _estimate_size_in_bytes(value=key) + _estimate_size_in_bytes(value=item)
+            for key, item in value.items()
+        )
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(
+            _estimate_size_in_bytes(value=item) for item in value
+        )
+
+    return sys.getsizeof(value)
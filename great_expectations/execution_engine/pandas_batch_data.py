@@ -1,7 +1,12 @@
+import logging
+from typing import Callable, Iterator
+
 import pandas as pd
 
 from great_expectations.execution_engine.execution_engine import BatchData
 
+logger = logging.getLogger(__name__)
+
 
 class PandasBatchData(BatchData):
     def __init__(self, execution_engine, dataframe: pd.DataFrame) -> None:
@@ -11,3 +16,42 @@ class PandasBatchData(BatchData):
     @property
     def dataframe(self):
         return self._dataframe
+
+
+class PandasChunkedBatchData(PandasBatchData):
+    """
+    PandasChunkedBatchData reads its records (e.g., from a CSV or Parquet file) in chunks of bounded size, every time
+    they are iterated over, instead of holding them in memory.
+
+    Metrics that can be computed chunk by chunk (see "pandas_chunked_aggregates") use "iter_chunks()"; accessing the
+    "dataframe" property (needed by all other metrics) reads all chunks and retains the resulting DataFrame.
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        chunk_reader_fn: Callable[[], Iterator[pd.DataFrame]],
+    ) -> None:
+        super().__init__(execution_engine=execution_engine, dataframe=None)
+        self._chunk_reader_fn = chunk_reader_fn
+
+    @property
+    def dataframe(self):
+        if self._dataframe is None:
+            logger.info(
+                "Materializing all chunks of PandasChunkedBatchData into a single DataFrame."
+            )
+            self._dataframe = pd.concat(list(self._chunk_reader_fn()))
+
+        return self._dataframe
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._dataframe is not None
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yields records in chunks (or the whole DataFrame, once it has been materialized)."""
+        if self._dataframe is not None:
+            yield self._dataframe
+        else:
+            yield from self._chunk_reader_fn()
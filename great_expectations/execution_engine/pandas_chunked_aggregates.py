@@ -0,0 +1,260 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+
+
+class ChunkedAggregate(ABC):
+    """
+    ChunkedAggregate computes the value of a metric over records read in chunks: a partial result is computed for every
+    chunk, partial results are merged (in the order of chunks), and the metric value is obtained from the merged result.
+
+    Partial results are small (independent of the number of records), so that memory usage does not grow with the
+    size of the batch data.
+    """
+
+    domain_type: MetricDomainTypes = MetricDomainTypes.COLUMN
+
+    def supports(self, metric_value_kwargs: dict) -> bool:
+        """Returns True, if metric with given value kwargs can be computed chunk by chunk (by default, no value kwargs)."""
+        return not any(metric_value_kwargs.values())
+
+    def bind(self, metric_value_kwargs: dict) -> "ChunkedAggregate":
+        """Returns ChunkedAggregate for computing metric with given value kwargs (by default, these are not used)."""
+        return self
+
+    @abstractmethod
+    def compute(self, data: pd.DataFrame, column: Optional[str]) -> Any:
+        """Computes partial result for given chunk of domain records."""
+        pass
+
+    @abstractmethod
+    def merge(self, partial: Any, other: Any) -> Any:
+        """Merges partial results of two chunks."""
+        pass
+
+    def finalize(self, partial: Any) -> Any:
+        """Obtains metric value from partial result, merged over all chunks."""
+        return partial
+
+
+class TableRowCount(ChunkedAggregate):
+    domain_type = MetricDomainTypes.TABLE
+
+    def compute(self, data: pd.DataFrame, column: Optional[str]) -> int:
+        return data.shape[0]
+
+    def merge(self, partial: int, other: int) -> int:
+        return partial + other
+
+
+class TableColumnTypes(ChunkedAggregate):
+    domain_type = MetricDomainTypes.TABLE
+
+    def supports(self, metric_value_kwargs: dict) -> bool:
+        # Value kwargs (i.e., "include_nested") do not affect types of pandas columns.
+        return True
+
+    def compute(self, data: pd.DataFrame, column: Optional[str]) -> List[tuple]:
+        return list(zip(data.columns, data.dtypes))
+
+    def merge(self, partial: List[tuple], other: List[tuple]) -> List[tuple]:
+        # Types, inferred independently for every chunk, may differ (e.g., "int64" and "float64" for integer values,
+        # some of which are missing in later chunks); these are promoted to their common type, as if read at once.
+        merged: List[tuple] = []
+        name: str
+        dtype: Any
+        other_dtype: Any
+        for (name, dtype), (_, other_dtype) in zip(partial, other):
+            if dtype != other_dtype:
+                try:
+                    dtype = np.result_type(dtype, other_dtype)
+                except TypeError:
+                    dtype = np.dtype(object)
+
+            merged.append((name, dtype))
+
+        return merged
+
+    def finalize(self, partial: List[tuple]) -> List[dict]:
+        return [{"name": name, "type": dtype} for name, dtype in partial]
+
+
+class ColumnMin(ChunkedAggregate):
+    def supports(self, metric_value_kwargs: dict) -> bool:
+        return not metric_value_kwargs.get("parse_strings_as_datetimes")
+
+    def compute(self, data: pd.DataFrame, column: Optional[str]) -> Any:
+        return data[column].min()
+
+    def merge(self, partial: Any, other: Any) -> Any:
+        if pd.isnull(partial):
+            return other
+
+        if pd.isnull(other):
+            return partial
+
+        return min(partial, other)
+
+
+class ColumnMax(ColumnMin):
+    def compute(self, data: pd.DataFrame, column: Optional[str]) -> Any:
+        return data[column].max()
+
+    def merge(self, partial: Any, other: Any) -> Any:
+        if pd.isnull(partial):
+            return other
+
+        if pd.isnull(other):
+            return partial
+
+        return max(partial, other)
+
+
+class ColumnSum(ChunkedAggregate):
+    def compute(self, data: pd.DataFrame, column: Optional[str]) -> Any:
+        return data[column].sum()
+
+    def merge(self, partial: Any, other: Any) -> Any:
+        return partial + other
+
+
+class ColumnMean(ChunkedAggregate):
+    """Partial result is the count, the mean, and the sum of squared deviations from the mean, of non-null values."""
+
+    def compute(
+        self, data: pd.DataFrame, column: Optional[str]
+    ) -> Tuple[int, float, float]:
+        values: pd.Series = data[column].dropna()
+        if values.empty:
+            return 0, 0.0, 0.0
+
+        mean: float = values.mean()
+        return values.shape[0], mean, ((values - mean) ** 2).sum()
+
+    def merge(
+        self, partial: Tuple[int, float, float], other: Tuple[int, float, float]
+    ) -> Tuple[int, float, float]:
+        # Pairwise update of mean and sum of squared deviations (Chan, Golub, and LeVeque).
+        count: int = partial[0] + other[0]
+        if count == 0:
+            return 0, 0.0, 0.0
+
+        delta: float = other[1] - partial[1]
+        return (
+            count,
+            partial[1] + delta * other[0] / count,
+            partial[2] + other[2] + delta**2 * partial[0] * other[0] / count,
+        )
+
+    def finalize(self, partial: Tuple[int, float, float]) -> float:
+        if partial[0] == 0:
+            return np.nan
+
+        return partial[1]
+
+
+class ColumnStandardDeviation(ColumnMean):
+    def finalize(self, partial: Tuple[int, float, float]) -> float:
+        # Sample standard deviation (with one degree of freedom), as computed by "pd.Series.std()".
+        if partial[0] < 2:
+            return np.nan
+
+        return math.sqrt(partial[2] / (partial[0] - 1))
+
+
+class ColumnNullCount(ChunkedAggregate):
+    def compute(self, data: pd.DataFrame, column: Optional[str]) -> int:
+        return int(data[column].isnull().sum())
+
+    def merge(self, partial: int, other: int) -> int:
+        return partial + other
+
+
+class ColumnNonNullCount(ColumnNullCount):
+    def compute(self, data: pd.DataFrame, column: Optional[str]) -> int:
+        return int(data[column].notnull().sum())
+
+
+class ColumnNullUnexpectedValues(ChunkedAggregate):
+    """
+    Partial result is the list of unexpected (i.e., null) values of chunk, limited to "partial_unexpected_count" values,
+    unless "result_format" is "COMPLETE" (as returned by map metrics for the materialized DataFrame).
+    """
+
+    def __init__(self, limit: Optional[int] = None) -> None:
+        self._limit = limit
+
+    def supports(self, metric_value_kwargs: dict) -> bool:
+        return isinstance(metric_value_kwargs.get("result_format"), dict)
+
+    def bind(self, metric_value_kwargs: dict) -> "ColumnNullUnexpectedValues":
+        result_format: dict = metric_value_kwargs["result_format"]
+        if result_format["result_format"] == "COMPLETE":
+            return type(self)()
+
+        return type(self)(limit=result_format["partial_unexpected_count"])
+
+    def compute(self, data: pd.DataFrame, column: Optional[str]) -> list:
+        values: pd.Series = data[column]
+        return list(values[values.isnull()][: self._limit])
+
+    def merge(self, partial: list, other: list) -> list:
+        return (partial + other)[: self._limit]
+
+
+class ColumnNonNullUnexpectedValues(ColumnNullUnexpectedValues):
+    def compute(self, data: pd.DataFrame, column: Optional[str]) -> list:
+        values: pd.Series = data[column]
+        return list(values[values.notnull()][: self._limit])
+
+
+class ColumnValueCounts(ChunkedAggregate):
+    def supports(self, metric_value_kwargs: dict) -> bool:
+        # Only ordering by value is reproduced after merging counts of chunks.
+        return (
+            metric_value_kwargs.get("sort", "value") == "value"
+            and metric_value_kwargs.get("collate") is None
+        )
+
+    def compute(self, data: pd.DataFrame, column: Optional[str]) -> pd.Series:
+        return data[column].value_counts()
+
+    def merge(self, partial: pd.Series, other: pd.Series) -> pd.Series:
+        return partial.add(other, fill_value=0)
+
+    def finalize(self, partial: pd.Series) -> pd.Series:
+        counts: pd.Series = partial.astype("int64")
+        try:
+            counts = counts.sort_index()
+        except TypeError:
+            # Values of multiple types in an object dtype column (e.g., strings and floats) are not comparable.
+            counts.index = counts.index.astype(str)
+            counts = counts.sort_index()
+
+        counts.name = "count"
+        counts.index.name = "value"
+        return counts
+
+
+# Metrics that PandasExecutionEngine computes chunk by chunk for PandasChunkedBatchData (keyed by metric name).  These
+# are computed without their metric dependencies; hence, of map Expectations, only those of null and non-null values
+# (up to "SUMMARY" result_format) are validated without materializing batch data.
+CHUNKED_AGGREGATES: Dict[str, ChunkedAggregate] = {
+    "table.row_count": TableRowCount(),
+    "table.column_types": TableColumnTypes(),
+    "column.min": ColumnMin(),
+    "column.max": ColumnMax(),
+    "column.sum": ColumnSum(),
+    "column.mean": ColumnMean(),
+    "column.standard_deviation": ColumnStandardDeviation(),
+    "column_values.nonnull.unexpected_count": ColumnNullCount(),
+    "column_values.null.unexpected_count": ColumnNonNullCount(),
+    "column_values.nonnull.unexpected_values": ColumnNullUnexpectedValues(),
+    "column_values.null.unexpected_values": ColumnNonNullUnexpectedValues(),
+    "column.value_counts": ColumnValueCounts(),
+}
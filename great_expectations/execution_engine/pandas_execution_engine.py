@@ -2,14 +2,17 @@ import datetime
 import hashlib
 import logging
 import pickle
+import threading
 import warnings
+from collections import OrderedDict
 from functools import partial
 from io import BytesIO
-from typing import Any, Callable, Iterable, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core import IDDict
 from great_expectations.core.batch import BatchMarkers
 from great_expectations.core.batch_spec import (
     AzureBatchSpec,
@@ -20,18 +23,37 @@ from great_expectations.core.batch_spec import (
     S3BatchSpec,
 )
 from great_expectations.core.metric_domain_types import MetricDomainTypes
-from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
+from great_expectations.core.util import (
+    AzureUrl,
+    GCSUrl,
+    S3Url,
+    convert_to_json_serializable,
+    sniff_s3_compression,
+)
 from great_expectations.execution_engine import ExecutionEngine
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.bundled_metric_configuration import (
+    BundledMetricConfiguration,
+)
+from great_expectations.execution_engine.pandas_batch_data import (
+    PandasBatchData,
+    PandasChunkedBatchData,
+)
+from great_expectations.execution_engine.pandas_chunked_aggregates import (
+    CHUNKED_AGGREGATES,
+    ChunkedAggregate,
+)
 from great_expectations.execution_engine.split_and_sample.pandas_data_sampler import (
     PandasDataSampler,
 )
 from great_expectations.execution_engine.split_and_sample.pandas_data_splitter import (
     PandasDataSplitter,
 )
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+
 try:
     import boto3
     from botocore.exceptions import ClientError, ParamValidationError
@@ -115,12 +137,33 @@ Notes:
         azure_options: dict = kwargs.pop("azure_options", {})
         gcs_options: dict = kwargs.pop("gcs_options", {})
 
+        domain_records_cache_max_bytes: Optional[int] = kwargs.pop(
+            "domain_records_cache_max_bytes", None
+        )
+        # If set, CSV and Parquet files are read in chunks of (at most) "chunk_size" rows, whenever metrics are computed.
+        self._chunk_size: Optional[int] = kwargs.pop("chunk_size", None)
+
         # Instantiate cloud provider clients as None at first.
         # They will be instantiated if/when passed cloud-specific in BatchSpec is passed in
         self._s3 = None
         self._azure = None
         self._gcs = None
 
+        # Filtered domain records (by "row_condition" and "ignore_row_if" directives), keyed by
+        # batch_id and normalized domain kwargs, in least-recently-used order (must exist before batch data is loaded).
+        self._domain_records_cache_max_bytes = (
+            DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES
+            if domain_records_cache_max_bytes is None
+            else domain_records_cache_max_bytes
+        )
+        self._domain_records_cache: "OrderedDict[Tuple[str, str], pd.DataFrame]" = (
+            OrderedDict()
+        )
+        self._domain_records_cache_sizes: Dict[Tuple[str, str], int] = {}
+        self._domain_records_cache_bytes: int = 0
+        # Metrics of the same ExecutionEngine may be resolved concurrently (e.g., by Rules of RuleBasedProfiler).
+        self._domain_records_cache_lock = threading.RLock()
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -131,6 +174,14 @@ Notes:
                 "gcs_options": gcs_options,
             }
         )
+        # Domain records cache capacity is recorded in config only if configured explicitly.
+        if domain_records_cache_max_bytes is not None:
+            self._config[
+                "domain_records_cache_max_bytes"
+            ] = domain_records_cache_max_bytes
+
+        if self._chunk_size is not None:
+            self._config["chunk_size"] = self._chunk_size
 
         self._data_splitter = PandasDataSplitter()
         self._data_sampler = PandasDataSampler()
@@ -193,8 +244,20 @@ Notes:
             raise ge_exceptions.GreatExpectationsError(
                 "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"
             )
+        self._invalidate_domain_records_cache(batch_id=batch_id)
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    def unload_batch_data(self, batch_id: str) -> None:
+        self._invalidate_domain_records_cache(batch_id=batch_id)
+        super().unload_batch_data(batch_id=batch_id)
+
+    def _compute_batch_fingerprint(self, batch_data: Any) -> Optional[str]:
+        # Same fingerprint as the "pandas_data_fingerprint" batch marker.
+        if isinstance(batch_data, PandasChunkedBatchData):
+            return hash_pandas_dataframe_chunks(chunks=batch_data.iter_chunks())
+
+        return hash_pandas_dataframe(batch_data.dataframe)
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -316,6 +379,16 @@ Please check your config."""
             reader_method: str = batch_spec.reader_method
             reader_options: dict = batch_spec.reader_options
             path: str = batch_spec.path
+            chunk_reader_fn: Optional[
+                Callable[[], Iterator[pd.DataFrame]]
+            ] = self._get_chunk_reader_fn(batch_spec=batch_spec)
+            if chunk_reader_fn is not None:
+                # Records are not read until metrics are computed; hence, "pandas_data_fingerprint" is not available.
+                typed_batch_data = PandasChunkedBatchData(
+                    execution_engine=self, chunk_reader_fn=chunk_reader_fn
+                )
+                return typed_batch_data, batch_markers
+
             reader_fn: Callable = self._get_reader_fn(reader_method, path)
             df = reader_fn(path, **reader_options)
 
@@ -332,6 +405,76 @@ Please check your config."""
 
         return typed_batch_data, batch_markers
 
+    def _get_chunk_reader_fn(
+        self, batch_spec: PathBatchSpec
+    ) -> Optional[Callable[[], Iterator[pd.DataFrame]]]:
+        """Returns function reading CSV or Parquet file of batch_spec in chunks (or None, if chunking is not applicable).
+
+        Chunking is not applicable if "chunk_size" is not configured, if file format or reader options are not
+        supported, or if splitting or sampling (which operate on the whole DataFrame) is requested.
+        """
+        if self._chunk_size is None:
+            return None
+
+        if batch_spec.get("splitter_method") or batch_spec.get("sampling_method"):
+            return None
+
+        path: str = batch_spec.path
+        reader_method: Optional[str] = batch_spec.reader_method
+        reader_options: dict = dict(batch_spec.reader_options or {})
+        if reader_method is None:
+            path_guess: dict = self.guess_reader_method_from_path(path)
+            reader_method = path_guess["reader_method"]
+            reader_options.update(path_guess.get("reader_options") or {})
+
+        chunk_size: int = self._chunk_size
+
+        if reader_method in ["read_csv", "read_table"]:
+            if "chunksize" in reader_options or "iterator" in reader_options:
+                return None
+
+            reader_fn: Callable = getattr(pd, reader_method)
+
+            def _read_csv_chunks() -> Iterator[pd.DataFrame]:
+                reader = reader_fn(path, chunksize=chunk_size, **reader_options)
+                try:
+                    yield from reader
+                finally:
+                    reader.close()
+
+            return _read_csv_chunks
+
+        if reader_method == "read_parquet":
+            if not set(reader_options.keys()) <= {"columns", "engine"} or (
+                reader_options.get("engine", "pyarrow") != "pyarrow"
+            ):
+                return None
+
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                logger.debug(
+                    "Unable to read Parquet file in chunks; install optional pyarrow dependency for support"
+                )
+                return None
+
+            columns: Optional[List[str]] = reader_options.get("columns")
+
+            def _read_parquet_chunks() -> Iterator[pd.DataFrame]:
+                num_rows: int = 0
+                for record_batch in pq.ParquetFile(path).iter_batches(
+                    batch_size=chunk_size, columns=columns
+                ):
+                    df: pd.DataFrame = record_batch.to_pandas()
+                    # Chunks are indexed consecutively, as rows of the whole DataFrame would be.
+                    df.index = pd.RangeIndex(num_rows, num_rows + df.shape[0])
+                    num_rows += df.shape[0]
+                    yield df
+
+            return _read_parquet_chunks
+
+        return None
+
     def _apply_splitting_and_sampling_methods(self, batch_spec, batch_data):
         splitter_method_name: Optional[str] = batch_spec.get("splitter_method")
         if splitter_method_name:
@@ -461,6 +604,7 @@ Please check your config."""
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data_id is not None:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data.dataframe
             else:
                 raise ge_exceptions.ValidationError(
@@ -474,6 +618,24 @@ Please check your config."""
                     f"Unable to find batch with batch_id {batch_id}"
                 )
 
+        cache_key: Optional[Tuple[str, str]] = self._get_domain_records_cache_key(
+            batch_id=batch_id, domain_kwargs=domain_kwargs
+        )
+        if cache_key is None:
+            return data
+
+        with self._domain_records_cache_lock:
+            if cache_key in self._domain_records_cache:
+                self._domain_records_cache.move_to_end(cache_key)
+                return self._domain_records_cache[cache_key]
+
+        data = self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+        self._add_to_domain_records_cache(cache_key=cache_key, data=data)
+        return data
+
+    def _filter_domain_records(
+        self, data: pd.DataFrame, domain_kwargs: dict
+    ) -> pd.DataFrame:
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
@@ -558,6 +720,46 @@ Please check your config."""
 
         return data
 
+    def _add_to_domain_records_cache(
+        self, cache_key: Tuple[str, str], data: pd.DataFrame
+    ) -> None:
+        if not self._caching:
+            return
+
+        num_bytes: int = int(data.memory_usage(index=True, deep=False).sum())
+        if num_bytes > self._domain_records_cache_max_bytes:
+            return
+
+        with self._domain_records_cache_lock:
+            # Another thread may have filtered (and cached) the same domain records in the meantime.
+            if cache_key in self._domain_records_cache:
+                self._domain_records_cache.move_to_end(cache_key)
+                return
+
+            self._domain_records_cache[cache_key] = data
+            self._domain_records_cache_sizes[cache_key] = num_bytes
+            self._domain_records_cache_bytes += num_bytes
+
+            evicted_cache_key: Tuple[str, str]
+            while (
+                self._domain_records_cache_bytes > self._domain_records_cache_max_bytes
+            ):
+                evicted_cache_key, _ = self._domain_records_cache.popitem(last=False)
+                self._domain_records_cache_bytes -= (
+                    self._domain_records_cache_sizes.pop(evicted_cache_key)
+                )
+
+    def _invalidate_domain_records_cache(self, batch_id: Optional[str] = None) -> None:
+        """Removes filtered domain records of the given batch (or of all batches, if batch_id is None) from cache."""
+        cache_key: Tuple[str, str]
+        with self._domain_records_cache_lock:
+            for cache_key in list(self._domain_records_cache.keys()):
+                if batch_id is None or cache_key[0] == batch_id:
+                    del self._domain_records_cache[cache_key]
+                    self._domain_records_cache_bytes -= (
+                        self._domain_records_cache_sizes.pop(cache_key)
+                    )
+
     def get_compute_domain(
         self,
         domain_kwargs: dict,
@@ -599,6 +801,311 @@ Please check your config."""
 
         return data, split_domain_kwargs.compute, split_domain_kwargs.accessor
 
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricConfiguration]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Resolves metrics, computing those, which are supported by ChunkedAggregate, over PandasChunkedBatchData in a
+        single pass over its chunks (all other metrics are resolved by ExecutionEngine using the materialized DataFrame).
+        """
+        metrics_to_resolve = list(metrics_to_resolve)
+        chunked_metrics: List[MetricConfiguration] = [
+            metric_to_resolve
+            for metric_to_resolve in metrics_to_resolve
+            if self._get_chunked_aggregate(metric_configuration=metric_to_resolve)
+            is not None
+        ]
+        if not chunked_metrics:
+            return super().resolve_metrics(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        chunked_metric_ids: set = {
+            metric_to_resolve.id for metric_to_resolve in chunked_metrics
+        }
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = super().resolve_metrics(
+            metrics_to_resolve=[
+                metric_to_resolve
+                for metric_to_resolve in metrics_to_resolve
+                if metric_to_resolve.id not in chunked_metric_ids
+            ],
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+        resolved_metrics.update(
+            self._resolve_chunked_metrics(metrics_to_resolve=chunked_metrics)
+        )
+        return resolved_metrics
+
+    def resolves_metric_from_batch_data(
+        self, metric_configuration: MetricConfiguration
+    ) -> bool:
+        """Metrics, supported by ChunkedAggregate, are computed from chunks, without any of their metric dependencies."""
+        return (
+            self._get_chunked_aggregate(metric_configuration=metric_configuration)
+            is not None
+        )
+
+    def _get_chunked_aggregate(
+        self, metric_configuration: MetricConfiguration
+    ) -> Optional[ChunkedAggregate]:
+        """Returns ChunkedAggregate for metric (or None, if metric is not computed in chunks).
+
+        The outcome does not depend on whether batch data is read in chunks or has been materialized, because metric
+        dependencies (omitted for metrics computed in chunks) are determined before any metrics are resolved; batch data,
+        which is not read in chunks (or has already been materialized), is aggregated as a single chunk.
+        """
+        if (
+            self._chunk_size is None
+            or self._get_metric_batch_id(metric_configuration=metric_configuration)
+            not in self.loaded_batch_data_dict
+        ):
+            return None
+
+        chunked_aggregate: Optional[ChunkedAggregate] = CHUNKED_AGGREGATES.get(
+            metric_configuration.metric_name
+        )
+        if chunked_aggregate is None or not chunked_aggregate.supports(
+            metric_value_kwargs=metric_configuration.metric_value_kwargs or {}
+        ):
+            return None
+
+        # Only the "row_condition" filtering directive is applied to chunks.
+        domain_kwargs: dict = metric_configuration.metric_domain_kwargs or {}
+        domain_keys: set = {
+            key for key, value in domain_kwargs.items() if value is not None
+        } - {"batch_id", "row_condition", "condition_parser"}
+        if chunked_aggregate.domain_type == MetricDomainTypes.COLUMN:
+            if domain_keys != {"column"}:
+                return None
+        elif domain_keys:
+            return None
+
+        return chunked_aggregate.bind(
+            metric_value_kwargs=metric_configuration.metric_value_kwargs or {}
+        )
+
+    def _resolve_chunked_metrics(
+        self, metrics_to_resolve: List[MetricConfiguration]
+    ) -> Dict[Tuple[str, str, str], Any]:
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+        failed_metrics: List[MetricConfiguration] = []
+        exceptions: List[Exception] = []
+
+        metrics_by_batch_id: Dict[str, List[MetricConfiguration]] = {}
+        metric_batch_ids: Dict[Tuple[str, str, str], str] = {}
+        metric_to_resolve: MetricConfiguration
+        for metric_to_resolve in metrics_to_resolve:
+            metric_batch_ids[metric_to_resolve.id] = self._get_metric_batch_id(
+                metric_configuration=metric_to_resolve
+            )
+
+        if self._batch_metric_store is not None:
+            resolved_metrics.update(
+                self._get_persisted_metric_values(
+                    metric_configurations=[
+                        metric_to_resolve
+                        for metric_to_resolve in metrics_to_resolve
+                        if self._is_persistable_metric(
+                            metric_configuration=metric_to_resolve
+                        )
+                    ],
+                    metric_batch_ids=metric_batch_ids,
+                )
+            )
+
+        for metric_to_resolve in metrics_to_resolve:
+            if metric_to_resolve.id in resolved_metrics:
+                continue
+
+            metrics_by_batch_id.setdefault(
+                metric_batch_ids[metric_to_resolve.id], []
+            ).append(metric_to_resolve)
+
+        batch_id: str
+        batch_metrics: List[MetricConfiguration]
+        for batch_id, batch_metrics in metrics_by_batch_id.items():
+            batch_data: PandasBatchData = self.loaded_batch_data_dict[batch_id]
+            chunks: Iterable[pd.DataFrame] = (
+                batch_data.iter_chunks()
+                if isinstance(batch_data, PandasChunkedBatchData)
+                else [batch_data.dataframe]
+            )
+            chunked_aggregates: Dict[Tuple[str, str, str], ChunkedAggregate] = {
+                metric_to_resolve.id: self._get_chunked_aggregate(
+                    metric_configuration=metric_to_resolve
+                )
+                for metric_to_resolve in batch_metrics
+            }
+            partials: Dict[Tuple[str, str, str], Any] = {}
+            failed_metric_ids: set = set()
+
+            chunk: pd.DataFrame
+            for chunk in chunks:
+                # Records of chunk, filtered by "row_condition", are shared by metrics with the same condition.
+                domain_records: Dict[Tuple[str, str], pd.DataFrame] = {}
+                for metric_to_resolve in batch_metrics:
+                    if metric_to_resolve.id in failed_metric_ids:
+                        continue
+
+                    domain_kwargs: dict = metric_to_resolve.metric_domain_kwargs
+                    column: Optional[str] = domain_kwargs.get("column")
+                    condition_key: Tuple[str, str] = (
+                        domain_kwargs.get("row_condition") or "",
+                        domain_kwargs.get("condition_parser") or "",
+                    )
+                    try:
+                        if column is not None and column not in chunk.columns:
+                            raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                                message=f'Error: The column "{column}" in BatchData does not exist.'
+                            )
+
+                        if condition_key not in domain_records:
+                            domain_records[condition_key] = self._filter_domain_records(
+                                data=chunk,
+                                domain_kwargs={
+                                    "row_condition": condition_key[0],
+                                    "condition_parser": condition_key[1],
+                                },
+                            )
+
+                        chunked_aggregate: ChunkedAggregate = chunked_aggregates[
+                            metric_to_resolve.id
+                        ]
+                        partial_result: Any = chunked_aggregate.compute(
+                            data=domain_records[condition_key], column=column
+                        )
+                        if metric_to_resolve.id in partials:
+                            partial_result = chunked_aggregate.merge(
+                                partials[metric_to_resolve.id], partial_result
+                            )
+
+                        partials[metric_to_resolve.id] = partial_result
+                    except Exception as e:
+                        failed_metric_ids.add(metric_to_resolve.id)
+                        failed_metrics.append(metric_to_resolve)
+                        exceptions.append(e)
+
+            for metric_to_resolve in batch_metrics:
+                if metric_to_resolve.id in failed_metric_ids:
+                    continue
+
+                try:
+                    resolved_metrics[metric_to_resolve.id] = chunked_aggregates[
+                        metric_to_resolve.id
+                    ].finalize(partials[metric_to_resolve.id])
+                except Exception as e:
+                    failed_metrics.append(metric_to_resolve)
+                    exceptions.append(e)
+
+            if self._batch_metric_store is not None:
+                self._persist_metric_values(
+                    metric_configurations=batch_metrics,
+                    resolved_metrics=resolved_metrics,
+                    metric_batch_ids=metric_batch_ids,
+                )
+
+            self._metric_cache.update(
+                batch_id=batch_id,
+                metrics={
+                    metric_to_resolve.id: resolved_metrics[metric_to_resolve.id]
+                    for metric_to_resolve in batch_metrics
+                    if metric_to_resolve.id in resolved_metrics
+                },
+            )
+
+        if failed_metrics:
+            raise ge_exceptions.MetricResolutionError(
+                message="; ".join(str(e) for e in exceptions),
+                failed_metrics=failed_metrics,
+            ) from exceptions[0]
+
+        return resolved_metrics
+
+    def resolve_metric_bundle(
+        self,
+        metric_fn_bundle: Iterable[BundledMetricConfiguration],
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Resolves bundled column aggregate metrics, sharing work among metrics computed on the same domain.
+
+        Records of every compute domain (i.e., with "row_condition" applied) are obtained once.  Values of every column
+        of that domain (with null values dropped, if requested by "filter_column_isnull" accessor domain kwarg) are also
+        obtained once, and all aggregate functions on that column are evaluated on the same Series.
+
+            Args:
+                metric_fn_bundle (Iterable[BundledMetricConfiguration]): \
+                    "BundledMetricConfiguration" contains MetricProvider's MetricConfiguration (its unique identifier),
+                    its aggregate function (accepting column values as "column" argument), and domain kwargs.
+
+            Returns:
+                A dictionary of "MetricConfiguration" IDs and their corresponding fully resolved values.
+        """
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+        failed_metrics: List[MetricConfiguration] = []
+        exceptions: List[Exception] = []
+
+        domain_records: Dict[str, pd.DataFrame] = {}
+        column_values: Dict[Tuple[str, str, bool], pd.Series] = {}
+
+        bundled_metric_configuration: BundledMetricConfiguration
+        for bundled_metric_configuration in metric_fn_bundle:
+            metric_to_resolve: MetricConfiguration = (
+                bundled_metric_configuration.metric_configuration
+            )
+            compute_domain_kwargs: dict = (
+                bundled_metric_configuration.compute_domain_kwargs
+            )
+            column_name: str = bundled_metric_configuration.accessor_domain_kwargs[
+                "column"
+            ]
+            filter_column_isnull: bool = (
+                bundled_metric_configuration.accessor_domain_kwargs.get(
+                    "filter_column_isnull", False
+                )
+            )
+            try:
+                domain_id: str = IDDict.convert_dictionary_to_id_dict(
+                    data=convert_to_json_serializable(data=compute_domain_kwargs)
+                ).to_id()
+                if domain_id not in domain_records:
+                    domain_records[domain_id] = self.get_domain_records(
+                        domain_kwargs=compute_domain_kwargs
+                    )
+
+                column_key: Tuple[str, str, bool] = (
+                    domain_id,
+                    column_name,
+                    filter_column_isnull,
+                )
+                if column_key not in column_values:
+                    column: pd.Series = domain_records[domain_id][column_name]
+                    if filter_column_isnull:
+                        column = column[column.notnull()]
+
+                    column_values[column_key] = column
+
+                resolved_metrics[
+                    metric_to_resolve.id
+                ] = bundled_metric_configuration.metric_fn(
+                    column=column_values[column_key]
+                )
+            except Exception as e:
+                failed_metrics.append(metric_to_resolve)
+                exceptions.append(e)
+
+        # Only failed metrics are reported, so that the remaining metrics of the bundle are not penalized.
+        if failed_metrics:
+            raise ge_exceptions.MetricResolutionError(
+                message="; ".join(str(e) for e in exceptions),
+                failed_metrics=failed_metrics,
+            ) from exceptions[0]
+
+        return resolved_metrics
+
 
 def hash_pandas_dataframe(df):
     try:
@@ -608,3 +1115,19 @@ def hash_pandas_dataframe(df):
         obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
 
     return hashlib.md5(obj).hexdigest()
+
+
+def hash_pandas_dataframe_chunks(chunks: Iterable[pd.DataFrame]) -> str:
+    """Computes the fingerprint of a DataFrame, read in chunks, as "hash_pandas_dataframe()" would for the whole one."""
+    md5 = hashlib.md5()
+    df: pd.DataFrame
+    for df in chunks:
+        try:
+            obj = pd.util.hash_pandas_object(df, index=True).values
+        except TypeError:
+            # In case of facing unhashable objects (like dict), use pickle
+            obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
+
+        md5.update(obj)
+
+    return md5.hexdigest()
@@ -1,10 +1,12 @@
 import copy
 import datetime
 import logging
+import threading
 import uuid
 import warnings
+from collections import OrderedDict
 from functools import reduce
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from dateutil.parser import parse
 
@@ -29,6 +31,9 @@ from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.bundled_metric_configuration import (
     BundledMetricConfiguration,
 )
+from great_expectations.execution_engine.execution_engine import (
+    MetricPartialFunctionTypes,
+)
 from great_expectations.execution_engine.sparkdf_batch_data import SparkDFBatchData
 from great_expectations.execution_engine.split_and_sample.sparkdf_data_sampler import (
     SparkDataSampler,
@@ -36,6 +41,7 @@ from great_expectations.execution_engine.split_and_sample.sparkdf_data_sampler i
 from great_expectations.execution_engine.split_and_sample.sparkdf_data_splitter import (
     SparkDataSplitter,
 )
+from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -45,18 +51,25 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PERSIST_STORAGE_LEVEL: str = "MEMORY_AND_DISK"
+DEFAULT_PERSIST_DOMAIN_RECORDS_MAX_ENTRIES: int = 8
+
+# Metrics, obtained from the schema of batch data (i.e., without running a Spark job over it).
+SCHEMA_METRIC_NAMES: Set[str] = {"table.columns", "table.column_types"}
+
 try:
     import pyspark
     import pyspark.sql.functions as F
 
     # noinspection SpellCheckingInspection
     import pyspark.sql.types as sparktypes
-    from pyspark import SparkContext
+    from pyspark import SparkContext, StorageLevel
     from pyspark.sql import DataFrame, Row, SparkSession
     from pyspark.sql.readwriter import DataFrameReader
 except ImportError:
     pyspark = None
     SparkContext = None
+    StorageLevel = None
     SparkSession = None
     Row = None
     DataFrame = None
@@ -164,11 +177,19 @@ class SparkDFExecutionEngine(ExecutionEngine):
         persist=True,
         spark_config=None,
         force_reuse_spark_context=False,
+        persist_storage_level: str = DEFAULT_PERSIST_STORAGE_LEVEL,
+        persist_domain_records_max_entries: int = DEFAULT_PERSIST_DOMAIN_RECORDS_MAX_ENTRIES,
+        combine_conditional_domains: bool = False,
         **kwargs,
     ) -> None:
         # Creation of the Spark DataFrame is done outside this class
         self._persist = persist
 
+        # If True, aggregate metrics, whose domains differ only by their "row_condition" and "filter_conditions"
+        # directives, apply these conditions to the aggregated values (using "F.when()"), so that all of them are
+        # computed over the unfiltered domain in a single Spark job, instead of in one job per filtered domain.
+        self._combine_conditional_domains = combine_conditional_domains
+
         if spark_config is None:
             spark_config = {}
 
@@ -186,6 +207,26 @@ class SparkDFExecutionEngine(ExecutionEngine):
         azure_options: dict = kwargs.pop("azure_options", {})
         self._azure_options = azure_options
 
+        # If "persist" is True, batch data is persisted (at the given storage level) once metrics to be resolved require
+        # more than one pass over it, and filtered domain records (by "row_condition", "filter_conditions", and
+        # "ignore_row_if" directives) are persisted once they are requested again (must exist before batch data is loaded).
+        try:
+            self._persist_storage_level = getattr(StorageLevel, persist_storage_level)
+        except AttributeError:
+            raise ExecutionEngineError(
+                f'Unrecognized persist_storage_level "{persist_storage_level}" for SparkDFExecutionEngine.'
+            )
+
+        self._persist_domain_records_max_entries = persist_domain_records_max_entries
+        self._batch_data_passes: Dict[str, int] = {}
+        self._persisted_batch_ids: set = set()
+        self._domain_records_uses: Dict[Tuple[str, str], int] = {}
+        self._persisted_domain_records: "OrderedDict[Tuple[str, str], DataFrame]" = (
+            OrderedDict()
+        )
+        # Metrics of the same ExecutionEngine may be resolved concurrently (e.g., by Rules of RuleBasedProfiler).
+        self._persistence_lock = threading.RLock()
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -195,6 +236,20 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "azure_options": azure_options,
             }
         )
+        # Persistence and domain combination settings are recorded in config only if they differ from their defaults.
+        if persist_storage_level != DEFAULT_PERSIST_STORAGE_LEVEL:
+            self._config["persist_storage_level"] = persist_storage_level
+
+        if (
+            persist_domain_records_max_entries
+            != DEFAULT_PERSIST_DOMAIN_RECORDS_MAX_ENTRIES
+        ):
+            self._config[
+                "persist_domain_records_max_entries"
+            ] = persist_domain_records_max_entries
+
+        if combine_conditional_domains:
+            self._config["combine_conditional_domains"] = combine_conditional_domains
 
         self._data_splitter = SparkDataSplitter()
         self._data_sampler = SparkDataSampler()
@@ -218,8 +273,151 @@ class SparkDFExecutionEngine(ExecutionEngine):
             raise GreatExpectationsError(
                 "SparkDFExecutionEngine requires batch data that is either a DataFrame or a SparkDFBatchData object"
             )
+        self._unpersist_batch_data(batch_id=batch_id)
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    def unload_batch_data(self, batch_id: str) -> None:
+        self._unpersist_batch_data(batch_id=batch_id)
+        super().unload_batch_data(batch_id=batch_id)
+
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricConfiguration]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], Any]:
+        metrics_to_resolve = list(metrics_to_resolve)
+        if self._persist:
+            # Spark jobs over data of every batch are counted; once more than one pass is required (in this or in
+            # previous calls), batch data is persisted, so that subsequent passes do not re-read the source.
+            batch_id: str
+            num_passes: int
+            batch_data_passes: Dict[str, int] = self._count_batch_data_passes(
+                metrics_to_resolve=metrics_to_resolve
+            )
+            with self._persistence_lock:
+                for batch_id, num_passes in batch_data_passes.items():
+                    self._batch_data_passes[batch_id] = (
+                        self._batch_data_passes.get(batch_id, 0) + num_passes
+                    )
+                    if self._batch_data_passes[batch_id] > 1:
+                        self._persist_batch_data(batch_id=batch_id)
+
+        return super().resolve_metrics(
+            metrics_to_resolve=metrics_to_resolve,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+
+    def _count_batch_data_passes(
+        self, metrics_to_resolve: List[MetricConfiguration]
+    ) -> Dict[str, int]:
+        """
+        Returns the number of Spark jobs over data of every batch, required to resolve given metrics: bundled metrics
+        (aggregates) of a batch are computed by one job, and every other value metric (e.g., unexpected values of a map
+        condition) runs its own job; partial metrics (functions) and metrics obtained from the schema run none.
+        """
+        num_passes: Dict[str, int] = {}
+        bundled_batch_ids: Set[str] = set()
+        metric_to_resolve: MetricConfiguration
+        for metric_to_resolve in metrics_to_resolve:
+            batch_id: Optional[str] = self._get_metric_batch_id(
+                metric_configuration=metric_to_resolve
+            )
+            if (
+                batch_id not in self.loaded_batch_data_dict
+                or metric_to_resolve.metric_name in SCHEMA_METRIC_NAMES
+            ):
+                continue
+
+            try:
+                _, metric_fn = get_metric_provider(
+                    metric_name=metric_to_resolve.metric_name, execution_engine=self
+                )
+            except ge_exceptions.MetricProviderError:
+                continue
+
+            if metric_fn is None or hasattr(metric_fn, "aggregate_partial_fn"):
+                bundled_batch_ids.add(batch_id)
+            elif not isinstance(
+                getattr(metric_fn, "metric_fn_type", None), MetricPartialFunctionTypes
+            ):
+                num_passes[batch_id] = num_passes.get(batch_id, 0) + 1
+
+        for batch_id in bundled_batch_ids:
+            num_passes[batch_id] = num_passes.get(batch_id, 0) + 1
+
+        return num_passes
+
+    def _persist_batch_data(self, batch_id: str) -> None:
+        with self._persistence_lock:
+            if batch_id in self._persisted_batch_ids:
+                return
+
+            dataframe: DataFrame = self.loaded_batch_data_dict[batch_id].dataframe
+            # DataFrames, which are already cached (e.g., by the caller, supplying runtime batch data), are left as they are.
+            if dataframe.is_cached:
+                return
+
+            dataframe.persist(self._persist_storage_level)
+            self._persisted_batch_ids.add(batch_id)
+            logger.debug(
+                f"SparkDFExecutionEngine persisted data of batch_id {batch_id} at storage level {self._persist_storage_level}."
+            )
+
+    def _unpersist_batch_data(self, batch_id: str) -> None:
+        """Unpersists data of the given batch (if persisted by this execution engine) and its filtered domain records."""
+        cache_key: Tuple[str, str]
+        with self._persistence_lock:
+            for cache_key in list(self._persisted_domain_records.keys()):
+                if cache_key[0] == batch_id:
+                    self._persisted_domain_records.pop(cache_key).unpersist()
+
+            for cache_key in list(self._domain_records_uses.keys()):
+                if cache_key[0] == batch_id:
+                    del self._domain_records_uses[cache_key]
+
+            self._batch_data_passes.pop(batch_id, None)
+            if batch_id in self._persisted_batch_ids:
+                logger.debug(
+                    f"SparkDFExecutionEngine unpersisted data of batch_id {batch_id} ({self.get_persisted_data_size(batch_id=batch_id)} bytes)."
+                )
+                self._persisted_batch_ids.discard(batch_id)
+                self.loaded_batch_data_dict[batch_id].dataframe.unpersist()
+
+    def get_persisted_data_size(self, batch_id: Optional[str] = None) -> int:
+        """
+        Returns the size (in bytes) of data, persisted by this execution engine, of the given batch (or of all batches,
+        if batch_id is None), including filtered domain records.  Persisted data is materialized by the first pass over
+        it; until then, its size is estimated by the Spark optimizer.
+        """
+        dataframes: List[DataFrame]
+        with self._persistence_lock:
+            dataframes = [
+                self.loaded_batch_data_dict[persisted_batch_id].dataframe
+                for persisted_batch_id in self._persisted_batch_ids
+                if batch_id is None or persisted_batch_id == batch_id
+            ]
+            dataframes.extend(
+                [
+                    dataframe
+                    for cache_key, dataframe in self._persisted_domain_records.items()
+                    if batch_id is None or cache_key[0] == batch_id
+                ]
+            )
+
+        dataframe: DataFrame
+        return sum(
+            int(
+                dataframe._jdf.queryExecution()
+                .optimizedPlan()
+                .stats()
+                .sizeInBytes()
+                .toString()
+            )
+            for dataframe in dataframes
+        )
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -414,6 +612,7 @@ Please check your config."""
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data.dataframe
             else:
                 raise ValidationError(
@@ -425,6 +624,49 @@ Please check your config."""
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
+        cache_key: Optional[Tuple[str, str]] = self._get_domain_records_cache_key(
+            batch_id=batch_id, domain_kwargs=domain_kwargs
+        )
+        if cache_key is None:
+            return data
+
+        with self._persistence_lock:
+            if cache_key in self._persisted_domain_records:
+                self._persisted_domain_records.move_to_end(cache_key)
+                return self._persisted_domain_records[cache_key]
+
+        data = self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+        if self._persist:
+            with self._persistence_lock:
+                # Another thread may have persisted the same domain records in the meantime.
+                if cache_key in self._persisted_domain_records:
+                    self._persisted_domain_records.move_to_end(cache_key)
+                    return self._persisted_domain_records[cache_key]
+
+                self._domain_records_uses[cache_key] = (
+                    self._domain_records_uses.get(cache_key, 0) + 1
+                )
+                if self._domain_records_uses[cache_key] > 1:
+                    self._persist_domain_records(cache_key=cache_key, data=data)
+
+        return data
+
+    def _persist_domain_records(
+        self, cache_key: Tuple[str, str], data: DataFrame
+    ) -> None:
+        """Persists filtered domain records, evicting the least recently used ones (must be called under lock)."""
+        data.persist(self._persist_storage_level)
+        self._persisted_domain_records[cache_key] = data
+
+        evicted_data: DataFrame
+        while (
+            len(self._persisted_domain_records)
+            > self._persist_domain_records_max_entries
+        ):
+            _, evicted_data = self._persisted_domain_records.popitem(last=False)
+            evicted_data.unpersist()
+
+    def _filter_domain_records(self, data: DataFrame, domain_kwargs: dict) -> DataFrame:
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
@@ -616,6 +858,57 @@ Please check your config."""
 
         return new_domain_kwargs
 
+    def split_domain_condition(
+        self, domain_kwargs: dict
+    ) -> Tuple[dict, Optional["pyspark.sql.Column"]]:
+        """
+        Separates "row_condition" and "filter_conditions" directives from the given domain kwargs, if
+        "combine_conditional_domains" is enabled, so that aggregate metrics can apply the condition to the aggregated
+        values (e.g., "F.max(F.when(condition, column))") and be bundled with other metrics over the unfiltered domain.
+
+        Args:
+            domain_kwargs (dict) - A dictionary consisting of the domain kwargs specifying which data to obtain
+
+        Returns:
+            A tuple including:
+              - a dictionary of domain kwargs without conditions (or the given domain kwargs, if not separated)
+              - a Spark Column, which is the conjunction of the separated conditions (or None)
+        """
+        if not self._combine_conditional_domains or (
+            "column" not in domain_kwargs and "ignore_row_if" in domain_kwargs
+        ):
+            return domain_kwargs, None
+
+        conditions: List["pyspark.sql.Column"] = []
+
+        row_condition: Optional[str] = domain_kwargs.get("row_condition")
+        if row_condition:
+            condition_parser: Optional[str] = domain_kwargs.get("condition_parser")
+            if condition_parser == "spark":
+                conditions.append(F.expr(row_condition))
+            elif condition_parser == "great_expectations__experimental__":
+                conditions.append(parse_condition_to_spark(row_condition))
+            else:
+                # Unrecognized condition parsers are reported, when domain records are obtained.
+                return domain_kwargs, None
+
+        filter_conditions: List[RowCondition] = domain_kwargs.get(
+            "filter_conditions", []
+        )
+        if len(filter_conditions) > 0:
+            filter_condition = self._combine_row_conditions(filter_conditions)
+            conditions.append(F.expr(filter_condition.condition))
+
+        if not conditions:
+            return domain_kwargs, None
+
+        unconditional_domain_kwargs: dict = {
+            key: value
+            for key, value in domain_kwargs.items()
+            if key not in ["row_condition", "condition_parser", "filter_conditions"]
+        }
+        return unconditional_domain_kwargs, reduce(lambda a, b: a & b, conditions)
+
     def resolve_metric_bundle(
         self,
         metric_fn_bundle: Iterable[BundledMetricConfiguration],
@@ -117,6 +117,8 @@ class SqlAlchemyBatchData(BatchData):
 
         self._dialect = dialect
 
+        self._created_temp_table = False
+
         if table_name:
             # Suggestion: pull this block out as its own _function
             if use_quoted_name:
@@ -162,6 +164,7 @@ class SqlAlchemyBatchData(BatchData):
                 query=query,
                 temp_table_schema_name=temp_table_schema_name,
             )
+            self._created_temp_table = True
             self._selectable = sa.Table(
                 generated_table_name,
                 sa.MetaData(),
@@ -173,6 +176,15 @@ class SqlAlchemyBatchData(BatchData):
             else:
                 self._selectable = selectable.alias(self._record_set_name)
 
+        # The source of records (i.e., the table, query, or selectable, prior to creating any temporary table) identifies
+        # this batch data independently of the (randomly named) temporary table.
+        if table_name:
+            self._source_selectable = self._selectable
+        elif selectable is not None:
+            self._source_selectable = selectable
+        else:
+            self._source_selectable = query
+
     @property
     def dialect(self) -> GESqlDialect:
         return self._dialect
@@ -194,6 +206,10 @@ class SqlAlchemyBatchData(BatchData):
     def source_schema_name(self):
         return self._source_schema_name
 
+    @property
+    def source_selectable(self):
+        return self._source_selectable
+
     @property
     def selectable(self):
         return self._selectable
@@ -202,6 +218,11 @@ class SqlAlchemyBatchData(BatchData):
     def use_quoted_name(self):
         return self._use_quoted_name
 
+    @property
+    def created_temp_table(self) -> bool:
+        """Whether or not the selectable of this batch is a temporary table (which may be visible to one session only)."""
+        return self._created_temp_table
+
     def _create_temporary_table(
         self, temp_table_name, query, temp_table_schema_name=None
     ) -> None:
@@ -7,10 +7,24 @@ import os
 import random
 import re
 import string
+import threading
+import time
 import traceback
 import warnings
+from collections import deque
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from great_expectations._version import get_versions  # isort:skip
 
@@ -32,11 +46,13 @@ del get_versions  # isort:skip
 
 
 from great_expectations.core import IDDict
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
     SqlAlchemyDatasourceBatchSpec,
 )
+from great_expectations.data_context.store.metric_store import BatchMetricStore
 from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.exceptions import (
     DatasourceKeyPairAuthBadPassphraseError,
@@ -51,6 +67,7 @@ from great_expectations.execution_engine.execution_engine import (
     MetricDomainTypes,
     SplitDomainKwargs,
 )
+from great_expectations.execution_engine.metric_cache import MetricCache
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
@@ -80,13 +97,20 @@ except ImportError:
 try:
     from sqlalchemy.engine import Dialect, Row
     from sqlalchemy.exc import OperationalError
-    from sqlalchemy.sql import Selectable
+    from sqlalchemy.sql import Selectable, operators, visitors
     from sqlalchemy.sql.elements import (
         BooleanClauseList,
+        ColumnClause,
+        FunctionFilter,
         Label,
+        Over,
         TextClause,
+        UnaryExpression,
+        WithinGroup,
         quoted_name,
     )
+    from sqlalchemy.sql.functions import FunctionElement
+    from sqlalchemy.sql.selectable import ScalarSelect, SelectBase
 except ImportError:
     Row = None
     Dialect = None
@@ -98,6 +122,16 @@ except ImportError:
     quoted_name = None
     OperationalError = None
     Label = None
+    operators = None
+    visitors = None
+    ColumnClause = None
+    FunctionFilter = None
+    Over = None
+    UnaryExpression = None
+    WithinGroup = None
+    FunctionElement = None
+    ScalarSelect = None
+    SelectBase = None
 
 
 try:
@@ -217,6 +251,104 @@ def _get_dialect_type_module(dialect):
     return dialect
 
 
+# Number of most recent per-domain metric bundle query timings, retained by SqlAlchemyExecutionEngine.
+_METRIC_BUNDLE_QUERY_TIMINGS_MAX_ENTRIES: int = 1000
+
+# Aggregate functions of one argument, which ignore NULL values (hence, "f(CASE WHEN <condition> THEN x END)" aggregates
+# only the rows satisfying "<condition>"), and scalar functions, which may be applied to (or within) such aggregates.
+_CONDITIONAL_AGGREGATE_FUNCTION_NAMES: Set[str] = {
+    "avg",
+    "count",
+    "max",
+    "min",
+    "stddev",
+    "stddev_pop",
+    "stddev_samp",
+    "stdev",
+    "sum",
+    "var_pop",
+    "var_samp",
+    "variance",
+}
+_CONDITIONAL_AGGREGATE_SCALAR_FUNCTION_NAMES: Set[str] = {
+    "abs",
+    "ceil",
+    "ceiling",
+    "char_length",
+    "coalesce",
+    "floor",
+    "len",
+    "length",
+    "lower",
+    "nullif",
+    "power",
+    "round",
+    "sqrt",
+    "trim",
+    "upper",
+}
+
+
+def _apply_condition_to_aggregate_metric_fn(metric_fn: Any, condition: Optional[Any]):
+    """Returns copy of "metric_fn" with "condition" applied to each of its aggregates (None if this is not possible)."""
+    num_aggregates: int = 0
+
+    element: Any
+    for element in visitors.iterate(metric_fn):
+        if isinstance(
+            element,
+            (Over, FunctionFilter, WithinGroup, TextClause, ScalarSelect, SelectBase),
+        ):
+            return None
+
+        if (
+            isinstance(element, UnaryExpression)
+            and element.operator is operators.distinct_op
+        ):
+            return None
+
+        if isinstance(element, FunctionElement):
+            if getattr(element, "packagenames", None):
+                return None
+
+            function_name: str = getattr(element, "name", "").lower()
+            if function_name in _CONDITIONAL_AGGREGATE_FUNCTION_NAMES:
+                if len(element.clauses.clauses) != 1:
+                    return None
+
+                num_aggregates += 1
+            elif function_name not in _CONDITIONAL_AGGREGATE_SCALAR_FUNCTION_NAMES:
+                return None
+
+    if num_aggregates == 0:
+        return None
+
+    if condition is None:
+        return metric_fn
+
+    def _replace_aggregate(element: Any) -> Optional[Any]:
+        if not (
+            isinstance(element, FunctionElement)
+            and element.name.lower() in _CONDITIONAL_AGGREGATE_FUNCTION_NAMES
+        ):
+            return None
+
+        argument: Any = element.clauses.clauses[0]
+        if (
+            isinstance(argument, ColumnClause)
+            and argument.is_literal
+            and argument.name == "*"
+        ):
+            # "count(*)" counts rows; "count(CASE WHEN <condition> THEN 1 END)" counts rows satisfying "<condition>".
+            argument = sa.literal_column("1")
+
+        return getattr(sa.func, element.name)(
+            sa.case([(condition, argument)]), type_=element.type
+        )
+
+    return visitors.replacement_traverse(metric_fn, {}, _replace_aggregate)
+
+
 class SqlAlchemyExecutionEngine(ExecutionEngine):
     def __init__(
         self,
@@ -229,6 +361,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
         concurrency: Optional[ConcurrencyConfig] = None,
+        combine_conditional_domains: bool = False,
+        metric_cache: Optional[Union[MetricCache, dict]] = None,
+        batch_metric_store: Optional[Union[BatchMetricStore, dict]] = None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ) -> None:
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -255,17 +390,48 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     If neither the engines, the credentials, nor the connection_string have been provided,
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
-                concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.
+                concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine and to \
+                    execute per-domain metric bundle queries concurrently (defaults to the DataContext configuration).
+                combine_conditional_domains (bool): If True, bundled metrics, whose domains differ only by their \
+                    "row_condition" and "filter_conditions" directives, are computed in a single query (table scan), \
+                    using conditional aggregates, instead of in one query per domain.
+                metric_cache (MetricCache or dict): MetricCache object (or its configuration) used to retain values of \
+                    resolved metrics (defaults to a bounded LRUMetricCache).
+                batch_metric_store (BatchMetricStore or dict): Optional BatchMetricStore object (or its configuration) \
+                    used to persist values of resolved metrics across runs.  SQL batch data is fingerprinted by the \
+                    database URL and the table (or query) it is obtained from, so it must be immutable.
         """
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            metric_cache=metric_cache,
+            batch_metric_store=batch_metric_store,
+        )
         self._name = name
 
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        self._combine_conditional_domains = combine_conditional_domains
         os.environ["SF_PARTNER"] = "great_expectations_oss"
 
+        if concurrency is None and data_context is not None:
+            concurrency = data_context.concurrency
+
+        if not isinstance(concurrency, ConcurrencyConfig):
+            concurrency = ConcurrencyConfig()
+
+        self._concurrency = concurrency
+
+        # Elapsed time (in seconds) of most recent per-domain queries issued by "resolve_metric_bundle()", as (domain_id,
+        # elapsed time) pairs; metric bundles may be resolved concurrently, so these are appended under lock (never
+        # replaced), and only a bounded number of them is retained (so that long-lived engines do not accumulate them).
+        self._metric_bundle_query_timings: Deque[Tuple[str, float]] = deque(
+            maxlen=_METRIC_BUNDLE_QUERY_TIMINGS_MAX_ENTRIES
+        )
+        self._metric_bundle_query_timings_lock = threading.Lock()
+
         if engine is not None:
             if credentials is not None:
                 logger.warning(
@@ -274,12 +440,6 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 )
             self.engine = engine
         else:
-            concurrency: ConcurrencyConfig
-            if data_context is None or data_context.concurrency is None:
-                concurrency = ConcurrencyConfig()
-            else:
-                concurrency = data_context.concurrency
-
             concurrency.add_sqlalchemy_create_engine_parameters(kwargs)
 
             if credentials is not None:
@@ -391,6 +551,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "metric_cache": metric_cache if isinstance(metric_cache, dict) else None,
+            "batch_metric_store": batch_metric_store
+            if isinstance(batch_metric_store, dict)
+            else None,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -404,6 +568,12 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def credentials(self) -> Optional[dict]:
         return self._credentials
 
+    @property
+    def metric_bundle_query_timings(self) -> List[Tuple[str, float]]:
+        """Pairs of domain_id and elapsed time (in seconds) of most recent queries issued by metric bundle resolutions."""
+        with self._metric_bundle_query_timings_lock:
+            return list(self._metric_bundle_query_timings)
+
     @property
     def connection_string(self) -> Optional[str]:
         return self._connection_string
@@ -943,40 +1113,44 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             queries[domain_id]["ids"].append(metric_to_resolve.id)
 
+        if self._combine_conditional_domains:
+            queries = self._combine_conditional_metric_bundle_queries(queries=queries)
+
+        # Selectables are built up front, so that only query execution proceeds concurrently.
         for query in queries.values():
-            domain_kwargs: dict = query["domain_kwargs"]
-            selectable: Any = self.get_domain_records(
-                domain_kwargs=domain_kwargs,
+            query["selectable"] = self.get_domain_records(
+                domain_kwargs=query["domain_kwargs"],
             )
-
             assert len(query["select"]) == len(query["ids"])
 
-            try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if TextClause and isinstance(selectable, TextClause):
-                    res = self.engine.execute(
-                        sa.select(query["select"]).select_from(
-                            selectable.columns().subquery()
-                        )
-                    ).fetchall()
-                else:
-                    res = self.engine.execute(
-                        sa.select(query["select"]).select_from(selectable)
-                    ).fetchall()
-
-                logger.debug(
-                    f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict.convert_dictionary_to_id_dict(data=convert_to_json_serializable(data=domain_kwargs)).to_id()}"
+        query_results: Dict[str, Tuple[List[Row], float]] = {}
+        with AsyncExecutor(
+            concurrency_config=self._concurrency,
+            max_workers=len(queries)
+            if self._can_execute_metric_bundle_queries_concurrently(queries=queries)
+            else 1,
+        ) as async_executor:
+            async_results: Dict[str, AsyncResult] = {
+                domain_id: async_executor.submit(
+                    self._execute_metric_bundle_query,
+                    domain_id=domain_id,
+                    query=query,
                 )
-            except OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
-                logger.error(exception_message)
-                raise ExecutionEngineError(message=exception_message)
+                for domain_id, query in queries.items()
+            }
+            query_results = {
+                domain_id: async_result.result()
+                for domain_id, async_result in async_results.items()
+            }
+
+        with self._metric_bundle_query_timings_lock:
+            self._metric_bundle_query_timings.extend(
+                (domain_id, elapsed_time)
+                for domain_id, (_, elapsed_time) in query_results.items()
+            )
+
+        for domain_id, query in queries.items():
+            res = query_results[domain_id][0]
 
             assert (
                 len(res) == 1
@@ -996,6 +1170,178 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
+    def _combine_conditional_metric_bundle_queries(
+        self, queries: Dict[str, dict]
+    ) -> Dict[str, dict]:
+        """
+        Merges per-domain queries, whose domains differ only by "row_condition" and "filter_conditions" directives, into
+        one query over the unfiltered domain.  The condition of every merged domain is moved into the aggregates of its
+        metrics (e.g., "max(x)" becomes "max(CASE WHEN <condition> THEN x END)"), which ignore NULL values.  Domains
+        having any metric, which cannot be rewritten this way (e.g., "DISTINCT" or window functions), are left as is.
+        """
+        domain_groups: Dict[str, List[str]] = {}
+        base_domain_kwargs: Dict[str, IDDict] = {}
+        domain_conditions: Dict[str, Optional[Any]] = {}
+
+        domain_id: str
+        query: dict
+        for domain_id, query in queries.items():
+            domain_kwargs: IDDict = query["domain_kwargs"]
+            row_condition: Optional[str] = domain_kwargs.get("row_condition")
+            filter_conditions: List[RowCondition] = (
+                domain_kwargs.get("filter_conditions") or []
+            )
+            if (
+                row_condition is not None
+                and domain_kwargs.get("condition_parser")
+                != "great_expectations__experimental__"
+            ) or not (
+                len(filter_conditions) <= 1
+                and all(
+                    filter_condition.condition_type == RowConditionParserType.GE
+                    for filter_condition in filter_conditions
+                )
+            ):
+                continue
+
+            condition_clauses: list = []
+            if row_condition is not None:
+                condition_clauses.append(parse_condition_to_sqlalchemy(row_condition))
+
+            if filter_conditions:
+                condition_clauses.append(
+                    parse_condition_to_sqlalchemy(filter_conditions[0].condition)
+                )
+
+            domain_conditions[domain_id] = (
+                sa.and_(*condition_clauses) if condition_clauses else None
+            )
+
+            base_kwargs: IDDict = IDDict(
+                {
+                    key: value
+                    for key, value in domain_kwargs.items()
+                    if key
+                    not in ["row_condition", "condition_parser", "filter_conditions"]
+                }
+            )
+            base_domain_id: str = IDDict.convert_dictionary_to_id_dict(
+                data=convert_to_json_serializable(data=base_kwargs)
+            ).to_id()
+            base_domain_kwargs[base_domain_id] = base_kwargs
+            domain_groups.setdefault(base_domain_id, []).append(domain_id)
+
+        combined_queries: Dict[str, dict] = {}
+        merged_domain_ids: Set[str] = set()
+
+        base_domain_id: str
+        domain_ids: List[str]
+        for base_domain_id, domain_ids in domain_groups.items():
+            rewritten_selects: Dict[str, list] = {}
+            for domain_id in domain_ids:
+                selects: list = [
+                    _apply_condition_to_aggregate_metric_fn(
+                        metric_fn=labeled_metric_fn.element,
+                        condition=domain_conditions[domain_id],
+                    )
+                    for labeled_metric_fn in queries[domain_id]["select"]
+                ]
+                if all(select is not None for select in selects):
+                    rewritten_selects[domain_id] = [
+                        select.label(labeled_metric_fn.name)
+                        for select, labeled_metric_fn in zip(
+                            selects, queries[domain_id]["select"]
+                        )
+                    ]
+
+            if len(rewritten_selects) <= 1 or all(
+                domain_conditions[domain_id] is None for domain_id in rewritten_selects
+            ):
+                continue
+
+            combined_query: dict = {
+                "select": [],
+                "ids": [],
+                "domain_kwargs": base_domain_kwargs[base_domain_id],
+            }
+            for domain_id, selects in rewritten_selects.items():
+                combined_query["select"].extend(selects)
+                combined_query["ids"].extend(queries[domain_id]["ids"])
+
+            combined_domain_id: str = IDDict(
+                {"combined_domain_ids": sorted(map(str, rewritten_selects.keys()))}
+            ).to_id()
+            combined_queries[combined_domain_id] = combined_query
+            logger.debug(
+                f"SqlAlchemyExecutionEngine combined {len(rewritten_selects)} conditional domains into domain_id {combined_domain_id}"
+            )
+
+            merged_domain_ids.update(rewritten_selects.keys())
+
+        queries = {
+            domain_id: query
+            for domain_id, query in queries.items()
+            if domain_id not in merged_domain_ids
+        }
+        queries.update(combined_queries)
+        return queries
+
+    def _can_execute_metric_bundle_queries_concurrently(
+        self, queries: Dict[str, dict]
+    ) -> bool:
+        # A "Connection" object (used for dialects, whose temporary tables only persist within a connection) cannot be
+        # shared among threads; temporary tables may also be invisible to other pooled connections.
+        if len(queries) <= 1 or not self._concurrency.enabled:
+            return False
+
+        if not isinstance(self.engine, sa.engine.Engine):
+            return False
+
+        batch_data: Any
+        return not any(
+            getattr(batch_data, "created_temp_table", False)
+            for batch_data in self.loaded_batch_data_dict.values()
+        )
+
+    def _execute_metric_bundle_query(
+        self, domain_id: str, query: dict
+    ) -> Tuple[List[Row], float]:
+        selectable: Any = query["selectable"]
+
+        res: List[Row]
+        start_time: float = time.perf_counter()
+        try:
+            """
+            If a custom query is passed, selectable will be TextClause and not formatted
+            as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+            to TextualSelect using sa.columns() before it can be converted to type Subquery
+            """
+            if TextClause and isinstance(selectable, TextClause):
+                res = self.engine.execute(
+                    sa.select(query["select"]).select_from(
+                        selectable.columns().subquery()
+                    )
+                ).fetchall()
+            else:
+                res = self.engine.execute(
+                    sa.select(query["select"]).select_from(selectable)
+                ).fetchall()
+        except OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
+            logger.error(exception_message)
+            raise ExecutionEngineError(message=exception_message)
+
+        elapsed_time: float = time.perf_counter() - start_time
+        logger.debug(
+            f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {domain_id}"
+        )
+        logger.debug(
+            f"SqlAlchemyExecutionEngine query on domain_id {domain_id} took {elapsed_time:.3f} seconds"
+        )
+        return res, elapsed_time
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -1131,6 +1477,35 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             .where(split_clause)
         )
 
+    def _compute_batch_fingerprint(self, batch_data: Any) -> Optional[str]:
+        """
+        SQL batch data is fingerprinted by the database URL (without password) and by the table (or query) that its
+        records are obtained from; contents of the underlying tables are not inspected, and thus must not change.
+        """
+        if not isinstance(batch_data, SqlAlchemyBatchData):
+            return None
+
+        source: Any = batch_data.source_selectable
+        if not isinstance(source, str):
+            if isinstance(source, sa.Table):
+                source = sa.select([sa.text("*")]).select_from(source)
+
+            try:
+                source = str(
+                    source.compile(
+                        dialect=self.engine.dialect,
+                        compile_kwargs={"literal_binds": True},
+                    )
+                )
+            except Exception as e:
+                logger.debug(f"Unable to compute fingerprint of batch data: {e}")
+                return None
+
+        # "self.engine" may be either an Engine or a Connection; both provide the underlying Engine as "engine".
+        return hashlib.md5(
+            f"{repr(self.engine.engine.url)}:{source}".encode("utf-8")
+        ).hexdigest()
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:
@@ -28,6 +28,7 @@ class ExpectColumnBootstrappedKsTestPValueToBeGreaterThan(TableExpectation):
         "p_value",
         "params",
     )
+    validation_dependencies_depend_on_data = False
 
     @classmethod
     @renderer(renderer_type="renderer.prescriptive")
@@ -27,6 +27,7 @@ class ExpectColumnChiSquareTestPValueToBeGreaterThan(TableExpectation):
         "p",
         "tail_weight_holdout",
     )
+    validation_dependencies_depend_on_data = False
 
     @classmethod
     @renderer(renderer_type="renderer.prescriptive")
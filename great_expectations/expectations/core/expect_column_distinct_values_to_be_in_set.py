@@ -130,6 +130,7 @@ class ExpectColumnDistinctValuesToBeInSet(ColumnExpectation):
         "column",
         "value_set",
     )
+    validation_dependencies_depend_on_data = False
 
     @classmethod
     def _atomic_prescriptive_template(
@@ -53,6 +53,7 @@ class ExpectColumnDistinctValuesToContainSet(ColumnExpectation):
         "column",
         "value_set",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -53,6 +53,7 @@ class ExpectColumnDistinctValuesToEqualSet(ColumnExpectation):
         "column",
         "value_set",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
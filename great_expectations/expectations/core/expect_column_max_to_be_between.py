@@ -196,6 +196,7 @@ class ExpectColumnMaxToBeBetween(ColumnExpectation):
         "profiler_config": default_profiler_config,
     }
     args_keys = ("column", "min_value", "max_value", "strict_min", "strict_max")
+    validation_dependencies_depend_on_data = False
 
     """ A Column Map MetricProvider Decorator for the Maximum"""
 
@@ -244,6 +244,7 @@ class ExpectColumnMeanToBeBetween(ColumnExpectation):
         },
         "required": ["column"],
     }
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -192,6 +192,7 @@ class ExpectColumnMedianToBeBetween(ColumnExpectation):
         "strict_min",
         "strict_max",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -195,6 +195,7 @@ class ExpectColumnMinToBeBetween(ColumnExpectation):
         "strict_min",
         "strict_max",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -99,6 +99,7 @@ class ExpectColumnMostCommonValueToBeInSet(ColumnExpectation):
         "column",
         "value_set",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
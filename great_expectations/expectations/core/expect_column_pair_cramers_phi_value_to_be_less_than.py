@@ -44,6 +44,7 @@ class ExpectColumnPairCramersPhiValueToBeLessThan(TableExpectation):
         "column_A",
         "column_B",
     )
+    validation_dependencies_depend_on_data = False
 
     @classmethod
     def _atomic_prescriptive_template(
@@ -76,6 +76,7 @@ class ExpectColumnPairValuesToBeEqual(ColumnPairMapExpectation):
         "column_A",
         "column_B",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
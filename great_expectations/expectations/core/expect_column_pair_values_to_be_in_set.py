@@ -102,6 +102,7 @@ class ExpectColumnPairValuesToBeInSet(ColumnPairMapExpectation):
         "column_B",
         "value_pairs_set",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
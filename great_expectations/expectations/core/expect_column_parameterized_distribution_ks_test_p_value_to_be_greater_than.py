@@ -24,6 +24,7 @@ class ExpectColumnParameterizedDistributionKsTestPValueToBeGreaterThan(
     success_keys = ()
     default_kwarg_values = {}
     args_keys = ()
+    validation_dependencies_depend_on_data = False
 
     @classmethod
     @renderer(renderer_type="renderer.prescriptive")
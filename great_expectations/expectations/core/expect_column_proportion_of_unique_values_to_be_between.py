@@ -195,6 +195,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
         "strict_min",
         "strict_max",
     )
+    validation_dependencies_depend_on_data = False
 
     """ A Column Aggregate MetricProvider Decorator for the Unique Proportion"""
 
@@ -240,6 +240,7 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
         "quantile_ranges",
         "allow_relative_error",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
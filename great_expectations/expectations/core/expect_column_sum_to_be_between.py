@@ -186,6 +186,7 @@ class ExpectColumnSumToBeBetween(ColumnExpectation):
         "strict_min",
         "strict_max",
     )
+    validation_dependencies_depend_on_data = False
 
     """ A Column Map Metric Decorator for the Sum"""
 
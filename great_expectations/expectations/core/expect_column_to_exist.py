@@ -72,6 +72,7 @@ class ExpectColumnToExist(TableExpectation):
         "column_index": None,
     }
     args_keys = ("column", "column_index")
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
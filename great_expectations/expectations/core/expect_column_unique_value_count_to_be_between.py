@@ -184,6 +184,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         "min_value",
         "max_value",
     )
+    validation_dependencies_depend_on_data = False
 
     """ A Column Aggregate Metric Decorator for the Unique Value Count"""
 
@@ -229,6 +229,7 @@ class ExpectColumnValueLengthsToBeBetween(ColumnMapExpectation):
         "min_value",
         "max_value",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -88,6 +88,7 @@ class ExpectColumnValueLengthsToEqual(ColumnMapExpectation):
         "column",
         "value",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -79,6 +79,7 @@ class ExpectColumnValueZScoresToBeLessThan(ColumnMapExpectation):
         "catch_exceptions": False,
     }
     args_keys = ("column", "threshold")
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -228,6 +228,7 @@ class ExpectColumnValuesToBeBetween(ColumnMapExpectation):
         "strict_min",
         "strict_max",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -72,6 +72,7 @@ class ExpectColumnValuesToBeDateutilParseable(ColumnMapExpectation):
         "catch_exceptions": True,
     }
     args_keys = ("column",)
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
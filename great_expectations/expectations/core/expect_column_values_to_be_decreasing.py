@@ -92,6 +92,7 @@ class ExpectColumnValuesToBeDecreasing(ColumnMapExpectation):
         "parse_strings_as_datetimes": False,
     }
     args_keys = ("column",)
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
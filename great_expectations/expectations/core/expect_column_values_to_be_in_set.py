@@ -181,6 +181,7 @@ class ExpectColumnValuesToBeInSet(ColumnMapExpectation):
         "auto": False,
         "profiler_config": default_profiler_config,
     }
+    validation_dependencies_depend_on_data = False
 
     @classmethod
     def _atomic_prescriptive_template(
@@ -91,6 +91,7 @@ class ExpectColumnValuesToBeIncreasing(ColumnMapExpectation):
         "parse_strings_as_datetimes": False,
     }
     args_keys = ("column",)
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
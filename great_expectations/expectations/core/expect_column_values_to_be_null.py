@@ -71,6 +71,7 @@ class ExpectColumnValuesToBeNull(ColumnMapExpectation):
 
     map_metric = "column_values.null"
     args_keys = ("column",)
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
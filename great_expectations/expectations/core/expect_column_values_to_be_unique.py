@@ -85,6 +85,7 @@ class ExpectColumnValuesToBeUnique(ColumnMapExpectation):
         "catch_exceptions": True,
     }
     args_keys = ("column",)
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
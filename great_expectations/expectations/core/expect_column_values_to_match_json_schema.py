@@ -93,6 +93,7 @@ class ExpectColumnValuesToMatchJsonSchema(ColumnMapExpectation):
         "column",
         "json_schema",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
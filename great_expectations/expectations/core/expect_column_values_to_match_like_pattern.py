@@ -45,6 +45,7 @@ class ExpectColumnValuesToMatchLikePattern(ColumnMapExpectation):
         "column",
         "like_pattern",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
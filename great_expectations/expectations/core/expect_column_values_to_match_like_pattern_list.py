@@ -38,6 +38,7 @@ class ExpectColumnValuesToMatchLikePatternList(ColumnMapExpectation):
         "column",
         "like_pattern_list",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
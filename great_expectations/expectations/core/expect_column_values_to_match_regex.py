@@ -158,6 +158,7 @@ class ExpectColumnValuesToMatchRegex(ColumnMapExpectation):
         "column",
         "regex",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
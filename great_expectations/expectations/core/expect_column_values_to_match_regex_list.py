@@ -101,6 +101,7 @@ class ExpectColumnValuesToMatchRegexList(ColumnMapExpectation):
         "column",
         "regex_list",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
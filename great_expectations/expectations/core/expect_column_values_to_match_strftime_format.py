@@ -145,6 +145,7 @@ class ExpectColumnValuesToMatchStrftimeFormat(ColumnMapExpectation):
         "column",
         "strftime_format",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -116,6 +116,7 @@ class ExpectColumnValuesToNotBeInSet(ColumnMapExpectation):
         "column",
         "value_set",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -75,6 +75,7 @@ class ExpectColumnValuesToNotBeNull(ColumnMapExpectation):
 
     map_metric = "column_values.nonnull"
     args_keys = ("column",)
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -86,6 +86,7 @@ class ExpectColumnValuesToNotMatchLikePattern(ColumnMapExpectation):
         "column",
         "like_pattern",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
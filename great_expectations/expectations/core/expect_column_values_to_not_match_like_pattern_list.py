@@ -86,6 +86,7 @@ class ExpectColumnValuesToNotMatchLikePatternList(ColumnMapExpectation):
         "column",
         "like_pattern_list",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -159,6 +159,7 @@ class ExpectColumnValuesToNotMatchRegex(ColumnMapExpectation):
         "column",
         "regex",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
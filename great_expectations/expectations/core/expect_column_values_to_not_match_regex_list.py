@@ -90,6 +90,7 @@ class ExpectColumnValuesToNotMatchRegexList(ColumnMapExpectation):
         "column",
         "regex_list",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -60,6 +60,7 @@ class ExpectMulticolumnSumToEqual(MulticolumnMapExpectation):
         "column_list",
         "sum_total",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
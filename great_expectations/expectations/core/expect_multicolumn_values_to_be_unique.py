@@ -72,6 +72,7 @@ class ExpectMulticolumnValuesToBeUnique(ColumnMapExpectation):
         "catch_exceptions": False,
     }
     args_keys = ("column_list",)
+    validation_dependencies_depend_on_data = False
 
     @classmethod
     def _atomic_prescriptive_template(
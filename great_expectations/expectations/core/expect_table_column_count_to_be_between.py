@@ -84,6 +84,7 @@ class ExpectTableColumnCountToBeBetween(TableExpectation):
         "min_value",
         "max_value",
     )
+    validation_dependencies_depend_on_data = False
 
     """ A Metric Decorator for the Column Count"""
 
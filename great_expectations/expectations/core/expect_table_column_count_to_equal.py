@@ -68,6 +68,7 @@ class ExpectTableColumnCountToEqual(TableExpectation):
         "meta": None,
     }
     args_keys = ("value",)
+    validation_dependencies_depend_on_data = False
 
     """ A Metric Decorator for the Column Count"""
 
@@ -80,6 +80,7 @@ class ExpectTableColumnsToMatchOrderedList(TableExpectation):
         "meta": None,
     }
     args_keys = ("column_list",)
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -134,6 +134,7 @@ class ExpectTableColumnsToMatchSet(TableExpectation):
         "column_set",
         "exact_match",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -163,6 +163,7 @@ class ExpectTableRowCountToBeBetween(TableExpectation):
         "min_value",
         "max_value",
     )
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -68,6 +68,7 @@ class ExpectTableRowCountToEqual(TableExpectation):
         "meta": None,
     }
     args_keys = ("value",)
+    validation_dependencies_depend_on_data = False
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
@@ -63,6 +63,7 @@ class ExpectTableRowCountToEqualOtherTable(TableExpectation):
         "catch_exceptions": False,
     }
     args_keys = ("other_table_name",)
+    validation_dependencies_depend_on_data = False
 
     @classmethod
     def _atomic_prescriptive_template(
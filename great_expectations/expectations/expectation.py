@@ -146,6 +146,11 @@ class Expectation(metaclass=MetaExpectation):
         2. default_kwarg_values is a dictionary that will be used to fill unspecified
            kwargs from the Expectation Configuration.
 
+    Metric dependency graphs of Expectation classes are only reused across Batches by
+    compiled validation plans, if they set `validation_dependencies_depend_on_data` to
+    False, declaring that their `get_validation_dependencies` does not inspect Batch data
+    (e.g., by resolving metrics).
+
     Expectation classes *must* implement the following:
         1. `_validate`
         2. `get_validation_dependencies`
@@ -173,6 +178,7 @@ class Expectation(metaclass=MetaExpectation):
         "result_format": "BASIC",
     }
     args_keys = None
+    validation_dependencies_depend_on_data = True
 
     def __init__(
         self, configuration: Optional[ExpectationConfiguration] = None
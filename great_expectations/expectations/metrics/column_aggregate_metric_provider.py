@@ -1,5 +1,5 @@
 import logging
-from functools import wraps
+from functools import partial, wraps
 from typing import Any, Callable, Dict, Optional, Type
 
 import great_expectations.exceptions as ge_exceptions
@@ -10,6 +10,7 @@ from great_expectations.execution_engine.execution_engine import (
     MetricPartialFunctionTypes,
 )
 from great_expectations.execution_engine.sparkdf_execution_engine import (
+    F,
     SparkDFExecutionEngine,
 )
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
@@ -86,6 +87,49 @@ def column_aggregate_value(
                     _metrics=metrics,
                 )
 
+            if MetricDomainTypes(domain_type) == MetricDomainTypes.COLUMN:
+
+                def aggregate_partial_fn(
+                    cls,
+                    execution_engine: PandasExecutionEngine,
+                    metric_domain_kwargs: Dict,
+                    metric_value_kwargs: Dict,
+                    metrics: Dict[str, Any],
+                    runtime_configuration: Dict,
+                ):
+                    filter_column_isnull = kwargs.get(
+                        "filter_column_isnull",
+                        getattr(cls, "filter_column_isnull", False),
+                    )
+
+                    column_name = metric_domain_kwargs["column"]
+
+                    if column_name not in metrics["table.columns"]:
+                        raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                            message=f'Error: The column "{column_name}" in BatchData does not exist.'
+                        )
+
+                    compute_domain_kwargs = {
+                        k: v for k, v in metric_domain_kwargs.items() if k != "column"
+                    }
+                    # Null values are dropped from the column directly (as in "inner_func"), instead of through a
+                    # "filter_conditions" row condition, whose grammar does not accept every column name.
+                    accessor_domain_kwargs = {
+                        "column": column_name,
+                        "filter_column_isnull": filter_column_isnull,
+                    }
+                    metric_aggregate = partial(
+                        metric_fn, cls, **metric_value_kwargs, _metrics=metrics
+                    )
+                    return (
+                        metric_aggregate,
+                        compute_domain_kwargs,
+                        accessor_domain_kwargs,
+                    )
+
+                # Enables "PandasExecutionEngine" to resolve aggregates of the same domain together in a bundle.
+                inner_func.aggregate_partial_fn = aggregate_partial_fn
+
             return inner_func
 
         return wrapper
@@ -197,6 +241,15 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
                     # We do not copy here because if compute domain is different, it will be copied by get_compute_domain
                     compute_domain_kwargs = metric_domain_kwargs
 
+                # If conditional domains are combined, the condition is applied to the aggregated column (rather than to
+                # the domain records), so that the metric is computed in the same Spark job as unconditional ones.
+                (
+                    compute_domain_kwargs,
+                    condition,
+                ) = execution_engine.split_domain_condition(
+                    domain_kwargs=compute_domain_kwargs
+                )
+
                 (
                     data,
                     compute_domain_kwargs,
@@ -213,6 +266,9 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
                     )
 
                 column = data[column_name]
+                if condition is not None:
+                    column = F.when(condition, column)
+
                 metric_aggregate = metric_fn(
                     cls,
                     column=column,
@@ -2346,8 +2346,18 @@ def _spark_map_condition_unexpected_count_aggregate_fn(
     unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics.get(
         "unexpected_condition"
     )
+    unexpected_count = F.when(unexpected_condition, 1).otherwise(0)
+
+    # If conditional domains are combined, rows not satisfying the domain condition are excluded from the sum (rather
+    # than filtered out of the domain records), so that the count is computed in the same Spark job as other metrics.
+    compute_domain_kwargs, condition = execution_engine.split_domain_condition(
+        domain_kwargs=compute_domain_kwargs
+    )
+    if condition is not None:
+        unexpected_count = F.when(condition, unexpected_count)
+
     return (
-        F.sum(F.when(unexpected_condition, 1).otherwise(0)),
+        F.sum(unexpected_count),
         compute_domain_kwargs,
         accessor_domain_kwargs,
     )
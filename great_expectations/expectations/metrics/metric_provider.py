@@ -181,6 +181,15 @@ class MetricProvider(metaclass=MetaMetricProvider):
           ...
         }
         """
+        # Metrics, computed by the ExecutionEngine directly from batch data, do not depend on any other metrics.
+        if (
+            execution_engine is not None
+            and execution_engine.resolves_metric_from_batch_data(
+                metric_configuration=metric
+            )
+        ):
+            return {}
+
         return (
             cls._get_evaluation_dependencies(
                 metric=metric,
@@ -58,10 +58,17 @@ class TableRowCount(TableMetricProvider):
     )
     def _spark(
         cls,
-        execution_engine: "SqlAlchemyExecutionEngine",
+        execution_engine: "SparkDFExecutionEngine",
         metric_domain_kwargs: Dict,
         metric_value_kwargs: Dict,
         metrics: Dict[str, Any],
         runtime_configuration: Dict,
     ):
+        # If conditional domains are combined, rows satisfying the condition are counted over the unfiltered domain.
+        domain_kwargs, condition = execution_engine.split_domain_condition(
+            domain_kwargs=metric_domain_kwargs
+        )
+        if condition is not None:
+            return F.count(F.when(condition, F.lit(1))), domain_kwargs, {}
+
         return F.count(F.lit(1)), metric_domain_kwargs, {}
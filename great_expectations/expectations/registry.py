@@ -11,6 +11,9 @@ logger = logging.getLogger(__name__)
 _registered_expectations = {}
 _registered_metrics = {}
 _registered_renderers = {}
+# Incremented whenever a registered Expectation or metric provider is overwritten (so that artifacts derived from
+# registered implementations, such as compiled validation plans, can be invalidated).
+_registry_version: int = 0
 
 """
 {
@@ -116,11 +119,22 @@ def register_expectation(expectation: Type["Expectation"]) -> None:  # noqa: F82
             logger.warning(
                 f"Overwriting declaration of expectation {expectation_type}."
             )
+            _increment_registry_version()
 
     logger.debug(f"Registering expectation: {expectation_type}")
     _registered_expectations[expectation_type] = expectation
 
 
+def _increment_registry_version() -> None:
+    global _registry_version
+    _registry_version += 1
+
+
+def get_registry_version() -> int:
+    """Returns number of times a registered Expectation or metric provider has been overwritten."""
+    return _registry_version
+
+
 def _add_response_key(res, key, value):
     if key in res:
         res[key].append(value)
@@ -182,6 +196,7 @@ def register_metric(
                     f"metric {metric_name} is being registered with different metric_provider; overwriting metric_provider",
                 )
                 providers[execution_engine_name] = metric_class, metric_provider
+                _increment_registry_version()
             else:
                 logger.info(
                     f"Multiple declarations of metric {metric_name} for engine {execution_engine_name}."
@@ -1,6 +1,6 @@
 import logging
 import math
-from typing import Callable, Dict, List, Optional, Union, cast
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union, cast
 
 from dateutil.parser import parse
 from tqdm.auto import tqdm
@@ -9,6 +9,9 @@ from great_expectations import DataContext
 from great_expectations.core import ExpectationSuite
 from great_expectations.core.batch import Batch
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_validation_result import (
+    ExpectationValidationResult,
+)
 from great_expectations.core.profiler_types_mapping import ProfilerTypeMapping
 from great_expectations.core.usage_statistics.events import UsageStatsEvents
 from great_expectations.core.usage_statistics.util import send_usage_message
@@ -108,6 +111,8 @@ class UserConfigurableProfiler:
                         comparing whether two tables are identical, it might make the most sense to set this to "unique"
         """
         self.column_info: Dict = {}
+        # Results of `expect_column_values_to_not_be_null`, validated in bulk, by column name.
+        self._not_null_results: Dict[str, dict] = {}
         self.profile_dataset = profile_dataset
         assert isinstance(self.profile_dataset, (Batch, Dataset, Validator))
 
@@ -190,6 +195,11 @@ class UserConfigurableProfiler:
             if column_name not in self.ignored_columns
         ]
 
+        if isinstance(self.profile_dataset, Validator):
+            self._add_column_types_and_cardinalities_to_column_info(
+                self.profile_dataset, included_columns
+            )
+
         for column_name in included_columns:
             self._add_column_cardinality_to_column_info(
                 self.profile_dataset, column_name
@@ -517,44 +527,11 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
         """
         # list of types is used to support pandas and sqlalchemy
         try:
-
-            if (
-                profile_dataset.expect_column_values_to_be_in_type_list(
-                    column, type_list=sorted(list(ProfilerTypeMapping.INT_TYPE_NAMES))
-                ).success
-                and profile_dataset.expect_column_values_to_be_in_type_list(
-                    column, type_list=sorted(list(ProfilerTypeMapping.FLOAT_TYPE_NAMES))
+            type_ = UserConfigurableProfiler._get_column_type_from_type_lists(
+                is_in_type_list=lambda type_list: profile_dataset.expect_column_values_to_be_in_type_list(
+                    column, type_list=type_list
                 ).success
-            ):
-                type_ = "NUMERIC"
-
-            elif profile_dataset.expect_column_values_to_be_in_type_list(
-                column, type_list=sorted(list(ProfilerTypeMapping.INT_TYPE_NAMES))
-            ).success:
-                type_ = "INT"
-
-            elif profile_dataset.expect_column_values_to_be_in_type_list(
-                column, type_list=sorted(list(ProfilerTypeMapping.FLOAT_TYPE_NAMES))
-            ).success:
-                type_ = "FLOAT"
-
-            elif profile_dataset.expect_column_values_to_be_in_type_list(
-                column, type_list=sorted(list(ProfilerTypeMapping.STRING_TYPE_NAMES))
-            ).success:
-                type_ = "STRING"
-
-            elif profile_dataset.expect_column_values_to_be_in_type_list(
-                column, type_list=sorted(list(ProfilerTypeMapping.BOOLEAN_TYPE_NAMES))
-            ).success:
-                type_ = "BOOLEAN"
-
-            elif profile_dataset.expect_column_values_to_be_in_type_list(
-                column, type_list=sorted(list(ProfilerTypeMapping.DATETIME_TYPE_NAMES))
-            ).success:
-                type_ = "DATETIME"
-
-            else:
-                type_ = "UNKNOWN"
+            )
         except NotImplementedError:
             type_ = "unknown"
 
@@ -574,6 +551,195 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
 
         return type_
 
+    @staticmethod
+    def _get_column_type_from_type_lists(
+        is_in_type_list: Callable[[List[str]], bool]
+    ) -> str:
+        """
+        Determines the data type of a column from the membership of its values in the type lists of ProfilerTypeMapping.
+
+        Args:
+            is_in_type_list: Callable returning True, if the column values belong to given (sorted) list of types
+
+        Returns:
+            The data type of the column
+        """
+        if is_in_type_list(
+            sorted(list(ProfilerTypeMapping.INT_TYPE_NAMES))
+        ) and is_in_type_list(sorted(list(ProfilerTypeMapping.FLOAT_TYPE_NAMES))):
+            return "NUMERIC"
+
+        if is_in_type_list(sorted(list(ProfilerTypeMapping.INT_TYPE_NAMES))):
+            return "INT"
+
+        if is_in_type_list(sorted(list(ProfilerTypeMapping.FLOAT_TYPE_NAMES))):
+            return "FLOAT"
+
+        if is_in_type_list(sorted(list(ProfilerTypeMapping.STRING_TYPE_NAMES))):
+            return "STRING"
+
+        if is_in_type_list(sorted(list(ProfilerTypeMapping.BOOLEAN_TYPE_NAMES))):
+            return "BOOLEAN"
+
+        if is_in_type_list(sorted(list(ProfilerTypeMapping.DATETIME_TYPE_NAMES))):
+            return "DATETIME"
+
+        return "UNKNOWN"
+
+    def _add_column_types_and_cardinalities_to_column_info(
+        self, profile_dataset: Validator, column_names: List[str]
+    ) -> None:
+        """
+        Adds the data types and cardinalities of columns to the column_info dictionary on self, validating the
+        expectations that determine them for all columns at once, so that their metrics are resolved together (e.g., in
+        one query per table with SqlAlchemyExecutionEngine), rather than expectation by expectation and column by column.
+        Results of `expect_column_values_to_not_be_null`, which decide the null expectations of columns, are validated
+        along with them and kept for building the suite.
+
+        Validating expectations in bulk does not add them to the expectation suite. Columns, for which any of these
+        expectations raised an exception, are skipped (their data types, cardinalities, and null expectations are
+        determined one expectation at a time).
+        Args:
+            profile_dataset: A GE Validator
+            column_names: The names of the columns for which to add data types and cardinalities
+        """
+        type_lists: List[List[str]] = [
+            sorted(list(type_names))
+            for type_names in (
+                ProfilerTypeMapping.INT_TYPE_NAMES,
+                ProfilerTypeMapping.FLOAT_TYPE_NAMES,
+                ProfilerTypeMapping.STRING_TYPE_NAMES,
+                ProfilerTypeMapping.BOOLEAN_TYPE_NAMES,
+                ProfilerTypeMapping.DATETIME_TYPE_NAMES,
+            )
+        ]
+        cardinality_expectation_types: List[str] = [
+            "expect_column_unique_value_count_to_be_between",
+            "expect_column_proportion_of_unique_values_to_be_between",
+        ]
+
+        configurations: List[ExpectationConfiguration] = []
+        column_name: str
+        for column_name in column_names:
+            column_info_entry: dict = self.column_info.get(column_name, {})
+            if not column_info_entry.get("type"):
+                configurations.extend(
+                    [
+                        ExpectationConfiguration(
+                            expectation_type="expect_column_values_to_be_in_type_list",
+                            kwargs={"column": column_name, "type_list": type_list},
+                        )
+                        for type_list in type_lists
+                    ]
+                )
+
+            if not column_info_entry.get("cardinality"):
+                configurations.extend(
+                    [
+                        ExpectationConfiguration(
+                            expectation_type=expectation_type,
+                            kwargs={
+                                "column": column_name,
+                                "min_value": None,
+                                "max_value": None,
+                            },
+                        )
+                        for expectation_type in cardinality_expectation_types
+                    ]
+                )
+
+            if (
+                "expect_column_values_to_not_be_null" not in self.excluded_expectations
+                and column_name not in self._not_null_results
+            ):
+                configurations.append(
+                    ExpectationConfiguration(
+                        expectation_type="expect_column_values_to_not_be_null",
+                        kwargs={"column": column_name},
+                    )
+                )
+
+        if not configurations:
+            return
+
+        # Results are keyed by column name, expectation type, and type list (of type list expectations).
+        results: Dict[Tuple[str, str, Optional[Tuple[str, ...]]], dict] = {}
+        failed_column_names: Set[str] = set()
+        validation_result: ExpectationValidationResult
+        for validation_result in profile_dataset.graph_validate(
+            configurations=configurations
+        ):
+            expectation_config: Optional[
+                ExpectationConfiguration
+            ] = validation_result.expectation_config
+            if expectation_config is None:
+                # Results, which cannot be attributed to a column, are not used.
+                continue
+
+            kwargs: dict = expectation_config.kwargs
+            column_name = kwargs["column"]
+            if (
+                validation_result.exception_info
+                and validation_result.exception_info.get("raised_exception")
+            ):
+                failed_column_names.add(column_name)
+                continue
+
+            type_list: Optional[List[str]] = kwargs.get("type_list")
+            results[
+                (
+                    column_name,
+                    expectation_config.expectation_type,
+                    tuple(type_list) if type_list is not None else None,
+                )
+            ] = {
+                "success": validation_result.success,
+                "result": validation_result.result,
+            }
+
+        for column_name in column_names:
+            if column_name in failed_column_names:
+                continue
+
+            not_null_result: Optional[dict] = results.get(
+                (column_name, "expect_column_values_to_not_be_null", None)
+            )
+            if not_null_result is not None:
+                self._not_null_results[column_name] = not_null_result
+
+            column_info_entry = self.column_info.setdefault(column_name, {})
+            if not column_info_entry.get("type"):
+                column_info_entry["type"] = self._get_column_type_from_type_lists(
+                    is_in_type_list=lambda type_list: results[
+                        (
+                            column_name,
+                            "expect_column_values_to_be_in_type_list",
+                            tuple(type_list),
+                        )
+                    ]["success"]
+                )
+
+            if not column_info_entry.get("cardinality"):
+                num_unique = None
+                pct_unique = None
+                try:
+                    num_unique = results[
+                        (column_name, cardinality_expectation_types[0], None)
+                    ]["result"]["observed_value"]
+                    pct_unique = results[
+                        (column_name, cardinality_expectation_types[1], None)
+                    ]["result"]["observed_value"]
+                except KeyError:  # if observed_value value is not set
+                    logger.error(
+                        f"Failed to get cardinality of column {column_name:s} - continuing..."
+                    )
+
+                column_info_entry[
+                    "cardinality"
+                ] = OrderedProfilerCardinality.get_basic_column_cardinality(
+                    num_unique, pct_unique
+                ).name
+
     def _add_column_cardinality_to_column_info(self, profile_dataset, column_name):
         """
         Adds the cardinality of a column to the column_info dictionary on self
@@ -1126,7 +1292,13 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
         Returns:
             The GE Dataset
         """
-        if "expect_column_values_to_not_be_null" not in self.excluded_expectations:
+        if column in self._not_null_results:
+            self._add_null_expectation_from_not_null_result(
+                profile_dataset=profile_dataset,
+                column=column,
+                not_null_result=self._not_null_results[column],
+            )
+        elif "expect_column_values_to_not_be_null" not in self.excluded_expectations:
             not_null_result = profile_dataset.expect_column_values_to_not_be_null(
                 column
             )
@@ -1205,6 +1377,56 @@ nan: {pct_unique}
                     f"Skipping expect_column_values_to_be_in_type_list for this column."
                 )
 
+    def _add_null_expectation_from_not_null_result(
+        self, profile_dataset: Validator, column: str, not_null_result: dict
+    ) -> None:
+        """
+        Adds `expect_column_values_to_not_be_null` (or `expect_column_values_to_be_null`) for a column to the suite,
+        choosing the expectation and its "mostly" value from the result of `expect_column_values_to_not_be_null`,
+        which was validated in bulk, the same way as `_build_expectations_for_all_column_types`, without validating
+        either expectation again.
+        Args:
+            profile_dataset: A GE Validator
+            column: The column for which to add the expectation
+            not_null_result: The "success" and "result" of `expect_column_values_to_not_be_null` for the column
+        """
+        expectation_type: str = "expect_column_values_to_not_be_null"
+        kwargs: dict = {"column": column}
+        success: bool = not_null_result["success"]
+        if not success:
+            result: dict = not_null_result["result"]
+            element_count: int = result["element_count"]
+            null_count: int = result["unexpected_count"]
+            unexpected_percent = float(result["unexpected_percent"])
+            if unexpected_percent >= 50 and not self.not_null_only:
+                if "expect_column_values_to_be_null" in self.excluded_expectations:
+                    return
+
+                expectation_type = "expect_column_values_to_be_null"
+                potential_mostly_value = math.floor(unexpected_percent) / 100.0
+                unexpected_count = element_count - null_count
+            else:
+                potential_mostly_value = (100.0 - math.ceil(unexpected_percent)) / 100.0
+                unexpected_count = null_count
+
+            # A safe_mostly_value of 0.001 gives us a rough way of ensuring that we don't wind up with a mostly
+            # value of 0 when we round
+            safe_mostly_value = max(0.001, potential_mostly_value)
+            kwargs["mostly"] = safe_mostly_value
+            success = (
+                float(element_count) - float(unexpected_count)
+            ) / element_count >= safe_mostly_value
+
+        # noinspection PyProtectedMember
+        profile_dataset._expectation_suite._add_expectation(
+            expectation_configuration=ExpectationConfiguration(
+                expectation_type=expectation_type,
+                kwargs=kwargs,
+                success_on_last_run=success,
+            ),
+            send_usage_event=False,
+        )
+
     def _build_expectations_table(self, profile_dataset) -> None:
         """
         Adds two table level expectations to the dataset
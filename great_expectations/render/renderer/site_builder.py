@@ -1,12 +1,17 @@
+import hashlib
+import json
 import logging
 import os
 import traceback
 from collections import OrderedDict
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from tqdm.auto import tqdm
 
 import great_expectations.exceptions as exceptions
-from great_expectations.core import ExpectationSuite
-from great_expectations.core.util import nested_update
+from great_expectations.core import ExpectationSuite, ExpectationSuiteValidationResult
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
+from great_expectations.core.util import convert_to_json_serializable, nested_update
 from great_expectations.data_context.store.ge_cloud_store_backend import (
     GeCloudRESTResource,
 )
@@ -15,6 +20,10 @@ from great_expectations.data_context.store.html_site_store import (
     SiteSectionIdentifier,
 )
 from great_expectations.data_context.store.json_site_store import JsonSiteStore
+from great_expectations.data_context.types.base import (
+    ConcurrencyConfig,
+    ProgressBarsConfig,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     GeCloudIdentifier,
@@ -36,6 +45,30 @@ FALSEY_YAML_STRINGS = [
 ]
 
 
+def _get_manifest_key(resource_key) -> str:
+    return "/".join(resource_key.to_tuple())
+
+
+def _get_resource_hash(resource) -> str:
+    return hashlib.md5(
+        json.dumps(resource.to_json_dict(), sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _get_index_summary(resource) -> dict:
+    """Returns the information about validation (or profiling) result, shown on the index page of the site."""
+    if not isinstance(resource, ExpectationSuiteValidationResult):
+        return {}
+
+    return convert_to_json_serializable(
+        {
+            "validation_success": resource.success,
+            "batch_kwargs": resource.meta.get("batch_kwargs", {}),
+            "batch_spec": resource.meta.get("batch_spec", {}),
+        }
+    )
+
+
 class SiteBuilder:
     """SiteBuilder builds data documentation for the project defined by a
     DataContext.
@@ -110,6 +143,18 @@ class SiteBuilder:
                     view:
                         module_name: great_expectations.render.view
                         class_name: DefaultJinjaIndexPageView
+
+    With ``incremental_build: true``, the site keeps a manifest of rendered
+    pages (site_manifest.json), so that a build renders only new and changed
+    resources, and the index page is built from the summaries of validation
+    and profiling results, held in the manifest, without retrieving them::
+
+        local_site:
+            class_name: SiteBuilder
+            incremental_build: true
+            store_backend:
+                class_name: TupleFilesystemStoreBackend
+                base_directory: uncommitted/data_docs/local_site/
     """
 
     def __init__(
@@ -122,6 +167,7 @@ class SiteBuilder:
         site_section_builders=None,
         runtime_environment=None,
         ge_cloud_mode=False,
+        incremental_build=False,
         **kwargs,
     ) -> None:
         self.site_name = site_name
@@ -129,6 +175,8 @@ class SiteBuilder:
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
         self.ge_cloud_mode = ge_cloud_mode
+        # GE Cloud renders Data Docs from JSON documents; the manifest is only kept for HTML sites.
+        self.incremental_build = incremental_build and not ge_cloud_mode
 
         usage_statistics_config = data_context.anonymous_usage_statistics
         data_context_id = None
@@ -302,18 +350,32 @@ class SiteBuilder:
         :return:
         """
 
-        # copy static assets
-        for site_section_builder in self.site_section_builders.values():
-            site_section_builder.build(resource_identifiers=resource_identifiers)
+        if not self.incremental_build:
+            for site_section_builder in self.site_section_builders.values():
+                site_section_builder.build(resource_identifiers=resource_identifiers)
+        else:
+            manifest: dict = self.target_store.get_manifest()
+            for site_section_builder in self.site_section_builders.values():
+                site_section_builder.build(
+                    resource_identifiers=resource_identifiers, manifest=manifest
+                )
 
         # GE Cloud supports JSON Site Data Docs
         # Skip static assets, indexing
         if self.ge_cloud_mode:
             return
 
+        # copy static assets
         self.target_store.copy_static_assets()
 
-        _, index_links_dict = self.site_index_builder.build(build_index=build_index)
+        if not self.incremental_build:
+            _, index_links_dict = self.site_index_builder.build(build_index=build_index)
+        else:
+            _, index_links_dict = self.site_index_builder.build(
+                build_index=build_index, manifest=manifest
+            )
+            self.target_store.write_manifest(manifest)
+
         return (
             self.get_resource_url(only_if_exists=False),
             index_links_dict,
@@ -405,13 +467,36 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None) -> None:
+    def build(self, resource_identifiers=None, manifest: Optional[dict] = None) -> None:
+        """
+        :param resource_identifiers: a list of resource identifiers; if specified, pages are built only for the
+        resources in this list
+        :param manifest: manifest of rendered pages (see "HtmlSiteStore.get_manifest()"); if specified (and no
+        resource_identifiers are passed), pages are built only for new and changed resources, and the manifest is
+        updated with the resources rendered
+        """
         source_store_keys = self.source_store.list_keys()
+
+        section_manifest: Optional[dict] = None
+        # Keys of pages in the target store (listed at most once per type of resource), by type of resource.
+        site_keys: Dict[type, Set[tuple]] = {}
+        if manifest is not None:
+            section_manifest = manifest.setdefault(self.name, {})
+            source_manifest_keys: Set[str] = {
+                _get_manifest_key(resource_key) for resource_key in source_store_keys
+            }
+            for manifest_key in list(section_manifest.keys()):
+                if manifest_key not in source_manifest_keys:
+                    del section_manifest[manifest_key]
+
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        # Pairs of resource key and manifest entry of page last rendered for it (if the manifest is kept), for which
+        # pages are to be built.
+        pages_to_build: List[Tuple[Any, Optional[dict]]] = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -426,78 +511,194 @@ class DefaultSiteSectionBuilder:
                     resource_key, self.run_name_filter
                 ):
                     continue
+
+            manifest_entry: Optional[dict] = None
+            if section_manifest is not None and not resource_identifiers:
+                manifest_entry = section_manifest.get(_get_manifest_key(resource_key))
+                if manifest_entry is not None and not self._site_page_exists(
+                    resource_key, site_keys
+                ):
+                    manifest_entry = None
+
+                # Validation results are not modified once stored; hence, their pages are not rendered again.
+                if manifest_entry is not None and isinstance(
+                    resource_key, ValidationResultIdentifier
+                ):
+                    continue
+
+            pages_to_build.append((resource_key, manifest_entry))
+
+        if not pages_to_build:
+            return
+
+        concurrency_config: Optional[ConcurrencyConfig] = self.data_context.concurrency
+        build_concurrently: bool = (
+            concurrency_config is not None
+            and concurrency_config.enabled
+            and concurrency_config.concurrent_data_docs_build
+        )
+
+        progress_bars: Optional[ProgressBarsConfig] = self.data_context.progress_bars
+        # Progress of concurrent builds is reported, unless progress bars are disabled.
+        disable_progress_bar: bool = not build_concurrently or (
+            progress_bars is not None and not progress_bars.get("globally", True)
+        )
+        progress_bar = tqdm(
+            total=len(pages_to_build),
+            desc=f"Building {self.name} pages",
+            disable=disable_progress_bar,
+        )
+
+        def build_page(
+            resource_key: Any, manifest_entry: Optional[dict]
+        ) -> Optional[dict]:
             try:
-                resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(
-                        **resource, data_context=self.data_context
-                    )
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+                return self._build_page(
+                    resource_key=resource_key,
+                    manifest_entry=manifest_entry,
+                    update_manifest=section_manifest is not None,
                 )
-                continue
+            finally:
+                progress_bar.update(1)
+
+        # Pages are retrieved, rendered, and written independently of one another; hence, if "concurrent_data_docs_build"
+        # is enabled, they are built concurrently (so that retrieval and uploads to S3/GCS proceed while other pages are
+        # rendered).
+        with AsyncExecutor(
+            concurrency_config=concurrency_config if build_concurrently else None,
+            max_workers=len(pages_to_build),
+        ) as async_executor:
+            async_results: List[Tuple[Any, AsyncResult]] = [
+                (
+                    resource_key,
+                    async_executor.submit(build_page, resource_key, manifest_entry),
+                )
+                for resource_key, manifest_entry in pages_to_build
+            ]
+
+            try:
+                for resource_key, async_result in async_results:
+                    manifest_entry = async_result.result()
+                    if section_manifest is not None and manifest_entry is not None:
+                        section_manifest[
+                            _get_manifest_key(resource_key)
+                        ] = manifest_entry
+            finally:
+                progress_bar.close()
+
+    def _build_page(
+        self,
+        resource_key,
+        manifest_entry: Optional[dict] = None,
+        update_manifest: bool = False,
+    ) -> Optional[dict]:
+        """
+        Retrieves resource, renders its page, and writes the page to the target store.
 
+        :param resource_key: key of resource in the source store
+        :param manifest_entry: manifest entry of page last rendered for resource; if specified, page is rendered only if
+        content of resource changed since
+        :param update_manifest: if True, manifest entry of rendered page is returned
+        :return: manifest entry of rendered page (None, if page was not rendered, or manifest entry is not requested)
+        """
+        try:
+            resource = self.source_store.get(resource_key)
             if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.expectation_suite_name
+                resource = ExpectationSuite(**resource, data_context=self.data_context)
+        except exceptions.InvalidKeyError:
+            logger.warning(
+                f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+            )
+            return None
+
+        resource_hash: Optional[str] = None
+        if update_manifest:
+            resource_hash = _get_resource_hash(resource)
+            if (
+                manifest_entry is not None
+                and manifest_entry.get("source_hash") == resource_hash
+            ):
+                return None
+
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.expectation_suite_name
+            logger.debug(
+                f"        Rendering expectation suite {expectation_suite_name}"
+            )
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = (
+                resource_key.expectation_suite_identifier.expectation_suite_name
+            )
+            if self.name == "profiling":
                 logger.debug(
-                    f"        Rendering expectation suite {expectation_suite_name}"
+                    f"        Rendering profiling for batch {resource_key.batch_identifier}"
                 )
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = (
-                    resource_key.expectation_suite_identifier.expectation_suite_name
+            else:
+
+                logger.debug(
+                    f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"
                 )
-                if self.name == "profiling":
-                    logger.debug(
-                        f"        Rendering profiling for batch {resource_key.batch_identifier}"
-                    )
-                else:
 
-                    logger.debug(
-                        f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"
-                    )
+        try:
+            rendered_content = self.renderer_class.render(resource)
+
+            if self.ge_cloud_mode:
+                self.target_store.set(
+                    GeCloudIdentifier(
+                        resource_type=GeCloudRESTResource.RENDERED_DATA_DOC
+                    ),
+                    rendered_content,
+                    source_type=resource_key.resource_type,
+                    source_id=resource_key.ge_cloud_id,
+                )
+            else:
+                viewable_content = self.view_class.render(
+                    rendered_content,
+                    data_context_id=self.data_context_id,
+                    show_how_to_buttons=self.show_how_to_buttons,
+                )
+                # Verify type
+                self.target_store.set(
+                    SiteSectionIdentifier(
+                        site_section_name=self.name,
+                        resource_identifier=resource_key,
+                    ),
+                    viewable_content,
+                )
 
-            try:
-                rendered_content = self.renderer_class.render(resource)
-
-                if self.ge_cloud_mode:
-                    self.target_store.set(
-                        GeCloudIdentifier(
-                            resource_type=GeCloudRESTResource.RENDERED_DATA_DOC
-                        ),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.ge_cloud_id,
-                    )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
-                    )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
-                        ),
-                        viewable_content,
-                    )
-            except Exception as e:
-                exception_message = """\
+            if update_manifest:
+                return {
+                    "source_hash": resource_hash,
+                    **_get_index_summary(resource),
+                }
+        except Exception as e:
+            exception_message = """\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
-                """
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{str(e)}".  '
-                    f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)
+            """
+            exception_traceback = traceback.format_exc()
+            exception_message += (
+                f'{type(e).__name__}: "{str(e)}".  '
+                f'Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)
+
+        return None
+
+    def _site_page_exists(
+        self, resource_key, site_keys: Dict[type, Set[tuple]]
+    ) -> bool:
+        resource_type: type = type(resource_key)
+        if resource_type not in site_keys:
+            site_keys[resource_type] = set(
+                self.target_store.store_backends[resource_type].list_keys()
+            )
+
+        return resource_key.to_tuple() in site_keys[resource_type]
 
 
 class DefaultSiteIndexBuilder:
@@ -715,12 +916,18 @@ class DefaultSiteIndexBuilder:
 
     # TODO: deprecate dual batch api support
     def build(
-        self, skip_and_clean_missing=True, build_index: bool = True
+        self,
+        skip_and_clean_missing=True,
+        build_index: bool = True,
+        manifest: Optional[dict] = None,
     ) -> Tuple[Any, Optional[OrderedDict]]:
         """
         :param skip_and_clean_missing: if True, target html store keys without corresponding source store keys will
         be skipped and removed from the target store
         :param build_index: a flag if False, skips building the index page
+        :param manifest: manifest of rendered pages (see "HtmlSiteStore.get_manifest()"); if specified, validation and
+        profiling results are listed using their summaries, held in the manifest (results without summaries are
+        retrieved, and their summaries are added to the manifest)
         :return: tuple(index_page_url, index_links_dict)
         """
 
@@ -743,10 +950,10 @@ class DefaultSiteIndexBuilder:
             )
         )
         self._add_profiling_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, manifest
         )
         self._add_validations_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, manifest
         )
 
         viewable_content = ""
@@ -854,6 +1061,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        manifest: Optional[dict] = None,
     ) -> None:
         profiling = self.site_section_builders_config.get("profiling", "None")
         if profiling and profiling not in FALSEY_YAML_STRINGS:
@@ -869,15 +1077,14 @@ diagnose and repair the underlying issue.  Detailed information follows:
             ]
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
+                    summary: dict = self._get_validation_result_summary(
+                        validation_result_key=profiling_result_key,
+                        section_name="profiling",
+                        manifest=manifest,
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    batch_kwargs = summary["batch_kwargs"]
+                    batch_spec = summary["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -900,6 +1107,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        manifest: Optional[dict] = None,
     ) -> None:
         validations = self.site_section_builders_config.get("validations", "None")
         if validations and validations not in FALSEY_YAML_STRINGS:
@@ -924,16 +1132,15 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 ]
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
+                    summary: dict = self._get_validation_result_summary(
+                        validation_result_key=validation_result_key,
+                        section_name="validations",
+                        manifest=manifest,
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    validation_success = summary["validation_success"]
+                    batch_kwargs = summary["batch_kwargs"]
+                    batch_spec = summary["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -953,6 +1160,39 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     error_msg = f"Validation result not found: {str(validation_result_key.to_tuple()):s} - skipping"
                     logger.warning(error_msg)
 
+    def _get_validation_result_summary(
+        self,
+        validation_result_key: ValidationResultIdentifier,
+        section_name: str,
+        manifest: Optional[dict] = None,
+    ) -> dict:
+        section_manifest: Optional[dict] = None
+        manifest_key: Optional[str] = None
+        if manifest is not None:
+            section_manifest = manifest.setdefault(section_name, {})
+            manifest_key = _get_manifest_key(validation_result_key)
+            if "validation_success" in section_manifest.get(manifest_key, {}):
+                return section_manifest[manifest_key]
+
+        validation = self.data_context.get_validation_result(
+            batch_identifier=validation_result_key.batch_identifier,
+            expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
+            run_id=validation_result_key.run_id,
+            validations_store_name=self.source_stores.get(section_name),
+        )
+        summary: dict = {
+            "validation_success": validation.success,
+            "batch_kwargs": validation.meta.get("batch_kwargs", {}),
+            "batch_spec": validation.meta.get("batch_spec", {}),
+        }
+        if section_manifest is not None:
+            section_manifest[manifest_key] = {
+                **section_manifest.get(manifest_key, {}),
+                **_get_index_summary(validation),
+            }
+
+        return summary
+
 
 class CallToActionButton:
     def __init__(self, title, link) -> None:
@@ -120,6 +120,26 @@ class BootstrapNumericRangeEstimator(NumericRangeEstimator):
                 DEFAULT_BOOTSTRAP_QUANTILE_BIAS_STD_ERROR_RATIO_THRESHOLD
             )
 
+        # Obtain chunk_size override from "rule state" (i.e., variables and parameters); from instance variable otherwise.
+        chunk_size: Optional[int] = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.configuration.chunk_size,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        # Obtain convergence_percentage_deviation override from "rule state" (i.e., variables and parameters); from instance variable otherwise.
+        convergence_percentage_deviation: Optional[
+            float
+        ] = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.configuration.convergence_percentage_deviation,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+
         return compute_bootstrap_quantiles_point_estimate(
             metric_values=metric_values,
             false_positive_rate=false_positive_rate,
@@ -128,4 +148,6 @@ class BootstrapNumericRangeEstimator(NumericRangeEstimator):
             quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
             quantile_bias_correction=quantile_bias_correction,
             quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
+            chunk_size=chunk_size,
+            convergence_percentage_deviation=convergence_percentage_deviation,
         )
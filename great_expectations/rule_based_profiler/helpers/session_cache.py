@@ -0,0 +1,195 @@
+import copy
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from great_expectations.core.batch import Batch
+from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.types import SerializableDictDot
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+@dataclass
+class ProfilerSessionCacheStatistics(SerializableDictDot):
+    """
+    ProfilerSessionCacheStatistics is a "dataclass" object, which holds counters describing usage of ProfilerSessionCache.
+    """
+
+    batch_list_hits: int = 0
+    batch_list_misses: int = 0
+    validator_hits: int = 0
+    validator_misses: int = 0
+    metric_hits: int = 0
+    metric_misses: int = 0
+    metric_resolutions: int = 0
+
+    def to_dict(self) -> dict:
+        """
+        Returns dictionary equivalent of this object.
+        """
+        return asdict(self)
+
+    def to_json_dict(self) -> dict:
+        """
+        Returns JSON dictionary equivalent of this object.
+        """
+        return convert_to_json_serializable(data=self.to_dict())
+
+
+class ProfilerSessionCache:
+    """
+    ProfilerSessionCache holds lists of Batch objects and Validator objects, resolved during one "RuleBasedProfiler.run()"
+    session, keyed by the effective BatchRequest (or by the explicit list of Batch objects), so that DomainBuilder and
+    ParameterBuilder objects of all Rule objects (and all Domain objects) load each Batch only once.
+
+    Resolved metrics are held as well (keyed by ID of MetricConfiguration, as requested, prior to addition of default
+    kwargs), so that metrics, planned for all Domain objects of Rule and resolved together, are served to ParameterBuilder
+    objects, and metrics, requested by more than one ParameterBuilder (or Rule), are computed only once.
+    """
+
+    def __init__(self) -> None:
+        self._batch_lists: Dict[Hashable, List[Batch]] = {}
+        self._validators: Dict[Hashable, "Validator"] = {}  # noqa: F821
+        self._resolved_metrics: Dict[
+            Tuple[str, str, str], Tuple[MetricConfiguration, Any]
+        ] = {}
+        self._statistics = ProfilerSessionCacheStatistics()
+        # Resolution of Batch objects and Validator objects is serialized, since Validator objects loading Batch data
+        # share the ExecutionEngine of the Datasource.
+        self._lock = threading.RLock()
+
+    @property
+    def statistics(self) -> ProfilerSessionCacheStatistics:
+        return self._statistics
+
+    def get_or_create_batch_list(
+        self, key: Hashable, create_fn: Callable[[], List[Batch]]
+    ) -> List[Batch]:
+        """Returns list of Batch objects, cached under "key" (obtained by calling "create_fn()", if not yet cached)."""
+        with self._lock:
+            if key in self._batch_lists:
+                self._statistics.batch_list_hits += 1
+            else:
+                self._statistics.batch_list_misses += 1
+                self._batch_lists[key] = create_fn()
+
+            return self._batch_lists[key]
+
+    def get_or_create_validator(
+        self, key: Hashable, create_fn: Callable[[], "Validator"]  # noqa: F821
+    ) -> "Validator":  # noqa: F821
+        """Returns Validator, cached under "key" (obtained by calling "create_fn()", if not yet cached)."""
+        with self._lock:
+            validator: "Validator"  # noqa: F821
+            if key in self._validators:
+                self._statistics.validator_hits += 1
+                validator = self._validators[key]
+                # Other Validator objects, sharing the same ExecutionEngine, may have loaded (and activated) their Batch
+                # data since; hence, the active Batch of this Validator is activated again.
+                active_batch_id: Optional[str] = validator.active_batch_id
+                if active_batch_id is not None:
+                    validator.execution_engine.active_batch_data_id = active_batch_id
+            else:
+                self._statistics.validator_misses += 1
+                validator = create_fn()
+                self._validators[key] = validator
+
+            return validator
+
+    def resolve_metrics(
+        self,
+        validator: "Validator",  # noqa: F821
+        metric_configurations: List[MetricConfiguration],
+        force_no_progress_bar: bool = False,
+    ) -> Dict[Tuple[str, str, str], Tuple[MetricConfiguration, Any]]:
+        """
+        Resolves metrics, not yet resolved during this session, in one "Validator.compute_metrics()" call.
+
+        Args:
+            validator: Validator object used for computing metrics, not yet resolved during this session.
+            metric_configurations: List of desired MetricConfiguration objects (these are not modified).
+            force_no_progress_bar: (bool) if True, prevent all "Calculating Metrics" output; (False by default).
+
+        Returns:
+            Dictionary, keyed by ID of requested MetricConfiguration, whose values are pairs of resolved
+            MetricConfiguration (i.e., with default kwargs added) and metric value (metrics, whose computation was
+            aborted, are omitted).
+        """
+        resolved_metrics: Dict[
+            Tuple[str, str, str], Tuple[MetricConfiguration, Any]
+        ] = {}
+        metrics_to_resolve: Dict[Tuple[str, str, str], MetricConfiguration] = {}
+
+        metric_configuration: MetricConfiguration
+        metric_id: Tuple[str, str, str]
+        with self._lock:
+            for metric_configuration in metric_configurations:
+                metric_id = metric_configuration.id
+                if metric_id in self._resolved_metrics:
+                    self._statistics.metric_hits += 1
+                    resolved_metrics[metric_id] = self._resolved_metrics[metric_id]
+                elif metric_id not in metrics_to_resolve:
+                    self._statistics.metric_misses += 1
+                    # "Validator.compute_metrics()" adds default kwargs to MetricConfiguration objects (changing IDs).
+                    metrics_to_resolve[metric_id] = copy.deepcopy(metric_configuration)
+
+        if not metrics_to_resolve:
+            return resolved_metrics
+
+        computed_metrics: Dict[Tuple[str, str, str], Any] = validator.compute_metrics(
+            metric_configurations=list(metrics_to_resolve.values()),
+            force_no_progress_bar=force_no_progress_bar,
+        )
+
+        with self._lock:
+            self._statistics.metric_resolutions += 1
+            for metric_id, metric_configuration in metrics_to_resolve.items():
+                if metric_configuration.id in computed_metrics:
+                    resolved_metrics[metric_id] = (
+                        metric_configuration,
+                        computed_metrics[metric_configuration.id],
+                    )
+                    self._resolved_metrics[metric_id] = resolved_metrics[metric_id]
+
+        return resolved_metrics
+
+    def clear(self) -> None:
+        with self._lock:
+            self._batch_lists.clear()
+            self._validators.clear()
+            self._resolved_metrics.clear()
+
+
+_active_profiler_session_cache: ContextVar[Optional[ProfilerSessionCache]] = ContextVar(
+    "active_profiler_session_cache", default=None
+)
+
+
+def get_active_profiler_session_cache() -> Optional[ProfilerSessionCache]:
+    """Returns ProfilerSessionCache of the "RuleBasedProfiler.run()" session in progress (or None, if there is none)."""
+    return _active_profiler_session_cache.get()
+
+
+@contextmanager
+def profiler_session_cache() -> Iterator[ProfilerSessionCache]:
+    """
+    Activates ProfilerSessionCache for the duration of the "with" block (nested sessions share the outermost cache).
+    """
+    session_cache: Optional[ProfilerSessionCache] = get_active_profiler_session_cache()
+    if session_cache is not None:
+        yield session_cache
+        return
+
+    session_cache = ProfilerSessionCache()
+    token: Any = _active_profiler_session_cache.set(session_cache)
+    try:
+        yield session_cache
+    finally:
+        _active_profiler_session_cache.reset(token)
+        session_cache.clear()
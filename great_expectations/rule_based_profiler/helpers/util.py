@@ -6,7 +6,7 @@ import re
 import uuid
 import warnings
 from numbers import Number
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 import numpy as np
 import scipy.stats as stats
@@ -18,6 +18,7 @@ from great_expectations.core.batch import (
     BatchRequest,
     BatchRequestBase,
     RuntimeBatchRequest,
+    batch_request_contains_batch_data,
     materialize_batch_request,
 )
 from great_expectations.core.metric_domain_types import MetricDomainTypes
@@ -29,6 +30,10 @@ from great_expectations.rule_based_profiler.estimators.numeric_range_estimation_
     NUM_HISTOGRAM_BINS,
     NumericRangeEstimationResult,
 )
+from great_expectations.rule_based_profiler.helpers.session_cache import (
+    ProfilerSessionCache,
+    get_active_profiler_session_cache,
+)
 from great_expectations.rule_based_profiler.parameter_container import (
     FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER,
     VARIABLES_PREFIX,
@@ -66,6 +71,9 @@ RECOGNIZED_QUANTILE_STATISTIC_INTERPOLATION_METHODS: set = {
     "linear",
 }
 
+# Number of bootstrap resamples, drawn (and reduced to their quantiles) at a time.
+DEFAULT_BOOTSTRAP_CHUNK_SIZE: int = 1000
+
 
 def get_validator(
     purpose: str,
@@ -90,7 +98,10 @@ def get_validator(
         )
 
     batch: Batch
-    if batch_list is None or all([batch is None for batch in batch_list]):
+    use_batch_request: bool = batch_list is None or all(
+        [batch is None for batch in batch_list]
+    )
+    if use_batch_request:
         if batch_request is None:
             return None
 
@@ -108,18 +119,43 @@ def get_validator(
 """
             )
 
-    validator = get_validator_with_expectation_suite(
-        data_context=data_context,
-        batch_list=batch_list,
-        batch_request=batch_request,
-        expectation_suite=None,
-        expectation_suite_name=expectation_suite_name,
-        component_name=f"rule_based_profiler-{expectation_suite_name}",
-        persist=False,
+    def _create_validator() -> "Validator":  # noqa: F821
+        created_validator: "Validator" = (
+            get_validator_with_expectation_suite(  # noqa: F821
+                data_context=data_context,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                expectation_suite=None,
+                expectation_suite_name=expectation_suite_name,
+                component_name=f"rule_based_profiler-{expectation_suite_name}",
+                persist=False,
+            )
+        )
+
+        # Always disabled for RBP and DataAssistants due to volume of metric calculations
+        created_validator.show_progress_bars = False
+
+        return created_validator
+
+    # Within "RuleBasedProfiler.run()" session, Validator (and its Batch objects) is reused for the same Batch source.
+    session_cache: Optional[ProfilerSessionCache] = get_active_profiler_session_cache()
+    if session_cache is None:
+        return _create_validator()
+
+    key: Hashable = _get_batch_source_key(
+        batch_list=batch_list, batch_request=batch_request
     )
+    if use_batch_request:
+        # Validator is created from cached Batch objects (shared with "get_batch_ids()"), rather than from BatchRequest.
+        batch_list = session_cache.get_or_create_batch_list(
+            key=key,
+            create_fn=lambda: data_context.get_batch_list(batch_request=batch_request),
+        )
+        batch_request = None
 
-    # Always disabled for RBP and DataAssistants due to volume of metric calculations
-    validator.show_progress_bars = False
+    validator = session_cache.get_or_create_validator(
+        key=key, create_fn=_create_validator
+    )
 
     return validator
 
@@ -145,7 +181,19 @@ def get_batch_ids(
             parameters=parameters,
         )
 
-        batch_list = data_context.get_batch_list(batch_request=batch_request)
+        # Within "RuleBasedProfiler.run()" session, Batch objects are obtained only once for the same BatchRequest.
+        session_cache: Optional[
+            ProfilerSessionCache
+        ] = get_active_profiler_session_cache()
+        if session_cache is None:
+            batch_list = data_context.get_batch_list(batch_request=batch_request)
+        else:
+            batch_list = session_cache.get_or_create_batch_list(
+                key=_get_batch_source_key(batch_list=None, batch_request=batch_request),
+                create_fn=lambda: data_context.get_batch_list(
+                    batch_request=batch_request
+                ),
+            )
 
     batch_ids: List[str] = [batch.id for batch in batch_list]
 
@@ -162,6 +210,28 @@ def get_batch_ids(
     return batch_ids
 
 
+def _get_batch_source_key(
+    batch_list: Optional[List[Batch]] = None,
+    batch_request: Optional[Union[BatchRequest, RuntimeBatchRequest]] = None,
+) -> Hashable:
+    """
+    Returns key, identifying source of Batch objects (explicit list of Batch objects or effective BatchRequest) in cache.
+    In-memory "batch_data" of RuntimeBatchRequest is not serialized by "BatchRequest.id"; hence, its identity is used.
+    """
+    batch: Batch
+    if batch_list is not None and not all([batch is None for batch in batch_list]):
+        return (
+            "batch_list",
+            tuple(batch.id for batch in batch_list if batch is not None),
+        )
+
+    batch_data_id: Optional[int] = None
+    if batch_request_contains_batch_data(batch_request=batch_request):
+        batch_data_id = id(batch_request.runtime_parameters["batch_data"])
+
+    return "batch_request", batch_request.id, batch_data_id
+
+
 def build_batch_request(
     batch_request: Optional[Union[str, BatchRequestBase, dict]] = None,
     domain: Optional[Domain] = None,
@@ -327,14 +397,36 @@ def get_resolved_metrics_by_key(
 
     # Step 1: Gather "MetricConfiguration" objects corresponding to all possible key values/combinations.
     # and compute all metric values (resolve "MetricConfiguration" objects ) using a single method call.
-    resolved_metrics: Dict[Tuple[str, str, str], Any] = validator.compute_metrics(
-        metric_configurations=[
-            metric_configuration
-            for key, metric_configurations_for_key in metric_configurations_by_key.items()
-            for metric_configuration in metric_configurations_for_key
-        ],
-        force_no_progress_bar=force_no_progress_bar,
-    )
+    metric_configurations: List[MetricConfiguration] = [
+        metric_configuration
+        for key, metric_configurations_for_key in metric_configurations_by_key.items()
+        for metric_configuration in metric_configurations_for_key
+    ]
+
+    resolved_metrics: Dict[Tuple[str, str, str], Any]
+    metric_configuration_id: Tuple[str, str, str]
+
+    # Within "RuleBasedProfiler.run()" session, metrics already resolved (e.g., by DomainBuilder of another Rule) are
+    # reused; these are keyed by ID of "MetricConfiguration" objects, as supplied (which are left unchanged).
+    session_cache: Optional[ProfilerSessionCache] = get_active_profiler_session_cache()
+    if session_cache is None:
+        resolved_metrics = validator.compute_metrics(
+            metric_configurations=metric_configurations,
+            force_no_progress_bar=force_no_progress_bar,
+        )
+    else:
+        resolved_metric_value: Any
+        resolved_metrics = {
+            metric_configuration_id: resolved_metric_value
+            for metric_configuration_id, (
+                _,
+                resolved_metric_value,
+            ) in session_cache.resolve_metrics(
+                validator=validator,
+                metric_configurations=metric_configurations,
+                force_no_progress_bar=force_no_progress_bar,
+            ).items()
+        }
 
     # Step 2: Gather "MetricConfiguration" ID values for each key (one element per batch_id in every list).
     metric_configuration_ids_by_key: Dict[str, List[Tuple[str, str, str]]] = {
@@ -358,7 +450,6 @@ def get_resolved_metrics_by_key(
 
     # Step 4: Retain only those metric computation results that both, correspond to "MetricConfiguration" objects of
     # interest (reflecting specified key values/combinations).
-    metric_configuration_id: Tuple[str, str, str]
     metric_value: Any
     resolved_metrics = {
         metric_configuration_id: metric_value
@@ -707,6 +798,9 @@ def compute_bootstrap_quantiles_point_estimate(
     quantile_bias_correction: bool,
     quantile_bias_std_error_ratio_threshold: float,
     random_seed: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    convergence_percentage_deviation: Optional[float] = None,
+    convergence_probability: float = 0.95,
 ) -> NumericRangeEstimationResult:
     """
     ML Flow Experiment: parameter_builders_bootstrap/bootstrap_quantiles
@@ -761,7 +855,26 @@ def compute_bootstrap_quantiles_point_estimate(
     bootstrap sampling technique (see https://en.wikipedia.org/wiki/Bootstrapping_(statistics) for background) for
     computing the stopping criterion, expressed as the optimal number of bootstrap samples, needed to achieve a maximum
     probability that the value of the statistic of interest will be minimally deviating from its actual (ideal) value.
+
+    Resamples are drawn in chunks of "chunk_size" resamples, and only quantiles of every resample are retained, so that
+    memory usage does not grow with the number of metric values.  If "convergence_percentage_deviation" is specified,
+    the number of resamples is chosen according to the above three-step method (up to "n_resamples"): after every chunk,
+    the number of resamples, for which the point estimates deviate from their ideal (infinitely resampled) values by no
+    more than "convergence_percentage_deviation" percent with probability "convergence_probability", is re-estimated,
+    and resampling stops once that many resamples have been drawn.
     """
+    if chunk_size is None:
+        chunk_size = DEFAULT_BOOTSTRAP_CHUNK_SIZE
+    elif (
+        isinstance(chunk_size, bool)
+        or not isinstance(chunk_size, (int, np.integer))
+        or chunk_size < 1
+    ):
+        raise ge_exceptions.ProfilerExecutionError(
+            f"""chunk_size must be a positive integer, but {chunk_size} was provided.
+"""
+        )
+
     lower_quantile_pct: float = false_positive_rate / 2.0
     upper_quantile_pct: float = 1.0 - false_positive_rate / 2.0
 
@@ -783,25 +896,68 @@ def compute_bootstrap_quantiles_point_estimate(
         method=quantile_statistic_interpolation_method,
     )
 
-    bootstraps: np.ndarray
+    random_state: Optional[np.random.Generator] = None
     if random_seed:
-        random_state: np.random.Generator = np.random.Generator(
-            np.random.PCG64(random_seed)
+        random_state = np.random.Generator(np.random.PCG64(random_seed))
+
+    # Chunks of resamples are drawn from the same random stream, as all resamples would be, if drawn at once.
+    lower_bootstrap_quantiles: List[np.ndarray] = []
+    upper_bootstrap_quantiles: List[np.ndarray] = []
+    num_resamples_drawn: int = 0
+    num_resamples_required: int = n_resamples
+    bootstraps: np.ndarray
+    while num_resamples_drawn < num_resamples_required:
+        size: Tuple[int, int] = (
+            min(chunk_size, num_resamples_required - num_resamples_drawn),
+            metric_values_converted.size,
         )
-        bootstraps = random_state.choice(
-            metric_values_converted, size=(n_resamples, metric_values_converted.size)
+        if random_state is None:
+            bootstraps = np.random.choice(metric_values_converted, size=size)
+        else:
+            bootstraps = random_state.choice(metric_values_converted, size=size)
+
+        lower_bootstrap_quantiles.append(
+            numpy_quantile(
+                bootstraps,
+                q=lower_quantile_pct,
+                axis=1,
+                method=quantile_statistic_interpolation_method,
+            )
         )
-    else:
-        bootstraps = np.random.choice(
-            metric_values_converted, size=(n_resamples, metric_values_converted.size)
+        upper_bootstrap_quantiles.append(
+            numpy_quantile(
+                bootstraps,
+                q=upper_quantile_pct,
+                axis=1,
+                method=quantile_statistic_interpolation_method,
+            )
         )
+        num_resamples_drawn += size[0]
+
+        if convergence_percentage_deviation is not None:
+            num_resamples_required = min(
+                n_resamples,
+                max(
+                    num_resamples_drawn,
+                    _get_andrews_buchinsky_num_resamples(
+                        bootstrap_quantiles=np.concatenate(lower_bootstrap_quantiles),
+                        percentage_deviation=convergence_percentage_deviation,
+                        probability=convergence_probability,
+                        max_num_resamples=n_resamples,
+                    ),
+                    _get_andrews_buchinsky_num_resamples(
+                        bootstrap_quantiles=np.concatenate(upper_bootstrap_quantiles),
+                        percentage_deviation=convergence_percentage_deviation,
+                        probability=convergence_probability,
+                        max_num_resamples=n_resamples,
+                    ),
+                ),
+            )
 
     lower_quantile_bias_corrected_point_estimate: Union[
         np.float64, datetime.datetime
     ] = _determine_quantile_bias_corrected_point_estimate(
-        bootstraps=bootstraps,
-        quantile_pct=lower_quantile_pct,
-        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        bootstrap_quantiles=np.concatenate(lower_bootstrap_quantiles),
         quantile_bias_correction=quantile_bias_correction,
         quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
         sample_quantile=sample_lower_quantile,
@@ -809,9 +965,7 @@ def compute_bootstrap_quantiles_point_estimate(
     upper_quantile_bias_corrected_point_estimate: Union[
         np.float64, datetime.datetime
     ] = _determine_quantile_bias_corrected_point_estimate(
-        bootstraps=bootstraps,
-        quantile_pct=upper_quantile_pct,
-        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        bootstrap_quantiles=np.concatenate(upper_bootstrap_quantiles),
         quantile_bias_correction=quantile_bias_correction,
         quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
         sample_quantile=sample_upper_quantile,
@@ -887,20 +1041,37 @@ def build_numeric_range_estimation_result(
     )
 
 
+def _get_andrews_buchinsky_num_resamples(
+    bootstrap_quantiles: np.ndarray,
+    percentage_deviation: float,
+    probability: float,
+    max_num_resamples: int,
+) -> int:
+    """
+    Estimates number of resamples, for which bootstrap point estimate (mean of bootstrap quantiles) deviates from its
+    ideal value by no more than "percentage_deviation" percent with given "probability" (Andrews and Buchinsky, 2000):
+    B = 10000 * z^2 * omega / pdb^2, where "omega" is squared coefficient of variation of bootstrap quantiles.
+    """
+    point_estimate: np.float64 = np.mean(bootstrap_quantiles)
+    if point_estimate == 0.0:
+        return max_num_resamples
+
+    omega: np.float64 = np.var(bootstrap_quantiles) / point_estimate**2
+    z: float = stats.norm.ppf(1.0 - (1.0 - probability) / 2.0)
+    return int(
+        min(
+            max_num_resamples,
+            np.ceil(1.0e4 * z**2 * omega / percentage_deviation**2),
+        )
+    )
+
+
 def _determine_quantile_bias_corrected_point_estimate(
-    bootstraps: np.ndarray,
-    quantile_pct: float,
-    quantile_statistic_interpolation_method: str,
+    bootstrap_quantiles: np.ndarray,
     quantile_bias_correction: bool,
     quantile_bias_std_error_ratio_threshold: float,
     sample_quantile: np.ndarray,
 ) -> np.float64:
-    bootstrap_quantiles: Union[np.ndarray, np.float64] = numpy_quantile(
-        bootstraps,
-        q=quantile_pct,
-        axis=1,
-        method=quantile_statistic_interpolation_method,
-    )
     bootstrap_quantile_point_estimate: np.ndarray = np.mean(bootstrap_quantiles)
     bootstrap_quantile_standard_error: np.ndarray = np.std(bootstrap_quantiles)
     bootstrap_quantile_bias: float = bootstrap_quantile_point_estimate - sample_quantile
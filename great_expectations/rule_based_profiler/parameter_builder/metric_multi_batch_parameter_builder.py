@@ -16,9 +16,11 @@ from great_expectations.rule_based_profiler.parameter_container import (
     FULLY_QUALIFIED_PARAMETER_NAME_ATTRIBUTED_VALUE_KEY,
     FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY,
     FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY,
+    PARAMETER_KEY,
     ParameterContainer,
 )
 from great_expectations.types.attributes import Attributes
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
 class MetricMultiBatchParameterBuilder(ParameterBuilder):
@@ -113,6 +115,48 @@ class MetricMultiBatchParameterBuilder(ParameterBuilder):
     def reduce_scalar_metric(self) -> Union[str, bool]:
         return self._reduce_scalar_metric
 
+    def _get_planned_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Returns "MetricConfiguration" directives, which "_build_parameters()" will resolve, unless these depend on
+        outputs of other "ParameterBuilder" objects (i.e., contain "$parameter"-style references).
+        """
+        if not self.metric_name or PARAMETER_KEY in str(
+            (
+                self.metric_domain_kwargs,
+                self.metric_value_kwargs,
+                self.single_batch_mode,
+                self.batch_request,
+            )
+        ):
+            return []
+
+        single_batch_mode: bool = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.single_batch_mode,
+            expected_return_type=bool,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        limit: Optional[int] = 1 if single_batch_mode else None
+
+        metric_configurations: List[MetricConfiguration]
+        _, metric_configurations, _ = self._get_metric_configurations(
+            metric_name=self.metric_name,
+            metric_domain_kwargs=self.metric_domain_kwargs,
+            metric_value_kwargs=self.metric_value_kwargs,
+            limit=limit,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        return metric_configurations
+
     def _build_parameters(
         self,
         domain: Domain,
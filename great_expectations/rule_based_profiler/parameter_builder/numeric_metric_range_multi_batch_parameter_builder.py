@@ -106,6 +106,8 @@ class NumericMetricRangeMultiBatchParameterBuilder(MetricMultiBatchParameterBuil
         quantile_statistic_interpolation_method: str = "auto",
         quantile_bias_correction: Union[str, bool] = False,
         quantile_bias_std_error_ratio_threshold: Optional[Union[str, float]] = None,
+        bootstrap_chunk_size: Optional[Union[str, int]] = None,
+        bootstrap_convergence_percentage_deviation: Optional[Union[str, float]] = None,
         bw_method: Optional[Union[str, float, Callable]] = None,
         include_estimator_samples_histogram_in_details: Union[str, bool] = False,
         truncate_values: Optional[
@@ -146,6 +148,12 @@ class NumericMetricRangeMultiBatchParameterBuilder(MetricMultiBatchParameterBuil
                 effect.
             quantile_bias_std_error_ratio_threshold: Applicable only for the "bootstrap" sampling method -- if omitted
                 (default), then 0.25 is used (as minimum ratio of bias to standard error for applying bias correction).
+            bootstrap_chunk_size: Applicable only for the "bootstrap" sampling method -- number of resamples drawn at a
+                time (only quantiles of resamples are retained); if omitted (default), then 1000 is used.
+            bootstrap_convergence_percentage_deviation: Applicable only for the "bootstrap" sampling method -- if
+                specified, then resampling stops (before n_resamples is reached), once the number of resamples, for
+                which the point estimates deviate from their ideal values by no more than this percentage (with 95%
+                probability), has been drawn; if omitted (default), then n_resamples resamples are always drawn.
             bw_method: Applicable only for the "kde" sampling method -- if omitted (default), then "scott" is used.
                 Possible values for the estimator bandwidth method are described at:
                 https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.gaussian_kde.html
@@ -199,6 +207,12 @@ class NumericMetricRangeMultiBatchParameterBuilder(MetricMultiBatchParameterBuil
             quantile_bias_std_error_ratio_threshold
         )
 
+        self._bootstrap_chunk_size = bootstrap_chunk_size
+
+        self._bootstrap_convergence_percentage_deviation = (
+            bootstrap_convergence_percentage_deviation
+        )
+
         self._bw_method = bw_method
 
         self._include_estimator_samples_histogram_in_details = (
@@ -260,6 +274,16 @@ detected.
     def quantile_bias_std_error_ratio_threshold(self) -> Optional[Union[str, float]]:
         return self._quantile_bias_std_error_ratio_threshold
 
+    @property
+    def bootstrap_chunk_size(self) -> Optional[Union[str, int]]:
+        return self._bootstrap_chunk_size
+
+    @property
+    def bootstrap_convergence_percentage_deviation(
+        self,
+    ) -> Optional[Union[str, float]]:
+        return self._bootstrap_convergence_percentage_deviation
+
     @property
     def bw_method(self) -> Optional[Union[str, float, Callable]]:
         return self._bw_method
@@ -453,6 +477,8 @@ detected.
                         "quantile_statistic_interpolation_method": self.quantile_statistic_interpolation_method,
                         "quantile_bias_correction": self.quantile_bias_correction,
                         "quantile_bias_std_error_ratio_threshold": self.quantile_bias_std_error_ratio_threshold,
+                        "chunk_size": self.bootstrap_chunk_size,
+                        "convergence_percentage_deviation": self.bootstrap_convergence_percentage_deviation,
                     }
                 )
             )
@@ -20,6 +20,10 @@ from great_expectations.rule_based_profiler.attributed_resolved_metrics import (
 from great_expectations.rule_based_profiler.builder import Builder
 from great_expectations.rule_based_profiler.config import ParameterBuilderConfig
 from great_expectations.rule_based_profiler.domain import Domain
+from great_expectations.rule_based_profiler.helpers.session_cache import (
+    ProfilerSessionCache,
+    get_active_profiler_session_cache,
+)
 from great_expectations.rule_based_profiler.helpers.util import (
     build_metric_domain_kwargs,
 )
@@ -33,6 +37,7 @@ from great_expectations.rule_based_profiler.helpers.util import (
     get_validator as get_validator_using_batch_list_or_batch_request,
 )
 from great_expectations.rule_based_profiler.metric_computation_result import (
+    MetricComputationDetails,
     MetricComputationResult,
 )
 from great_expectations.rule_based_profiler.parameter_container import (
@@ -254,7 +259,57 @@ class ParameterBuilder(ABC, Builder):
             parameters=parameters,
         )
 
-    def get_metrics(
+    def get_planned_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Returns "MetricConfiguration" directives, which this "ParameterBuilder" will resolve for given "Domain" and which
+        are knowable before any "ParameterBuilder" is executed (i.e., do not depend on "$parameter"-style references).
+        These are resolved together, for all "Domain" objects of "Rule", prior to building parameters (metrics, which
+        cannot be planned, are computed by "get_metrics()" as before).
+
+        Args:
+            domain: "Domain" object that is context for execution of this "ParameterBuilder" object.
+            variables: attribute name/value pairs
+            parameters: Dictionary of "ParameterContainer" objects corresponding to all "Domain" objects in memory.
+            batch_list: Explicit list of "Batch" objects to supply data at runtime.
+            batch_request: Explicit batch_request used to supply data at runtime.
+        """
+        self.set_batch_list_if_null_batch_request(
+            batch_list=batch_list,
+            batch_request=batch_request,
+        )
+
+        try:
+            return self._get_planned_metric_configurations(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+        except Exception as e:
+            # Planning is an optimization; "get_metrics()" reports errors, should the same metrics be requested later.
+            logger.debug(
+                f"""Metrics of {self.__class__.__name__} "{self.name}" could not be planned: {e}."""
+            )
+            return []
+
+    def _get_planned_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Returns "MetricConfiguration" directives, which "_build_parameters()" will resolve (none, unless overridden).
+        """
+        return []
+
+    def _get_metric_configurations(
         self,
         metric_name: str,
         metric_domain_kwargs: Optional[
@@ -264,38 +319,17 @@ class ParameterBuilder(ABC, Builder):
             Union[Union[str, dict], List[Union[str, dict]]]
         ] = None,
         limit: Optional[int] = None,
-        enforce_numeric_metric: Union[str, bool] = False,
-        replace_nan_with_zero: Union[str, bool] = False,
-        force_no_progress_bar: Optional[bool] = False,
         domain: Optional[Domain] = None,
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
-    ) -> MetricComputationResult:
+    ) -> Tuple[List[str], List[MetricConfiguration], MetricComputationDetails]:
         """
-        General multi-batch metric computation facility.
+        Generates "MetricConfiguration" directives for all "batch_ids"/"metric_value_kwargs" pairs (used by
+        "get_metrics()" and for planning metrics).
 
-        Computes specified metric (can be multi-dimensional, numeric, non-numeric, or mixed) and conditions (or
-        "sanitizes") result according to two criteria: enforcing metric output to be numeric and handling NaN values.
-        :param metric_name: Name of metric of interest, being computed.
-        :param metric_domain_kwargs: Metric Domain Kwargs is an essential parameter of the MetricConfiguration object.
-        :param metric_value_kwargs: Metric Value Kwargs is an essential parameter of the MetricConfiguration object.
-        :param limit: Optional limit on number of "Batch" objects requested (supports single-Batch scenarios).
-        :param enforce_numeric_metric: Flag controlling whether or not metric output must be numerically-valued.
-        :param replace_nan_with_zero: Directive controlling how NaN metric values, if encountered, should be handled.
-        :param force_no_progress_bar (bool) if True, prevent all "Calculating Metrics" output; (False by default).
-        :param domain: "Domain" object scoping "$variable"/"$parameter"-style references in configuration and runtime.
-        :param variables: Part of the "rule state" available for "$variable"-style references.
-        :param parameters: Part of the "rule state" available for "$parameter"-style references.
-        :return: "MetricComputationResult" object, containing both: data samples in the format "N x R^m", where "N"
-        (most significant dimension) is the number of measurements (e.g., one per "Batch" of data), while "R^m" is the
-        multi-dimensional metric, whose values are being estimated, and details (to be used for metadata purposes).
+        :return: Tuple of "batch_ids", "MetricConfiguration" directives (sorted by "metric_value_kwargs_id" and
+        "batch_id"), and details (to be used for metadata purposes).
         """
-        if not metric_name:
-            raise ge_exceptions.ProfilerExecutionError(
-                message=f"""Utilizing "{self.__class__.__name__}.get_metrics()" requires valid "metric_name" to be \
-specified (empty "metric_name" value detected)."""
-            )
-
         batch_ids: Optional[List[str]] = self.get_batch_ids(
             limit=limit,
             domain=domain,
@@ -394,6 +428,75 @@ specified (empty "metric_name" value detected)."""
             ),
         )
 
+        details: MetricComputationDetails = {
+            "metric_configuration": {
+                "metric_name": metric_name,
+                "domain_kwargs": domain_kwargs,
+                "metric_value_kwargs": metric_value_kwargs[0]
+                if len(metric_value_kwargs) == 1
+                else metric_value_kwargs,
+                "metric_dependencies": None,
+            },
+            "num_batches": len(batch_ids),
+        }
+
+        return batch_ids, metrics_to_resolve, details
+
+    def get_metrics(
+        self,
+        metric_name: str,
+        metric_domain_kwargs: Optional[
+            Union[Union[str, dict], List[Union[str, dict]]]
+        ] = None,
+        metric_value_kwargs: Optional[
+            Union[Union[str, dict], List[Union[str, dict]]]
+        ] = None,
+        limit: Optional[int] = None,
+        enforce_numeric_metric: Union[str, bool] = False,
+        replace_nan_with_zero: Union[str, bool] = False,
+        force_no_progress_bar: Optional[bool] = False,
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> MetricComputationResult:
+        """
+        General multi-batch metric computation facility.
+
+        Computes specified metric (can be multi-dimensional, numeric, non-numeric, or mixed) and conditions (or
+        "sanitizes") result according to two criteria: enforcing metric output to be numeric and handling NaN values.
+        :param metric_name: Name of metric of interest, being computed.
+        :param metric_domain_kwargs: Metric Domain Kwargs is an essential parameter of the MetricConfiguration object.
+        :param metric_value_kwargs: Metric Value Kwargs is an essential parameter of the MetricConfiguration object.
+        :param limit: Optional limit on number of "Batch" objects requested (supports single-Batch scenarios).
+        :param enforce_numeric_metric: Flag controlling whether or not metric output must be numerically-valued.
+        :param replace_nan_with_zero: Directive controlling how NaN metric values, if encountered, should be handled.
+        :param force_no_progress_bar (bool) if True, prevent all "Calculating Metrics" output; (False by default).
+        :param domain: "Domain" object scoping "$variable"/"$parameter"-style references in configuration and runtime.
+        :param variables: Part of the "rule state" available for "$variable"-style references.
+        :param parameters: Part of the "rule state" available for "$parameter"-style references.
+        :return: "MetricComputationResult" object, containing both: data samples in the format "N x R^m", where "N"
+        (most significant dimension) is the number of measurements (e.g., one per "Batch" of data), while "R^m" is the
+        multi-dimensional metric, whose values are being estimated, and details (to be used for metadata purposes).
+        """
+        if not metric_name:
+            raise ge_exceptions.ProfilerExecutionError(
+                message=f"""Utilizing "{self.__class__.__name__}.get_metrics()" requires valid "metric_name" to be \
+specified (empty "metric_name" value detected)."""
+            )
+
+        batch_ids: List[str]
+        metrics_to_resolve: List[MetricConfiguration]
+        details: MetricComputationDetails
+        batch_ids, metrics_to_resolve, details = self._get_metric_configurations(
+            metric_name=metric_name,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
+            limit=limit,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
         # Step-5: Resolve all metrics in one operation simultaneously.
 
         # The Validator object used for metric calculation purposes.
@@ -403,10 +506,36 @@ specified (empty "metric_name" value detected)."""
             parameters=parameters,
         )
 
-        resolved_metrics: Dict[Tuple[str, str, str], Any] = validator.compute_metrics(
-            metric_configurations=metrics_to_resolve,
-            force_no_progress_bar=force_no_progress_bar,
-        )
+        resolved_metrics: Dict[Tuple[str, str, str], Any]
+
+        # Within "RuleBasedProfiler.run()" session, metrics planned for all "Domain" objects of "Rule" (or requested by
+        # other "ParameterBuilder" objects) have been resolved already; only remaining metrics are computed.
+        session_cache: Optional[
+            ProfilerSessionCache
+        ] = get_active_profiler_session_cache()
+        if session_cache is None:
+            resolved_metrics = validator.compute_metrics(
+                metric_configurations=metrics_to_resolve,
+                force_no_progress_bar=force_no_progress_bar,
+            )
+        else:
+            session_resolved_metrics: Dict[
+                Tuple[str, str, str], Tuple[MetricConfiguration, Any]
+            ] = session_cache.resolve_metrics(
+                validator=validator,
+                metric_configurations=metrics_to_resolve,
+                force_no_progress_bar=force_no_progress_bar,
+            )
+            metrics_to_resolve = [
+                session_resolved_metrics[metric_configuration.id][0]
+                if metric_configuration.id in session_resolved_metrics
+                else metric_configuration
+                for metric_configuration in metrics_to_resolve
+            ]
+            resolved_metrics = {
+                metric_configuration.id: resolved_metric_value
+                for metric_configuration, resolved_metric_value in session_resolved_metrics.values()
+            }
 
         # Step-6: Sort resolved metrics according to same sort order as was applied to "MetricConfiguration" directives.
 
@@ -496,17 +625,7 @@ specified (empty "metric_name" value detected)."""
         # Step-10: Build and return result to receiver (apply simplifications to cases of single "metric_value_kwargs").
         return MetricComputationResult(
             attributed_resolved_metrics=list(attributed_resolved_metrics_map.values()),
-            details={
-                "metric_configuration": {
-                    "metric_name": metric_name,
-                    "domain_kwargs": domain_kwargs,
-                    "metric_value_kwargs": metric_value_kwargs[0]
-                    if len(metric_value_kwargs) == 1
-                    else metric_value_kwargs,
-                    "metric_dependencies": None,
-                },
-                "num_batches": len(batch_ids),
-            },
+            details=details,
         )
 
     def _sanitize_metric_computation(
@@ -7,7 +7,10 @@ from great_expectations.rule_based_profiler.domain import Domain
 from great_expectations.rule_based_profiler.helpers.util import (
     get_parameter_value_and_validate_return_type,
 )
-from great_expectations.rule_based_profiler.metric_computation_result import MetricValue
+from great_expectations.rule_based_profiler.metric_computation_result import (
+    MetricComputationResult,
+    MetricValue,
+)
 from great_expectations.rule_based_profiler.parameter_builder import (
     MetricSingleBatchParameterBuilder,
 )
@@ -251,35 +254,31 @@ class PartitionParameterBuilder(MetricSingleBatchParameterBuilder):
                 FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY
             ]
         else:
-            self.metric_name = "column.histogram"
-            self.metric_value_kwargs = {
-                "bins": tuple(bins),
-            }
-
-            # Compute metric value for one Batch object.
-            super().build_parameters(
+            # Compute "column.histogram" metric value for one Batch object; "metric_name" and "metric_value_kwargs"
+            # are passed explicitly (rather than set on this "ParameterBuilder", which is shared by all Domain objects).
+            metric_computation_result: MetricComputationResult = self.get_metrics(
+                metric_name="column.histogram",
+                metric_domain_kwargs=self.metric_domain_kwargs,
+                metric_value_kwargs={
+                    "bins": tuple(bins),
+                },
+                limit=1,
+                enforce_numeric_metric=False,
+                replace_nan_with_zero=False,
                 domain=domain,
                 variables=variables,
                 parameters=parameters,
-                parameter_computation_impl=super()._build_parameters,
-                recompute_existing_parameter_values=recompute_existing_parameter_values,
             )
-
-            # Retrieve metric values for one Batch object.
-            parameter_node: ParameterNode = (
-                get_parameter_value_and_validate_return_type(
-                    domain=domain,
-                    parameter_reference=self.raw_fully_qualified_parameter_name,
-                    expected_return_type=None,
-                    variables=variables,
-                    parameters=parameters,
-                )
+            histogram: MetricValue = (
+                metric_computation_result.attributed_resolved_metrics[
+                    0
+                ].conditioned_metric_values[-1]
             )
 
             # in this case, we have requested a partition, histogram using said partition, and nonnull count
             bins = list(bins)
             weights = list(
-                np.asarray(parameter_node[FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY])
+                np.asarray(histogram)
                 / column_values_nonnull_count_parameter_node[
                     FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY
                 ]
@@ -291,7 +290,7 @@ class PartitionParameterBuilder(MetricSingleBatchParameterBuilder):
                 "weights": weights,
                 "tail_weights": [tail_weights, tail_weights],
             }
-            details = parameter_node[FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY]
+            details = metric_computation_result.details
 
         return Attributes(
             {
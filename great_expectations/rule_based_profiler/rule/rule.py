@@ -1,12 +1,15 @@
+import contextvars
 import copy
 import json
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import Batch, BatchRequestBase
 from great_expectations.core.util import (
     convert_to_json_serializable,
     determine_progress_bar_method_by_environment,
 )
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.rule_based_profiler.config.base import (
     domainBuilderConfigSchema,
     expectationConfigurationBuilderConfigSchema,
@@ -22,6 +25,10 @@ from great_expectations.rule_based_profiler.helpers.configuration_reconciliation
     ReconciliationDirectives,
     reconcile_rule_variables,
 )
+from great_expectations.rule_based_profiler.helpers.session_cache import (
+    ProfilerSessionCache,
+    get_active_profiler_session_cache,
+)
 from great_expectations.rule_based_profiler.helpers.util import (
     convert_variables_to_dict,
 )
@@ -36,6 +43,7 @@ from great_expectations.util import (
     deep_filter_properties_iterable,
     measure_execution_time,
 )
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
 class Rule(SerializableDictDot):
@@ -94,6 +102,7 @@ class Rule(SerializableDictDot):
         recompute_existing_parameter_values: bool = False,
         reconciliation_directives: ReconciliationDirectives = DEFAULT_RECONCILATION_DIRECTIVES,
         rule_state: Optional[RuleState] = None,
+        concurrency_config: Optional[ConcurrencyConfig] = None,
     ) -> RuleState:
         """
         Builds a list of Expectation Configurations, returning a single Expectation Configuration entry for every
@@ -106,6 +115,7 @@ class Rule(SerializableDictDot):
             recompute_existing_parameter_values: If "True", recompute value if "fully_qualified_parameter_name" exists
             reconciliation_directives: directives for how each rule component should be overwritten
             rule_state: holds "Rule" execution state and responds to "execution_time_property_name" ("execution_time")
+            concurrency_config: if "concurrent_rule_execution" is enabled, Domain objects are profiled concurrently
 
         Returns:
             RuleState representing effect of executing Rule
@@ -134,9 +144,62 @@ class Rule(SerializableDictDot):
 
         rule_state.reset_parameter_containers()
 
+        self._resolve_planned_metrics(
+            domains=domains,
+            variables=variables,
+            parameters=rule_state.parameters,
+            batch_list=batch_list,
+            batch_request=batch_request,
+        )
+
         pbar_method: Callable = determine_progress_bar_method_by_environment()
 
         domain: Domain
+
+        # Domain objects share no state other than their own "ParameterContainer"; hence, if "concurrent_rule_execution"
+        # is enabled, they are profiled concurrently.  "ParameterContainer" objects are initialized beforehand (in order
+        # of Domain objects), and results are collected in the same order, so that outputs remain deterministic.
+        if (
+            concurrency_config is not None
+            and concurrency_config.enabled
+            and concurrency_config.concurrent_rule_execution
+            and len(domains) > 1
+        ):
+            for domain in domains:
+                rule_state.initialize_parameter_container_for_domain(domain=domain)
+
+            async_results: List[AsyncResult] = []
+            with AsyncExecutor(
+                concurrency_config=concurrency_config,
+                max_workers=len(domains),
+            ) as async_executor:
+                for domain in domains:
+                    # Worker threads do not inherit context variables (e.g., "RuleBasedProfiler.run()" session).
+                    async_results.append(
+                        async_executor.submit(
+                            contextvars.copy_context().run,
+                            self._build_domain_parameters,
+                            domain=domain,
+                            variables=variables,
+                            parameters=rule_state.parameters,
+                            batch_list=batch_list,
+                            batch_request=batch_request,
+                            recompute_existing_parameter_values=recompute_existing_parameter_values,
+                        )
+                    )
+
+                async_result: AsyncResult
+                for async_result in pbar_method(
+                    async_results,
+                    desc="Profiling Dataset:",
+                    position=1,
+                    leave=False,
+                    bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
+                ):
+                    async_result.result()
+
+            return rule_state
+
         for domain in pbar_method(
             domains,
             desc="Profiling Dataset:",
@@ -146,36 +209,58 @@ class Rule(SerializableDictDot):
         ):
             rule_state.initialize_parameter_container_for_domain(domain=domain)
 
-            parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
-            parameter_builder: ParameterBuilder
-            for parameter_builder in parameter_builders:
-                parameter_builder.build_parameters(
-                    domain=domain,
-                    variables=variables,
-                    parameters=rule_state.parameters,
-                    parameter_computation_impl=None,
-                    batch_list=batch_list,
-                    batch_request=batch_request,
-                    recompute_existing_parameter_values=recompute_existing_parameter_values,
-                )
+            self._build_domain_parameters(
+                domain=domain,
+                variables=variables,
+                parameters=rule_state.parameters,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                recompute_existing_parameter_values=recompute_existing_parameter_values,
+            )
 
-            expectation_configuration_builders: List[
-                ExpectationConfigurationBuilder
-            ] = (self.expectation_configuration_builders or [])
+        return rule_state
 
-            expectation_configuration_builder: ExpectationConfigurationBuilder
+    def _build_domain_parameters(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        recompute_existing_parameter_values: bool = False,
+    ) -> None:
+        """
+        Executes all "ParameterBuilder" objects (and validation dependencies of "ExpectationConfigurationBuilder" objects)
+        of this "Rule" for given "Domain" (its "ParameterContainer" must have been initialized in "parameters").
+        """
+        parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
+        parameter_builder: ParameterBuilder
+        for parameter_builder in parameter_builders:
+            parameter_builder.build_parameters(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+                parameter_computation_impl=None,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                recompute_existing_parameter_values=recompute_existing_parameter_values,
+            )
 
-            for expectation_configuration_builder in expectation_configuration_builders:
-                expectation_configuration_builder.resolve_validation_dependencies(
-                    domain=domain,
-                    variables=variables,
-                    parameters=rule_state.parameters,
-                    batch_list=batch_list,
-                    batch_request=batch_request,
-                    recompute_existing_parameter_values=recompute_existing_parameter_values,
-                )
+        expectation_configuration_builders: List[ExpectationConfigurationBuilder] = (
+            self.expectation_configuration_builders or []
+        )
 
-        return rule_state
+        expectation_configuration_builder: ExpectationConfigurationBuilder
+
+        for expectation_configuration_builder in expectation_configuration_builders:
+            expectation_configuration_builder.resolve_validation_dependencies(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                recompute_existing_parameter_values=recompute_existing_parameter_values,
+            )
 
     @property
     def name(self) -> str:
@@ -342,3 +427,103 @@ class Rule(SerializableDictDot):
             )
         )
         return domains
+
+    def _resolve_planned_metrics(
+        self,
+        domains: List[Domain],
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+    ) -> None:
+        """
+        Within "RuleBasedProfiler.run()" session, collects metrics, which "ParameterBuilder" objects of this "Rule" will
+        request for all "Domain" objects (as far as these are knowable in advance), and resolves them together (one
+        deduplicated validation graph per "Validator"), so that "ParameterBuilder" objects are served from the result.
+        """
+        session_cache: Optional[
+            ProfilerSessionCache
+        ] = get_active_profiler_session_cache()
+        if session_cache is None:
+            return
+
+        parameter_builders: List[ParameterBuilder] = list(self.parameter_builders or [])
+
+        expectation_configuration_builder: ExpectationConfigurationBuilder
+        for expectation_configuration_builder in (
+            self.expectation_configuration_builders or []
+        ):
+            parameter_builders.extend(
+                expectation_configuration_builder.validation_parameter_builders or []
+            )
+
+        # Planned metrics are grouped by "Validator" (shared by "ParameterBuilder" objects within the session).
+        metric_configurations_by_validator: Dict[
+            int, Tuple["Validator", List[MetricConfiguration]]  # noqa: F821
+        ] = {}
+
+        domain: Domain
+        parameter_builder: ParameterBuilder
+        parameter_builders_to_plan: List[
+            Tuple[
+                ParameterBuilder,
+                Optional[List[Batch]],
+                Optional[Union[BatchRequestBase, dict]],
+            ]
+        ]
+        metric_configurations: List[MetricConfiguration]
+        validator: Optional["Validator"]  # noqa: F821
+        for domain in domains:
+            # Dependencies ("evaluation_parameter_builders") obtain Batch objects from "ParameterBuilder" depending on
+            # them (as in "resolve_evaluation_dependencies()"); hence, these are planned after their dependents.
+            parameter_builders_to_plan = [
+                (parameter_builder, batch_list, batch_request)
+                for parameter_builder in parameter_builders
+            ]
+            while parameter_builders_to_plan:
+                (
+                    parameter_builder,
+                    parameter_builder_batch_list,
+                    parameter_builder_batch_request,
+                ) = parameter_builders_to_plan.pop(0)
+                metric_configurations = (
+                    parameter_builder.get_planned_metric_configurations(
+                        domain=domain,
+                        variables=variables,
+                        parameters=parameters,
+                        batch_list=parameter_builder_batch_list,
+                        batch_request=parameter_builder_batch_request,
+                    )
+                )
+                parameter_builders_to_plan.extend(
+                    (
+                        evaluation_parameter_builder,
+                        parameter_builder.batch_list,
+                        parameter_builder.batch_request,
+                    )
+                    for evaluation_parameter_builder in parameter_builder.evaluation_parameter_builders
+                    or []
+                )
+                if not metric_configurations:
+                    continue
+
+                validator = parameter_builder.get_validator(
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                )
+                if validator is None:
+                    continue
+
+                metric_configurations_by_validator.setdefault(
+                    id(validator), (validator, [])
+                )[1].extend(metric_configurations)
+
+        for (
+            validator,
+            metric_configurations,
+        ) in metric_configurations_by_validator.values():
+            session_cache.resolve_metrics(
+                validator=validator,
+                metric_configurations=metric_configurations,
+            )
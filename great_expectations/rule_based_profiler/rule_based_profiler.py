@@ -1,11 +1,14 @@
+import contextvars
 import copy
 import datetime
 import json
 import logging
 import sys
+import time
 from typing import Any, Callable, Dict, List, Optional, Set, Union
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import (
     Batch,
     BatchRequestBase,
@@ -27,6 +30,7 @@ from great_expectations.core.util import (
 from great_expectations.data_context.store.ge_cloud_store_backend import (
     GeCloudRESTResource,
 )
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.types.refs import GeCloudResourceRef
 from great_expectations.data_context.types.resource_identifiers import (
     ConfigurationIdentifier,
@@ -61,6 +65,9 @@ from great_expectations.rule_based_profiler.helpers.runtime_environment import (
     RuntimeEnvironmentDomainTypeDirectives,
     RuntimeEnvironmentVariablesDirectives,
 )
+from great_expectations.rule_based_profiler.helpers.session_cache import (
+    profiler_session_cache,
+)
 from great_expectations.rule_based_profiler.helpers.util import (
     convert_variables_to_dict,
 )
@@ -307,23 +314,68 @@ class BaseRuleBasedProfiler(ConfigPeer):
 
         rule_state: RuleState
         rule: Rule
-        for rule in pbar_method(
-            effective_rules,
-            desc="Generating Expectations:",
-            disable=disable,
-            position=0,
-            leave=True,
-            bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
-        ):
-            rule_state = rule.run(
-                variables=effective_variables,
-                batch_list=batch_list,
-                batch_request=batch_request,
-                recompute_existing_parameter_values=recompute_existing_parameter_values,
-                reconciliation_directives=reconciliation_directives,
-                rule_state=RuleState(),
-            )
-            self.rule_states.append(rule_state)
+        # Batch lists and Validator objects, resolved by DomainBuilder and ParameterBuilder objects, are reused by all
+        # Rule objects (and Domain objects) for the duration of this session (i.e., each Batch is loaded only once).
+        concurrency_config: Optional[ConcurrencyConfig] = self._concurrency_config
+        with profiler_session_cache():
+            # Rule objects do not share state; hence, if "concurrent_rule_execution" is enabled, they are run concurrently
+            # (RuleState objects are collected in order of Rule objects, so that outputs remain deterministic).
+            if (
+                concurrency_config is not None
+                and concurrency_config.enabled
+                and concurrency_config.concurrent_rule_execution
+                and len(effective_rules) > 1
+            ):
+                async_results: List[AsyncResult] = []
+                with AsyncExecutor(
+                    concurrency_config=concurrency_config,
+                    max_workers=len(effective_rules),
+                ) as async_executor:
+                    for rule in effective_rules:
+                        # Worker threads do not inherit context variables (e.g., this "RuleBasedProfiler.run()" session).
+                        async_results.append(
+                            async_executor.submit(
+                                contextvars.copy_context().run,
+                                self._run_rule_concurrently,
+                                rule=rule,
+                                variables=effective_variables,
+                                batch_list=batch_list,
+                                batch_request=batch_request,
+                                recompute_existing_parameter_values=recompute_existing_parameter_values,
+                                reconciliation_directives=reconciliation_directives,
+                                concurrency_config=concurrency_config,
+                            )
+                        )
+
+                    async_result: AsyncResult
+                    for async_result in pbar_method(
+                        async_results,
+                        desc="Generating Expectations:",
+                        disable=disable,
+                        position=0,
+                        leave=True,
+                        bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
+                    ):
+                        self.rule_states.append(async_result.result())
+            else:
+                for rule in pbar_method(
+                    effective_rules,
+                    desc="Generating Expectations:",
+                    disable=disable,
+                    position=0,
+                    leave=True,
+                    bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
+                ):
+                    rule_state = rule.run(
+                        variables=effective_variables,
+                        batch_list=batch_list,
+                        batch_request=batch_request,
+                        recompute_existing_parameter_values=recompute_existing_parameter_values,
+                        reconciliation_directives=reconciliation_directives,
+                        rule_state=RuleState(),
+                        concurrency_config=concurrency_config,
+                    )
+                    self.rule_states.append(rule_state)
 
         return RuleBasedProfilerResult(
             fully_qualified_parameter_names_by_domain=self.get_fully_qualified_parameter_names_by_domain(),
@@ -356,6 +408,44 @@ class BaseRuleBasedProfiler(ConfigPeer):
             _usage_statistics_handler=self._usage_statistics_handler,
         )
 
+    @staticmethod
+    def _run_rule_concurrently(
+        rule: Rule,
+        variables: Optional[ParameterContainer] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        recompute_existing_parameter_values: bool = False,
+        reconciliation_directives: ReconciliationDirectives = DEFAULT_RECONCILATION_DIRECTIVES,
+        concurrency_config: Optional[ConcurrencyConfig] = None,
+    ) -> RuleState:
+        """
+        Runs "Rule" on worker thread.  Processor time, which "Rule.run()" records otherwise, is shared by all threads;
+        hence, "rule_execution_time" holds elapsed (wall-clock) time of "Rule" instead.
+        """
+        rule_state = RuleState()
+        time_begin: float = time.perf_counter()
+        rule.run(
+            variables=variables,
+            batch_list=batch_list,
+            batch_request=batch_request,
+            recompute_existing_parameter_values=recompute_existing_parameter_values,
+            reconciliation_directives=reconciliation_directives,
+            rule_state=rule_state,
+            concurrency_config=concurrency_config,
+        )
+        rule_state.rule_execution_time = time.perf_counter() - time_begin
+        return rule_state
+
+    @property
+    def _concurrency_config(self) -> Optional[ConcurrencyConfig]:
+        concurrency_config: Optional[ConcurrencyConfig] = getattr(
+            self._data_context, "concurrency", None
+        )
+        if isinstance(concurrency_config, ConcurrencyConfig):
+            return concurrency_config
+
+        return None
+
     def get_expectation_configurations(self) -> List[ExpectationConfiguration]:
         """
         Returns:
@@ -1,7 +1,7 @@
 import logging
 import warnings
 from collections import OrderedDict
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
 from dateutil.parser import parse
 
@@ -25,6 +25,9 @@ from great_expectations.validation_operators.types.validation_operator_result im
     ValidationOperatorResult,
 )
 
+if TYPE_CHECKING:
+    from great_expectations.validator.validator import EvaluatedExpectationSuite
+
 logger = logging.getLogger(__name__)
 
 
@@ -291,6 +294,8 @@ class ActionListValidationOperator(ValidationOperator):
         checkpoint_identifier=None,
         checkpoint_name: Optional[str] = None,
         validation_id: Optional[str] = None,
+        metrics: Optional[Dict[Tuple[str, str, str], Any]] = None,
+        evaluated_expectation_suite: Optional["EvaluatedExpectationSuite"] = None,
     ) -> ValidationOperatorResult:
         assert not (run_id and run_name) and not (
             run_id and run_time
@@ -360,6 +365,16 @@ class ActionListValidationOperator(ValidationOperator):
                 if checkpoint_name is not None:
                     batch_validate_arguments["checkpoint_name"] = checkpoint_name
 
+                # Metrics, already resolved for the batch (e.g., together with metrics of other Expectation Suites).
+                if metrics is not None:
+                    batch_validate_arguments["metrics"] = metrics
+
+                # Expectation Suite, whose evaluation parameters have already been evaluated (e.g., for resolving the above metrics).
+                if evaluated_expectation_suite is not None:
+                    batch_validate_arguments[
+                        "evaluated_expectation_suite"
+                    ] = evaluated_expectation_suite
+
                 batch_and_async_result_tuples.append(
                     (
                         batch,
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Set, Tuple, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union, cast
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.validator.exception_info import ExceptionInfo
@@ -29,17 +29,82 @@ class MetricEdge:
 
 class ValidationGraph:
     def __init__(self, edges: Optional[List[MetricEdge]] = None) -> None:
-        if edges:
-            self._edges = edges
-        else:
-            self._edges = []
+        self._edges: List[MetricEdge] = []
+        self._edge_ids: Set[
+            Tuple[Tuple[str, str, str], Optional[Tuple[str, str, str]]]
+        ] = set()
+        # Intern table: equal MetricConfiguration objects (same "id") are represented by one shared vertex object.
+        self._metric_configurations: Dict[
+            Tuple[str, str, str], MetricConfiguration
+        ] = {}
+        # Adjacency (dependencies of every "left" vertex) and reverse adjacency (dependents of every "right" vertex).
+        self._metric_dependency_ids: Dict[
+            Tuple[str, str, str], Set[Tuple[str, str, str]]
+        ] = {}
+        self._metric_dependent_ids: Dict[
+            Tuple[str, str, str], Set[Tuple[str, str, str]]
+        ] = {}
 
-        self._edge_ids = {edge.id for edge in self._edges}
+        if edges:
+            edge: MetricEdge
+            for edge in edges:
+                self.add(edge=edge)
 
     def add(self, edge: MetricEdge) -> None:
-        if edge.id not in self._edge_ids:
-            self._edges.append(edge)
-            self._edge_ids.add(edge.id)
+        edge_id: Tuple[Tuple[str, str, str], Optional[Tuple[str, str, str]]] = edge.id
+        if edge_id not in self._edge_ids:
+            self._edges.append(
+                MetricEdge(
+                    left=self._intern_metric_configuration(
+                        metric_configuration=edge.left
+                    ),
+                    right=self._intern_metric_configuration(
+                        metric_configuration=edge.right
+                    ),
+                )
+            )
+            self._edge_ids.add(edge_id)
+
+            left_id: Tuple[str, str, str]
+            right_id: Optional[Tuple[str, str, str]]
+            left_id, right_id = edge_id
+            self._metric_dependency_ids.setdefault(left_id, set())
+            if right_id is not None:
+                self._metric_dependency_ids[left_id].add(right_id)
+                self._metric_dependent_ids.setdefault(right_id, set()).add(left_id)
+
+    def _intern_metric_configuration(
+        self, metric_configuration: Optional[MetricConfiguration]
+    ) -> Optional[MetricConfiguration]:
+        if metric_configuration is None:
+            return None
+
+        return self._metric_configurations.setdefault(
+            metric_configuration.id, metric_configuration
+        )
+
+    def get_metric_configuration(
+        self, metric_id: Tuple[str, str, str]
+    ) -> Optional[MetricConfiguration]:
+        """Returns the (interned) MetricConfiguration vertex of this graph that has the given "id" (or None)."""
+        return self._metric_configurations.get(metric_id)
+
+    @property
+    def metric_configurations(self) -> List[MetricConfiguration]:
+        return list(self._metric_configurations.values())
+
+    @property
+    def metric_dependency_ids(
+        self,
+    ) -> Dict[Tuple[str, str, str], Set[Tuple[str, str, str]]]:
+        """Maps the "id" of every metric, which appears as "left" vertex of an edge, to "id" values of its dependencies."""
+        return self._metric_dependency_ids
+
+    def get_metric_dependent_ids(
+        self, metric_id: Tuple[str, str, str]
+    ) -> Set[Tuple[str, str, str]]:
+        """Returns "id" values of metrics, which directly depend on metric with the given "id"."""
+        return self._metric_dependent_ids.get(metric_id, set())
 
     @property
     def edges(self):
@@ -47,7 +112,96 @@ class ValidationGraph:
 
     @property
     def edge_ids(self):
-        return {edge.id for edge in self._edges}
+        return set(self._edge_ids)
+
+
+class MetricResolutionQueue:
+    """
+    MetricResolutionQueue schedules the resolution of metrics in a ValidationGraph in topological order (Kahn-style).
+
+    The number of unresolved dependencies of every metric is computed once; thereafter, marking metrics as resolved
+    decrements the counts of their dependents (using reverse adjacency of the graph) and moves dependents, whose counts
+    reach zero, from the "needed" set to the "ready" set.  Hence, the cost of scheduling is proportional to the number
+    of edges in the graph, rather than to the number of edges times the depth of the graph.
+    """
+
+    def __init__(
+        self,
+        graph: ValidationGraph,
+        metrics: Dict[Tuple[str, str, str], Any],
+    ) -> None:
+        self._graph = graph
+
+        self._unresolved_metric_ids: Set[Tuple[str, str, str]] = set()
+        self._pending_dependency_counts: Dict[Tuple[str, str, str], int] = {}
+        self._ready_metric_ids: Set[Tuple[str, str, str]] = set()
+        self._needed_metric_ids: Set[Tuple[str, str, str]] = set()
+
+        metric_id: Tuple[str, str, str]
+        dependency_ids: Set[Tuple[str, str, str]]
+        for metric_id, dependency_ids in graph.metric_dependency_ids.items():
+            if metric_id in metrics:
+                continue
+
+            pending_dependency_ids: Set[Tuple[str, str, str]] = {
+                dependency_id
+                for dependency_id in dependency_ids
+                if dependency_id not in metrics
+            }
+            self._unresolved_metric_ids.add(metric_id)
+            self._unresolved_metric_ids.update(pending_dependency_ids)
+
+            self._pending_dependency_counts[metric_id] = len(pending_dependency_ids)
+            if len(pending_dependency_ids) == 0:
+                self._ready_metric_ids.add(metric_id)
+            else:
+                self._needed_metric_ids.add(metric_id)
+
+    @property
+    def ready_metrics(self) -> Set[MetricConfiguration]:
+        """Metrics, whose dependencies have all been resolved."""
+        return {
+            self._graph.get_metric_configuration(metric_id)
+            for metric_id in self._ready_metric_ids
+        }
+
+    @property
+    def needed_metrics(self) -> Set[MetricConfiguration]:
+        """Metrics, which still have unresolved dependencies."""
+        return {
+            self._graph.get_metric_configuration(metric_id)
+            for metric_id in self._needed_metric_ids
+        }
+
+    @property
+    def ready_metric_ids(self) -> Set[Tuple[str, str, str]]:
+        return self._ready_metric_ids
+
+    @property
+    def needed_metric_ids(self) -> Set[Tuple[str, str, str]]:
+        return self._needed_metric_ids
+
+    def mark_resolved(self, metric_ids: Iterable[Tuple[str, str, str]]) -> None:
+        """Removes resolved metrics from the queue and promotes dependents, whose dependencies are now all resolved."""
+        metric_id: Tuple[str, str, str]
+        dependent_id: Tuple[str, str, str]
+        for metric_id in metric_ids:
+            if metric_id not in self._unresolved_metric_ids:
+                continue
+
+            self._unresolved_metric_ids.remove(metric_id)
+            self._ready_metric_ids.discard(metric_id)
+            self._needed_metric_ids.discard(metric_id)
+            self._pending_dependency_counts.pop(metric_id, None)
+
+            for dependent_id in self._graph.get_metric_dependent_ids(metric_id):
+                if dependent_id not in self._pending_dependency_counts:
+                    continue
+
+                self._pending_dependency_counts[dependent_id] -= 1
+                if self._pending_dependency_counts[dependent_id] == 0:
+                    self._needed_metric_ids.discard(dependent_id)
+                    self._ready_metric_ids.add(dependent_id)
 
 
 class ExpectationValidationGraph:
@@ -88,13 +242,10 @@ class ExpectationValidationGraph:
         Tuple[str, str, str],
         Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
     ]:
-        graph_metric_ids: List[Tuple[str, str, str]] = []
-        edge: MetricEdge
-        vertex: MetricConfiguration
-        for edge in self.graph.edges:
-            for vertex in [edge.left, edge.right]:
-                if vertex is not None:
-                    graph_metric_ids.append(vertex.id)
+        graph_metric_ids: Set[Tuple[str, str, str]] = {
+            metric_configuration.id
+            for metric_configuration in self.graph.metric_configurations
+        }
 
         metric_id: Tuple[str, str, str]
         metric_info_item: Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]]
@@ -0,0 +1,254 @@
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.id_dict import IDDict
+from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.expectations.registry import get_registry_version
+from great_expectations.types import DictDot
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import (
+    ExpectationValidationGraph,
+    MetricEdge,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import ExecutionEngine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VALIDATION_PLAN_CACHE_MAX_ENTRIES: int = 128
+
+
+class ValidationPlan:
+    """
+    ValidationPlan is the compiled form of metric dependency graphs of a list of ExpectationConfiguration objects: the
+    graph of every Expectation is built once (for the Batch, active at the time) and bound to the Batch of every
+    subsequent validation of the same ExpectationConfiguration objects (with the same ExecutionEngine configuration and
+    runtime configuration), which only requires substituting "batch_id" in the kwargs of its metrics.
+
+    Expectations, whose validation dependencies are determined from Batch data, have no compiled graph (their graphs are
+    built for every validation).
+    """
+
+    def __init__(
+        self,
+        batch_id: str,
+        expectation_metric_edges: List[Optional[List[MetricEdge]]],
+    ) -> None:
+        """
+        Args:
+            batch_id: ID of Batch, for which metric dependency graphs were built
+            expectation_metric_edges: edges of metric dependency graph of every ExpectationConfiguration, in order (or
+            None, if graph of ExpectationConfiguration is built for every validation)
+        """
+        self._batch_id = batch_id
+        self._expectation_metric_edges = expectation_metric_edges
+
+    @property
+    def batch_id(self) -> str:
+        return self._batch_id
+
+    @property
+    def num_expectations(self) -> int:
+        return len(self._expectation_metric_edges)
+
+    def is_compiled(self, index: int) -> bool:
+        """Returns True, if graph of ExpectationConfiguration at given position has been compiled."""
+        return self._expectation_metric_edges[index] is not None
+
+    def bind(
+        self,
+        index: int,
+        configuration: ExpectationConfiguration,
+        batch_id: str,
+        bound_metric_configurations: Dict[Tuple[str, str, str], MetricConfiguration],
+    ) -> ExpectationValidationGraph:
+        """
+        Returns ExpectationValidationGraph of ExpectationConfiguration at given position, bound to given Batch.
+
+        Args:
+            index: position of ExpectationConfiguration in this ValidationPlan
+            configuration: evaluated ExpectationConfiguration (i.e., with "batch_id" of given Batch in its kwargs)
+            batch_id: ID of Batch, to which metric dependency graph is bound
+            bound_metric_configurations: MetricConfiguration objects, already bound to given Batch (keyed by "id" in
+            this ValidationPlan), so that metrics, shared by Expectations, are bound only once
+
+        Returns:
+            ExpectationValidationGraph, whose metrics are computed for given Batch
+        """
+        expectation_validation_graph = ExpectationValidationGraph(
+            configuration=configuration
+        )
+
+        metric_edges: Optional[List[MetricEdge]] = self._expectation_metric_edges[index]
+        if metric_edges is None:
+            raise ValueError(
+                f"Graph of ExpectationConfiguration at position {index} of ValidationPlan has not been compiled."
+            )
+
+        edge: MetricEdge
+        for edge in metric_edges:
+            expectation_validation_graph.graph.add(
+                edge=MetricEdge(
+                    left=self._bind_metric_configuration(
+                        metric_configuration=edge.left,
+                        batch_id=batch_id,
+                        bound_metric_configurations=bound_metric_configurations,
+                    ),
+                    right=None
+                    if edge.right is None
+                    else self._bind_metric_configuration(
+                        metric_configuration=edge.right,
+                        batch_id=batch_id,
+                        bound_metric_configurations=bound_metric_configurations,
+                    ),
+                )
+            )
+
+        return expectation_validation_graph
+
+    def _bind_metric_configuration(
+        self,
+        metric_configuration: MetricConfiguration,
+        batch_id: str,
+        bound_metric_configurations: Dict[Tuple[str, str, str], MetricConfiguration],
+    ) -> MetricConfiguration:
+        metric_id: Tuple[str, str, str] = metric_configuration.id
+        if metric_id in bound_metric_configurations:
+            return bound_metric_configurations[metric_id]
+
+        # MetricConfiguration objects of ValidationPlan are shared by all validations; hence, these are never modified.
+        bound_metric_configuration = MetricConfiguration(
+            metric_name=metric_configuration.metric_name,
+            metric_domain_kwargs=self._bind_kwargs(
+                kwargs=metric_configuration.metric_domain_kwargs, batch_id=batch_id
+            ),
+            metric_value_kwargs=self._bind_kwargs(
+                kwargs=metric_configuration.metric_value_kwargs, batch_id=batch_id
+            ),
+        )
+        bound_metric_configurations[metric_id] = bound_metric_configuration
+
+        bound_metric_configuration.metric_dependencies = {
+            name: self._bind_metric_configuration(
+                metric_configuration=metric_dependency,
+                batch_id=batch_id,
+                bound_metric_configurations=bound_metric_configurations,
+            )
+            for name, metric_dependency in metric_configuration.metric_dependencies.items()
+        }
+
+        return bound_metric_configuration
+
+    def _bind_kwargs(self, kwargs: IDDict, batch_id: str) -> IDDict:
+        if kwargs.get("batch_id") != self._batch_id:
+            return kwargs
+
+        bound_kwargs = IDDict(kwargs)
+        bound_kwargs["batch_id"] = batch_id
+        return bound_kwargs
+
+
+@dataclass
+class ValidationPlanCacheStatistics(DictDot):
+    """
+    ValidationPlanCacheStatistics is a "dataclass" object, which holds counters describing usage of ValidationPlanCache.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> dict:
+        """Returns: this ValidationPlanCacheStatistics as a dictionary"""
+        return asdict(self)
+
+    def to_json_dict(self) -> dict:
+        """Returns: this ValidationPlanCacheStatistics as a JSON dictionary"""
+        return convert_to_json_serializable(data=self.to_dict())
+
+
+class ValidationPlanCache:
+    """
+    ValidationPlanCache holds ValidationPlan objects, keyed by content of ExpectationConfiguration objects (excluding
+    "batch_id"), by ExecutionEngine class and configuration, by runtime configuration, and by version of the registry of
+    Expectation and metric implementations, and evicts least-recently-used ValidationPlan objects, once the number of
+    entries exceeds "max_entries".
+
+    ValidationPlanCache is safe to use from multiple threads.
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_VALIDATION_PLAN_CACHE_MAX_ENTRIES
+    ) -> None:
+        self._max_entries = max_entries
+        self._validation_plans: "OrderedDict[str, ValidationPlan]" = OrderedDict()
+        self._statistics = ValidationPlanCacheStatistics()
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @property
+    def statistics(self) -> ValidationPlanCacheStatistics:
+        return self._statistics
+
+    @staticmethod
+    def get_key(
+        configurations: List[ExpectationConfiguration],
+        execution_engine: "ExecutionEngine",
+        runtime_configuration: Optional[dict] = None,
+    ) -> str:
+        configuration: ExpectationConfiguration
+        configuration_dicts: List[dict] = []
+        for configuration in configurations:
+            configuration_dict: dict = configuration.to_json_dict()
+            configuration_dict["kwargs"].pop("batch_id", None)
+            configuration_dicts.append(configuration_dict)
+
+        return hashlib.md5(
+            json.dumps(
+                {
+                    "configurations": configuration_dicts,
+                    "execution_engine": f"{execution_engine.__class__.__module__}.{execution_engine.__class__.__name__}",
+                    "execution_engine_config": execution_engine.config,
+                    "runtime_configuration": runtime_configuration,
+                    "registry_version": get_registry_version(),
+                },
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[ValidationPlan]:
+        with self._lock:
+            if key not in self._validation_plans:
+                self._statistics.misses += 1
+                return None
+
+            self._statistics.hits += 1
+            self._validation_plans.move_to_end(key)
+            return self._validation_plans[key]
+
+    def set(self, key: str, validation_plan: ValidationPlan) -> None:
+        with self._lock:
+            self._validation_plans[key] = validation_plan
+            self._validation_plans.move_to_end(key)
+            while len(self._validation_plans) > self._max_entries:
+                self._validation_plans.popitem(last=False)
+                self._statistics.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validation_plans.clear()
+
+
+# ValidationPlan objects are shared by all Validator objects (e.g., of consecutive validations in Checkpoint runs).
+validation_plan_cache = ValidationPlanCache()
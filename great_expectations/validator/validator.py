@@ -4,16 +4,19 @@ import inspect
 import itertools
 import json
 import logging
+import time
 import traceback
 import warnings
 from collections import OrderedDict, defaultdict, namedtuple
 from collections.abc import Hashable
+from dataclasses import dataclass
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from dateutil.parser import parse
 from tqdm.auto import tqdm
 
 from great_expectations import __version__ as ge_version
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import Batch, BatchDefinition, BatchMarkers
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_suite import (
@@ -29,6 +32,7 @@ from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.data_asset.util import recursively_convert_to_json_serializable
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.dataset import PandasDataset, SparkDFDataset, SqlAlchemyDataset
 from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyBatchReference
 from great_expectations.exceptions import (
@@ -74,8 +78,14 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 from great_expectations.validator.validation_graph import (
     ExpectationValidationGraph,
     MetricEdge,
+    MetricResolutionQueue,
     ValidationGraph,
 )
+from great_expectations.validator.validation_plan import (
+    ValidationPlan,
+    ValidationPlanCache,
+    validation_plan_cache,
+)
 
 logger = logging.getLogger(__name__)
 logging.captureWarnings(True)
@@ -104,6 +114,19 @@ ValidationStatistics = namedtuple(
 )
 
 
+@dataclass(frozen=True)
+class EvaluatedExpectationSuite:
+    """
+    EvaluatedExpectationSuite holds (a copy of) an Expectation Suite, whose evaluation parameters have been evaluated,
+    together with runtime evaluation parameters and ExpectationConfiguration objects (in order of evaluation), so that
+    these can be validated (and their metrics resolved) without evaluating evaluation parameters again.
+    """
+
+    expectation_suite: ExpectationSuite
+    runtime_evaluation_parameters: dict
+    expectations_to_evaluate: List[ExpectationConfiguration]
+
+
 def _calc_validation_statistics(
     validation_results: List[ExpectationValidationResult],
 ) -> ValidationStatistics:
@@ -945,6 +968,24 @@ class Validator:
         Returns:
             A list of Validations, validating that all necessary metrics are available.
         """
+        evrs: List[ExpectationValidationResult]
+        evrs, _ = self._graph_validate(
+            configurations=configurations,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+            force_no_progress_bar=force_no_progress_bar,
+        )
+        return evrs
+
+    def _graph_validate(
+        self,
+        configurations: List[ExpectationConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], Any]] = None,
+        runtime_configuration: Optional[dict] = None,
+        force_no_progress_bar: bool = False,
+    ) -> Tuple[List[ExpectationValidationResult], float]:
+        """Implements "graph_validate()"; returns list of Validations and time (in seconds) spent building the
+        validation graph."""
         if runtime_configuration is None:
             runtime_configuration = {}
 
@@ -958,10 +999,8 @@ class Validator:
         expectation_validation_graphs: List[ExpectationValidationGraph] = []
 
         processed_configurations: List[ExpectationConfiguration] = []
-        (
-            evrs,
-            processed_configurations,
-        ) = self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+        graph_build_start_time: float = time.perf_counter()
+        (evrs, processed_configurations,) = self._build_expectation_level_sub_graphs(
             expectation_configurations=configurations,
             expectation_validation_graphs=expectation_validation_graphs,
             processed_configurations=processed_configurations,
@@ -977,6 +1016,7 @@ class Validator:
                 expectation_validation_graphs=expectation_validation_graphs
             )
         )
+        graph_build_time: float = time.perf_counter() - graph_build_start_time
 
         try:
             (
@@ -1002,7 +1042,7 @@ class Validator:
                     failing_expectation_configurations=processed_configurations,
                     evrs=evrs,
                 )
-                return evrs
+                return evrs, graph_build_time
             else:
                 raise err
 
@@ -1028,7 +1068,105 @@ class Validator:
                 else:
                     raise err
 
-        return evrs
+        return evrs, graph_build_time
+
+    def _build_expectation_level_sub_graphs(
+        self,
+        expectation_configurations: List[ExpectationConfiguration],
+        expectation_validation_graphs: List[ExpectationValidationGraph],
+        processed_configurations: List[ExpectationConfiguration],
+        catch_exceptions: bool,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Tuple[List[ExpectationValidationResult], List[ExpectationConfiguration]]:
+        # Sub-graphs are bound to the active batch from the compiled ValidationPlan of the same expectation
+        # configurations (and the same ExecutionEngine and runtime configurations), if one is cached; otherwise, they
+        # are built, and the ValidationPlan is compiled from them.
+        batch_id: Optional[str] = self.active_batch_id
+        if batch_id is None:
+            return self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+                expectation_configurations=expectation_configurations,
+                expectation_validation_graphs=expectation_validation_graphs,
+                processed_configurations=processed_configurations,
+                catch_exceptions=catch_exceptions,
+                runtime_configuration=runtime_configuration,
+            )
+
+        validation_plan_key: str = ValidationPlanCache.get_key(
+            configurations=expectation_configurations,
+            execution_engine=self._execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+        validation_plan: Optional[ValidationPlan] = validation_plan_cache.get(
+            key=validation_plan_key
+        )
+
+        evrs: List[ExpectationValidationResult]
+        if validation_plan is None:
+            (
+                evrs,
+                processed_configurations,
+            ) = self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+                expectation_configurations=expectation_configurations,
+                expectation_validation_graphs=expectation_validation_graphs,
+                processed_configurations=processed_configurations,
+                catch_exceptions=catch_exceptions,
+                runtime_configuration=runtime_configuration,
+            )
+            # Only sub-graphs of expectation configurations, which were all processed without errors, are compiled.
+            if len(evrs) == 0:
+                expectation_validation_graph: ExpectationValidationGraph
+                validation_plan_cache.set(
+                    key=validation_plan_key,
+                    validation_plan=ValidationPlan(
+                        batch_id=batch_id,
+                        expectation_metric_edges=[
+                            None
+                            if get_expectation_impl(
+                                expectation_validation_graph.configuration.expectation_type
+                            ).validation_dependencies_depend_on_data
+                            else list(expectation_validation_graph.graph.edges)
+                            for expectation_validation_graph in expectation_validation_graphs
+                        ],
+                    ),
+                )
+
+            return evrs, processed_configurations
+
+        evrs = []
+        bound_metric_configurations: Dict[
+            Tuple[str, str, str], MetricConfiguration
+        ] = {}
+        index: int
+        configuration: ExpectationConfiguration
+        evaluated_config: ExpectationConfiguration
+        for index, configuration in enumerate(expectation_configurations):
+            if not validation_plan.is_compiled(index=index):
+                evrs.extend(
+                    self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+                        expectation_configurations=[configuration],
+                        expectation_validation_graphs=expectation_validation_graphs,
+                        processed_configurations=processed_configurations,
+                        catch_exceptions=catch_exceptions,
+                        runtime_configuration=runtime_configuration,
+                    )[
+                        0
+                    ]
+                )
+                continue
+
+            evaluated_config = copy.deepcopy(configuration)
+            evaluated_config.kwargs.update({"batch_id": batch_id})
+            expectation_validation_graphs.append(
+                validation_plan.bind(
+                    index=index,
+                    configuration=evaluated_config,
+                    batch_id=batch_id,
+                    bound_metric_configurations=bound_metric_configurations,
+                )
+            )
+            processed_configurations.append(evaluated_config)
+
+        return evrs, processed_configurations
 
     def _generate_metric_dependency_subgraphs_for_each_expectation_configuration(
         self,
@@ -1280,17 +1418,21 @@ class Validator:
         ] = {}
 
         ready_metrics: Set[MetricConfiguration]
-        needed_metrics: Set[MetricConfiguration]
+        num_needed_metrics: int
 
         exception_info: ExceptionInfo
 
         progress_bar: Optional[tqdm] = None
 
+        # The ready queue is updated incrementally as metrics are resolved (no full scan of graph edges per iteration).
+        metric_resolution_queue = MetricResolutionQueue(graph=graph, metrics=metrics)
+
+        resolved_metrics: Dict[Tuple[str, str, str], Any]
+
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse_validation_graph(
-                validation_graph=graph, metrics=metrics
-            )
+            ready_metrics = metric_resolution_queue.ready_metrics
+            num_needed_metrics = len(metric_resolution_queue.needed_metric_ids)
 
             # Check to see if the user has disabled progress bars
             disable = not self._show_progress_bars
@@ -1300,7 +1442,7 @@ class Validator:
             if progress_bar is None and not force_no_progress_bar:
                 # noinspection PyProtectedMember,SpellCheckingInspection
                 progress_bar = tqdm(
-                    total=len(ready_metrics) + len(needed_metrics),
+                    total=len(ready_metrics) + num_needed_metrics,
                     desc="Calculating Metrics",
                     disable=disable,
                 )
@@ -1319,14 +1461,13 @@ class Validator:
                 else:
                     computable_metrics.add(metric)
 
+            resolved_metrics = {}
             try:
-                metrics.update(
-                    self._resolve_metrics(
-                        execution_engine=self._execution_engine,
-                        metrics_to_resolve=computable_metrics,
-                        metrics=metrics,
-                        runtime_configuration=runtime_configuration,
-                    )
+                self._resolve_ready_metrics(
+                    metrics_to_resolve=computable_metrics,
+                    metrics=metrics,
+                    resolved_metrics=resolved_metrics,
+                    runtime_configuration=runtime_configuration,
                 )
                 if progress_bar:
                     progress_bar.update(len(computable_metrics))
@@ -1367,7 +1508,11 @@ aborting graph resolution.
                 else:
                     raise e
 
-            if (len(ready_metrics) + len(needed_metrics) == 0) or (
+            # When metrics are resolved concurrently, metrics resolved successfully are kept even if others failed.
+            metrics.update(resolved_metrics)
+            metric_resolution_queue.mark_resolved(metric_ids=resolved_metrics.keys())
+
+            if (len(ready_metrics) + num_needed_metrics == 0) or (
                 len(ready_metrics) == len(aborted_metrics_info)
             ):
                 done = True
@@ -1788,6 +1933,8 @@ set as active.
         run_name: Optional[str] = None,
         run_time: Optional[str] = None,
         checkpoint_name: Optional[str] = None,
+        metrics: Optional[Dict[Tuple[str, str, str], Any]] = None,
+        evaluated_expectation_suite: Optional[EvaluatedExpectationSuite] = None,
     ) -> Union[ExpectationValidationResult, ExpectationSuiteValidationResult]:
         # noinspection SpellCheckingInspection
         """Generates a JSON-formatted report describing the outcome of all expectations.
@@ -1825,6 +1972,12 @@ set as active.
             checkpoint_name (string or None): \
                 Name of the Checkpoint which invoked this Validator.validate() call against an Expectation Suite. \
                 It will be added to `meta` field of the returned ExpectationSuiteValidationResult.
+            metrics (dict or None): \
+                Metrics, already resolved for the active batch (e.g., by "resolve_expectation_suites_metrics()"), \
+                keyed by metric ID; these are not computed again (metrics resolved during validation are added).
+            evaluated_expectation_suite (EvaluatedExpectationSuite or None): \
+                Expectation Suite, already evaluated (e.g., by "evaluate_expectation_suite()"); if provided, it is \
+                validated as is (in place of "expectation_suite"), and its evaluation parameters are not evaluated again.
 
         Returns:
             A JSON-formatted dictionary containing a list of the validation results. \
@@ -1901,7 +2054,9 @@ set as active.
                 # temporarily set self._data_context so it is used inside the expectation decorator
                 self._data_context = data_context
 
-            if expectation_suite is None:
+            if evaluated_expectation_suite is not None:
+                expectation_suite = evaluated_expectation_suite.expectation_suite
+            elif expectation_suite is None:
                 expectation_suite = self.get_expectation_suite(
                     discard_failed_expectations=False,
                     discard_result_format_kwargs=False,
@@ -1934,65 +2089,33 @@ set as active.
                     )
                 return ExpectationValidationResult(success=False)
 
-            # Evaluation parameter priority is
-            # 1. from provided parameters
-            # 2. from expectation configuration
-            # 3. from data context
-            # So, we load them in reverse order
-
-            if data_context is not None:
-                runtime_evaluation_parameters = (
-                    data_context.evaluation_parameter_store.get_bind_params(run_id)
+            if evaluated_expectation_suite is None:
+                evaluated_expectation_suite = self._evaluate_expectation_suite(
+                    expectation_suite=expectation_suite,
+                    run_id=run_id,
+                    data_context=data_context,
+                    evaluation_parameters=evaluation_parameters,
                 )
-            else:
-                runtime_evaluation_parameters = {}
 
-            if expectation_suite.evaluation_parameters:
-                runtime_evaluation_parameters.update(
-                    expectation_suite.evaluation_parameters
-                )
-
-            if evaluation_parameters is not None:
-                runtime_evaluation_parameters.update(evaluation_parameters)
-
-            # Convert evaluation parameters to be json-serializable
-            runtime_evaluation_parameters = recursively_convert_to_json_serializable(
-                runtime_evaluation_parameters
+            runtime_evaluation_parameters: dict = (
+                evaluated_expectation_suite.runtime_evaluation_parameters
             )
 
             # Warn if our version is different from the version in the configuration
             # TODO: Deprecate "great_expectations.__version__"
 
-            # Group expectations by column
-            columns = {}
-
-            for expectation in expectation_suite.expectations:
-                expectation.process_evaluation_parameters(
-                    evaluation_parameters=runtime_evaluation_parameters,
-                    interactive_evaluation=self.interactive_evaluation,
-                    data_context=self._data_context,
-                )
-                if "column" in expectation.kwargs and isinstance(
-                    expectation.kwargs["column"], Hashable
-                ):
-                    column = expectation.kwargs["column"]
-                else:
-                    # noinspection SpellCheckingInspection
-                    column = "_nocolumn"
-                if column not in columns:
-                    columns[column] = []
-                columns[column].append(expectation)
-
-            expectations_to_evaluate = []
-            for col in columns:
-                expectations_to_evaluate.extend(columns[col])
+            expectations_to_evaluate: List[
+                ExpectationConfiguration
+            ] = evaluated_expectation_suite.expectations_to_evaluate
 
             runtime_configuration = self._get_runtime_configuration(
                 catch_exceptions=catch_exceptions, result_format=result_format
             )
 
-            results = self.graph_validate(
+            graph_build_time: float
+            results, graph_build_time = self._graph_validate(
                 configurations=expectations_to_evaluate,
+                metrics=metrics,
                 runtime_configuration=runtime_configuration,
             )
             if self._include_rendered_content:
@@ -2028,6 +2151,7 @@ set as active.
                     "active_batch_definition": self.active_batch_definition,
                     "validation_time": validation_time,
                     "checkpoint_name": checkpoint_name,
+                    "graph_build_time": graph_build_time,
                 },
             )
 
@@ -2217,23 +2341,121 @@ set as active.
     ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
         validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in validation_graph.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
+        metric_resolution_queue = MetricResolutionQueue(
+            graph=validation_graph, metrics=metrics
+        )
+        return (
+            metric_resolution_queue.ready_metrics,
+            metric_resolution_queue.needed_metrics,
+        )
 
-        return maybe_ready - unmet_dependency, unmet_dependency
+    def _resolve_ready_metrics(
+        self,
+        metrics_to_resolve: Set[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], Any],
+        resolved_metrics: Dict[Tuple[str, str, str], Any],
+        runtime_configuration: Optional[dict] = None,
+    ) -> None:
+        """Resolves metrics, whose dependencies are all available, and stores them in "resolved_metrics" argument.
+
+        If "concurrent_metric_resolution" is enabled in the ConcurrencyConfig of the DataContext, independent groups
+        of ready metrics are resolved by the ExecutionEngine concurrently (using AsyncExecutor); metrics computed from
+        bundled aggregate partial functions are kept in one group, so that ExecutionEngine can still bundle them.
+
+        If resolution of any group fails, the metrics of the successful groups are still stored in "resolved_metrics",
+        and a single MetricResolutionError, reporting the failed metrics of all unsuccessful groups, is raised.
+        """
+        metric_groups: List[
+            List[MetricConfiguration]
+        ] = self._get_independent_metric_groups(metrics_to_resolve=metrics_to_resolve)
+        if len(metric_groups) <= 1:
+            resolved_metrics.update(
+                self._resolve_metrics(
+                    execution_engine=self._execution_engine,
+                    metrics_to_resolve=metrics_to_resolve,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+            return
+
+        async_results: List[AsyncResult] = []
+        metric_group: List[MetricConfiguration]
+        with AsyncExecutor(
+            concurrency_config=self._concurrency_config,
+            max_workers=len(metric_groups),
+        ) as async_executor:
+            for metric_group in metric_groups:
+                async_results.append(
+                    async_executor.submit(
+                        self._resolve_metrics,
+                        execution_engine=self._execution_engine,
+                        metrics_to_resolve=metric_group,
+                        metrics=metrics,
+                        runtime_configuration=runtime_configuration,
+                    )
+                )
+
+        errors: List[MetricResolutionError] = []
+        async_result: AsyncResult
+        for async_result in async_results:
+            try:
+                resolved_metrics.update(async_result.result())
+            except MetricResolutionError as e:
+                errors.append(e)
+
+        if errors:
+            raise MetricResolutionError(
+                message="\n".join([str(error) for error in errors]),
+                failed_metrics=list(
+                    itertools.chain.from_iterable(
+                        [error.failed_metrics for error in errors]
+                    )
+                ),
+            )
+
+    def _get_independent_metric_groups(
+        self, metrics_to_resolve: Set[MetricConfiguration]
+    ) -> List[List[MetricConfiguration]]:
+        concurrency_config: Optional[ConcurrencyConfig] = self._concurrency_config
+        if not (
+            concurrency_config
+            and concurrency_config.enabled
+            and concurrency_config.concurrent_metric_resolution
+        ):
+            return [list(metrics_to_resolve)]
+
+        bundled_metrics: List[MetricConfiguration] = []
+        metric_groups: List[List[MetricConfiguration]] = []
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metrics_to_resolve:
+            # Metrics without their own metric function are computed from partial functions, which are bundled.
+            metric_fn: Optional[Callable] = get_metric_provider(
+                metric_name=metric_configuration.metric_name,
+                execution_engine=self._execution_engine,
+            )[1]
+            if (
+                metric_fn is None
+                or getattr(metric_fn, "aggregate_partial_fn", None) is not None
+            ):
+                bundled_metrics.append(metric_configuration)
+            else:
+                metric_groups.append([metric_configuration])
+
+        if bundled_metrics:
+            metric_groups.append(bundled_metrics)
+
+        return metric_groups
+
+    @property
+    def _concurrency_config(self) -> Optional[ConcurrencyConfig]:
+        concurrency_config: Optional[ConcurrencyConfig] = getattr(
+            self._data_context, "concurrency", None
+        )
+        if isinstance(concurrency_config, ConcurrencyConfig):
+            return concurrency_config
+
+        return None
 
     @staticmethod
     def _resolve_metrics(
@@ -2322,6 +2544,173 @@ set as active.
             self.execution_engine
         ).__name__
 
+    def evaluate_expectation_suite(
+        self,
+        run_id: Optional[RunIdentifier] = None,
+        evaluation_parameters: Optional[dict] = None,
+    ) -> EvaluatedExpectationSuite:
+        """
+        Evaluates evaluation parameters of (a copy of) the Expectation Suite of this Validator, as "validate()" would.
+
+        Args:
+            run_id: run_id used for binding evaluation parameters from the DataContext
+            evaluation_parameters: evaluation parameters, used in addition to those of the Expectation Suite
+
+        Returns:
+            EvaluatedExpectationSuite, which can be passed to "resolve_expectation_suites_metrics()" and "validate()".
+        """
+        return self._evaluate_expectation_suite(
+            expectation_suite=self.get_expectation_suite(
+                discard_failed_expectations=False,
+                discard_result_format_kwargs=False,
+                discard_include_config_kwargs=False,
+                discard_catch_exceptions_kwargs=False,
+            ),
+            run_id=run_id,
+            data_context=self._data_context,
+            evaluation_parameters=evaluation_parameters,
+        )
+
+    def resolve_expectation_suites_metrics(
+        self,
+        evaluated_expectation_suites: List[EvaluatedExpectationSuite],
+        result_format: Optional[Union[dict, str]] = None,
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """
+        Resolves metrics, needed for validating all given Expectation Suites against the active batch, in one validation
+        graph (so that metrics shared by Expectation Suites are computed once and the rest are computed together).
+
+        Resolution is "best effort": expectations, whose metric dependencies cannot be determined, and metrics, which
+        cannot be computed, are skipped (their errors are reported, when each Expectation Suite is validated by passing
+        the returned metrics to "validate()").
+
+        Args:
+            evaluated_expectation_suites: Expectation Suites (evaluated by "evaluate_expectation_suite()"), whose
+                metrics are to be resolved
+            result_format: result_format, with which Expectation Suites are going to be validated
+
+        Returns:
+            Dictionary of resolved metric values, keyed by metric ID.
+        """
+        runtime_configuration: dict = self._get_runtime_configuration(
+            catch_exceptions=True, result_format=result_format
+        )
+
+        evaluated_expectation_suite: EvaluatedExpectationSuite
+        configurations: List[ExpectationConfiguration] = list(
+            itertools.chain.from_iterable(
+                evaluated_expectation_suite.expectations_to_evaluate
+                for evaluated_expectation_suite in evaluated_expectation_suites
+            )
+        )
+
+        expectation_validation_graphs: List[ExpectationValidationGraph] = []
+        self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+            expectation_configurations=configurations,
+            expectation_validation_graphs=expectation_validation_graphs,
+            processed_configurations=[],
+            catch_exceptions=True,
+            runtime_configuration=runtime_configuration,
+        )
+        graph: ValidationGraph = (
+            self._generate_suite_level_graph_from_expectation_level_sub_graphs(
+                expectation_validation_graphs=expectation_validation_graphs
+            )
+        )
+
+        metrics: Dict[Tuple[str, str, str], Any] = {}
+        self.resolve_validation_graph(
+            graph=graph,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+
+        return metrics
+
+    def _evaluate_expectation_suite(
+        self,
+        expectation_suite: ExpectationSuite,
+        run_id: Optional[RunIdentifier],
+        data_context: Optional[Any],
+        evaluation_parameters: Optional[dict],
+    ) -> EvaluatedExpectationSuite:
+        runtime_evaluation_parameters: dict = self._get_runtime_evaluation_parameters(
+            expectation_suite=expectation_suite,
+            run_id=run_id,
+            data_context=data_context,
+            evaluation_parameters=evaluation_parameters,
+        )
+        return EvaluatedExpectationSuite(
+            expectation_suite=expectation_suite,
+            runtime_evaluation_parameters=runtime_evaluation_parameters,
+            expectations_to_evaluate=self._get_expectations_to_evaluate(
+                expectation_suite=expectation_suite,
+                runtime_evaluation_parameters=runtime_evaluation_parameters,
+            ),
+        )
+
+    @staticmethod
+    def _get_runtime_evaluation_parameters(
+        expectation_suite: ExpectationSuite,
+        run_id: Optional[RunIdentifier],
+        data_context: Optional[Any],
+        evaluation_parameters: Optional[dict],
+    ) -> dict:
+        # Evaluation parameter priority is
+        # 1. from provided parameters
+        # 2. from expectation configuration
+        # 3. from data context
+        # So, we load them in reverse order
+
+        if data_context is not None:
+            runtime_evaluation_parameters = (
+                data_context.evaluation_parameter_store.get_bind_params(run_id)
+            )
+        else:
+            runtime_evaluation_parameters = {}
+
+        if expectation_suite.evaluation_parameters:
+            runtime_evaluation_parameters.update(
+                expectation_suite.evaluation_parameters
+            )
+
+        if evaluation_parameters is not None:
+            runtime_evaluation_parameters.update(evaluation_parameters)
+
+        # Convert evaluation parameters to be json-serializable
+        return recursively_convert_to_json_serializable(runtime_evaluation_parameters)
+
+    def _get_expectations_to_evaluate(
+        self,
+        expectation_suite: ExpectationSuite,
+        runtime_evaluation_parameters: dict,
+    ) -> List[ExpectationConfiguration]:
+        # Group expectations by column
+        columns = {}
+
+        for expectation in expectation_suite.expectations:
+            expectation.process_evaluation_parameters(
+                evaluation_parameters=runtime_evaluation_parameters,
+                interactive_evaluation=self.interactive_evaluation,
+                data_context=self._data_context,
+            )
+            if "column" in expectation.kwargs and isinstance(
+                expectation.kwargs["column"], Hashable
+            ):
+                column = expectation.kwargs["column"]
+            else:
+                # noinspection SpellCheckingInspection
+                column = "_nocolumn"
+            if column not in columns:
+                columns[column] = []
+            columns[column].append(expectation)
+
+        expectations_to_evaluate = []
+        for col in columns:
+            expectations_to_evaluate.extend(columns[col])
+
+        return expectations_to_evaluate
+
     def _get_runtime_configuration(
         self,
         catch_exceptions: Optional[bool] = None,
@@ -1,3 +1,5 @@
+from unittest import mock
+
 from freezegun import freeze_time
 
 from great_expectations.checkpoint.actions import StoreMetricsAction
@@ -185,3 +187,62 @@ def test_StoreMetricsAction_column_metric(
         )
         == 7
     )
+
+
+def test_StoreMetricsAction_stores_metrics_of_validation_at_once(
+    basic_in_memory_data_context_for_validation_operator,
+):
+    action = StoreMetricsAction(
+        data_context=basic_in_memory_data_context_for_validation_operator,
+        requested_metrics={
+            "*": [
+                "statistics.evaluated_expectations",
+                "statistics.successful_expectations",
+                "statistics.unsuccessful_expectations",
+            ]
+        },
+        target_store_name="metrics_store",
+    )
+
+    run_id = RunIdentifier(run_name="bar")
+    validation_result = ExpectationSuiteValidationResult(
+        success=False,
+        meta={"expectation_suite_name": "foo", "run_id": run_id},
+        statistics={
+            "evaluated_expectations": 5,
+            "successful_expectations": 3,
+            "unsuccessful_expectations": 2,
+        },
+    )
+
+    metrics_store = basic_in_memory_data_context_for_validation_operator.stores[
+        "metrics_store"
+    ]
+    store_backend = metrics_store.store_backend
+    with mock.patch.object(
+        store_backend, "_set_many", wraps=store_backend._set_many
+    ) as mock_set_many:
+        action.run(
+            validation_result,
+            ValidationResultIdentifier.from_object(validation_result),
+            data_asset=None,
+        )
+
+    assert mock_set_many.call_count == 1
+    assert len(mock_set_many.call_args[0][0]) == 3
+    assert metrics_store.get_many(
+        [
+            ValidationMetricIdentifier(
+                run_id=run_id,
+                data_asset_name=None,
+                expectation_suite_identifier=ExpectationSuiteIdentifier("foo"),
+                metric_name=metric_name,
+                metric_kwargs_id=None,
+            )
+            for metric_name in [
+                "statistics.evaluated_expectations",
+                "statistics.successful_expectations",
+                "statistics.unsuccessful_expectations",
+            ]
+        ]
+    ) == [5, 3, 2]
@@ -1,6 +1,8 @@
+import copy
 import logging
 import os
 import pickle
+import threading
 import unittest
 from typing import List, Optional, Union
 from unittest import mock
@@ -14,7 +16,10 @@ import great_expectations as ge
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.checkpoint import Checkpoint, LegacyCheckpoint
 from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
-from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.core import (
+    ExpectationConfiguration,
+    ExpectationSuiteValidationResult,
+)
 from great_expectations.core.batch import RuntimeBatchRequest
 from great_expectations.core.config_peer import ConfigOutputModes
 from great_expectations.core.expectation_validation_result import (
@@ -25,6 +30,7 @@ from great_expectations.data_context.data_context.data_context import DataContex
 from great_expectations.data_context.types.base import (
     CheckpointConfig,
     CheckpointValidationConfig,
+    ConcurrencyConfig,
     checkpointConfigSchema,
 )
 from great_expectations.data_context.types.resource_identifiers import (
@@ -1390,6 +1396,328 @@ def test_newstyle_checkpoint_instantiates_and_produces_a_validation_result_when_
     assert result["success"]
 
 
+@pytest.mark.integration
+def test_newstyle_checkpoint_merges_validations_sharing_batch(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+
+    expectation_suite_name: str
+    for expectation_suite_name in ["team_suite", "platform_suite"]:
+        suite = context.create_expectation_suite(expectation_suite_name)
+        suite.add_expectation(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "Name"},
+            )
+        )
+        context.save_expectation_suite(suite)
+
+    batch_request: dict = {
+        "datasource_name": "my_datasource",
+        "data_connector_name": "my_basic_data_connector",
+        "data_asset_name": "Titanic_1911",
+    }
+    checkpoint: Checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        validations=[
+            {
+                "batch_request": batch_request,
+                "expectation_suite_name": "team_suite",
+            },
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": "Titanic_1912",
+                },
+                "expectation_suite_name": "team_suite",
+            },
+            {
+                "batch_request": batch_request,
+                "expectation_suite_name": "platform_suite",
+            },
+        ],
+    )
+
+    execution_engine = context.datasources["my_datasource"].execution_engine
+    resolve_metrics = execution_engine.resolve_metrics
+    resolved_metric_ids: List[tuple] = []
+
+    def record_resolved_metrics(metrics_to_resolve, *args, **kwargs):
+        resolved_metric_ids.extend(
+            metric_configuration.id for metric_configuration in metrics_to_resolve
+        )
+        return resolve_metrics(metrics_to_resolve, *args, **kwargs)
+
+    with mock.patch.object(
+        context, "get_batch_list", wraps=context.get_batch_list
+    ) as mock_get_batch_list, mock.patch.object(
+        execution_engine, "resolve_metrics", side_effect=record_resolved_metrics
+    ):
+        result: CheckpointResult = checkpoint.run()
+
+    # The Batch, shared by the first and the third validations, is loaded once (the second one is loaded separately).
+    assert mock_get_batch_list.call_count == 2
+    # Metrics, shared by Expectation Suites of merged validations, are computed once per Batch.
+    assert len(resolved_metric_ids) == len(set(resolved_metric_ids))
+
+    assert result.success
+    assert len(context.validations_store.list_keys()) == 3
+    assert [
+        (
+            validation_result.meta["expectation_suite_name"],
+            validation_result.meta["active_batch_definition"]["data_asset_name"],
+        )
+        for validation_result in result.list_validation_results()
+    ] == [
+        ("team_suite", "Titanic_1911"),
+        ("team_suite", "Titanic_1912"),
+        ("platform_suite", "Titanic_1911"),
+    ]
+    validation_result: ExpectationSuiteValidationResult
+    for validation_result in result.list_validation_results():
+        assert validation_result.statistics["evaluated_expectations"] == 1
+        assert validation_result.statistics["successful_expectations"] == 1
+
+
+@pytest.mark.integration
+def test_newstyle_checkpoint_evaluates_evaluation_parameters_of_merged_validations_once(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+
+    expectation_suite_name: str
+    for expectation_suite_name in ["team_suite", "platform_suite"]:
+        suite = context.create_expectation_suite(expectation_suite_name)
+        suite.add_expectation(
+            ExpectationConfiguration(
+                expectation_type="expect_table_row_count_to_be_between",
+                kwargs={"min_value": {"$PARAMETER": "min_row_count"}},
+            )
+        )
+        context.save_expectation_suite(suite)
+
+    batch_request: dict = {
+        "datasource_name": "my_datasource",
+        "data_connector_name": "my_basic_data_connector",
+        "data_asset_name": "Titanic_1911",
+    }
+    checkpoint: Checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        evaluation_parameters={"min_row_count": 1},
+        validations=[
+            {
+                "batch_request": batch_request,
+                "expectation_suite_name": "team_suite",
+            },
+            {
+                "batch_request": batch_request,
+                "expectation_suite_name": "platform_suite",
+            },
+        ],
+    )
+
+    process_evaluation_parameters = (
+        ExpectationConfiguration.process_evaluation_parameters
+    )
+    processed_kwargs: List[dict] = []
+
+    def record_processed_kwargs(self, *args, **kwargs):
+        processed_kwargs.append(copy.deepcopy(self.kwargs))
+        return process_evaluation_parameters(self, *args, **kwargs)
+
+    with mock.patch.object(
+        ExpectationConfiguration,
+        "process_evaluation_parameters",
+        autospec=True,
+        side_effect=record_processed_kwargs,
+    ), mock.patch.object(
+        context.evaluation_parameter_store,
+        "get_bind_params",
+        wraps=context.evaluation_parameter_store.get_bind_params,
+    ) as mock_get_bind_params:
+        result: CheckpointResult = checkpoint.run()
+
+    # Evaluation parameters are bound once per Expectation Suite and evaluated once per expectation (always from raw kwargs).
+    assert mock_get_bind_params.call_count == 2
+    assert processed_kwargs == [
+        {"min_value": {"$PARAMETER": "min_row_count"}},
+        {"min_value": {"$PARAMETER": "min_row_count"}},
+    ]
+
+    assert result.success
+    validation_result: ExpectationSuiteValidationResult
+    for validation_result in result.list_validation_results():
+        assert validation_result.evaluation_parameters == {"min_row_count": 1}
+        assert validation_result.results[0].expectation_config.kwargs["min_value"] == 1
+
+
+@pytest.mark.integration
+def test_newstyle_checkpoint_does_not_merge_validations_depending_on_results_of_other_validations(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+
+    upstream_suite = context.create_expectation_suite("upstream")
+    upstream_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 1},
+        )
+    )
+    context.save_expectation_suite(upstream_suite)
+
+    downstream_suite = context.create_expectation_suite("downstream")
+    downstream_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_equal",
+            kwargs={
+                "value": {
+                    "$PARAMETER": "urn:great_expectations:validations:upstream:expect_table_row_count_to_be_between.result.observed_value"
+                }
+            },
+        )
+    )
+    context.save_expectation_suite(downstream_suite)
+
+    batch_request: dict = {
+        "datasource_name": "my_datasource",
+        "data_connector_name": "my_basic_data_connector",
+        "data_asset_name": "Titanic_1911",
+    }
+    checkpoint: Checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+            {
+                "name": "store_evaluation_params",
+                "action": {
+                    "class_name": "StoreEvaluationParametersAction",
+                },
+            },
+        ],
+        validations=[
+            {
+                "batch_request": batch_request,
+                "expectation_suite_name": "upstream",
+            },
+            {
+                "batch_request": batch_request,
+                "expectation_suite_name": "downstream",
+            },
+        ],
+    )
+
+    with mock.patch.object(
+        context, "get_batch_list", wraps=context.get_batch_list
+    ) as mock_get_batch_list:
+        result: CheckpointResult = checkpoint.run()
+
+    # The "downstream" validation is run separately, after actions of the "upstream" validation have stored its results.
+    assert mock_get_batch_list.call_count == 2
+
+    assert result.success
+    upstream_validation_result: ExpectationSuiteValidationResult
+    downstream_validation_result: ExpectationSuiteValidationResult
+    (
+        upstream_validation_result,
+        downstream_validation_result,
+    ) = result.list_validation_results()
+    assert (
+        downstream_validation_result.results[0].expectation_config.kwargs["value"]
+        == upstream_validation_result.results[0].result["observed_value"]
+    )
+
+
+@pytest.mark.integration
+def test_newstyle_checkpoint_loads_batches_concurrently_and_reports_batch_load_time(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+    context.variables.concurrency = ConcurrencyConfig(enabled=True)
+    context.create_expectation_suite("my_expectation_suite")
+
+    checkpoint: Checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": data_asset_name,
+                }
+            }
+            for data_asset_name in ["Titanic_1911", "Titanic_1912"]
+        ],
+    )
+
+    # Both validations must be loading their Batch data at the same time for the barrier to be passed.
+    barrier = threading.Barrier(parties=2, timeout=30)
+    get_validator = context.get_validator
+
+    def get_validator_after_barrier(*args, **kwargs):
+        barrier.wait()
+        return get_validator(*args, **kwargs)
+
+    with mock.patch.object(
+        context, "get_validator", side_effect=get_validator_after_barrier
+    ):
+        result: CheckpointResult = checkpoint.run()
+
+    assert result.success
+    assert len(result.run_results) == 2
+    run_result: dict
+    for run_result in result.run_results.values():
+        assert run_result["batch_load_time"] > 0.0
+
+    assert result.get_statistics()["batch_load_time"] == sum(
+        run_result["batch_load_time"] for run_result in result.run_results.values()
+    )
+
+
 @pytest.mark.integration
 def test_newstyle_checkpoint_instantiates_and_produces_a_validation_result_with_checkpoint_name_in_meta_when_run(
     titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
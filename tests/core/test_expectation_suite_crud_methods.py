@@ -6,7 +6,10 @@ import pytest
 
 from great_expectations import DataContext
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
-from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.core.expectation_suite import (
+    ExpectationSuite,
+    _ExpectationConfigurationIndex,
+)
 from great_expectations.exceptions import (
     DataContextError,
     InvalidExpectationConfigurationError,
@@ -743,3 +746,178 @@ def test_replace_expectation_finds_no_matches(ge_cloud_suite, ge_cloud_id, exp4)
         str(err.value)
         == "More than one matching expectation was found. Please be more specific with your search criteria"
     )
+
+
+def test_find_expectation_indexes_after_adding_many_expectations(empty_suite):
+    num_columns: int = 500
+    column_index: int
+    for column_index in range(num_columns):
+        empty_suite.add_expectation(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": f"column_{column_index}"},
+            ),
+            send_usage_event=False,
+        )
+        empty_suite.add_expectation(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": f"column_{column_index}", "value_set": [1, 2]},
+            ),
+            send_usage_event=False,
+        )
+
+    # Expectation on the same domain replaces existing one.
+    empty_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "column_7", "value_set": [1, 2, 3]},
+        ),
+        send_usage_event=False,
+    )
+    assert len(empty_suite.expectations) == 2 * num_columns
+
+    candidate = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "column_7", "value_set": [1, 2]},
+    )
+    assert empty_suite.find_expectation_indexes(candidate, "domain") == [15]
+    assert empty_suite.find_expectation_indexes(candidate, "success") == []
+    assert empty_suite.find_expectation_indexes(candidate, "runtime") == []
+
+    empty_suite.remove_expectation(candidate, match_type="domain")
+    assert len(empty_suite.expectations) == 2 * num_columns - 1
+    assert empty_suite.find_expectation_indexes(candidate, "domain") == []
+    assert empty_suite.find_expectation_indexes(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "column_8"},
+        ),
+        "domain",
+    ) == [15]
+
+
+def test_find_expectation_indexes_after_modifying_expectations_directly(
+    exp1, exp2, exp4, baseline_suite
+):
+    assert baseline_suite.find_expectation_indexes(exp1, "domain") == [0]
+
+    baseline_suite.expectations.insert(0, exp4)
+    assert baseline_suite.find_expectation_indexes(exp1, "domain") == [1]
+    assert baseline_suite.find_expectation_indexes(exp4, "runtime") == [0]
+
+    baseline_suite.expectations[0] = exp2
+    assert baseline_suite.find_expectation_indexes(exp4, "runtime") == []
+    assert baseline_suite.find_expectation_indexes(exp2, "runtime") == [0, 2]
+
+    baseline_suite.expectations = [exp1]
+    assert baseline_suite.find_expectation_indexes(exp2, "domain") == []
+    assert baseline_suite.find_expectation_indexes(exp1, "domain") == [0]
+
+
+def test_find_expectation_indexes_after_modifying_expectation_kwargs_in_place(
+    empty_suite,
+):
+    empty_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "a", "value_set": [1, 2]},
+        ),
+        send_usage_event=False,
+    )
+    empty_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "c", "value_set": [1, 2]},
+        ),
+        send_usage_event=False,
+    )
+    assert empty_suite.find_expectation_indexes(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "a"},
+        ),
+        "domain",
+    ) == [0]
+
+    # Domain kwargs
+    empty_suite.expectations[0].kwargs["column"] = "b"
+    candidate = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "b", "value_set": [1, 2, 3]},
+    )
+    assert empty_suite.find_expectation_indexes(candidate, "domain") == [0]
+    empty_suite.add_expectation(candidate, send_usage_event=False)
+    assert len(empty_suite.expectations) == 2
+    assert empty_suite.expectations[0].kwargs["value_set"] == [1, 2, 3]
+
+    # Success kwargs (including nested values)
+    empty_suite.expectations[1].kwargs["value_set"].append(3)
+    assert empty_suite.find_expectation_indexes(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "c", "value_set": [1, 2, 3]},
+        ),
+        "success",
+    ) == [1]
+    assert (
+        empty_suite.find_expectation_indexes(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": "c", "value_set": [1, 2]},
+            ),
+            "success",
+        )
+        == []
+    )
+
+    # Expectations, modified to match on the same domain, are all found.
+    empty_suite.expectations[1].kwargs["column"] = "b"
+    assert empty_suite.find_expectation_indexes(candidate, "domain") == [0, 1]
+    assert empty_suite.find_expectation_indexes(candidate, "success") == [0, 1]
+
+
+def test_find_expectation_indexes_re_indexes_only_modified_expectations(
+    empty_suite,
+):
+    for column in ["a", "b", "c"]:
+        empty_suite.add_expectation(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": column, "value_set": [1, 2]},
+            ),
+            send_usage_event=False,
+        )
+
+    candidate = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "d"},
+    )
+    # noinspection PyProtectedMember
+    with mock.patch.object(
+        _ExpectationConfigurationIndex,
+        "_get_keys",
+        side_effect=_ExpectationConfigurationIndex._get_keys,
+    ) as mock_get_keys:
+        assert empty_suite.find_expectation_indexes(candidate, "domain") == []
+        mock_get_keys.reset_mock()
+        assert empty_suite.find_expectation_indexes(candidate, "domain") == []
+        # Only the candidate is keyed.
+        assert mock_get_keys.call_count == 1
+
+        empty_suite.expectations[2].kwargs["column"] = "d"
+        mock_get_keys.reset_mock()
+        assert empty_suite.find_expectation_indexes(candidate, "domain") == [2]
+        # Only the candidate and the modified expectation are keyed.
+        assert mock_get_keys.call_count == 2
+
+    empty_suite.expectations[0].ge_cloud_id = "12345678-1234-5678-1234-567812345678"
+    assert empty_suite.find_expectation_indexes(
+        ge_cloud_id="12345678-1234-5678-1234-567812345678"
+    ) == [0]
+
+    # Copies of indexed expectations are not observed by the index of the original suite.
+    expectation_configuration: ExpectationConfiguration = deepcopy(
+        empty_suite.expectations[1]
+    )
+    assert not hasattr(expectation_configuration, "_modification_observers")
@@ -0,0 +1,55 @@
+import copy
+import pickle
+
+import pytest
+
+from great_expectations.core.id_dict import IDDict
+
+
+@pytest.mark.unit
+def test_id_dict_to_id_is_cached():
+    id_dict = IDDict({"column": "a", "row_condition": 'col("b")>1'})
+
+    first_id: str = id_dict.to_id()
+
+    assert id_dict.to_id() is first_id
+    assert id_dict.to_id(id_keys=id_dict.keys()) == first_id
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(lambda d: d.__setitem__("column", "b"), id="setitem"),
+        pytest.param(lambda d: d.__delitem__("row_condition"), id="delitem"),
+        pytest.param(lambda d: d.update({"batch_id": "abc"}), id="update"),
+        pytest.param(lambda d: d.setdefault("batch_id", "abc"), id="setdefault"),
+        pytest.param(lambda d: d.pop("column"), id="pop"),
+        pytest.param(lambda d: d.popitem(), id="popitem"),
+        pytest.param(lambda d: d.clear(), id="clear"),
+    ],
+)
+def test_id_dict_mutation_invalidates_cached_id(mutate):
+    id_dict = IDDict({"column": "a", "row_condition": 'col("b")>1'})
+    original_id: str = id_dict.to_id()
+
+    mutate(id_dict)
+
+    assert id_dict.to_id() != original_id
+    assert id_dict.to_id() == IDDict(dict(id_dict)).to_id()
+
+
+@pytest.mark.unit
+def test_id_dict_copies_carry_correct_id():
+    id_dict = IDDict({"column": "a", "row_condition": 'col("b")>1'})
+    original_id: str = id_dict.to_id()
+
+    copied_id_dict: IDDict = copy.deepcopy(id_dict)
+    assert copied_id_dict.to_id() == original_id
+
+    copied_id_dict["column"] = "b"
+    assert copied_id_dict.to_id() != original_id
+    assert id_dict.to_id() == original_id
+
+    unpickled_id_dict: IDDict = pickle.loads(pickle.dumps(id_dict))
+    assert unpickled_id_dict.to_id() == original_id
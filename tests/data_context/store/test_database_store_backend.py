@@ -1,12 +1,13 @@
 import logging
 import os
+from unittest import mock
 
 import pytest
 
 import tests.test_utils as test_utils
 from great_expectations.data_context.store import DatabaseStoreBackend
 from great_expectations.data_context.util import instantiate_class_from_config
-from great_expectations.exceptions import StoreBackendError
+from great_expectations.exceptions import StoreBackendError, StoreError
 
 try:
     sqlalchemy = pytest.importorskip("sqlalchemy")
@@ -217,3 +218,151 @@ def test_database_store_backend_id_initialization(caplog, sa, test_backends):
         expectations_store_with_database_backend.store_backend_id
         == "00000000-0000-0000-0000-000000aaaaaa"
     )
+
+
+def test_database_store_backend_get_many(caplog, sa, test_backends):
+    if "sqlite" not in test_backends:
+        pytest.skip("test_database_store_backend_get_many requires sqlite")
+
+    store_backend = DatabaseStoreBackend(
+        url="sqlite://",
+        table_name="test_database_store_backend_get_many",
+        key_columns=["k1", "k2"],
+    )
+    # Enough keys to require more than one query (bind parameters per query are bounded).
+    num_keys: int = store_backend.MAX_BIND_PARAMETERS_PER_QUERY
+    for idx in range(num_keys):
+        store_backend.set((f"key_{idx}", "suite"), f"value_{idx}")
+
+    keys = [(f"key_{idx}", "suite") for idx in reversed(range(num_keys))]
+    assert store_backend.get_many(keys) == [
+        f"value_{idx}" for idx in reversed(range(num_keys))
+    ]
+    assert store_backend.get_many([]) == []
+
+    with pytest.raises(StoreError):
+        store_backend.get_many([("key_0", "suite"), ("missing_key", "suite")])
+
+
+def test_database_store_backend_set_many(caplog, sa, test_backends):
+    if "sqlite" not in test_backends:
+        pytest.skip("test_database_store_backend_set_many requires sqlite")
+
+    store_backend = DatabaseStoreBackend(
+        url="sqlite://",
+        table_name="test_database_store_backend_set_many",
+        key_columns=["k1", "k2"],
+    )
+    assert store_backend._supports_native_upsert()
+
+    store_backend.set(("a", "1"), "hello")
+    store_backend.set_many(
+        [(("a", "2"), "world"), (("b", "1"), "foo"), (("a", "1"), "bar")]
+    )
+    # Keys sharing a prefix are updated independently.
+    store_backend.set(("a", "2"), "baz")
+
+    assert sorted(store_backend.list_keys()) == [("a", "1"), ("a", "2"), ("b", "1")]
+    assert store_backend.get_many([("a", "1"), ("a", "2"), ("b", "1")]) == [
+        "bar",
+        "baz",
+        "foo",
+    ]
+
+    # The last value of a key, given more than once, is stored.
+    store_backend.set_many([(("c", "1"), "first"), (("c", "1"), "second")])
+    assert store_backend.get(("c", "1")) == "second"
+
+
+def test_database_store_backend_set_many_without_primary_key(caplog, sa, test_backends):
+    if "sqlite" not in test_backends:
+        pytest.skip(
+            "test_database_store_backend_set_many_without_primary_key requires sqlite"
+        )
+
+    engine = sa.create_engine("sqlite://")
+    engine.execute(
+        "CREATE TABLE test_database_store_backend_no_pk (k1 VARCHAR, value VARCHAR);"
+    )
+    store_backend = DatabaseStoreBackend(
+        engine=engine,
+        table_name="test_database_store_backend_no_pk",
+        key_columns=["k1"],
+    )
+    assert not store_backend._supports_native_upsert()
+
+    store_backend.set_many([(("a",), "hello"), (("b",), "world")])
+    store_backend.set_many([(("a",), "bar"), (("c",), "foo")])
+
+    assert sorted(store_backend.list_keys()) == [("a",), ("b",), ("c",)]
+    assert store_backend.get_many([("a",), ("b",), ("c",)]) == [
+        "bar",
+        "world",
+        "foo",
+    ]
+
+
+def test_database_store_backend_set_many_with_concurrent_insert(
+    caplog, sa, test_backends
+):
+    if "sqlite" not in test_backends:
+        pytest.skip(
+            "test_database_store_backend_set_many_with_concurrent_insert requires sqlite"
+        )
+
+    store_backend = DatabaseStoreBackend(
+        url="sqlite://",
+        table_name="test_database_store_backend_set_many_with_concurrent_insert",
+        key_columns=["k1"],
+    )
+    upsert = store_backend._upsert
+
+    def upsert_racing_with_other_writer(connection, rows):
+        # Another writer inserts key "a" after it was found missing, so that inserting it fails.
+        if any(row["k1"] == "a" for row in rows):
+            if not store_backend.has_key(("a",)):
+                store_backend._set(("a",), "hello", allow_update=False)
+            raise sa.exc.IntegrityError(
+                "INSERT", {}, Exception("UNIQUE constraint failed")
+            )
+
+        upsert(connection=connection, rows=rows)
+
+    with mock.patch.object(
+        store_backend, "_upsert", side_effect=upsert_racing_with_other_writer
+    ):
+        # The same value as the one of the other writer is accepted.
+        store_backend.set_many([(("a",), "hello"), (("b",), "world")])
+        assert store_backend.get_many([("a",), ("b",)]) == ["hello", "world"]
+
+        with pytest.raises(StoreBackendError):
+            store_backend.set_many([(("a",), "bar")])
+
+    assert store_backend.get(("a",)) == "hello"
+
+
+def test_database_store_backend_pool_settings(caplog, sa, test_backends, tmp_path):
+    if "sqlite" not in test_backends:
+        pytest.skip("test_database_store_backend_pool_settings requires sqlite")
+
+    store_backend = instantiate_class_from_config(
+        config={
+            "class_name": "DatabaseStoreBackend",
+            "url": f"sqlite:///{tmp_path / 'store.db'}",
+            "table_name": "test_database_store_backend_pool_settings",
+            "key_columns": ["k1"],
+            "poolclass": sa.pool.QueuePool,
+            "pool_size": 3,
+            "max_overflow": 2,
+            "pool_recycle": 600,
+        },
+        runtime_environment={},
+        config_defaults={"module_name": "great_expectations.data_context.store"},
+    )
+
+    assert isinstance(store_backend.engine.pool, sa.pool.QueuePool)
+    assert store_backend.engine.pool.size() == 3
+    assert store_backend.engine.pool._recycle == 600
+
+    store_backend.set(("a",), "hello")
+    assert store_backend.get(("a",)) == "hello"
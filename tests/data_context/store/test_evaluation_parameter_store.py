@@ -393,3 +393,39 @@ class_name: EvaluationParameterStore
     # Confirm that logs do not contain any exceptions or invalid messages
     assert not usage_stats_exceptions_exist(messages=caplog.messages)
     assert not usage_stats_invalid_messages_exist(messages=caplog.messages)
+
+
+def test_evaluation_parameter_store_get_bind_params_fetches_values_in_bulk():
+    evaluation_parameter_store = EvaluationParameterStore()
+    run_id = RunIdentifier(run_name="my_run")
+    for metric_name, metric_value in [
+        ("expect_table_row_count_to_be_between.result.observed_value", 512),
+        ("expect_column_values_to_be_null.result.unexpected_count", 3),
+    ]:
+        evaluation_parameter_store.set(
+            ValidationMetricIdentifier(
+                run_id=run_id,
+                data_asset_name=None,
+                expectation_suite_identifier="asset.warning",
+                metric_name=metric_name,
+                metric_kwargs_id=None,
+            ),
+            metric_value,
+        )
+
+    store_backend = evaluation_parameter_store.store_backend
+    with mock.patch.object(
+        store_backend, "_get_many", wraps=store_backend._get_many
+    ) as mock_get_many, mock.patch.object(
+        store_backend, "_get", wraps=store_backend._get
+    ) as mock_get:
+        params = evaluation_parameter_store.get_bind_params(run_id)
+
+    assert params == {
+        "urn:great_expectations:validations:asset.warning:"
+        "expect_table_row_count_to_be_between.result.observed_value": 512,
+        "urn:great_expectations:validations:asset.warning:"
+        "expect_column_values_to_be_null.result.unexpected_count": 3,
+    }
+    assert mock_get_many.call_count == 1
+    assert mock_get.call_count == 2
@@ -3,6 +3,7 @@ import os
 import pytest
 
 import tests.test_utils as test_utils
+from great_expectations.core.metric import BatchMetricIdentifier
 from great_expectations.data_context.util import instantiate_class_from_config
 
 
@@ -92,3 +93,33 @@ def test_metric_store_store_backend_id(in_memory_param_store):
     assert in_memory_param_store.store_backend_id is not None
     # Check that store_backend_id is a valid UUID
     assert test_utils.validate_uuid4(in_memory_param_store.store_backend_id)
+
+
+@pytest.mark.unit
+def test_batch_metric_store_with_tuple_filesystem_store_backend(tmp_path):
+    store = instantiate_class_from_config(
+        config={
+            "class_name": "BatchMetricStore",
+            "store_backend": {
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": str(tmp_path),
+            },
+        },
+        config_defaults={
+            "module_name": "great_expectations.data_context.store",
+        },
+        runtime_environment={},
+    )
+    key = BatchMetricIdentifier(
+        batch_fingerprint="9b1f4d2a",
+        metric_name="column.max",
+        metric_domain_kwargs_id="column=a",
+        metric_value_kwargs_id=None,
+    )
+    assert not store.has_key(key)
+
+    store.set(key=key, value=3)
+    assert store.has_key(key)
+    assert store.get(key=key) == 3
+    assert store.list_keys() == [key]
+    assert BatchMetricIdentifier.from_tuple(key.to_tuple()) == key
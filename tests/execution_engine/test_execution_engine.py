@@ -1,10 +1,13 @@
 from typing import Tuple
+from unittest import mock
 
 import pandas as pd
 import pytest
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchMarkers
+from great_expectations.core.metric import BatchMetricIdentifier
+from great_expectations.data_context.store import BatchMetricStore
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.execution_engine.execution_engine import BatchData
 from great_expectations.expectations.row_conditions import (
@@ -321,3 +324,135 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(ge_exceptions.GreatExpectationsError) as error:
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+@pytest.mark.unit
+def test_resolve_metrics_with_batch_metric_store(tmp_path):
+    batch_metric_store = BatchMetricStore(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": str(tmp_path),
+        }
+    )
+
+    def _resolve_column_max(engine: PandasExecutionEngine):
+        table_columns_metric: MetricConfiguration
+        table_columns_metric, _ = get_table_columns_metric(engine=engine)
+        max_metric = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+            metric_dependencies={"table.columns": table_columns_metric},
+        )
+        return engine.resolve_metrics(metrics_to_resolve=(max_metric,))[max_metric.id]
+
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    engine = PandasExecutionEngine(
+        batch_data_dict={"batch_0": df}, batch_metric_store=batch_metric_store
+    )
+    assert _resolve_column_max(engine=engine) == 3
+
+    batch_fingerprint: str = engine.get_batch_fingerprint(batch_id="batch_0")
+    key = BatchMetricIdentifier(
+        batch_fingerprint=batch_fingerprint,
+        metric_name="column.max",
+        metric_domain_kwargs_id="column=a",
+        metric_value_kwargs_id=None,
+    )
+    assert key in batch_metric_store.list_keys()
+    # Metric values not serializable to JSON (e.g., table.column_types with their type objects) are not persisted.
+    assert {key.metric_name for key in batch_metric_store.list_keys()} == {
+        "column.max",
+        "table.columns",
+    }
+
+    # Persisted values are served for batches with the same data (regardless of batch_id), instead of recomputed.
+    batch_metric_store.set(key=key, value=42)
+    engine = PandasExecutionEngine(
+        batch_data_dict={"batch_1": df.copy()},
+        batch_metric_store={
+            "class_name": "BatchMetricStore",
+            "store_backend": {
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": str(tmp_path),
+            },
+        },
+    )
+    assert engine.get_batch_fingerprint(batch_id="batch_1") == batch_fingerprint
+    assert _resolve_column_max(engine=engine) == 42
+
+    engine.load_batch_data(batch_id="batch_1", batch_data=pd.DataFrame({"a": [4, 5]}))
+    assert engine.get_batch_fingerprint(batch_id="batch_1") != batch_fingerprint
+    assert _resolve_column_max(engine=engine) == 5
+
+
+def test_resolve_metrics_fetches_persisted_metrics_in_bulk():
+    batch_metric_store = BatchMetricStore()
+
+    def _resolve_column_min_and_max(engine: PandasExecutionEngine) -> list:
+        table_columns_metric: MetricConfiguration
+        table_columns_metric, _ = get_table_columns_metric(engine=engine)
+        metrics = [
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"column": "a"},
+                metric_value_kwargs=None,
+                metric_dependencies={"table.columns": table_columns_metric},
+            )
+            for metric_name in ["column.min", "column.max"]
+        ]
+        resolved_metrics = engine.resolve_metrics(metrics_to_resolve=metrics)
+        return [resolved_metrics[metric.id] for metric in metrics]
+
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    engine = PandasExecutionEngine(
+        batch_data_dict={"batch_0": df}, batch_metric_store=batch_metric_store
+    )
+    assert _resolve_column_min_and_max(engine=engine) == [1, 3]
+
+    engine = PandasExecutionEngine(
+        batch_data_dict={"batch_1": df.copy()}, batch_metric_store=batch_metric_store
+    )
+    with mock.patch.object(
+        batch_metric_store, "get_many", wraps=batch_metric_store.get_many
+    ) as mock_get_many, mock.patch.object(
+        batch_metric_store, "has_key", wraps=batch_metric_store.has_key
+    ) as mock_has_key:
+        assert _resolve_column_min_and_max(engine=engine) == [1, 3]
+
+    # "table.columns" (resolved first) and both column metrics are fetched with one call each.
+    assert mock_get_many.call_count == 2
+    assert len(mock_get_many.call_args[0][0]) == 2
+    assert not mock_has_key.called
+
+    # Keys of a Batch fingerprint are listed once per ExecutionEngine; metrics it persists are served from then on.
+    engine = PandasExecutionEngine(
+        batch_data_dict={"batch_2": pd.DataFrame({"a": [4, 5]})},
+        batch_metric_store=batch_metric_store,
+    )
+    # noinspection PyProtectedMember
+    with mock.patch.object(
+        batch_metric_store._store_backend,
+        "list_keys",
+        wraps=batch_metric_store._store_backend.list_keys,
+    ) as mock_list_keys, mock.patch.object(
+        batch_metric_store, "get_many", wraps=batch_metric_store.get_many
+    ) as mock_get_many:
+        assert _resolve_column_min_and_max(engine=engine) == [4, 5]
+        assert not mock_get_many.called
+        assert _resolve_column_min_and_max(engine=engine) == [4, 5]
+
+    # Of four resolutions ("table.columns" and column metrics, twice), only the second pair fetches persisted values.
+    assert mock_list_keys.call_count == 1
+    assert mock_get_many.call_count == 2
+    assert len(mock_get_many.call_args[0][0]) == 2
+
+    # Values of partial metrics (functions) are never persisted, hence these are not looked up.
+    # noinspection PyProtectedMember
+    assert not engine._is_persistable_metric(
+        metric_configuration=MetricConfiguration(
+            metric_name="column_values.nonnull.condition",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+        )
+    )
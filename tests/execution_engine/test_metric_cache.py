@@ -0,0 +1,115 @@
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.metric_cache import (
+    LRUMetricCache,
+    NoOpMetricCache,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+
+
+@pytest.mark.unit
+def test_lru_metric_cache_evicts_least_recently_used_entries():
+    cache = LRUMetricCache(max_entries=2, max_bytes=None)
+    cache.update(
+        batch_id="batch_0",
+        metrics={("metric_0", "", ""): 0, ("metric_1", "", ""): 1},
+    )
+    assert cache.get(batch_id="batch_0", metric_id=("metric_0", "", "")) == 0
+
+    cache.update(batch_id="batch_0", metrics={("metric_2", "", ""): 2})
+    assert cache.get(batch_id="batch_0", metric_id=("metric_1", "", "")) is None
+    assert cache.get(batch_id="batch_0", metric_id=("metric_0", "", "")) == 0
+    assert cache.get(batch_id="batch_0", metric_id=("metric_2", "", "")) == 2
+
+    assert cache.statistics.to_dict() == {
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+        "invalidations": 0,
+        "num_entries": 2,
+        "num_bytes": cache.statistics.num_bytes,
+    }
+
+
+@pytest.mark.unit
+def test_lru_metric_cache_evicts_entries_exceeding_max_bytes():
+    series = pd.Series(range(1000))
+    num_bytes: int = int(series.memory_usage(index=True))
+    cache = LRUMetricCache(max_entries=None, max_bytes=num_bytes + 100)
+
+    cache.update(batch_id="batch_0", metrics={("metric_0", "", ""): series})
+    cache.update(batch_id="batch_0", metrics={("metric_1", "", ""): series.copy()})
+    assert cache.statistics.num_entries == 1
+    assert cache.statistics.evictions == 1
+    assert cache.statistics.num_bytes <= num_bytes + 100
+
+    # Values larger than the capacity of the cache are not retained.
+    cache.update(
+        batch_id="batch_0", metrics={("metric_2", "", ""): pd.Series(range(10000))}
+    )
+    assert cache.get(batch_id="batch_0", metric_id=("metric_2", "", "")) is None
+
+
+@pytest.mark.unit
+def test_lru_metric_cache_invalidates_entries_of_batch():
+    cache = LRUMetricCache()
+    cache.update(batch_id="batch_0", metrics={("metric_0", "", ""): 0})
+    cache.update(batch_id="batch_1", metrics={("metric_0", "", ""): 1})
+
+    cache.invalidate(batch_id="batch_0")
+    assert cache.get(batch_id="batch_0", metric_id=("metric_0", "", "")) is None
+    assert cache.get(batch_id="batch_1", metric_id=("metric_0", "", "")) == 1
+    assert cache.statistics.invalidations == 1
+
+    cache.invalidate()
+    assert cache.statistics.num_entries == 0
+    assert cache.statistics.num_bytes == 0
+
+
+@pytest.mark.unit
+def test_execution_engine_metric_cache_is_scoped_by_batch():
+    engine = PandasExecutionEngine(
+        batch_data_dict={"batch_0": pd.DataFrame({"a": [1, 2, 3]})}
+    )
+    assert isinstance(engine.metric_cache, LRUMetricCache)
+
+    table_columns_metric: MetricConfiguration
+    table_columns_metric, _ = get_table_columns_metric(engine=engine)
+    # Both "table.column_types" and "table.columns" metrics are cached.
+    assert engine.metric_cache.statistics.num_entries == 2
+
+    max_metric = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+        metric_dependencies={"table.columns": table_columns_metric},
+    )
+    # The "table.columns" dependency is not supplied by the caller, so it is obtained from the metric cache.
+    results: dict = engine.resolve_metrics(metrics_to_resolve=(max_metric,))
+    assert results[max_metric.id] == 3
+    assert engine.metric_cache.statistics.hits == 1
+
+    # Loading batch data for the same batch_id invalidates metrics computed on the previous batch data.
+    engine.load_batch_data(
+        batch_id="batch_0", batch_data=pd.DataFrame({"a": [1, 2, 3]})
+    )
+    assert engine.metric_cache.statistics.num_entries == 0
+
+
+@pytest.mark.unit
+def test_execution_engine_metric_cache_from_config():
+    engine = PandasExecutionEngine(
+        metric_cache={"class_name": "LRUMetricCache", "max_entries": 5}
+    )
+    assert isinstance(engine.metric_cache, LRUMetricCache)
+    assert engine.metric_cache.max_entries == 5
+    assert engine.config["metric_cache"] == {
+        "class_name": "LRUMetricCache",
+        "max_entries": 5,
+    }
+
+    engine = PandasExecutionEngine(caching=False)
+    assert isinstance(engine.metric_cache, NoOpMetricCache)
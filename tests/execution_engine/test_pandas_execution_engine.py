@@ -1,4 +1,6 @@
+import concurrent.futures
 import os
+from typing import List
 from unittest import mock
 
 import pandas as pd
@@ -13,14 +15,23 @@ except:
 
 
 import great_expectations.exceptions as ge_exceptions
-from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+from great_expectations.core.batch_spec import (
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
+    S3BatchSpec,
+)
+from great_expectations.core.metric import BatchMetricIdentifier
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.data_context.store import BatchMetricStore
+from great_expectations.execution_engine.pandas_batch_data import PandasChunkedBatchData
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
     storage,
 )
 from great_expectations.util import is_library_loadable
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -640,3 +651,424 @@ def test_get_batch_with_gcs_misconfigured(gcs_batch_spec):
     # Raises error if batch_spec causes ExecutionEngine error
     with pytest.raises(ge_exceptions.ExecutionEngineError):
         execution_engine_no_gcs.get_batch_data(batch_spec=gcs_batch_spec)
+
+
+def test_resolve_metric_bundle_shares_domain_records_among_column_aggregates():
+    df = pd.DataFrame({"a": [1, 2, 3, None, 5], "b": [4, None, 6, 7, 8]})
+
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    domain_kwargs: dict
+    desired_metrics: list = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=None,
+            metric_dependencies={
+                "table.columns": table_columns_metric,
+            },
+        )
+        for metric_name, domain_kwargs in [
+            ("column.min", {"column": "a"}),
+            ("column.max", {"column": "a"}),
+            ("column.mean", {"column": "b"}),
+            (
+                "column.sum",
+                {"column": "b", "row_condition": "a>1", "condition_parser": "pandas"},
+            ),
+        ]
+    ]
+
+    with mock.patch.object(
+        engine, "get_domain_records", wraps=engine.get_domain_records
+    ) as mock_get_domain_records:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+
+    assert [results[metric.id] for metric in desired_metrics] == [1, 5, 6.25, 14]
+    # One call per distinct compute domain (the unconditioned one and the one with "row_condition").
+    assert mock_get_domain_records.call_count == 2
+
+
+def test_resolve_metric_bundle_reports_only_failed_metrics():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", 2, None]})
+
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    valid_metric = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    invalid_metric = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+
+    with pytest.raises(ge_exceptions.MetricResolutionError) as e:
+        engine.resolve_metrics(
+            metrics_to_resolve=(valid_metric, invalid_metric), metrics=metrics
+        )
+
+    assert [metric.id for metric in e.value.failed_metrics] == [invalid_metric.id]
+
+
+def test_resolve_metric_bundle_drops_nulls_of_columns_with_any_name():
+    df = pd.DataFrame(
+        {"first name": ["ab", None, "abc", "a"], "Unnamed: 0": [1, 2, 3, 4]}
+    )
+
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metrics: list = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column_name},
+            metric_value_kwargs=None,
+            metric_dependencies={
+                "table.columns": table_columns_metric,
+            },
+        )
+        for metric_name, column_name in [
+            ("column_values.length.min", "first name"),
+            ("column_values.length.max", "first name"),
+            ("column.max", "Unnamed: 0"),
+        ]
+    ]
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics, metrics=metrics
+    )
+
+    assert [results[metric.id] for metric in desired_metrics] == [1, 3, 4]
+
+
+def test_get_domain_records_reuses_filtered_records_of_same_batch():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, None, 6, 7]})
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    records_a: pd.DataFrame = engine.get_domain_records(
+        domain_kwargs={
+            "column": "a",
+            "row_condition": "a>1",
+            "condition_parser": "pandas",
+        }
+    )
+    records_b: pd.DataFrame = engine.get_domain_records(
+        domain_kwargs={
+            "column": "b",
+            "row_condition": "a>1",
+            "condition_parser": "pandas",
+        }
+    )
+    assert records_a is records_b
+    assert records_a.index.tolist() == [1, 2]
+
+    records: pd.DataFrame = engine.get_domain_records(
+        domain_kwargs={
+            "column_A": "a",
+            "column_B": "b",
+            "ignore_row_if": "either_value_is_missing",
+        }
+    )
+    assert records.index.tolist() == [0, 2]
+    assert (
+        engine.get_domain_records(
+            domain_kwargs={
+                "column_A": "a",
+                "column_B": "b",
+                "ignore_row_if": "either_value_is_missing",
+            }
+        )
+        is records
+    )
+
+    # Reloading batch data invalidates filtered records of that batch.
+    engine.load_batch_data(
+        batch_id="made-up-id", batch_data=pd.DataFrame({"a": [5, 0], "b": [1, 2]})
+    )
+    records_a = engine.get_domain_records(
+        domain_kwargs={
+            "column": "a",
+            "row_condition": "a>1",
+            "condition_parser": "pandas",
+        }
+    )
+    assert records_a["a"].tolist() == [5]
+
+
+def test_get_domain_records_evicts_least_recently_used_filtered_records():
+    df = pd.DataFrame({"a": list(range(100))})
+    engine = PandasExecutionEngine(
+        batch_data_dict={"made-up-id": df},
+        domain_records_cache_max_bytes=int(df.memory_usage().sum()),
+    )
+
+    records_0: pd.DataFrame = engine.get_domain_records(
+        domain_kwargs={"row_condition": "a<50", "condition_parser": "pandas"}
+    )
+    records_1: pd.DataFrame = engine.get_domain_records(
+        domain_kwargs={"row_condition": "a>=50", "condition_parser": "pandas"}
+    )
+    assert (
+        engine.get_domain_records(
+            domain_kwargs={"row_condition": "a>=50", "condition_parser": "pandas"}
+        )
+        is records_1
+    )
+    # Both filtered records do not fit into the cache together, so the least recently used one has been evicted.
+    assert (
+        engine.get_domain_records(
+            domain_kwargs={"row_condition": "a<50", "condition_parser": "pandas"}
+        )
+        is not records_0
+    )
+    # noinspection PyProtectedMember
+    assert engine._domain_records_cache_bytes <= int(df.memory_usage().sum())
+
+
+def test_get_domain_records_from_concurrent_threads():
+    df = pd.DataFrame({"a": list(range(1000))})
+    engine = PandasExecutionEngine(
+        batch_data_dict={"made-up-id": df},
+        # Room for about two filtered records, so that threads evict records of each other.
+        domain_records_cache_max_bytes=int(df.memory_usage().sum()),
+    )
+
+    def _get_domain_records(idx: int) -> int:
+        return engine.get_domain_records(
+            domain_kwargs={
+                "row_condition": f"a>={(idx % 8) * 100}",
+                "condition_parser": "pandas",
+            }
+        ).shape[0]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        num_records: List[int] = list(executor.map(_get_domain_records, range(400)))
+
+    assert num_records == [1000 - (idx % 8) * 100 for idx in range(400)]
+    # noinspection PyProtectedMember
+    assert engine._domain_records_cache_bytes == sum(
+        engine._domain_records_cache_sizes.values()
+    )
+    # noinspection PyProtectedMember
+    assert set(engine._domain_records_cache_sizes.keys()) == set(
+        engine._domain_records_cache.keys()
+    )
+
+
+def test_resolve_metrics_of_chunked_batch_data_without_materializing_it(tmp_path):
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, None, 4, 5, 6, 7],
+            "b": ["x", "y", "x", None, "z", "x", "y"],
+        }
+    )
+    path: str = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+
+    def _resolve_metrics(engine: PandasExecutionEngine) -> list:
+        batch_data, _ = engine.get_batch_data_and_markers(
+            batch_spec=PathBatchSpec(path=path)
+        )
+        engine.load_batch_data(batch_id="batch_0", batch_data=batch_data)
+
+        metrics: dict = {}
+
+        table_columns_metric: MetricConfiguration
+        results: dict
+
+        table_columns_metric, results = get_table_columns_metric(engine=engine)
+        metrics.update(results)
+
+        domain_kwargs: dict
+        desired_metrics: list = [
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=domain_kwargs,
+                metric_value_kwargs=value_kwargs,
+                metric_dependencies={
+                    "table.columns": table_columns_metric,
+                },
+            )
+            for metric_name, domain_kwargs, value_kwargs in [
+                ("table.row_count", {}, None),
+                ("column.max", {"column": "a"}, None),
+                (
+                    "column.min",
+                    {
+                        "column": "a",
+                        "row_condition": 'b=="x"',
+                        "condition_parser": "pandas",
+                    },
+                    None,
+                ),
+                ("column.sum", {"column": "a"}, None),
+                ("column.mean", {"column": "a"}, None),
+                ("column.standard_deviation", {"column": "a"}, None),
+                (
+                    "column.value_counts",
+                    {"column": "b"},
+                    {"sort": "value", "collate": None},
+                ),
+            ]
+        ]
+        results = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+        metrics.update(results)
+        return [metrics[metric.id] for metric in desired_metrics] + [
+            metrics[table_columns_metric.metric_dependencies["table.column_types"].id]
+        ]
+
+    engine = PandasExecutionEngine(chunk_size=2)
+    chunked_results: list = _resolve_metrics(engine=engine)
+    batch_data: PandasChunkedBatchData = engine.loaded_batch_data_dict["batch_0"]
+    assert isinstance(batch_data, PandasChunkedBatchData)
+    assert not batch_data.is_materialized
+
+    expected_results: list = _resolve_metrics(engine=PandasExecutionEngine())
+    assert chunked_results[:5] == expected_results[:5]
+    assert chunked_results[5] == pytest.approx(expected_results[5])
+    assert chunked_results[6].to_dict() == expected_results[6].to_dict()
+    # Column "a" is read as integer in the first chunk, and as float in later chunks (due to missing value).
+    assert chunked_results[7] == expected_results[7]
+
+    # Metrics, which cannot be computed chunk by chunk, are computed on the materialized DataFrame.
+    median_metric = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": get_table_columns_metric(engine=engine)[0],
+        },
+    )
+    results = engine.resolve_metrics(metrics_to_resolve=(median_metric,))
+    assert results[median_metric.id] == 4.5
+    assert batch_data.is_materialized
+
+
+def test_resolve_metrics_of_chunked_batch_data_with_batch_metric_store(tmp_path):
+    path: str = str(tmp_path / "data.csv")
+    pd.DataFrame({"a": [1, 2, 3, 4, 5]}).to_csv(path, index=False)
+
+    batch_metric_store = BatchMetricStore()
+
+    def _resolve_column_min_and_max(engine: PandasExecutionEngine) -> list:
+        batch_data, _ = engine.get_batch_data_and_markers(
+            batch_spec=PathBatchSpec(path=path)
+        )
+        engine.load_batch_data(batch_id="batch_0", batch_data=batch_data)
+
+        table_columns_metric: MetricConfiguration
+        table_columns_metric, _ = get_table_columns_metric(engine=engine)
+        metrics = [
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"column": "a"},
+                metric_value_kwargs=None,
+                metric_dependencies={"table.columns": table_columns_metric},
+            )
+            for metric_name in ["column.min", "column.max"]
+        ]
+        resolved_metrics = engine.resolve_metrics(metrics_to_resolve=metrics)
+        return [resolved_metrics[metric.id] for metric in metrics]
+
+    engine = PandasExecutionEngine(chunk_size=2, batch_metric_store=batch_metric_store)
+    assert _resolve_column_min_and_max(engine=engine) == [1, 5]
+    assert {key.metric_name for key in batch_metric_store.list_keys()} >= {
+        "column.min",
+        "column.max",
+    }
+
+    # Persisted values are served for the same data (fetched in bulk), instead of recomputed from chunks.
+    max_key: BatchMetricIdentifier = next(
+        key for key in batch_metric_store.list_keys() if key.metric_name == "column.max"
+    )
+    batch_metric_store.set(key=max_key, value=42)
+    engine = PandasExecutionEngine(chunk_size=2, batch_metric_store=batch_metric_store)
+    with mock.patch.object(
+        batch_metric_store, "get_many", wraps=batch_metric_store.get_many
+    ) as mock_get_many:
+        assert _resolve_column_min_and_max(engine=engine) == [1, 42]
+
+    assert len(mock_get_many.call_args[0][0]) == 2
+
+
+def test_validate_map_expectations_of_chunked_batch_data_without_materializing_it(
+    tmp_path,
+):
+    path: str = str(tmp_path / "data.csv")
+    pd.DataFrame({"a": [1, None, 3, 4, None, 6, 7]}).to_csv(path, index=False)
+
+    def _validate(engine: PandasExecutionEngine) -> list:
+        batch_data, _ = engine.get_batch_data_and_markers(
+            batch_spec=PathBatchSpec(path=path)
+        )
+        engine.load_batch_data(batch_id="batch_0", batch_data=batch_data)
+
+        expectation_suite = ExpectationSuite(expectation_suite_name="my_suite")
+        expectation_suite.add_expectation(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "a"},
+            )
+        )
+        expectation_suite.add_expectation(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_null",
+                kwargs={"column": "a", "mostly": 0.2},
+            )
+        )
+        validator = Validator(
+            execution_engine=engine, expectation_suite=expectation_suite
+        )
+        return [
+            validation_result.to_json_dict()
+            for validation_result in validator.validate(result_format="SUMMARY").results
+        ]
+
+    engine = PandasExecutionEngine(chunk_size=2)
+    with mock.patch.object(
+        PandasChunkedBatchData,
+        "dataframe",
+        new_callable=mock.PropertyMock,
+        side_effect=AssertionError("Batch data must not be materialized."),
+    ):
+        chunked_results: list = _validate(engine=engine)
+
+    assert not engine.loaded_batch_data_dict["batch_0"].is_materialized
+    assert chunked_results == _validate(engine=PandasExecutionEngine())
+    assert [result["success"] for result in chunked_results] == [False, True]
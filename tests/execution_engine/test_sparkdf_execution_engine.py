@@ -1,5 +1,7 @@
+import concurrent.futures
 import datetime
 import logging
+from typing import Any, List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -7,6 +9,7 @@ import pytest
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch_spec import PathBatchSpec, RuntimeDataBatchSpec
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.execution_engine import SparkDFExecutionEngine
 from great_expectations.expectations.row_conditions import (
@@ -1107,3 +1110,195 @@ def test_dataframe_property_given_loaded_batch(spark_session):
 
     # Ensuring Data not distorted
     assert engine.dataframe == df
+
+
+def test_batch_data_is_persisted_once_more_than_one_pass_is_required(spark_session):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=pd.DataFrame(
+            {"a": [1, 2, 3, 4], "b": [2, 3, 4, None]},
+        ),
+        batch_id="1234",
+    )
+    df = engine.dataframe
+    assert not df.is_cached
+
+    table_columns_metric: MetricConfiguration
+    metrics: dict
+    table_columns_metric, metrics = get_table_columns_metric(engine=engine)
+
+    def _resolve_column_aggregate(metric_name: str) -> Any:
+        partial_metric = MetricConfiguration(
+            metric_name=f"{metric_name}.aggregate_fn",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+            metric_dependencies={"table.columns": table_columns_metric},
+        )
+        metrics.update(
+            engine.resolve_metrics(
+                metrics_to_resolve=(partial_metric,), metrics=metrics
+            )
+        )
+        # Schema metrics and partial metrics do not run Spark jobs over batch data.
+        assert not df.is_cached
+
+        metric = MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+            metric_dependencies={"metric_partial_fn": partial_metric},
+        )
+        metrics.update(
+            engine.resolve_metrics(metrics_to_resolve=(metric,), metrics=metrics)
+        )
+        return metrics[metric.id]
+
+    # The first bundle of aggregates is one pass over batch data.
+    assert _resolve_column_aggregate(metric_name="column.max") == 4
+    assert not df.is_cached
+
+    # Batch data is persisted for the second pass.
+    assert _resolve_column_aggregate(metric_name="column.min") == 1
+    assert df.is_cached
+    assert engine.get_persisted_data_size(batch_id="1234") > 0
+
+    # Filtered domain records are persisted, once they are requested again.
+    domain_kwargs: dict = {"row_condition": "b > 2", "condition_parser": "spark"}
+    data = engine.get_domain_records(domain_kwargs=domain_kwargs)
+    assert not data.is_cached
+    data = engine.get_domain_records(domain_kwargs=domain_kwargs)
+    assert data.is_cached
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs) is data
+
+    engine.unload_batch_data(batch_id="1234")
+    assert not df.is_cached
+    assert not data.is_cached
+    assert engine.get_persisted_data_size() == 0
+
+
+def test_filtered_domain_records_are_persisted_once_when_requested_concurrently(
+    spark_session,
+):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=pd.DataFrame(
+            {"a": [1, 2, 3, 4], "b": [2, 3, 4, None]},
+        ),
+        batch_id="1234",
+    )
+
+    def _count_domain_records(idx: int) -> int:
+        return engine.get_domain_records(
+            domain_kwargs={
+                "row_condition": f"a > {idx % 4}",
+                "condition_parser": "spark",
+            }
+        ).count()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        num_records: List[int] = list(executor.map(_count_domain_records, range(64)))
+
+    assert num_records == [4 - idx % 4 for idx in range(64)]
+    # Every filtered domain is persisted exactly once (no DataFrame is persisted without being retained).
+    # noinspection PyProtectedMember
+    persisted_domain_records: list = list(engine._persisted_domain_records.values())
+    assert len(persisted_domain_records) == 4
+    assert all(data.is_cached for data in persisted_domain_records)
+
+    engine.unload_batch_data(batch_id="1234")
+    assert not any(data.is_cached for data in persisted_domain_records)
+    assert engine.get_persisted_data_size() == 0
+
+
+def test_unrecognized_persist_storage_level_raises_error(spark_session):
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        SparkDFExecutionEngine(persist_storage_level="NOT_A_STORAGE_LEVEL")
+
+
+def test_resolve_metric_bundle_combines_conditional_domains_into_single_job(
+    spark_session,
+):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, 4, None]}),
+        batch_id="1234",
+    )
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+
+    def _resolve_conditional_metrics(metrics: dict) -> Tuple[list, list]:
+        partial_metrics: List[MetricConfiguration] = []
+        metric_configurations: List[MetricConfiguration] = []
+        metric_name: str
+        domain_kwargs: dict
+        for metric_name, domain_kwargs in [
+            ("table.row_count", {}),
+            (
+                "table.row_count",
+                {"row_condition": "a > 1", "condition_parser": "spark"},
+            ),
+            (
+                "column.max",
+                {
+                    "column": "a",
+                    "row_condition": 'col("b")==4',
+                    "condition_parser": "great_expectations__experimental__",
+                },
+            ),
+            (
+                "column.mean",
+                {"column": "b", "row_condition": "a > 2", "condition_parser": "spark"},
+            ),
+            (
+                "column.mean",
+                {"column": "b", "row_condition": "a > 3", "condition_parser": "spark"},
+            ),
+        ]:
+            partial_metric = MetricConfiguration(
+                metric_name=f"{metric_name}.aggregate_fn",
+                metric_domain_kwargs=domain_kwargs,
+                metric_value_kwargs=None,
+                metric_dependencies={"table.columns": table_columns_metric},
+            )
+            metrics.update(
+                engine.resolve_metrics(
+                    metrics_to_resolve=(partial_metric,), metrics=metrics
+                )
+            )
+            partial_metrics.append(partial_metric)
+
+            metric_configurations.append(
+                MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs=domain_kwargs,
+                    metric_value_kwargs=None,
+                    metric_dependencies={"metric_partial_fn": partial_metric},
+                )
+            )
+
+        resolved_metrics: dict = engine.resolve_metrics(
+            metrics_to_resolve=metric_configurations, metrics=metrics
+        )
+        return (
+            [metrics[metric.id][1] for metric in partial_metrics],
+            [resolved_metrics[metric.id] for metric in metric_configurations],
+        )
+
+    compute_domain_kwargs: List[dict]
+    per_domain_job_results: list
+    compute_domain_kwargs, per_domain_job_results = _resolve_conditional_metrics(
+        metrics=dict(results)
+    )
+    assert per_domain_job_results == [6, 4, 3, 4.0, None]
+    assert len({IDDict(kwargs).to_id() for kwargs in compute_domain_kwargs}) == 5
+
+    # noinspection PyProtectedMember
+    engine._combine_conditional_domains = True
+    single_job_results: list
+    compute_domain_kwargs, single_job_results = _resolve_conditional_metrics(
+        metrics=dict(results)
+    )
+    assert single_job_results == per_domain_job_results
+    assert len({IDDict(kwargs).to_id() for kwargs in compute_domain_kwargs}) == 1
@@ -1,5 +1,9 @@
+import concurrent.futures
 import logging
 import os
+import threading
+from typing import List
+from unittest import mock
 
 import pandas as pd
 import pytest
@@ -10,7 +14,11 @@ from great_expectations.core.batch_spec import (
     SqlAlchemyDatasourceBatchSpec,
 )
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.execution_engine.bundled_metric_configuration import (
+    BundledMetricConfiguration,
+)
 from great_expectations.execution_engine.sqlalchemy_dialect import GESqlDialect
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
@@ -807,6 +815,35 @@ def test_get_batch_data_and_markers_using_query(sqlite_view_engine, test_df):
     assert batch_markers.get("ge_load_time") is not None
 
 
+def test_batch_fingerprint_identifies_source_of_temp_table(sqlite_view_engine, test_df):
+    my_execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
+        engine=sqlite_view_engine
+    )
+    test_df.to_sql("test_table_0", con=my_execution_engine.engine)
+
+    batch_fingerprints: List[str] = []
+    query: str
+    for query in [
+        "SELECT * FROM test_table_0",
+        "SELECT * FROM test_table_0",
+        "SELECT * FROM test_table_0 WHERE 1 = 0",
+    ]:
+        batch_data, _ = my_execution_engine.get_batch_data_and_markers(
+            batch_spec=RuntimeQueryBatchSpec(
+                query=query,
+            )
+        )
+        my_execution_engine.load_batch_data(batch_id="batch_0", batch_data=batch_data)
+        batch_fingerprints.append(
+            my_execution_engine.get_batch_fingerprint(batch_id="batch_0")
+        )
+
+    # Temporary tables, created for each batch, are named randomly; fingerprints are computed from queries instead.
+    assert batch_fingerprints[0] is not None
+    assert batch_fingerprints[0] == batch_fingerprints[1]
+    assert batch_fingerprints[0] != batch_fingerprints[2]
+
+
 def test_sa_batch_unexpected_condition_temp_table(caplog, sa):
     def validate_tmp_tables():
         temp_tables = [
@@ -864,3 +901,234 @@ def test_sa_batch_unexpected_condition_temp_table(caplog, sa):
     )
 
     validate_tmp_tables()
+
+
+def test_resolve_metric_bundle_reports_per_domain_query_timings(sa):
+    engine: SqlAlchemyExecutionEngine = build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, 4, 4]}), sa
+    )
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    metric_configurations: List[MetricConfiguration] = []
+    row_condition: str
+    for row_condition in ['col("a")>1', 'col("a")>2']:
+        domain_kwargs: dict = {
+            "column": "a",
+            "row_condition": row_condition,
+            "condition_parser": "great_expectations__experimental__",
+        }
+        partial_metric = MetricConfiguration(
+            metric_name="column.max.aggregate_fn",
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        partial_metric.metric_dependencies = {"table.columns": table_columns_metric}
+        results = engine.resolve_metrics(
+            metrics_to_resolve=(partial_metric,), metrics=metrics
+        )
+        metrics.update(results)
+
+        metric = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        metric.metric_dependencies = {"metric_partial_fn": partial_metric}
+        metric_configurations.append(metric)
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=metric_configurations, metrics=metrics
+    )
+
+    assert [results[metric.id] for metric in metric_configurations] == [3, 3]
+    assert len(engine.metric_bundle_query_timings) == 2
+    assert all(
+        elapsed_time >= 0.0
+        for domain_id, elapsed_time in engine.metric_bundle_query_timings
+    )
+
+
+def test_resolve_metric_bundle_keeps_query_timings_of_concurrent_bundles(sa):
+    engine: SqlAlchemyExecutionEngine = build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, 4, 4]}), sa
+    )
+
+    # Both bundles are held until each one has executed its query, so that they resolve concurrently.
+    barrier = threading.Barrier(parties=2)
+
+    def execute_metric_bundle_query(domain_id: str, query: dict) -> tuple:
+        barrier.wait(timeout=5)
+        return [tuple(range(len(query["select"])))], 0.5
+
+    metric_fn_bundles: List[List[BundledMetricConfiguration]] = [
+        [
+            BundledMetricConfiguration(
+                metric_configuration=MetricConfiguration(
+                    metric_name="column.max",
+                    metric_domain_kwargs={"column": column},
+                    metric_value_kwargs=None,
+                ),
+                metric_fn=sa.func.max(sa.column(column)),
+                compute_domain_kwargs={},
+                accessor_domain_kwargs={"column": column},
+                metric_provider_kwargs={},
+            )
+        ]
+        for column in ["a", "b"]
+    ]
+
+    with mock.patch.object(
+        engine,
+        "_execute_metric_bundle_query",
+        side_effect=execute_metric_bundle_query,
+    ), concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(engine.resolve_metric_bundle, metric_fn_bundles))
+
+    assert [
+        elapsed_time for domain_id, elapsed_time in engine.metric_bundle_query_timings
+    ] == [0.5, 0.5]
+
+
+def test_resolve_metric_bundle_retains_bounded_number_of_query_timings(sa):
+    with mock.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._METRIC_BUNDLE_QUERY_TIMINGS_MAX_ENTRIES",
+        2,
+    ):
+        engine: SqlAlchemyExecutionEngine = build_sa_engine(
+            pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, 4, 4]}), sa
+        )
+
+    elapsed_times = iter([0.1, 0.2, 0.3])
+
+    def execute_metric_bundle_query(domain_id: str, query: dict) -> tuple:
+        return [tuple(range(len(query["select"])))], next(elapsed_times)
+
+    metric_fn_bundle: List[BundledMetricConfiguration] = [
+        BundledMetricConfiguration(
+            metric_configuration=MetricConfiguration(
+                metric_name="column.max",
+                metric_domain_kwargs={"column": "a"},
+                metric_value_kwargs=None,
+            ),
+            metric_fn=sa.func.max(sa.column("a")),
+            compute_domain_kwargs={},
+            accessor_domain_kwargs={"column": "a"},
+            metric_provider_kwargs={},
+        )
+    ]
+
+    with mock.patch.object(
+        engine,
+        "_execute_metric_bundle_query",
+        side_effect=execute_metric_bundle_query,
+    ):
+        for _ in range(3):
+            engine.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle)
+
+    # Only the most recent timings are retained.
+    assert [
+        elapsed_time for domain_id, elapsed_time in engine.metric_bundle_query_timings
+    ] == [0.2, 0.3]
+
+
+def test_metric_bundle_queries_are_not_concurrent_on_shared_connection(sa):
+    engine: SqlAlchemyExecutionEngine = build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, 4, 4]}), sa
+    )
+    # noinspection PyProtectedMember
+    engine._concurrency = ConcurrencyConfig(enabled=True)
+    queries: dict = {"domain_id_0": {}, "domain_id_1": {}}
+
+    # SQLite temporary tables only persist within a connection, so the engine holds a single (shared) Connection.
+    assert isinstance(engine.engine, sa.engine.Connection)
+    # noinspection PyProtectedMember
+    assert not engine._can_execute_metric_bundle_queries_concurrently(queries=queries)
+
+
+def test_resolve_metric_bundle_combines_conditional_domains_into_single_query(sa):
+    engine: SqlAlchemyExecutionEngine = build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, 4, None]}), sa
+    )
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    metric_configurations: List[MetricConfiguration] = []
+    metric_name: str
+    domain_kwargs: dict
+    for metric_name, domain_kwargs in [
+        ("table.row_count", {}),
+        (
+            "table.row_count",
+            {
+                "row_condition": 'col("a")>1',
+                "condition_parser": "great_expectations__experimental__",
+            },
+        ),
+        (
+            "column.max",
+            {
+                "column": "a",
+                "row_condition": 'col("b")==4',
+                "condition_parser": "great_expectations__experimental__",
+            },
+        ),
+        (
+            "column.mean",
+            {
+                "column": "b",
+                "row_condition": 'col("a")>2',
+                "condition_parser": "great_expectations__experimental__",
+            },
+        ),
+    ]:
+        partial_metric = MetricConfiguration(
+            metric_name=f"{metric_name}.aggregate_fn",
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        partial_metric.metric_dependencies = {"table.columns": table_columns_metric}
+        results = engine.resolve_metrics(
+            metrics_to_resolve=(partial_metric,), metrics=metrics
+        )
+        metrics.update(results)
+
+        metric = MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        metric.metric_dependencies = {"metric_partial_fn": partial_metric}
+        metric_configurations.append(metric)
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=metric_configurations, metrics=metrics
+    )
+    per_domain_query_results: List[Any] = [
+        results[metric.id] for metric in metric_configurations
+    ]
+    assert per_domain_query_results == [6, 4, 3, 4.0]
+    assert len(engine.metric_bundle_query_timings) == 4
+
+    # noinspection PyProtectedMember
+    engine._combine_conditional_domains = True
+    results = engine.resolve_metrics(
+        metrics_to_resolve=metric_configurations, metrics=metrics
+    )
+    assert [
+        results[metric.id] for metric in metric_configurations
+    ] == per_domain_query_results
+    # Timings of the second bundle (of a single combined query) are appended to those of the first one.
+    assert len(engine.metric_bundle_query_timings) == 4 + 1
@@ -0,0 +1,104 @@
+"""
+Micro-benchmarks of metric dependency graph construction.
+
+These benchmarks do not need any backend, but (like all performance tests) they only run with --performance-tests:
+
+    pytest tests/performance/test_validation_graph_benchmarks.py --performance-tests
+
+The "cached_metric_ids" parameter contrasts the current behavior (metric identifiers computed once per IDDict and
+MetricConfiguration vertices interned per graph) with the previous behavior (identifiers recomputed on every access).
+"""
+from typing import List
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core.id_dict import IDDict
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import MetricEdge, ValidationGraph
+from great_expectations.validator.validator import Validator
+
+
+def _build_metric_edges(number_of_columns: int) -> List[MetricEdge]:
+    """Emulates the metric dependency sub-graphs of a suite with a few column expectations per column."""
+    edges: List[MetricEdge] = []
+
+    table_row_count = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={"batch_id": "my_batch_id"},
+    )
+    edges.append(MetricEdge(left=table_row_count))
+
+    column_index: int
+    for column_index in range(number_of_columns):
+        domain_kwargs: dict = {
+            "batch_id": "my_batch_id",
+            "column": f"column_{column_index}",
+            "row_condition": f'col("column_{column_index}")>0',
+            "condition_parser": "great_expectations__experimental__",
+        }
+        metric_name: str
+        for metric_name in [
+            "column.min",
+            "column.max",
+            "column.mean",
+            "column_values.nonnull.unexpected_count",
+        ]:
+            partial_metric = MetricConfiguration(
+                metric_name=f"{metric_name}.aggregate_fn",
+                metric_domain_kwargs=domain_kwargs,
+                metric_value_kwargs={"parse_strings_as_datetimes": False},
+            )
+            metric = MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=domain_kwargs,
+                metric_value_kwargs={"parse_strings_as_datetimes": False},
+            )
+            # Each expectation re-creates shared dependencies, which the graph de-duplicates.
+            edges.append(MetricEdge(left=metric, right=partial_metric))
+            edges.append(
+                MetricEdge(
+                    left=partial_metric,
+                    right=MetricConfiguration(
+                        metric_name="table.row_count",
+                        metric_domain_kwargs={"batch_id": "my_batch_id"},
+                    ),
+                )
+            )
+
+    return edges
+
+
+def _uncached_to_id(self, id_keys=None, id_ignore_keys=None):
+    if id_keys is None:
+        id_keys = self.keys()
+    if id_ignore_keys is None:
+        id_ignore_keys = self._id_ignore_keys
+    return self._compute_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+
+@pytest.mark.parametrize("cached_metric_ids", [False, True])
+@pytest.mark.parametrize("number_of_columns", [30, 300])
+def test_build_and_parse_validation_graph_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    monkeypatch: pytest.MonkeyPatch,
+    number_of_columns: int,
+    cached_metric_ids: bool,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    if not cached_metric_ids:
+        monkeypatch.setattr(IDDict, "to_id", _uncached_to_id)
+
+    def _build_and_parse() -> ValidationGraph:
+        graph = ValidationGraph(edges=_build_metric_edges(number_of_columns))
+        # noinspection PyProtectedMember
+        Validator._parse_validation_graph(validation_graph=graph, metrics={})
+        return graph
+
+    graph: ValidationGraph = benchmark(_build_and_parse)
+
+    assert len(graph.metric_configurations) == 1 + 8 * number_of_columns
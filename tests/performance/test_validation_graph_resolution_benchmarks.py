@@ -0,0 +1,116 @@
+"""
+Benchmarks of metric scheduling over large synthetic validation graphs.
+
+These benchmarks do not need any backend, but (like all performance tests) they only run with --performance-tests:
+
+    pytest tests/performance/test_validation_graph_resolution_benchmarks.py --performance-tests
+
+The "scheduler" parameter contrasts the incremental (Kahn-style) MetricResolutionQueue with the previous approach,
+which re-scanned every edge of the graph on each iteration of "Validator.resolve_validation_graph()".
+"""
+from typing import Any, Dict, List, Set, Tuple
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import (
+    MetricEdge,
+    MetricResolutionQueue,
+    ValidationGraph,
+)
+
+
+def _build_layered_validation_graph(
+    number_of_edges: int, depth: int = 10, fan_in: int = 2
+) -> ValidationGraph:
+    """Builds a layered DAG, in which every metric depends on "fan_in" metrics of the previous layer."""
+    width: int = max(number_of_edges // (depth * fan_in), fan_in)
+
+    layers: List[List[MetricConfiguration]] = [
+        [
+            MetricConfiguration(
+                metric_name=f"synthetic.metric_{layer_index}",
+                metric_domain_kwargs={"column": f"column_{column_index}"},
+            )
+            for column_index in range(width)
+        ]
+        for layer_index in range(depth + 1)
+    ]
+
+    edges: List[MetricEdge] = [MetricEdge(left=metric) for metric in layers[0]]
+    layer_index: int
+    column_index: int
+    offset: int
+    for layer_index in range(1, depth + 1):
+        for column_index, metric in enumerate(layers[layer_index]):
+            for offset in range(fan_in):
+                edges.append(
+                    MetricEdge(
+                        left=metric,
+                        right=layers[layer_index - 1][(column_index + offset) % width],
+                    )
+                )
+
+    return ValidationGraph(edges=edges)
+
+
+def _resolve_with_full_rescan(graph: ValidationGraph) -> int:
+    metrics: Dict[Tuple[str, str, str], Any] = {}
+    iterations: int = 0
+    while True:
+        ready_ids: Set[Tuple[str, str, str]] = set()
+        unmet_ids: Set[Tuple[str, str, str]] = set()
+        for edge in graph.edges:
+            if edge.left.id not in metrics:
+                if edge.right is None or edge.right.id in metrics:
+                    ready_ids.add(edge.left.id)
+                else:
+                    unmet_ids.add(edge.left.id)
+
+        ready_ids -= unmet_ids
+        if not ready_ids:
+            return iterations
+
+        metrics.update({metric_id: 0 for metric_id in ready_ids})
+        iterations += 1
+
+
+def _resolve_with_metric_resolution_queue(graph: ValidationGraph) -> int:
+    metrics: Dict[Tuple[str, str, str], Any] = {}
+    queue = MetricResolutionQueue(graph=graph, metrics=metrics)
+    iterations: int = 0
+    while queue.ready_metric_ids:
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {
+            metric.id: 0 for metric in queue.ready_metrics
+        }
+        metrics.update(resolved_metrics)
+        queue.mark_resolved(metric_ids=resolved_metrics.keys())
+        iterations += 1
+
+    return iterations
+
+
+@pytest.mark.parametrize("scheduler", ["full_rescan", "metric_resolution_queue"])
+@pytest.mark.parametrize("number_of_edges", [10_000, 50_000, 100_000])
+def test_validation_graph_resolution_scheduling_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    number_of_edges: int,
+    scheduler: str,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    depth: int = 10
+    graph: ValidationGraph = _build_layered_validation_graph(
+        number_of_edges=number_of_edges, depth=depth
+    )
+
+    if scheduler == "full_rescan":
+        iterations: int = benchmark(_resolve_with_full_rescan, graph)
+    else:
+        iterations: int = benchmark(_resolve_with_metric_resolution_queue, graph)
+
+    assert iterations == depth + 1
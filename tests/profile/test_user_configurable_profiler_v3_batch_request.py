@@ -345,6 +345,35 @@ def test_profiler_init_full_config_no_semantic_types(cardinality_validator):
     assert "col_one" not in profiler.column_info
 
 
+def test_profiler_init_profiles_all_columns_in_one_validation(cardinality_validator):
+    """
+    What does this test do and why?
+    Confirms that data types and cardinalities of all columns are determined by validating their expectations together,
+    without adding these expectations to the expectation suite
+    """
+    with mock.patch.object(
+        cardinality_validator,
+        "graph_validate",
+        wraps=cardinality_validator.graph_validate,
+    ) as mock_graph_validate:
+        profiler = UserConfigurableProfiler(cardinality_validator)
+
+    assert mock_graph_validate.call_count == 1
+    assert len(cardinality_validator.get_expectation_suite().expectations) == 0
+    assert {
+        column_name: (column_info["type"], column_info["cardinality"])
+        for column_name, column_info in profiler.column_info.items()
+    } == {
+        "col_one": ("INT", "ONE"),
+        "col_two": ("INT", "TWO"),
+        "col_very_few": ("INT", "VERY_FEW"),
+        "col_few": ("INT", "FEW"),
+        "col_many": ("INT", "MANY"),
+        "col_very_many": ("INT", "VERY_MANY"),
+        "col_unique": ("INT", "UNIQUE"),
+    }
+
+
 def test_init_with_semantic_types(cardinality_validator):
     """
     What does this test do and why?
@@ -859,6 +888,44 @@ def test_nullity_expectations_mostly_tolerance(
         assert i["kwargs"]["mostly"] == 0.66
 
 
+def test_nullity_expectations_are_built_from_results_validated_in_bulk(
+    nulls_validator, possible_expectations_set
+):
+    """
+    What does this test do and why?
+    Confirms that nullity expectations are chosen from results of `expect_column_values_to_not_be_null`, validated
+    together with data types and cardinalities of columns, without validating these expectations for every column
+    """
+    excluded_expectations = [i for i in possible_expectations_set if "null" not in i]
+
+    validator = nulls_validator
+
+    profiler = UserConfigurableProfiler(
+        validator, excluded_expectations, not_null_only=False
+    )
+    with mock.patch.object(
+        validator,
+        "graph_validate",
+        wraps=validator.graph_validate,
+    ) as mock_graph_validate:
+        suite = profiler.build_suite()
+
+    assert mock_graph_validate.call_count == 0
+    assert {
+        expectation.kwargs["column"]: (
+            expectation.expectation_type,
+            expectation.kwargs["mostly"],
+        )
+        for expectation in suite.expectations
+    } == {
+        "mostly_null": ("expect_column_values_to_be_null", 0.66),
+        "mostly_not_null": ("expect_column_values_to_not_be_null", 0.66),
+    }
+
+    results = validator.validate(expectation_suite=suite)
+    assert results.success
+
+
 def test_profiled_dataset_passes_own_validation(
     cardinality_validator, titanic_data_context
 ):
@@ -1,6 +1,8 @@
 import os
 import shutil
+import threading
 from typing import Dict
+from unittest import mock
 
 import pytest
 from freezegun import freeze_time
@@ -8,7 +10,10 @@ from freezegun import freeze_time
 from great_expectations import DataContext
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context.store import ExpectationsStore, ValidationsStore
-from great_expectations.data_context.types.base import AnonymizedUsageStatisticsConfig
+from great_expectations.data_context.types.base import (
+    AnonymizedUsageStatisticsConfig,
+    ConcurrencyConfig,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
@@ -722,3 +727,126 @@ def test_site_builder_usage_statistics_disabled(
             page_contents = f.read()
             assert expected_logo_url in page_contents
             assert data_context_id not in page_contents
+
+
+@pytest.mark.rendered_output
+def test_site_builder_incremental_build_renders_only_new_and_changed_resources(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        incremental_build=True,
+        **local_site_config
+    )
+    _, index_links_dict = site_builder.build()
+
+    manifest: dict = site_builder.target_store.get_manifest()
+    assert set(manifest["expectations"].keys()) == {
+        "/".join(key.to_tuple())
+        for key in context.stores["expectations_store"].list_keys()
+    }
+    profiling_keys = [
+        key
+        for key in context.stores["validations_store"].list_keys()
+        if key.run_id.run_name == "profiling"
+    ]
+    assert len(manifest["profiling"]) == len(profiling_keys) > 0
+
+    # Pages of the index, built from the manifest, are the same as those of the index, built from validation results.
+    _, full_index_links_dict = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    ).build()
+    assert index_links_dict == full_index_links_dict
+
+    # Nothing changed: no page is rendered again, and no validation result is retrieved to build the index.
+    section_renderers = {
+        name: mock.patch.object(
+            section_builder.renderer_class,
+            "render",
+            wraps=section_builder.renderer_class.render,
+        )
+        for name, section_builder in site_builder.site_section_builders.items()
+    }
+    with mock.patch.object(
+        context, "get_validation_result", wraps=context.get_validation_result
+    ) as mock_get_validation_result, section_renderers[
+        "expectations"
+    ] as mock_render_expectations, section_renderers[
+        "profiling"
+    ] as mock_render_profiling:
+        _, incremental_index_links_dict = site_builder.build()
+
+    assert mock_render_expectations.call_count == 0
+    assert mock_render_profiling.call_count == 0
+    assert mock_get_validation_result.call_count == 0
+    assert incremental_index_links_dict == index_links_dict
+
+    # Only the changed expectation suite is rendered again.
+    expectation_suite_name: str = context.list_expectation_suite_names()[0]
+    suite = context.get_expectation_suite(expectation_suite_name)
+    suite.meta["notes"] = "changed"
+    context.save_expectation_suite(suite)
+
+    with section_renderers["expectations"] as mock_render_expectations:
+        site_builder.build()
+
+    assert mock_render_expectations.call_count == 1
+    assert (
+        mock_render_expectations.call_args[0][0].expectation_suite_name
+        == expectation_suite_name
+    )
+
+
+@pytest.mark.rendered_output
+def test_site_builder_builds_pages_concurrently(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    _, index_links_dict = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    ).build()
+
+    context.variables.concurrency = ConcurrencyConfig(
+        enabled=True, concurrent_data_docs_build=True
+    )
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    expectations_section_builder = site_builder.site_section_builders["expectations"]
+    num_expectation_suites: int = len(context.list_expectation_suite_names())
+    assert num_expectation_suites > 1
+
+    # Every page waits for all others to be rendered; this only completes, if pages are rendered concurrently.
+    barrier = threading.Barrier(num_expectation_suites, timeout=30)
+    render = expectations_section_builder.renderer_class.render
+
+    def render_after_barrier(*args, **kwargs):
+        barrier.wait()
+        return render(*args, **kwargs)
+
+    with mock.patch.object(
+        expectations_section_builder.renderer_class,
+        "render",
+        side_effect=render_after_barrier,
+    ):
+        _, concurrent_index_links_dict = site_builder.build()
+
+    assert not barrier.broken
+    assert concurrent_index_links_dict == index_links_dict
+    assert set(
+        site_builder.target_store.store_backends[ExpectationSuiteIdentifier].list_keys()
+    ) == {key.to_tuple() for key in context.stores["expectations_store"].list_keys()}
@@ -1,8 +1,10 @@
-from typing import Dict, Union
+from typing import Dict, List, Union
 
 import numpy as np
 import pandas as pd
+import pytest
 
+import great_expectations.exceptions as ge_exceptions
 from great_expectations.rule_based_profiler.estimators.bootstrap_numeric_range_estimator import (
     DEFAULT_BOOTSTRAP_NUM_RESAMPLES,
 )
@@ -74,3 +76,104 @@ def test_bootstrap_point_estimate_efficacy(
             atol=EFFICACY_TOLERANCE,
             err_msg=f"Actual value of {actual_false_positive_rates[distribution]} differs from expected value of {false_positive_rate} by more than {ATOL + EFFICACY_TOLERANCE * abs(actual_false_positive_rates[distribution])} tolerance.",
         )
+
+
+def test_bootstrap_point_estimate_is_independent_of_chunk_size(
+    bootstrap_distribution_parameters_and_1000_samples_with_01_false_positive,
+):
+    """
+    Drawing resamples in chunks reproduces the point estimate, obtained from all resamples drawn at once, exactly.
+    """
+    false_positive_rate: np.float64 = (
+        bootstrap_distribution_parameters_and_1000_samples_with_01_false_positive[
+            "false_positive_rate"
+        ]
+    )
+    distribution_samples: pd.DataFrame = (
+        bootstrap_distribution_parameters_and_1000_samples_with_01_false_positive[
+            "distribution_samples"
+        ]
+    )
+
+    metric_values: pd.Series = distribution_samples[distribution_samples.columns[0]]
+    value_ranges: List[np.ndarray] = [
+        compute_bootstrap_quantiles_point_estimate(
+            metric_values=metric_values,
+            false_positive_rate=false_positive_rate,
+            n_resamples=1000,
+            random_seed=43792,
+            quantile_statistic_interpolation_method="linear",
+            quantile_bias_correction=True,
+            quantile_bias_std_error_ratio_threshold=2.5e-1,
+            chunk_size=chunk_size,
+        ).value_range
+        for chunk_size in [1000, 333, 1]
+    ]
+    np.testing.assert_array_equal(value_ranges[1], value_ranges[0])
+    np.testing.assert_array_equal(value_ranges[2], value_ranges[0])
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1, 2.5])
+def test_bootstrap_point_estimate_with_invalid_chunk_size_raises_error(chunk_size):
+    with pytest.raises(ge_exceptions.ProfilerExecutionError) as e:
+        compute_bootstrap_quantiles_point_estimate(
+            metric_values=np.array([1.0, 2.0, 3.0]),
+            false_positive_rate=1.0e-2,
+            n_resamples=10,
+            random_seed=43792,
+            quantile_statistic_interpolation_method="linear",
+            quantile_bias_correction=False,
+            quantile_bias_std_error_ratio_threshold=2.5e-1,
+            chunk_size=chunk_size,
+        )
+
+    assert "chunk_size must be a positive integer" in str(e.value)
+
+
+def test_bootstrap_point_estimate_efficacy_with_convergence_stopping(
+    bootstrap_distribution_parameters_and_1000_samples_with_01_false_positive,
+):
+    """
+    Resampling, stopped upon convergence (Andrews and Buchinsky), approximates the sample +/- efficacy tolerance.
+    """
+    false_positive_rate: np.float64 = (
+        bootstrap_distribution_parameters_and_1000_samples_with_01_false_positive[
+            "false_positive_rate"
+        ]
+    )
+    distribution_samples: pd.DataFrame = (
+        bootstrap_distribution_parameters_and_1000_samples_with_01_false_positive[
+            "distribution_samples"
+        ]
+    )
+
+    distribution: str
+    numeric_range_estimation_result: NumericRangeEstimationResult
+    actual_false_positive_rate: np.float64
+    for distribution in distribution_samples.columns:
+        numeric_range_estimation_result = compute_bootstrap_quantiles_point_estimate(
+            metric_values=distribution_samples[distribution],
+            false_positive_rate=false_positive_rate,
+            n_resamples=DEFAULT_BOOTSTRAP_NUM_RESAMPLES,
+            random_seed=43792,
+            quantile_statistic_interpolation_method="linear",
+            quantile_bias_correction=True,
+            quantile_bias_std_error_ratio_threshold=2.5e-1,
+            chunk_size=100,
+            convergence_percentage_deviation=1.0,
+        )
+        actual_false_positive_rate = (
+            1.0
+            - np.sum(
+                distribution_samples[distribution].between(
+                    *numeric_range_estimation_result.value_range
+                )
+            )
+            / distribution_samples.shape[0]
+        )
+        np.testing.assert_allclose(
+            actual=actual_false_positive_rate,
+            desired=false_positive_rate,
+            rtol=RTOL,
+            atol=EFFICACY_TOLERANCE,
+        )
@@ -6,8 +6,12 @@ import pandas as pd
 import pytest
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations import DataContext
+from great_expectations.core.async_executor import AsyncExecutor
 from great_expectations.core.batch import BatchRequest
+from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.data_context.store.profiler_store import ProfilerStore
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.types.resource_identifiers import (
     ConfigurationIdentifier,
     GeCloudIdentifier,
@@ -23,6 +27,7 @@ from great_expectations.rule_based_profiler.config import (
     ParameterBuilderConfig,
     RuleBasedProfilerConfig,
 )
+from great_expectations.rule_based_profiler.domain import Domain
 from great_expectations.rule_based_profiler.domain_builder import TableDomainBuilder
 from great_expectations.rule_based_profiler.expectation_configuration_builder import (
     DefaultExpectationConfigurationBuilder,
@@ -36,9 +41,13 @@ from great_expectations.rule_based_profiler.parameter_builder import (
 )
 from great_expectations.rule_based_profiler.parameter_container import (
     ParameterContainer,
+    get_parameter_value_by_fully_qualified_parameter_name,
 )
 from great_expectations.rule_based_profiler.rule import Rule
+from great_expectations.rule_based_profiler.rule_state import RuleState
 from great_expectations.util import deep_filter_properties_iterable
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
 
 
 @pytest.fixture()
@@ -1452,3 +1461,260 @@ def test_add_rule_bad_rule(
         # noinspection PyTypeChecker
         profiler.add_rule(rule=not_a_rule)
     assert "'dict' object has no attribute 'name'" in str(e.value)
+
+
+def test_run_profiler_loads_batches_once_per_session(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    profiler = RuleBasedProfiler(
+        name="my_rbp",
+        config_version=1.0,
+        rules={
+            "my_rule": {
+                "domain_builder": {
+                    "class_name": "ColumnDomainBuilder",
+                    "include_column_names": [
+                        "passenger_count",
+                        "trip_distance",
+                        "fare_amount",
+                    ],
+                },
+                "parameter_builders": [
+                    {
+                        "class_name": "MetricMultiBatchParameterBuilder",
+                        "name": "my_column_max",
+                        "metric_name": "column.max",
+                        "metric_domain_kwargs": "$domain.domain_kwargs",
+                    },
+                    {
+                        "class_name": "MetricMultiBatchParameterBuilder",
+                        "name": "my_column_min",
+                        "metric_name": "column.min",
+                        "metric_domain_kwargs": "$domain.domain_kwargs",
+                    },
+                ],
+                "expectation_configuration_builders": [],
+            },
+        },
+        data_context=data_context,
+    )
+
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    with mock.patch.object(
+        data_context, "get_batch_list", wraps=data_context.get_batch_list
+    ) as mock_get_batch_list:
+        profiler.run(batch_request=batch_request)
+
+    # Batches are loaded by the DomainBuilder; all ParameterBuilder invocations (for every Domain) reuse them.
+    assert mock_get_batch_list.call_count == 1
+    assert len(profiler.rule_states[0].domains) == 3
+
+
+def test_run_profiler_resolves_planned_metrics_together(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    domain_builder_config: dict = {
+        "class_name": "ColumnDomainBuilder",
+        "include_column_names": [
+            "passenger_count",
+            "trip_distance",
+            "fare_amount",
+        ],
+    }
+    column_max_parameter_builder_config: dict = {
+        "class_name": "MetricMultiBatchParameterBuilder",
+        "name": "my_column_max",
+        "metric_name": "column.max",
+        "metric_domain_kwargs": "$domain.domain_kwargs",
+    }
+    profiler = RuleBasedProfiler(
+        name="my_rbp",
+        config_version=1.0,
+        rules={
+            "my_rule": {
+                "domain_builder": domain_builder_config,
+                "parameter_builders": [
+                    column_max_parameter_builder_config,
+                    {
+                        "class_name": "MetricMultiBatchParameterBuilder",
+                        "name": "my_column_min",
+                        "metric_name": "column.min",
+                        "metric_domain_kwargs": "$domain.domain_kwargs",
+                        "single_batch_mode": "$variables.single_batch_mode",
+                    },
+                ],
+                "expectation_configuration_builders": [],
+            },
+            "my_other_rule": {
+                "domain_builder": domain_builder_config,
+                "parameter_builders": [column_max_parameter_builder_config],
+                "expectation_configuration_builders": [],
+            },
+        },
+        variables={"single_batch_mode": True},
+        data_context=data_context,
+    )
+
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    with mock.patch.object(
+        Validator,
+        "compute_metrics",
+        autospec=True,
+        side_effect=Validator.compute_metrics,
+    ) as mock_compute_metrics:
+        profiler.run(batch_request=batch_request)
+
+    # Metrics of all Domain objects of "my_rule" are resolved in one validation graph; "my_other_rule" reuses them.
+    parameter_builder_metric_configurations: List[List[MetricConfiguration]] = [
+        call.kwargs["metric_configurations"]
+        for call in mock_compute_metrics.call_args_list
+        if call.kwargs["metric_configurations"][0].metric_name
+        in ("column.max", "column.min")
+    ]
+    assert len(parameter_builder_metric_configurations) == 1
+    assert len(parameter_builder_metric_configurations[0]) == 3 * (3 + 1)
+
+    rule_state: RuleState
+    for rule_state in profiler.rule_states:
+        domain: Domain
+        for domain in rule_state.domains:
+            assert (
+                len(
+                    get_parameter_value_by_fully_qualified_parameter_name(
+                        fully_qualified_parameter_name="$parameter.my_column_max.value",
+                        domain=domain,
+                        parameters=rule_state.parameters,
+                    )
+                )
+                == 3
+            )
+
+    rule_state = profiler.rule_states[0]
+    assert all(
+        len(
+            get_parameter_value_by_fully_qualified_parameter_name(
+                fully_qualified_parameter_name="$parameter.my_column_min.value",
+                domain=domain,
+                parameters=rule_state.parameters,
+            )
+        )
+        == 1
+        for domain in rule_state.domains
+    )
+
+
+def test_run_profiler_with_concurrent_rule_execution(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    domain_builder_config: dict = {
+        "class_name": "ColumnDomainBuilder",
+        "include_column_names": [
+            "passenger_count",
+            "trip_distance",
+            "fare_amount",
+        ],
+    }
+    rules: Dict[str, Dict[str, Any]] = {
+        "my_rule": {
+            "domain_builder": domain_builder_config,
+            "parameter_builders": [
+                {
+                    "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
+                    "name": "my_column_max_range",
+                    "metric_name": "column.max",
+                    "metric_domain_kwargs": "$domain.domain_kwargs",
+                    "estimator": "quantiles",
+                },
+            ],
+            "expectation_configuration_builders": [
+                {
+                    "class_name": "DefaultExpectationConfigurationBuilder",
+                    "expectation_type": "expect_column_max_to_be_between",
+                    "column": "$domain.domain_kwargs.column",
+                    "min_value": "$parameter.my_column_max_range.value[0]",
+                    "max_value": "$parameter.my_column_max_range.value[1]",
+                },
+            ],
+        },
+        "my_other_rule": {
+            "domain_builder": domain_builder_config,
+            "parameter_builders": [
+                {
+                    "class_name": "MetricMultiBatchParameterBuilder",
+                    "name": "my_column_min",
+                    "metric_name": "column.min",
+                    "metric_domain_kwargs": "$domain.domain_kwargs",
+                },
+            ],
+            "expectation_configuration_builders": [],
+        },
+    }
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    expected_result: RuleBasedProfilerResult = RuleBasedProfiler(
+        name="my_rbp",
+        config_version=1.0,
+        rules=rules,
+        data_context=data_context,
+    ).run(batch_request=batch_request)
+
+    data_context.variables.concurrency = ConcurrencyConfig(
+        enabled=True, concurrent_rule_execution=True
+    )
+    profiler = RuleBasedProfiler(
+        name="my_rbp",
+        config_version=1.0,
+        rules=rules,
+        data_context=data_context,
+    )
+    with mock.patch(
+        "great_expectations.rule_based_profiler.rule_based_profiler.AsyncExecutor",
+        wraps=AsyncExecutor,
+    ) as mock_async_executor:
+        result: RuleBasedProfilerResult = profiler.run(batch_request=batch_request)
+
+    assert mock_async_executor.called
+    # Results are collected in order of Rule objects (and of Domain objects), as if profiled sequentially.
+    assert [rule_state.rule.name for rule_state in profiler.rule_states] == [
+        "my_rule",
+        "my_other_rule",
+    ]
+    assert len(result.expectation_configurations) == 3
+    assert (
+        result.expectation_configurations == expected_result.expectation_configurations
+    )
+    assert convert_to_json_serializable(
+        data=result.parameter_values_for_fully_qualified_parameter_names_by_domain
+    ) == convert_to_json_serializable(
+        data=expected_result.parameter_values_for_fully_qualified_parameter_names_by_domain
+    )
+    assert list(result.rule_execution_time.keys()) == ["my_rule", "my_other_rule"]
+    assert all(
+        execution_time > 0.0 for execution_time in result.rule_execution_time.values()
+    )
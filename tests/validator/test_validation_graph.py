@@ -0,0 +1,114 @@
+import pytest
+
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import (
+    MetricEdge,
+    MetricResolutionQueue,
+    ValidationGraph,
+)
+
+
+@pytest.mark.unit
+def test_validation_graph_interns_equal_metric_configurations():
+    table_row_count_0 = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={"batch_id": "my_batch_id"},
+    )
+    table_row_count_1 = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={"batch_id": "my_batch_id"},
+    )
+    column_min = MetricConfiguration(
+        metric_name="column.min",
+        metric_domain_kwargs={"batch_id": "my_batch_id", "column": "a"},
+    )
+    column_max = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"batch_id": "my_batch_id", "column": "a"},
+    )
+
+    graph = ValidationGraph(
+        edges=[
+            MetricEdge(left=column_min, right=table_row_count_0),
+            MetricEdge(left=column_max, right=table_row_count_1),
+            MetricEdge(left=column_min, right=table_row_count_1),
+        ]
+    )
+
+    assert len(graph.edges) == 2
+    assert len(graph.metric_configurations) == 3
+    assert graph.edges[0].right is graph.edges[1].right
+    assert graph.get_metric_configuration(table_row_count_1.id) is table_row_count_0
+
+
+def _build_chain_graph() -> ValidationGraph:
+    # column.max depends on column.max.aggregate_fn, which depends on table.columns and table.row_count.
+    table_columns = MetricConfiguration(
+        metric_name="table.columns", metric_domain_kwargs={}
+    )
+    table_row_count = MetricConfiguration(
+        metric_name="table.row_count", metric_domain_kwargs={}
+    )
+    column_max_aggregate_fn = MetricConfiguration(
+        metric_name="column.max.aggregate_fn", metric_domain_kwargs={"column": "a"}
+    )
+    column_max = MetricConfiguration(
+        metric_name="column.max", metric_domain_kwargs={"column": "a"}
+    )
+    return ValidationGraph(
+        edges=[
+            MetricEdge(left=column_max, right=column_max_aggregate_fn),
+            MetricEdge(left=column_max_aggregate_fn, right=table_columns),
+            MetricEdge(left=column_max_aggregate_fn, right=table_row_count),
+            MetricEdge(left=table_columns),
+            MetricEdge(left=table_row_count),
+        ]
+    )
+
+
+@pytest.mark.unit
+def test_metric_resolution_queue_promotes_dependents_incrementally():
+    graph: ValidationGraph = _build_chain_graph()
+    queue = MetricResolutionQueue(graph=graph, metrics={})
+
+    assert {metric.metric_name for metric in queue.ready_metrics} == {
+        "table.columns",
+        "table.row_count",
+    }
+    assert {metric.metric_name for metric in queue.needed_metrics} == {
+        "column.max.aggregate_fn",
+        "column.max",
+    }
+
+    table_columns_id = ("table.columns", tuple(), tuple())
+    queue.mark_resolved(metric_ids=[table_columns_id])
+    # Resolving the same metric twice must not promote dependents prematurely.
+    queue.mark_resolved(metric_ids=[table_columns_id])
+    assert {metric.metric_name for metric in queue.ready_metrics} == {"table.row_count"}
+
+    queue.mark_resolved(metric_ids=[("table.row_count", tuple(), tuple())])
+    assert {metric.metric_name for metric in queue.ready_metrics} == {
+        "column.max.aggregate_fn"
+    }
+    assert {metric.metric_name for metric in queue.needed_metrics} == {"column.max"}
+
+    queue.mark_resolved(metric_ids=[metric.id for metric in list(queue.ready_metrics)])
+    assert {metric.metric_name for metric in queue.ready_metrics} == {"column.max"}
+    assert len(queue.needed_metric_ids) == 0
+
+
+@pytest.mark.unit
+def test_metric_resolution_queue_accounts_for_already_resolved_metrics():
+    graph: ValidationGraph = _build_chain_graph()
+    queue = MetricResolutionQueue(
+        graph=graph,
+        metrics={
+            ("table.columns", tuple(), tuple()): ["a"],
+            ("table.row_count", tuple(), tuple()): 3,
+        },
+    )
+
+    assert {metric.metric_name for metric in queue.ready_metrics} == {
+        "column.max.aggregate_fn"
+    }
+    assert {metric.metric_name for metric in queue.needed_metrics} == {"column.max"}
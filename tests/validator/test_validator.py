@@ -10,6 +10,7 @@ import pytest
 import great_expectations.exceptions as ge_exceptions
 from great_expectations import DataContext
 from great_expectations.core import ExpectationSuite
+from great_expectations.core.async_executor import AsyncExecutor
 from great_expectations.core.batch import (
     Batch,
     BatchDefinition,
@@ -22,7 +23,10 @@ from great_expectations.core.expectation_configuration import ExpectationConfigu
 from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
-from great_expectations.data_context.types.base import ProgressBarsConfig
+from great_expectations.data_context.types.base import (
+    ConcurrencyConfig,
+    ProgressBarsConfig,
+)
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.datasource.data_connector.batch_filter import (
     BatchFilter,
@@ -34,9 +38,14 @@ from great_expectations.expectations.core.expect_column_value_z_scores_to_be_les
 )
 from great_expectations.expectations.registry import get_expectation_impl
 from great_expectations.render.types import RenderedAtomicContent
+from great_expectations.self_check.util import build_pandas_engine
 from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metric_configuration import MetricConfiguration
 from great_expectations.validator.validation_graph import ValidationGraph
+from great_expectations.validator.validation_plan import (
+    ValidationPlanCacheStatistics,
+    validation_plan_cache,
+)
 from great_expectations.validator.validator import (
     MAX_METRIC_COMPUTATION_RETRIES,
     Validator,
@@ -1192,6 +1201,62 @@ def test_validator_progress_bar_config_disabled(
     assert mock_tqdm.call_args[1]["disable"] is True
 
 
+@mock.patch("great_expectations.data_context.data_context.DataContext")
+def test_validator_compute_metrics_with_concurrent_metric_resolution(
+    mock_data_context,
+):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, 6]})
+    metric_configurations: List[MetricConfiguration] = [
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": "a"},
+        ),
+        MetricConfiguration(
+            metric_name="column.min",
+            metric_domain_kwargs={"column": "b"},
+        ),
+        MetricConfiguration(
+            metric_name="table.row_count",
+            metric_domain_kwargs={},
+        ),
+        MetricConfiguration(
+            metric_name="column.distinct_values",
+            metric_domain_kwargs={"column": "a"},
+        ),
+    ]
+
+    data_context = mock_data_context()
+    data_context.progress_bars = None
+    data_context.concurrency = ConcurrencyConfig(
+        enabled=True, concurrent_metric_resolution=True
+    )
+    concurrent_validator = Validator(
+        execution_engine=build_pandas_engine(df=df), data_context=data_context
+    )
+    sequential_validator = Validator(execution_engine=build_pandas_engine(df=df))
+
+    expected_metrics: Dict[
+        Tuple[str, str, str], Any
+    ] = sequential_validator.compute_metrics(
+        metric_configurations=metric_configurations
+    )
+    with mock.patch(
+        "great_expectations.validator.validator.AsyncExecutor",
+        wraps=AsyncExecutor,
+    ) as mock_async_executor:
+        actual_metrics: Dict[
+            Tuple[str, str, str], Any
+        ] = concurrent_validator.compute_metrics(
+            metric_configurations=metric_configurations
+        )
+
+    assert mock_async_executor.called
+    assert actual_metrics == expected_metrics
+    assert actual_metrics[metric_configurations[0].id] == 22
+    assert actual_metrics[metric_configurations[1].id] == 1
+    assert actual_metrics[metric_configurations[2].id] == 6
+
+
 def test_validator_docstrings(multi_batch_taxi_validator):
     expectation_impl = getattr(
         multi_batch_taxi_validator, "expect_column_values_to_be_in_set", None
@@ -1298,3 +1363,112 @@ def test_validator_include_rendered_content_evaluation_parameters(
         ]
         == 8000
     )
+
+
+def _get_runtime_batch(datasource, df: pd.DataFrame, run_id: int) -> Batch:
+    return datasource.get_single_batch_from_batch_request(
+        RuntimeBatchRequest(
+            **{
+                "datasource_name": "my_datasource",
+                "data_connector_name": "test_runtime_data_connector",
+                "data_asset_name": "IN_MEMORY_DATA_ASSET",
+                "runtime_parameters": {
+                    "batch_data": df,
+                },
+                "batch_identifiers": {
+                    "pipeline_stage_name": 0,
+                    "airflow_run_id": run_id,
+                    "custom_key_0": 0,
+                },
+            }
+        )
+    )
+
+
+def test_graph_validate_reuses_validation_plan_for_another_batch(basic_datasource):
+    expectation_configurations: List[ExpectationConfiguration] = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 10},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "b"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_of_type",
+            kwargs={"column": "b", "type_": "float64"},
+        ),
+    ]
+
+    validation_plan_cache.clear()
+    statistics: ValidationPlanCacheStatistics = validation_plan_cache.statistics
+    hits: int = statistics.hits
+
+    first_batch: Batch = _get_runtime_batch(
+        datasource=basic_datasource,
+        df=pd.DataFrame({"a": [1, 5, 3], "b": [1.0, 2.0, None]}),
+        run_id=0,
+    )
+    first_results: List[ExpectationValidationResult] = Validator(
+        execution_engine=PandasExecutionEngine(), batches=[first_batch]
+    ).graph_validate(configurations=expectation_configurations)
+    assert statistics.hits == hits
+    assert [result.success for result in first_results] == [True, False, True]
+
+    second_batch: Batch = _get_runtime_batch(
+        datasource=basic_datasource,
+        df=pd.DataFrame({"a": [1, 50, 3], "b": [1.0, 2.0, 3.0]}),
+        run_id=1,
+    )
+    second_results: List[ExpectationValidationResult] = Validator(
+        execution_engine=PandasExecutionEngine(), batches=[second_batch]
+    ).graph_validate(configurations=expectation_configurations)
+    assert statistics.hits == hits + 1
+    assert [result.success for result in second_results] == [False, True, True]
+    assert second_results[0].result["observed_value"] == 50
+    assert all(
+        result.expectation_config.kwargs["batch_id"] == second_batch.id
+        for result in second_results
+    )
+
+
+def test_graph_validate_rebuilds_data_dependent_graph_for_another_batch(
+    basic_datasource,
+):
+    # Without "partition_object", the bins of the KL divergence are computed from the partition of every Batch.
+    expectation_configurations: List[ExpectationConfiguration] = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_kl_divergence_to_be_less_than",
+            kwargs={
+                "column": "a",
+                "partition_object": None,
+                "threshold": 0.1,
+                "bucketize_data": True,
+            },
+        ),
+    ]
+
+    validation_plan_cache.clear()
+    execution_engine: PandasExecutionEngine = PandasExecutionEngine()
+
+    first_batch: Batch = _get_runtime_batch(
+        datasource=basic_datasource,
+        df=pd.DataFrame({"a": [1.0, 2.0, 3.0, 4.0, 5.0]}),
+        run_id=0,
+    )
+    first_results: List[ExpectationValidationResult] = Validator(
+        execution_engine=execution_engine, batches=[first_batch]
+    ).graph_validate(configurations=expectation_configurations)
+    assert first_results[0].result["details"]["observed_partition"]["bins"][0] == 1.0
+
+    second_batch: Batch = _get_runtime_batch(
+        datasource=basic_datasource,
+        df=pd.DataFrame({"a": [100.0, 150.0, 175.0, 190.0, 200.0]}),
+        run_id=1,
+    )
+    second_results: List[ExpectationValidationResult] = Validator(
+        execution_engine=execution_engine, batches=[second_batch]
+    ).graph_validate(configurations=expectation_configurations)
+    assert second_results[0].expectation_config.kwargs["batch_id"] == second_batch.id
+    assert second_results[0].result["details"]["observed_partition"]["bins"][0] == 100.0